@@ -0,0 +1,116 @@
+import itertools
+import os
+import sqlite3
+import threading
+
+
+class Catalog:
+    # Rows are written in one transaction per batch of this many changes
+    BATCH_SIZE = 1000
+
+    SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT NOT NULL,
+    record TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    archive TEXT NOT NULL,
+    offset INTEGER,
+    stored_size INTEGER,
+    size INTEGER,
+    dcx INTEGER,
+    path TEXT,
+    digest TEXT,
+    UNIQUE (parent, record)
+);
+CREATE INDEX IF NOT EXISTS files_name ON files (name);
+CREATE INDEX IF NOT EXISTS files_parent ON files (parent);
+CREATE INDEX IF NOT EXISTS files_path ON files (path);
+'''
+
+    INSERT = '''
+INSERT OR REPLACE INTO files (
+    name, record, parent, archive, offset, stored_size, size, dcx, path,
+    digest
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+    DELETE_PARENT = 'DELETE FROM files WHERE parent = ?'
+    DELETE_PATH = 'DELETE FROM files WHERE path = ?'
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.connection = None
+        # (statement, parameters) waiting for the next batch, in order
+        self.pending = []
+        self.lock = threading.Lock()
+
+    # Open the catalog, creating it if needed. Unless kept, the rows of the
+    #  previous run are dropped
+    def open(self, keep=False):
+        # the connection is shared by the pipeline workers under the lock
+        self.connection = sqlite3.connect(
+            self.filename, check_same_thread=False
+        )
+        with self.connection:
+            self.connection.executescript(self.SCHEMA)
+            if not keep:
+                self.connection.execute('DELETE FROM files')
+
+    # Record an extracted file. record is its name inside the parent
+    #  container and archive the top-level archive it came from. path is
+    #  None for files that were only kept in memory
+    def add(
+        self, record, parent, archive, offset, stored_size, size, dcx,
+        path, digest
+    ):
+        name = os.path.basename(record.replace('\\', '/'))
+        self.queue(self.INSERT, (
+            name, record, parent, archive, offset, stored_size, size,
+            None if dcx is None else int(dcx), path, digest
+        ))
+
+    # Forget the files of a container that is unpacked again
+    def remove_parent(self, parent):
+        self.queue(self.DELETE_PARENT, (parent,))
+
+    # Forget the files written to the given paths
+    def remove_paths(self, paths):
+        for path in paths:
+            self.queue(self.DELETE_PATH, (path,))
+
+    # Queue a change, writing the batch once it is full
+    def queue(self, statement, parameters):
+        with self.lock:
+            self.pending.append((statement, parameters))
+            if len(self.pending) >= self.BATCH_SIZE:
+                self.write_pending()
+
+    # Write the queued changes in one transaction, consecutive changes
+    #  using the same statement are executed together
+    def write_pending(self):
+        if len(self.pending) == 0:
+            return
+        with self.connection:
+            for statement, group in itertools.groupby(
+                self.pending, key=lambda change: change[0]
+            ):
+                self.connection.executemany(
+                    statement, [parameters for (_, parameters) in group]
+                )
+        self.pending = []
+
+    # Get the catalog rows of the files with the given name
+    def find(self, name):
+        with self.lock:
+            self.write_pending()
+            return self.connection.execute(
+                'SELECT * FROM files WHERE name = ? ORDER BY parent',
+                (name,)
+            ).fetchall()
+
+    # Write the remaining changes and close the catalog
+    def close(self):
+        if self.connection is None:
+            return
+        with self.lock:
+            self.write_pending()
+        self.connection.close()
+        self.connection = None
@@ -0,0 +1,35 @@
+import sys
+
+# Labels huepy writes before the messages of its commands
+LABELS = {
+    'info': '[!] ',
+    'que': '[?] ',
+    'bad': '[-] ',
+    'good': '[+] ',
+    'run': '[~] ',
+}
+
+
+# Check if a stream is a terminal, which shows colors
+def is_terminal(stream):
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class Hue:
+    # Color, style or label a text with the huepy function of the given name
+    #  when the stream (standard error by default) is a terminal, and leave
+    #  it plain otherwise. huepy is imported for the first colored text, so
+    #  importing the package or redirecting the output does not load it
+    def __init__(self, name, stream=None):
+        self.name = name
+        self.stream = stream
+
+    def __call__(self, text):
+        if not is_terminal(self.stream or sys.stderr):
+            return LABELS.get(self.name, '') + text
+        # also enables escape sequences in the Windows console
+        import huepy
+        return getattr(huepy, self.name)(text)
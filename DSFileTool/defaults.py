@@ -1,6198 +1,69 @@
-# This file contains custom data for c4110.chrtpfbhd, a header file
-#  that was not included in the archived files (the file it unpacks is
-#  not used in-game). This data is a reconstructed version of the file.
+import functools
+import gzip
+import json
+import os
+
+# FILENAMES, c4110 and FINGERPRINTS are loaded from the resources directory
+#  the first time they are used, so importing the package does not pay for
+#  them. The names are stored one per line in a gzip-compressed UTF-8 text
+#  file
+RESOURCES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'resources'
+)
+FILENAMES_RESOURCE = 'filenames.txt.gz'
+C4110_RESOURCE = 'c4110.chrtpfbhd'
+FINGERPRINTS_RESOURCE = 'fingerprints.json'
+
+# c4110.chrtpfbhd is a header file that was not included in the archived
+#  files (the file it unpacks is not used in-game). The resource is a
+#  reconstructed version of the file.
 # The real version of this file would have almost certainly been included
 #  in dvdroot:/chr/c4110.chrbnd
-c4110 = {
-    'DATA': b'BHF307D7R6\x00\x00t\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x00' +
-            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00@\x00\x00\x00\x9f\xda\x03' +
-            b'\x00\x10\x00\x00\x00\x00\x00\x00\x00\xf0\x02\x00\x00\x9f\xda' +
-            b'\x03\x00@\x00\x00\x00\xbcn\x01\x00\xb0\xda\x03\x00\x01\x00\x00' +
-            b'\x00\x05\x03\x00\x00\xbcn\x01\x00@\x00\x00\x00#f\x00\x00pI\x05' +
-            b'\x00\x02\x00\x00\x00\x1c\x03\x00\x00#f\x00\x00@\x00\x00\x00' +
-            b'\x11 \x00\x00\xa0\xaf\x05\x00\x03\x00\x00\x005\x03\x00\x00\x11' +
-            b' \x00\x00@\x00\x00\x00I\x8e\x00\x00\xc0\xcf\x05\x00\x04\x00' +
-            b'\x00\x00N\x03\x00\x00I\x8e\x00\x00@\x00\x00\x00\xdc\x1d\x00' +
-            b'\x00\x10^\x06\x00\x05\x00\x00\x00e\x03\x00\x00\xdc\x1d\x00\x00' +
-            b'@\x00\x00\x00\x17\x16\x00\x00\xf0{\x06\x00\x06\x00\x00\x00~' +
-            b'\x03\x00\x00\x17\x16\x00\x00@\x00\x00\x00|\xda\x03\x00\x10\x92' +
-            b'\x06\x00\x07\x00\x00\x00\x97\x03\x00\x00|\xda\x03\x00@\x00\x00' +
-            b'\x00\x19\xcc\x00\x00\x90l\n\x00\x08\x00\x00\x00\xae\x03\x00' +
-            b'\x00\x19\xcc\x00\x00@\x00\x00\x00\x82k\x04\x00\xb08\x0b\x00\t' +
-            b'\x00\x00\x00\xc5\x03\x00\x00\x82k\x04\x00@\x00\x00\x00!\x84' +
-            b'\x00\x00@\xa4\x0f\x00\n\x00\x00\x00\xe4\x03\x00\x00!\x84\x00' +
-            b'\x00@\x00\x00\x00\xcc\xe8\x00\x00p(\x10\x00\x0b\x00\x00\x00' +
-            b'\x05\x04\x00\x00\xcc\xe8\x00\x00@\x00\x00\x00\x12)\x02\x00@' +
-            b'\x11\x11\x00\x0c\x00\x00\x00&\x04\x00\x00\x12)\x02\x00@\x00' +
-            b'\x00\x00}D\x00\x00`:\x13\x00\r\x00\x00\x00E\x04\x00\x00}D\x00' +
-            b'\x00@\x00\x00\x004\x00\x02\x00\xe0~\x13\x00\x0e\x00\x00\x00f' +
-            b'\x04\x00\x004\x00\x02\x00@\x00\x00\x00\xd6\x16\t\x00 \x7f\x15' +
-            b'\x00\x0f\x00\x00\x00\x87\x04\x00\x00\xd6\x16\t\x00@\x00\x00' +
-            b'\x00\x06\xc6\x01\x00\x00\x96\x1e\x00\x10\x00\x00\x00\xa8\x04' +
-            b'\x00\x00\x06\xc6\x01\x00@\x00\x00\x00A"\x07\x00\x10\\ \x00\x11' +
-            b'\x00\x00\x00\xcb\x04\x00\x00A"\x07\x00@\x00\x00\x00\x07^\x04' +
-            b'\x00`~\'\x00\x12\x00\x00\x00\xee\x04\x00\x00\x07^\x04\x00@\x00' +
-            b'\x00\x008\xed\x00\x00p\xdc+\x00\x13\x00\x00\x00\x0f\x05\x00' +
-            b'\x008\xed\x00\x00@\x00\x00\x00r3\x03\x00\xb0\xc9,\x00\x14\x00' +
-            b'\x00\x002\x05\x00\x00r3\x03\x00@\x00\x00\x00\xa6\x98\x01\x000' +
-            b'\xfd/\x00\x15\x00\x00\x00U\x05\x00\x00\xa6\x98\x01\x00@\x00' +
-            b'\x00\x00\x19d\x00\x00\xe0\x951\x00\x16\x00\x00\x00v\x05\x00' +
-            b'\x00\x19d\x00\x00@\x00\x00\x00p\xdb\x01\x00\x00\xfa1\x00\x17' +
-            b'\x00\x00\x00\x97\x05\x00\x00p\xdb\x01\x00@\x00\x00\x00\xe2\xef' +
-            b'\x00\x00p\xd53\x00\x18\x00\x00\x00\xb6\x05\x00\x00\xe2\xef\x00' +
-            b'\x00@\x00\x00\x00YC\x00\x00`\xc54\x00\x19\x00\x00\x00\xcd\x05' +
-            b'\x00\x00YC\x00\x00@\x00\x00\x00N\x11\x00\x00\xc0\x085\x00\x1a' +
-            b'\x00\x00\x00\xe6\x05\x00\x00N\x11\x00\x00@\x00\x00\x00eO\t\x00' +
-            b'\x10\x1a5\x00\x1b\x00\x00\x00\xff\x05\x00\x00eO\t\x00@\x00\x00' +
-            b'\x00\x1d\x14\x02\x00\x80i>\x00\x1c\x00\x00\x00\x16\x06\x00\x00' +
-            b'\x1d\x14\x02\x00@\x00\x00\x00y}\x00\x00\xa0}@\x00\x1d\x00\x00' +
-            b'\x00/\x06\x00\x00y}\x00\x00\\c4110\\c4110.tpf.dcx\x00\\c4110\\' +
-            b'c4110_2.tpf.dcx\x00\\c4110\\c4110_2_n.tpf.dcx\x00\\c4110\\c411' +
-            b'0_2_s.tpf.dcx\x00\\c4110\\c4110_4.tpf.dcx\x00\\c4110\\c4110_4_' +
-            b'n.tpf.dcx\x00\\c4110\\c4110_4_s.tpf.dcx\x00\\c4110\\c4110_n.tp' +
-            b'f.dcx\x00\\c4110\\c4110_s.tpf.dcx\x00\\c4110\\c4110_LG_M_9720.' +
-            b'tpf.dcx\x00\\c4110\\c4110_LG_M_9720_n.tpf.dcx\x00\\c4110\\c411' +
-            b'0_LG_M_9720_s.tpf.dcx\x00\\c4110\\c4110_AM_M_9720.tpf.dcx\x00' +
-            b'\\c4110\\c4110_AM_M_9720_n.tpf.dcx\x00\\c4110\\c4110_AM_M_9720' +
-            b'_s.tpf.dcx\x00\\c4110\\c4110_BD_M_9720_1.tpf.dcx\x00\\c4110\\c' +
-            b'4110_BD_M_9720_1_n.tpf.dcx\x00\\c4110\\c4110_BD_M_9720_1_s.tpf' +
-            b'.dcx\x00\\c4110\\c4110_BD_M_9720_2.tpf.dcx\x00\\c4110\\c4110_B' +
-            b'D_M_9720_2_n.tpf.dcx\x00\\c4110\\c4110_BD_M_9720_2_s.tpf.dcx' +
-            b'\x00\\c4110\\c4110_HD_M_9720_s.tpf.dcx\x00\\c4110\\c4110_HD_M_' +
-            b'9720_n.tpf.dcx\x00\\c4110\\c4110_HD_M_9720.tpf.dcx\x00\\c4110' +
-            b'\\c4110_5.tpf.dcx\x00\\c4110\\c4110_5_n.tpf.dcx\x00\\c4110\\c4' +
-            b'110_5_s.tpf.dcx\x00\\c4110\\c4110_6.tpf.dcx\x00\\c4110\\c4110_' +
-            b'6_n.tpf.dcx\x00\\c4110\\c4110_6_s.tpf.dcx\x00',
-    'PATH': 'N:\\FRPG\\data\\INTERROOT_win32\\chr\\c4110\\c4110.chrtpfbhd',
+C4110_PATH = 'N:\\FRPG\\data\\INTERROOT_win32\\chr\\c4110\\c4110.chrtpfbhd'
+
+
+# Read a file from the resources directory
+def read_resource(name):
+    with open(os.path.join(RESOURCES_PATH, name), 'rb') as f:
+        return f.read()
+
+
+# Get the paths of the files stored in the archives, whose hashes identify
+#  the .bhd5 records
+@functools.lru_cache(maxsize=None)
+def get_filenames():
+    content = gzip.decompress(read_resource(FILENAMES_RESOURCE))
+    return content.decode('utf-8').splitlines()
+
+
+# Get the content and the path of the custom c4110.chrtpfbhd
+@functools.lru_cache(maxsize=None)
+def get_c4110():
+    return {
+        'DATA': read_resource(C4110_RESOURCE),
+        'PATH': C4110_PATH,
+    }
+
+
+# Get the fingerprints of the known executables, see EXE.fingerprint()
+@functools.lru_cache(maxsize=None)
+def get_fingerprints():
+    return json.loads(read_resource(FINGERPRINTS_RESOURCE))
+
+
+LAZY_ATTRIBUTES = {
+    'FILENAMES': get_filenames,
+    'c4110': get_c4110,
+    'FINGERPRINTS': get_fingerprints,
 }
 
-FILENAMES = [
-    '/chr/c0000.anibnd.dcx',
-    '/chr/c0000.chrbnd.dcx',
-    '/chr/c0000.esd.dcx',
-    '/chr/c0000_a00_hi.anibnd.dcx',
-    '/chr/c0000_a00_lo.anibnd.dcx',
-    '/chr/c0000_a00_md.anibnd.dcx',
-    '/chr/c0000_a0x.anibnd.dcx',
-    '/chr/c0000_a1x.anibnd.dcx',
-    '/chr/c0000_a2x.anibnd.dcx',
-    '/chr/c0000_a3x.anibnd.dcx',
-    '/chr/c0000_a4x.anibnd.dcx',
-    '/chr/c0000_a5x.anibnd.dcx',
-    '/chr/c0000_a6x.anibnd.dcx',
-    '/chr/c0000_a7x.anibnd.dcx',
-    '/chr/c0000_a8x.anibnd.dcx',
-    '/chr/c0000_a9x.anibnd.dcx',
-    '/chr/c0000_c2060.anibnd.dcx',
-    '/chr/c0000_c2290.anibnd.dcx',
-    '/chr/c0000_c2300.anibnd.dcx',
-    '/chr/c0000_c2310.anibnd.dcx',
-    '/chr/c0000_c2320.anibnd.dcx',
-    '/chr/c0000_c2330.anibnd.dcx',
-    '/chr/c0000_c2390.anibnd.dcx',
-    '/chr/c0000_c2520.anibnd.dcx',
-    '/chr/c0000_c2591.anibnd.dcx',
-    '/chr/c0000_c2660.anibnd.dcx',
-    '/chr/c0000_c2670.anibnd.dcx',
-    '/chr/c0000_c2680.anibnd.dcx',
-    '/chr/c0000_c2690.anibnd.dcx',
-    '/chr/c0000_c2700.anibnd.dcx',
-    '/chr/c0000_c2780.anibnd.dcx',
-    '/chr/c0000_c3200.anibnd.dcx',
-    '/chr/c0000_c3210.anibnd.dcx',
-    '/chr/c0000_c3240.anibnd.dcx',
-    '/chr/c0000_c3250.anibnd.dcx',
-    '/chr/c0000_c3330.anibnd.dcx',
-    '/chr/c0000_c3390.anibnd.dcx',
-    '/chr/c0000_c4510.anibnd.dcx',
-    '/chr/c0000_c5200.anibnd.dcx',
-    '/chr/c0000_c5220.anibnd.dcx',
-    '/chr/c0000_c5260.anibnd.dcx',
-    '/chr/c0000_c5270.anibnd.dcx',
-    '/chr/c0000_c5271.anibnd.dcx',
-    '/chr/c0000_c5360.anibnd.dcx',
-    '/chr/c0000_c5390.anibnd.dcx',
-    '/chr/c0000_dlc.anibnd.dcx',
-    '/chr/c1000.anibnd.dcx',
-    '/chr/c1000.chrbnd.dcx',
-    '/chr/c1200.anibnd.dcx',
-    '/chr/c1200.chrbnd.dcx',
-    '/chr/c1201.anibnd.dcx',
-    '/chr/c1201.chrbnd.dcx',
-    '/chr/c1202.anibnd.dcx',
-    '/chr/c1202.chrbnd.dcx',
-    '/chr/c1203.anibnd.dcx',
-    '/chr/c1203.chrbnd.dcx',
-    '/chr/c2060.anibnd.dcx',
-    '/chr/c2060.chrbnd.dcx',
-    '/chr/c2210.anibnd.dcx',
-    '/chr/c2210.chrbnd.dcx',
-    '/chr/c2230.anibnd.dcx',
-    '/chr/c2230.chrbnd.dcx',
-    '/chr/c2231.anibnd.dcx',
-    '/chr/c2231.chrbnd.dcx',
-    '/chr/c2231.chrtpfbdt',
-    '/chr/c2232.anibnd.dcx',
-    '/chr/c2232.chrbnd.dcx',
-    '/chr/c2239.chrbnd.dcx',
-    '/chr/c2239.chrtpfbdt',
-    '/chr/c2240.anibnd.dcx',
-    '/chr/c2240.chrbnd.dcx',
-    '/chr/c2250.anibnd.dcx',
-    '/chr/c2250.chrbnd.dcx',
-    '/chr/c2250.chrtpfbdt',
-    '/chr/c2260.anibnd.dcx',
-    '/chr/c2260.chrbnd.dcx',
-    '/chr/c2270.anibnd.dcx',
-    '/chr/c2270.chrbnd.dcx',
-    '/chr/c2280.anibnd.dcx',
-    '/chr/c2280.chrbnd.dcx',
-    '/chr/c2290.anibnd.dcx',
-    '/chr/c2290.chrbnd.dcx',
-    '/chr/c2300.anibnd.dcx',
-    '/chr/c2300.chrbnd.dcx',
-    '/chr/c2310.anibnd.dcx',
-    '/chr/c2310.chrbnd.dcx',
-    '/chr/c2320.anibnd.dcx',
-    '/chr/c2320.chrbnd.dcx',
-    '/chr/c2320.chrtpfbdt',
-    '/chr/c2330.anibnd.dcx',
-    '/chr/c2330.chrbnd.dcx',
-    '/chr/c2360.anibnd.dcx',
-    '/chr/c2360.chrbnd.dcx',
-    '/chr/c2370.anibnd.dcx',
-    '/chr/c2370.chrbnd.dcx',
-    '/chr/c2380.anibnd.dcx',
-    '/chr/c2380.chrbnd.dcx',
-    '/chr/c2390.anibnd.dcx',
-    '/chr/c2390.chrbnd.dcx',
-    '/chr/c2400.anibnd.dcx',
-    '/chr/c2400.chrbnd.dcx',
-    '/chr/c2410.anibnd.dcx',
-    '/chr/c2410.chrbnd.dcx',
-    '/chr/c2430.anibnd.dcx',
-    '/chr/c2430.chrbnd.dcx',
-    '/chr/c2500.anibnd.dcx',
-    '/chr/c2500.chrbnd.dcx',
-    '/chr/c2509.chrbnd.dcx',
-    '/chr/c2510.anibnd.dcx',
-    '/chr/c2510.chrbnd.dcx',
-    '/chr/c2511.chrbnd.dcx',
-    '/chr/c2519.chrbnd.dcx',
-    '/chr/c2520.anibnd.dcx',
-    '/chr/c2520.chrbnd.dcx',
-    '/chr/c2530.anibnd.dcx',
-    '/chr/c2530.chrbnd.dcx',
-    '/chr/c2540.anibnd.dcx',
-    '/chr/c2540.chrbnd.dcx',
-    '/chr/c2550.anibnd.dcx',
-    '/chr/c2550.chrbnd.dcx',
-    '/chr/c2560.anibnd.dcx',
-    '/chr/c2560.chrbnd.dcx',
-    '/chr/c2570.anibnd.dcx',
-    '/chr/c2570.chrbnd.dcx',
-    '/chr/c2590.anibnd.dcx',
-    '/chr/c2590.chrbnd.dcx',
-    '/chr/c2591.anibnd.dcx',
-    '/chr/c2591.chrbnd.dcx',
-    '/chr/c2600.anibnd.dcx',
-    '/chr/c2600.chrbnd.dcx',
-    '/chr/c2640.anibnd.dcx',
-    '/chr/c2640.chrbnd.dcx',
-    '/chr/c2650.anibnd.dcx',
-    '/chr/c2650.chrbnd.dcx',
-    '/chr/c2660.anibnd.dcx',
-    '/chr/c2660.chrbnd.dcx',
-    '/chr/c2670.anibnd.dcx',
-    '/chr/c2670.chrbnd.dcx',
-    '/chr/c2680.anibnd.dcx',
-    '/chr/c2680.chrbnd.dcx',
-    '/chr/c2690.anibnd.dcx',
-    '/chr/c2690.chrbnd.dcx',
-    '/chr/c2700.anibnd.dcx',
-    '/chr/c2700.chrbnd.dcx',
-    '/chr/c2710.anibnd.dcx',
-    '/chr/c2710.chrbnd.dcx',
-    '/chr/c2711.anibnd.dcx',
-    '/chr/c2711.chrbnd.dcx',
-    '/chr/c2730.anibnd.dcx',
-    '/chr/c2730.chrbnd.dcx',
-    '/chr/c2730.chrtpfbdt',
-    '/chr/c2731.anibnd.dcx',
-    '/chr/c2731.chrbnd.dcx',
-    '/chr/c2750.anibnd.dcx',
-    '/chr/c2750.chrbnd.dcx',
-    '/chr/c2780.anibnd.dcx',
-    '/chr/c2780.chrbnd.dcx',
-    '/chr/c2790.anibnd.dcx',
-    '/chr/c2790.chrbnd.dcx',
-    '/chr/c2791.anibnd.dcx',
-    '/chr/c2791.chrbnd.dcx',
-    '/chr/c2792.anibnd.dcx',
-    '/chr/c2792.chrbnd.dcx',
-    '/chr/c2793.anibnd.dcx',
-    '/chr/c2793.chrbnd.dcx',
-    '/chr/c2794.anibnd.dcx',
-    '/chr/c2794.chrbnd.dcx',
-    '/chr/c2795.anibnd.dcx',
-    '/chr/c2795.chrbnd.dcx',
-    '/chr/c2799.chrbnd.dcx',
-    '/chr/c2800.anibnd.dcx',
-    '/chr/c2800.chrbnd.dcx',
-    '/chr/c2810.anibnd.dcx',
-    '/chr/c2810.chrbnd.dcx',
-    '/chr/c2811.anibnd.dcx',
-    '/chr/c2811.chrbnd.dcx',
-    '/chr/c2819.chrbnd.dcx',
-    '/chr/c2820.anibnd.dcx',
-    '/chr/c2820.chrbnd.dcx',
-    '/chr/c2830.anibnd.dcx',
-    '/chr/c2830.chrbnd.dcx',
-    '/chr/c2840.anibnd.dcx',
-    '/chr/c2840.chrbnd.dcx',
-    '/chr/c2860.anibnd.dcx',
-    '/chr/c2860.chrbnd.dcx',
-    '/chr/c2861.chrbnd.dcx',
-    '/chr/c2869.chrbnd.dcx',
-    '/chr/c2870.anibnd.dcx',
-    '/chr/c2870.chrbnd.dcx',
-    '/chr/c2900.anibnd.dcx',
-    '/chr/c2900.chrbnd.dcx',
-    '/chr/c2909.chrbnd.dcx',
-    '/chr/c2910.anibnd.dcx',
-    '/chr/c2910.chrbnd.dcx',
-    '/chr/c2920.anibnd.dcx',
-    '/chr/c2920.chrbnd.dcx',
-    '/chr/c2921.chrbnd.dcx',
-    '/chr/c2929.chrbnd.dcx',
-    '/chr/c2930.anibnd.dcx',
-    '/chr/c2930.chrbnd.dcx',
-    '/chr/c2940.anibnd.dcx',
-    '/chr/c2940.chrbnd.dcx',
-    '/chr/c2950.anibnd.dcx',
-    '/chr/c2950.chrbnd.dcx',
-    '/chr/c2960.anibnd.dcx',
-    '/chr/c2960.chrbnd.dcx',
-    '/chr/c3090.anibnd.dcx',
-    '/chr/c3090.chrbnd.dcx',
-    '/chr/c3110.anibnd.dcx',
-    '/chr/c3110.chrbnd.dcx',
-    '/chr/c3200.anibnd.dcx',
-    '/chr/c3200.chrbnd.dcx',
-    '/chr/c3210.anibnd.dcx',
-    '/chr/c3210.chrbnd.dcx',
-    '/chr/c3220.anibnd.dcx',
-    '/chr/c3220.chrbnd.dcx',
-    '/chr/c3230.anibnd.dcx',
-    '/chr/c3230.chrbnd.dcx',
-    '/chr/c3240.anibnd.dcx',
-    '/chr/c3240.chrbnd.dcx',
-    '/chr/c3250.anibnd.dcx',
-    '/chr/c3250.chrbnd.dcx',
-    '/chr/c3270.anibnd.dcx',
-    '/chr/c3270.chrbnd.dcx',
-    '/chr/c3290.anibnd.dcx',
-    '/chr/c3290.chrbnd.dcx',
-    '/chr/c3300.anibnd.dcx',
-    '/chr/c3300.chrbnd.dcx',
-    '/chr/c3320.anibnd.dcx',
-    '/chr/c3320.chrbnd.dcx',
-    '/chr/c3330.anibnd.dcx',
-    '/chr/c3330.chrbnd.dcx',
-    '/chr/c3340.anibnd.dcx',
-    '/chr/c3340.chrbnd.dcx',
-    '/chr/c3341.anibnd.dcx',
-    '/chr/c3341.chrbnd.dcx',
-    '/chr/c3350.anibnd.dcx',
-    '/chr/c3350.chrbnd.dcx',
-    '/chr/c3370.anibnd.dcx',
-    '/chr/c3370.chrbnd.dcx',
-    '/chr/c3380.anibnd.dcx',
-    '/chr/c3380.chrbnd.dcx',
-    '/chr/c3390.anibnd.dcx',
-    '/chr/c3390.chrbnd.dcx',
-    '/chr/c3390.chrtpfbdt',
-    '/chr/c3400.anibnd.dcx',
-    '/chr/c3400.chrbnd.dcx',
-    '/chr/c3410.anibnd.dcx',
-    '/chr/c3410.chrbnd.dcx',
-    '/chr/c3420.anibnd.dcx',
-    '/chr/c3420.chrbnd.dcx',
-    '/chr/c3420.chrtpfbdt',
-    '/chr/c3421.anibnd.dcx',
-    '/chr/c3421.chrbnd.dcx',
-    '/chr/c3422.anibnd.dcx',
-    '/chr/c3422.chrbnd.dcx',
-    '/chr/c3430.anibnd.dcx',
-    '/chr/c3430.chrbnd.dcx',
-    '/chr/c3430.chrtpfbdt',
-    '/chr/c3431.anibnd.dcx',
-    '/chr/c3431.chrbnd.dcx',
-    '/chr/c3440.anibnd.dcx',
-    '/chr/c3440.chrbnd.dcx',
-    '/chr/c3440.chrtpfbdt',
-    '/chr/c3450.anibnd.dcx',
-    '/chr/c3450.chrbnd.dcx',
-    '/chr/c3450.chrtpfbdt',
-    '/chr/c3451.anibnd.dcx',
-    '/chr/c3451.chrbnd.dcx',
-    '/chr/c3460.anibnd.dcx',
-    '/chr/c3460.chrbnd.dcx',
-    '/chr/c3461.anibnd.dcx',
-    '/chr/c3461.chrbnd.dcx',
-    '/chr/c3469.chrbnd.dcx',
-    '/chr/c3470.anibnd.dcx',
-    '/chr/c3470.chrbnd.dcx',
-    '/chr/c3470.chrtpfbdt',
-    '/chr/c3471.anibnd.dcx',
-    '/chr/c3471.chrbnd.dcx',
-    '/chr/c3472.anibnd.dcx',
-    '/chr/c3472.chrbnd.dcx',
-    '/chr/c3480.anibnd.dcx',
-    '/chr/c3480.chrbnd.dcx',
-    '/chr/c3490.anibnd.dcx',
-    '/chr/c3490.chrbnd.dcx',
-    '/chr/c3491.anibnd.dcx',
-    '/chr/c3491.chrbnd.dcx',
-    '/chr/c3499.chrbnd.dcx',
-    '/chr/c3500.anibnd.dcx',
-    '/chr/c3500.chrbnd.dcx',
-    '/chr/c3501.anibnd.dcx',
-    '/chr/c3501.chrbnd.dcx',
-    '/chr/c3510.anibnd.dcx',
-    '/chr/c3510.chrbnd.dcx',
-    '/chr/c3510.chrtpfbdt',
-    '/chr/c3511.anibnd.dcx',
-    '/chr/c3511.chrbnd.dcx',
-    '/chr/c3520.anibnd.dcx',
-    '/chr/c3520.chrbnd.dcx',
-    '/chr/c3530.anibnd.dcx',
-    '/chr/c3530.chrbnd.dcx',
-    '/chr/c3530.chrtpfbdt',
-    '/chr/c3530_c3530.anibnd.dcx',
-    '/chr/c3531.anibnd.dcx',
-    '/chr/c3531.chrbnd.dcx',
-    '/chr/c4090.anibnd.dcx',
-    '/chr/c4090.chrbnd.dcx',
-    '/chr/c4091.anibnd.dcx',
-    '/chr/c4091.chrbnd.dcx',
-    '/chr/c4095.chrbnd.dcx',
-    '/chr/c4099.chrbnd.dcx',
-    '/chr/c4100.anibnd.dcx',
-    '/chr/c4100.chrbnd.dcx',
-    '/chr/c4100.chrtpfbdt',
-    '/chr/c4110.anibnd.dcx',
-    '/chr/c4110.chrbnd.dcx',
-    '/chr/c4110.chrtpfbdt',
-    '/chr/c4115.chrbnd.dcx',
-    '/chr/c4119.chrbnd.dcx',
-    '/chr/c4119.chrtpfbdt',
-    '/chr/c4120.anibnd.dcx',
-    '/chr/c4120.chrbnd.dcx',
-    '/chr/c4130.anibnd.dcx',
-    '/chr/c4130.chrbnd.dcx',
-    '/chr/c4140.anibnd.dcx',
-    '/chr/c4140.chrbnd.dcx',
-    '/chr/c4145.chrbnd.dcx',
-    '/chr/c4149.chrbnd.dcx',
-    '/chr/c4150.anibnd.dcx',
-    '/chr/c4150.chrbnd.dcx',
-    '/chr/c4160.anibnd.dcx',
-    '/chr/c4160.chrbnd.dcx',
-    '/chr/c4170.anibnd.dcx',
-    '/chr/c4170.chrbnd.dcx',
-    '/chr/c4171.anibnd.dcx',
-    '/chr/c4171.chrbnd.dcx',
-    '/chr/c4172.anibnd.dcx',
-    '/chr/c4172.chrbnd.dcx',
-    '/chr/c4180.anibnd.dcx',
-    '/chr/c4180.chrbnd.dcx',
-    '/chr/c4190.anibnd.dcx',
-    '/chr/c4190.chrbnd.dcx',
-    '/chr/c4500.anibnd.dcx',
-    '/chr/c4500.chrbnd.dcx',
-    '/chr/c4500.chrtpfbdt',
-    '/chr/c4510.anibnd.dcx',
-    '/chr/c4510.chrbnd.dcx',
-    '/chr/c4510.chrtpfbdt',
-    '/chr/c4510_c4510.anibnd.dcx',
-    '/chr/c4511.anibnd.dcx',
-    '/chr/c4511.chrbnd.dcx',
-    '/chr/c4520.anibnd.dcx',
-    '/chr/c4520.chrbnd.dcx',
-    '/chr/c4530.chrbnd.dcx',
-    '/chr/c4531.anibnd.dcx',
-    '/chr/c4531.chrbnd.dcx',
-    '/chr/c5200.anibnd.dcx',
-    '/chr/c5200.chrbnd.dcx',
-    '/chr/c5200.chrtpfbdt',
-    '/chr/c5201.anibnd.dcx',
-    '/chr/c5201.chrbnd.dcx',
-    '/chr/c5202.anibnd.dcx',
-    '/chr/c5202.chrbnd.dcx',
-    '/chr/c5210.anibnd.dcx',
-    '/chr/c5210.chrbnd.dcx',
-    '/chr/c5210.chrtpfbdt',
-    '/chr/c5220.anibnd.dcx',
-    '/chr/c5220.chrbnd.dcx',
-    '/chr/c5220.chrtpfbdt',
-    '/chr/c5230.anibnd.dcx',
-    '/chr/c5230.chrbnd.dcx',
-    '/chr/c5230.chrtpfbdt',
-    '/chr/c5231.anibnd.dcx',
-    '/chr/c5231.chrbnd.dcx',
-    '/chr/c5231.chrtpfbdt',
-    '/chr/c5240.anibnd.dcx',
-    '/chr/c5240.chrbnd.dcx',
-    '/chr/c5240.chrtpfbdt',
-    '/chr/c5250.anibnd.dcx',
-    '/chr/c5250.chrbnd.dcx',
-    '/chr/c5250.chrtpfbdt',
-    '/chr/c5250_c5250.anibnd.dcx',
-    '/chr/c5260.anibnd.dcx',
-    '/chr/c5260.chrbnd.dcx',
-    '/chr/c5260.chrtpfbdt',
-    '/chr/c5261.anibnd.dcx',
-    '/chr/c5261.chrbnd.dcx',
-    '/chr/c5270.anibnd.dcx',
-    '/chr/c5270.chrbnd.dcx',
-    '/chr/c5271.anibnd.dcx',
-    '/chr/c5271.chrbnd.dcx',
-    '/chr/c5271.chrtpfbdt',
-    '/chr/c5280.anibnd.dcx',
-    '/chr/c5280.chrbnd.dcx',
-    '/chr/c5280.chrtpfbdt',
-    '/chr/c5290.anibnd.dcx',
-    '/chr/c5290.chrbnd.dcx',
-    '/chr/c5290.chrtpfbdt',
-    '/chr/c5291.anibnd.dcx',
-    '/chr/c5291.chrbnd.dcx',
-    '/chr/c5300.anibnd.dcx',
-    '/chr/c5300.chrbnd.dcx',
-    '/chr/c5310.anibnd.dcx',
-    '/chr/c5310.chrbnd.dcx',
-    '/chr/c5310.chrtpfbdt',
-    '/chr/c5320.anibnd.dcx',
-    '/chr/c5320.chrbnd.dcx',
-    '/chr/c5320.chrtpfbdt',
-    '/chr/c5330.anibnd.dcx',
-    '/chr/c5330.chrbnd.dcx',
-    '/chr/c5340.anibnd.dcx',
-    '/chr/c5340.chrbnd.dcx',
-    '/chr/c5340.chrtpfbdt',
-    '/chr/c5350.anibnd.dcx',
-    '/chr/c5350.chrbnd.dcx',
-    '/chr/c5350.chrtpfbdt',
-    '/chr/c5351.anibnd.dcx',
-    '/chr/c5351.chrbnd.dcx',
-    '/chr/c5352.anibnd.dcx',
-    '/chr/c5352.chrbnd.dcx',
-    '/chr/c5353.anibnd.dcx',
-    '/chr/c5353.chrbnd.dcx',
-    '/chr/c5360.anibnd.dcx',
-    '/chr/c5360.chrbnd.dcx',
-    '/chr/c5360.chrtpfbdt',
-    '/chr/c5361.anibnd.dcx',
-    '/chr/c5361.chrbnd.dcx',
-    '/chr/c5362.chrbnd.dcx',
-    '/chr/c5369.chrbnd.dcx',
-    '/chr/c5370.anibnd.dcx',
-    '/chr/c5370.chrbnd.dcx',
-    '/chr/c5370.chrtpfbdt',
-    '/chr/c5390.anibnd.dcx',
-    '/chr/c5390.chrbnd.dcx',
-    '/chr/c5390.chrtpfbdt',
-    '/chr/c5400.anibnd.dcx',
-    '/chr/c5400.chrbnd.dcx',
-    '/chr/c5400.chrtpfbdt',
-    '/chr/c5401.anibnd.dcx',
-    '/chr/c5401.chrbnd.dcx',
-    '/chr/enemyCommon.esd.dcx',
-    '/chr/m10.chresdbnd.dcx',
-    '/chr/m11.chresdbnd.dcx',
-    '/chr/m12.chresdbnd.dcx',
-    '/chr/m13.chresdbnd.dcx',
-    '/chr/m14.chresdbnd.dcx',
-    '/chr/m15.chresdbnd.dcx',
-    '/chr/m16.chresdbnd.dcx',
-    '/chr/m17.chresdbnd.dcx',
-    '/chr/m18.chresdbnd.dcx',
-    '/chr/m99.chresdbnd.dcx',
-    '/event/common.emedf.dcx',
-    '/event/common.emeld.dcx',
-    '/event/common.emevd.dcx',
-    '/event/common.evd.dcx',
-    '/event/ev6302.nfd',
-    '/event/m10.emeld.dcx',
-    '/event/m10.emevd.dcx',
-    '/event/m10_00_00_00.emeld.dcx',
-    '/event/m10_00_00_00.emevd.dcx',
-    '/event/m10_01_00_00.emeld.dcx',
-    '/event/m10_01_00_00.emevd.dcx',
-    '/event/m10_02_00_00.emeld.dcx',
-    '/event/m10_02_00_00.emevd.dcx',
-    '/event/m11.emeld.dcx',
-    '/event/m11.emevd.dcx',
-    '/event/m11_00_00_00.emeld.dcx',
-    '/event/m11_00_00_00.emevd.dcx',
-    '/event/m12.emeld.dcx',
-    '/event/m12.emevd.dcx',
-    '/event/m12_00_00_00.emeld.dcx',
-    '/event/m12_00_00_00.emevd.dcx',
-    '/event/m12_01_00_00.emeld.dcx',
-    '/event/m12_01_00_00.emevd.dcx',
-    '/event/m13.emeld.dcx',
-    '/event/m13.emevd.dcx',
-    '/event/m13_00_00_00.emeld.dcx',
-    '/event/m13_00_00_00.emevd.dcx',
-    '/event/m13_01_00_00.emeld.dcx',
-    '/event/m13_01_00_00.emevd.dcx',
-    '/event/m13_02_00_00.emeld.dcx',
-    '/event/m13_02_00_00.emevd.dcx',
-    '/event/m14.emeld.dcx',
-    '/event/m14.emevd.dcx',
-    '/event/m14_00_00_00.emeld.dcx',
-    '/event/m14_00_00_00.emevd.dcx',
-    '/event/m14_01_00_00.emeld.dcx',
-    '/event/m14_01_00_00.emevd.dcx',
-    '/event/m15.emeld.dcx',
-    '/event/m15.emevd.dcx',
-    '/event/m15_00_00_00.emeld.dcx',
-    '/event/m15_00_00_00.emevd.dcx',
-    '/event/m15_01_00_00.emeld.dcx',
-    '/event/m15_01_00_00.emevd.dcx',
-    '/event/m16.emeld.dcx',
-    '/event/m16.emevd.dcx',
-    '/event/m16_00_00_00.emeld.dcx',
-    '/event/m16_00_00_00.emevd.dcx',
-    '/event/m17.emeld.dcx',
-    '/event/m17.emevd.dcx',
-    '/event/m17_00_00_00.emeld.dcx',
-    '/event/m17_00_00_00.emevd.dcx',
-    '/event/m18.emeld.dcx',
-    '/event/m18.emevd.dcx',
-    '/event/m18_00_00_00.emeld.dcx',
-    '/event/m18_00_00_00.emevd.dcx',
-    '/event/m18_01_00_00.emeld.dcx',
-    '/event/m18_01_00_00.emevd.dcx',
-    '/map/breakobj/m10_00_00_00.breakobj',
-    '/map/breakobj/m10_01_00_00.breakobj',
-    '/map/breakobj/m10_02_00_00.breakobj',
-    '/map/breakobj/m11_00_00_00.breakobj',
-    '/map/breakobj/m12_00_00_00.breakobj',
-    '/map/breakobj/m12_00_00_01.breakobj',
-    '/map/breakobj/m12_01_00_00.breakobj',
-    '/map/breakobj/m13_00_00_00.breakobj',
-    '/map/breakobj/m13_01_00_00.breakobj',
-    '/map/breakobj/m13_02_00_00.breakobj',
-    '/map/breakobj/m14_00_00_00.breakobj',
-    '/map/breakobj/m14_01_00_00.breakobj',
-    '/map/breakobj/m15_00_00_00.breakobj',
-    '/map/breakobj/m15_01_00_00.breakobj',
-    '/map/breakobj/m16_00_00_00.breakobj',
-    '/map/breakobj/m17_00_00_00.breakobj',
-    '/map/breakobj/m18_00_00_00.breakobj',
-    '/map/breakobj/m18_01_00_00.breakobj',
-    '/map/m10/GI_Env_m10.tpfbdt',
-    '/map/m10/GI_Env_m10.tpfbhd',
-    '/map/m10/m10_0000.tpfbdt',
-    '/map/m10/m10_0000.tpfbhd',
-    '/map/m10/m10_0001.tpfbdt',
-    '/map/m10/m10_0001.tpfbhd',
-    '/map/m10/m10_0002.tpfbdt',
-    '/map/m10/m10_0002.tpfbhd',
-    '/map/m10/m10_0003.tpfbdt',
-    '/map/m10/m10_0003.tpfbhd',
-    '/map/m10/m10_9999.tpf.dcx',
-    '/map/m10_00_00_00/h10_00_00_00.hkxbdt',
-    '/map/m10_00_00_00/h10_00_00_00.hkxbhd',
-    '/map/m10_00_00_00/l10_00_00_00.hkxbdt',
-    '/map/m10_00_00_00/l10_00_00_00.hkxbhd',
-    '/map/m10_00_00_00/m10_00_00_00.mcg',
-    '/map/m10_00_00_00/m10_00_00_00.mcp',
-    '/map/m10_00_00_00/m10_00_00_00.nvmbnd.dcx',
-    '/map/m10_00_00_00/m2080B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2090B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2100B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2110B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2120B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2121B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2122B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2130B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2131B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2140B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2141B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2200B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2201B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2202B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2210B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2220B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2230B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2240B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2250B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2260B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2280B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2300B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2310B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2320B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2330B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2331B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2340B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2350B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2360B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2370B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2380B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2390B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2400B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2410B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2500B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2510B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2520B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2521B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2530B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2540B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2541B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2700B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2710B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2720B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2721B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2730B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2740B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2750B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2760B0A10.flver.dcx',
-    '/map/m10_00_00_00/m2770B0A10.flver.dcx',
-    '/map/m10_00_00_00/m3000B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5000B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5001B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5002B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5200B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5210B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5220B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5230B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5240B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5250B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5260B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5280B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5310B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5330B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5340B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5350B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5360B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5370B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5380B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5390B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5400B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5410B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5520B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5521B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5530B0A10.flver.dcx',
-    '/map/m10_00_00_00/m5540B0A10.flver.dcx',
-    '/map/m10_00_00_00/m9000B0A10.flver.dcx',
-    '/map/m10_01_00_00/h10_01_00_00.hkxbdt',
-    '/map/m10_01_00_00/h10_01_00_00.hkxbhd',
-    '/map/m10_01_00_00/l10_01_00_00.hkxbdt',
-    '/map/m10_01_00_00/l10_01_00_00.hkxbhd',
-    '/map/m10_01_00_00/m10_01_00_00.mcg',
-    '/map/m10_01_00_00/m10_01_00_00.mcp',
-    '/map/m10_01_00_00/m10_01_00_00.nvmbnd.dcx',
-    '/map/m10_01_00_00/m0000B1A10.flver.dcx',
-    '/map/m10_01_00_00/m1000B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2000B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2001B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2010B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2011B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2012B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2013B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2020B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2021B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2030B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2031B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2040B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2041B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2050B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2060B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2061B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2062B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2063B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2070B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2080B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2090B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2100B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2105B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2110B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2120B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2121B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2130B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2140B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2150B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2200B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2201B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2210B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2220B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2225B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2230B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2231B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2232B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2235B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2240B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2250B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2251B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2252B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2260B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2270B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2280B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2290B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2300B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2310B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2320B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2321B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2322B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2330B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2331B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2332B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2333B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2334B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2335B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2336B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2337B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2338B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2339B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2340B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2341B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2342B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2343B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2344B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2345B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2346B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2347B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2348B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2350B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2360B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2370B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2371B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2372B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2380B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2390B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2400B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2410B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2420B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2430B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2500B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2510B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2520B1A10.flver.dcx',
-    '/map/m10_01_00_00/m2521B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3000B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3001B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3002B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3003B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3004B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3005B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3010B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3020B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3030B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3100B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3105B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3110B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3111B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3120B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3121B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3125B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3130B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3135B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3136B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3140B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3150B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3155B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3156B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3160B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3170B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3180B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3190B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3200B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3205B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3210B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3220B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3221B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3222B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3223B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3224B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3300B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3301B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3310B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3320B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3325B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3330B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3340B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3350B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3360B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3370B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3380B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3400B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3500B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3510B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3520B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3530B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3600B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3601B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3602B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3603B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3604B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3605B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3606B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3607B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3608B1A10.flver.dcx',
-    '/map/m10_01_00_00/m3700B1A10.flver.dcx',
-    '/map/m10_01_00_00/m8000B1A10.flver.dcx',
-    '/map/m10_01_00_00/m8010B1A10.flver.dcx',
-    '/map/m10_01_00_00/m9000B1A10.flver.dcx',
-    '/map/m10_02_00_00/h10_02_00_00.hkxbdt',
-    '/map/m10_02_00_00/h10_02_00_00.hkxbhd',
-    '/map/m10_02_00_00/l10_02_00_00.hkxbdt',
-    '/map/m10_02_00_00/l10_02_00_00.hkxbhd',
-    '/map/m10_02_00_00/m0000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m0030B2A10.flver.dcx',
-    '/map/m10_02_00_00/m0100B2A10.flver.dcx',
-    '/map/m10_02_00_00/m0101B2A10.flver.dcx',
-    '/map/m10_02_00_00/m10_02_00_00.mcg',
-    '/map/m10_02_00_00/m10_02_00_00.mcp',
-    '/map/m10_02_00_00/m10_02_00_00.nvmbnd.dcx',
-    '/map/m10_02_00_00/m2000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2001B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2002B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2010B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2020B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2021B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2022B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2023B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2030B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2040B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2110B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2120B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2130B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2200B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2210B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2300B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2301B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2310B2A10.flver.dcx',
-    '/map/m10_02_00_00/m2901B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4001B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4002B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4010B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4011B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4012B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4013B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4100B2A10.flver.dcx',
-    '/map/m10_02_00_00/m4110B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5001B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5002B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5003B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5004B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5005B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5006B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5007B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5008B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5009B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5010B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5011B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5012B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5013B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5014B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5015B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5016B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5017B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5018B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5019B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5020B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5030B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5040B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5050B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5060B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5061B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5062B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5063B2A10.flver.dcx',
-    '/map/m10_02_00_00/m5064B2A10.flver.dcx',
-    '/map/m10_02_00_00/m6000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m6100B2A10.flver.dcx',
-    '/map/m10_02_00_00/m7000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m7010B2A10.flver.dcx',
-    '/map/m10_02_00_00/m7011B2A10.flver.dcx',
-    '/map/m10_02_00_00/m8000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m8100B2A10.flver.dcx',
-    '/map/m10_02_00_00/m8101B2A10.flver.dcx',
-    '/map/m10_02_00_00/m8200B2A10.flver.dcx',
-    '/map/m10_02_00_00/m8500B2A10.flver.dcx',
-    '/map/m10_02_00_00/m9000B2A10.flver.dcx',
-    '/map/m10_02_00_00/m9001B2A10.flver.dcx',
-    '/map/m11/GI_Env_m11.tpfbdt',
-    '/map/m11/GI_Env_m11.tpfbhd',
-    '/map/m11/m11_0000.tpfbdt',
-    '/map/m11/m11_0000.tpfbhd',
-    '/map/m11/m11_0001.tpfbdt',
-    '/map/m11/m11_0001.tpfbhd',
-    '/map/m11/m11_0002.tpfbdt',
-    '/map/m11/m11_0002.tpfbhd',
-    '/map/m11/m11_0003.tpfbdt',
-    '/map/m11/m11_0003.tpfbhd',
-    '/map/m11/m11_9999.tpf.dcx',
-    '/map/m11_00_00_00/h11_00_00_00.hkxbdt',
-    '/map/m11_00_00_00/h11_00_00_00.hkxbhd',
-    '/map/m11_00_00_00/l11_00_00_00.hkxbdt',
-    '/map/m11_00_00_00/l11_00_00_00.hkxbhd',
-    '/map/m11_00_00_00/m0000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m0999B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1001B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1002B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1010B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1011B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1020B0A11.flver.dcx',
-    '/map/m11_00_00_00/m1030B0A11.flver.dcx',
-    '/map/m11_00_00_00/m11_00_00_00.mcg',
-    '/map/m11_00_00_00/m11_00_00_00.mcp',
-    '/map/m11_00_00_00/m11_00_00_00.nvmbnd.dcx',
-    '/map/m11_00_00_00/m2000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2001B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2002B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2005B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2010B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2011B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2012B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2020B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2021B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2022B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2023B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2030B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2031B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2040B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2050B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2051B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2052B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2055B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2056B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2060B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2061B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2062B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2070B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2071B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2080B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2081B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2100B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2101B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2102B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2200B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2201B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2202B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2203B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2210B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2220B0A11.flver.dcx',
-    '/map/m11_00_00_00/m2230B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3005B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3010B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3011B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3020B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3030B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3040B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3050B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3055B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3060B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3061B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3062B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3070B0A11.flver.dcx',
-    '/map/m11_00_00_00/m3071B0A11.flver.dcx',
-    '/map/m11_00_00_00/m4000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m4010B0A11.flver.dcx',
-    '/map/m11_00_00_00/m4020B0A11.flver.dcx',
-    '/map/m11_00_00_00/m4070B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5010B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5020B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5021B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5100B0A11.flver.dcx',
-    '/map/m11_00_00_00/m5150B0A11.flver.dcx',
-    '/map/m11_00_00_00/m9000B0A11.flver.dcx',
-    '/map/m11_00_00_00/m9001B0A11.flver.dcx',
-    '/map/m12/GI_Env_m12.tpfbdt',
-    '/map/m12/GI_Env_m12.tpfbhd',
-    '/map/m12/m12_0000.tpfbdt',
-    '/map/m12/m12_0000.tpfbhd',
-    '/map/m12/m12_0001.tpfbdt',
-    '/map/m12/m12_0001.tpfbhd',
-    '/map/m12/m12_0002.tpfbdt',
-    '/map/m12/m12_0002.tpfbhd',
-    '/map/m12/m12_0003.tpfbdt',
-    '/map/m12/m12_0003.tpfbhd',
-    '/map/m12/m12_9999.tpf.dcx',
-    '/map/m12_00_00_00/h12_00_00_00.hkxbdt',
-    '/map/m12_00_00_00/h12_00_00_00.hkxbhd',
-    '/map/m12_00_00_00/l12_00_00_00.hkxbdt',
-    '/map/m12_00_00_00/l12_00_00_00.hkxbhd',
-    '/map/m12_00_00_00/m12_00_00_00.mcg',
-    '/map/m12_00_00_00/m12_00_00_00.mcp',
-    '/map/m12_00_00_00/m12_00_00_00.nvmbnd.dcx',
-    '/map/m12_00_00_00/m1330B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1340B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1350B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1360B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1400B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1410B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1500B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1501B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1502B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1510B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1520B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1530B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1540B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1550B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1560B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1570B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1571B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1572B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1590B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1600B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1610B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1620B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1621B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1622B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1623B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1624B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1625B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1626B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1630B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1631B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1632B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1633B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1634B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1635B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1636B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1640B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1641B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1710B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1720B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1730B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1740B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1750B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1760B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1770B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1780B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1790B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1800B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1810B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1820B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1830B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1850B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1860B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1910B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1920B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1930B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1940B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1950B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1960B0A12.flver.dcx',
-    '/map/m12_00_00_00/m1970B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2000B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2040B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2041B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2042B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2050B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2055B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2060B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2061B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2062B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2070B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2080B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2090B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2100B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2105B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2110B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2111B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2112B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2113B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2114B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2115B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2570B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2571B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2572B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2610B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2611B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2620B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2621B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2622B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2623B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2624B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2630B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2631B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2632B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2633B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2634B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2635B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2639B0A12.flver.dcx',
-    '/map/m12_00_00_00/m2640B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3001B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3002B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3003B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3004B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3005B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3006B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3007B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3008B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3009B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3010B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3011B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3012B0A12.flver.dcx',
-    '/map/m12_00_00_00/m3013B0A12.flver.dcx',
-    '/map/m12_00_00_00/m8000B0A12.flver.dcx',
-    '/map/m12_00_00_00/m9000B0A12.flver.dcx',
-    '/map/m12_00_00_00/m9010B0A12.flver.dcx',
-    '/map/m12_00_00_00/m9020B0A12.flver.dcx',
-    '/map/m12_00_00_00/m9030B0A12.flver.dcx',
-    '/map/m12_00_00_01/m12_00_00_01.mcg',
-    '/map/m12_00_00_01/m12_00_00_01.mcp',
-    '/map/m12_00_00_01/m12_00_00_01.nvmbnd.dcx',
-    '/map/m12_01_00_00/h12_01_00_00.hkxbdt',
-    '/map/m12_01_00_00/h12_01_00_00.hkxbhd',
-    '/map/m12_01_00_00/l12_01_00_00.hkxbdt',
-    '/map/m12_01_00_00/l12_01_00_00.hkxbhd',
-    '/map/m12_01_00_00/m12_01_00_00.mcg',
-    '/map/m12_01_00_00/m12_01_00_00.mcp',
-    '/map/m12_01_00_00/m12_01_00_00.nvmbnd.dcx',
-    '/map/m12_01_00_00/m1340B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1400B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1410B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1540B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1621B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1622B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1623B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1624B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1625B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1626B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1629B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1630B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1631B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1632B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1633B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1634B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1635B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1636B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1640B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1641B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1730B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1740B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1750B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1760B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1770B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1780B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1790B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1800B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1810B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1820B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1830B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1850B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1860B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1930B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1940B1A12.flver.dcx',
-    '/map/m12_01_00_00/m1950B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2080B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2090B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2100B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2105B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2106B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2107B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2110B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2111B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2112B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2113B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2114B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2115B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2120B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2121B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2122B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2123B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2124B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2125B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2620B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2621B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2622B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2623B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2624B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2630B0A12.flver.dcx',
-    '/map/m12_01_00_00/m2630B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2631B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2632B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2633B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2634B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2635B1A12.flver.dcx',
-    '/map/m12_01_00_00/m2640B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3001B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3002B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3003B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3004B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3005B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3006B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3007B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3008B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3009B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3010B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3011B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3012B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3013B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3014B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3015B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3016B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3500B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3600B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3610B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3620B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3630B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3640B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3650B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3660B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3670B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3680B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3690B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3700B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3710B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3720B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3730B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3740B1A12.flver.dcx',
-    '/map/m12_01_00_00/m3750B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4000B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4001B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4010B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4100B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4101B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4110B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4120B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4121B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4130B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4140B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4150B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4160B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4300B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4301B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4302B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4303B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4304B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4310B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4311B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4312B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4313B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4314B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4500B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4510B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4520B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4530B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4540B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4550B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4560B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4570B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4580B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4600B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4610B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4620B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4630B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4640B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4650B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4660B1A12.flver.dcx',
-    '/map/m12_01_00_00/m4700B1A12.flver.dcx',
-    '/map/m12_01_00_00/m8000B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9000B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9001B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9010B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9020B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9030B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9040B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9041B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9050B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9060B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9070B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9080B1A12.flver.dcx',
-    '/map/m12_01_00_00/m9090B1A12.flver.dcx',
-    '/map/m13/GI_Env_m13.tpfbdt',
-    '/map/m13/GI_Env_m13.tpfbhd',
-    '/map/m13/m13_0000.tpfbdt',
-    '/map/m13/m13_0000.tpfbhd',
-    '/map/m13/m13_0001.tpfbdt',
-    '/map/m13/m13_0001.tpfbhd',
-    '/map/m13/m13_0002.tpfbdt',
-    '/map/m13/m13_0002.tpfbhd',
-    '/map/m13/m13_0003.tpfbdt',
-    '/map/m13/m13_0003.tpfbhd',
-    '/map/m13/m13_9999.tpf.dcx',
-    '/map/m13_00_00_00/h13_00_00_00.hkxbdt',
-    '/map/m13_00_00_00/h13_00_00_00.hkxbhd',
-    '/map/m13_00_00_00/l13_00_00_00.hkxbdt',
-    '/map/m13_00_00_00/l13_00_00_00.hkxbhd',
-    '/map/m13_00_00_00/m0000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0080B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0090B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0100B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0101B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0102B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0103B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0110B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0115B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0120B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0125B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0130B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0140B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0150B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0160B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0170B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0180B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0190B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0200B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0500B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0510B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0520B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0530B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0531B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0540B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0550B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0551B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0560B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0570B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0580B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0581B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0590B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0591B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0600B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0601B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0610B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0611B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0620B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0621B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0630B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0640B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0641B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0650B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0651B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0660B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0661B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0670B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0680B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0681B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0690B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0691B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0700B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0701B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0710B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0711B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0715B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0720B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0721B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0725B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0730B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0731B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0735B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0740B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0750B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0760B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0770B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0771B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0780B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0781B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0790B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0791B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0800B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0801B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0810B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0811B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0812B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0813B0A13.flver.dcx',
-    '/map/m13_00_00_00/m0820B0A13.flver.dcx',
-    '/map/m13_00_00_00/m1000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m1100B0A13.flver.dcx',
-    '/map/m13_00_00_00/m13_00_00_00.mcg',
-    '/map/m13_00_00_00/m13_00_00_00.mcp',
-    '/map/m13_00_00_00/m13_00_00_00.nvmbnd.dcx',
-    '/map/m13_00_00_00/m1500B0A13.flver.dcx',
-    '/map/m13_00_00_00/m1600B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2001B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2010B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2011B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2020B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2021B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2100B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2200B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2201B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2202B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2203B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2300B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2301B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2400B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2401B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2500B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2501B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2502B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2503B0A13.flver.dcx',
-    '/map/m13_00_00_00/m2600B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3001B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3010B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3011B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3012B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3013B0A13.flver.dcx',
-    '/map/m13_00_00_00/m3020B0A13.flver.dcx',
-    '/map/m13_00_00_00/m8000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m9000B0A13.flver.dcx',
-    '/map/m13_00_00_00/m9800B0A13.flver.dcx',
-    '/map/m13_00_00_00/m9900B0A13.flver.dcx',
-    '/map/m13_01_00_00/h13_01_00_00.hkxbdt',
-    '/map/m13_01_00_00/h13_01_00_00.hkxbhd',
-    '/map/m13_01_00_00/l13_01_00_00.hkxbdt',
-    '/map/m13_01_00_00/l13_01_00_00.hkxbhd',
-    '/map/m13_01_00_00/m0000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0001B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0002B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0010B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0020B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0030B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0040B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0050B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0060B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0061B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0062B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0063B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0065B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0066B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0067B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0068B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0069B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0070B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0075B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0080B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0081B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0085B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0086B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0087B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0090B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0100B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0110B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0120B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0130B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0140B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0145B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0150B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0155B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0160B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0170B1A13.flver.dcx',
-    '/map/m13_01_00_00/m0200B1A13.flver.dcx',
-    '/map/m13_01_00_00/m1000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m13_01_00_00.mcg',
-    '/map/m13_01_00_00/m13_01_00_00.mcp',
-    '/map/m13_01_00_00/m13_01_00_00.nvmbnd.dcx',
-    '/map/m13_01_00_00/m2000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m2100B1A13.flver.dcx',
-    '/map/m13_01_00_00/m2200B1A13.flver.dcx',
-    '/map/m13_01_00_00/m3000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4010B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4020B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4030B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4040B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4050B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4060B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4070B1A13.flver.dcx',
-    '/map/m13_01_00_00/m4080B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5001B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5002B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5003B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5004B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5005B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5006B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5007B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5008B1A13.flver.dcx',
-    '/map/m13_01_00_00/m5009B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6000B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6001B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6100B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6101B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6700B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6701B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6702B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6703B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6704B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6705B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6706B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6707B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6800B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6801B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6802B1A13.flver.dcx',
-    '/map/m13_01_00_00/m6900B1A13.flver.dcx',
-    '/map/m13_01_00_00/m9900B1A13.flver.dcx',
-    '/map/m13_02_00_00/h13_02_00_00.hkxbdt',
-    '/map/m13_02_00_00/h13_02_00_00.hkxbhd',
-    '/map/m13_02_00_00/l13_02_00_00.hkxbdt',
-    '/map/m13_02_00_00/l13_02_00_00.hkxbhd',
-    '/map/m13_02_00_00/m0030B1A13.flver.dcx',
-    '/map/m13_02_00_00/m0030B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0050B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0070B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0075B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0080B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0081B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0082B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0083B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0085B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0086B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0087B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0090B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0100B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0105B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0110B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0120B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0130B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0140B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0141B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0145B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0150B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0151B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0155B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0160B2A13.flver.dcx',
-    '/map/m13_02_00_00/m0170B2A13.flver.dcx',
-    '/map/m13_02_00_00/m1000B2A13.flver.dcx',
-    '/map/m13_02_00_00/m1100B2A13.flver.dcx',
-    '/map/m13_02_00_00/m1200B2A13.flver.dcx',
-    '/map/m13_02_00_00/m13_02_00_00.mcg',
-    '/map/m13_02_00_00/m13_02_00_00.mcp',
-    '/map/m13_02_00_00/m13_02_00_00.nvmbnd.dcx',
-    '/map/m13_02_00_00/m1300B2A13.flver.dcx',
-    '/map/m13_02_00_00/m2000B2A13.flver.dcx',
-    '/map/m13_02_00_00/m3000B2A13.flver.dcx',
-    '/map/m13_02_00_00/m3500B2A13.flver.dcx',
-    '/map/m13_02_00_00/m3510B2A13.flver.dcx',
-    '/map/m13_02_00_00/m3520B2A13.flver.dcx',
-    '/map/m13_02_00_00/m3530B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4000B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4100B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4110B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4200B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4210B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4300B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4310B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4320B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4330B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4340B2A13.flver.dcx',
-    '/map/m13_02_00_00/m4350B2A13.flver.dcx',
-    '/map/m13_02_00_00/m9900B2A13.flver.dcx',
-    '/map/m14/GI_Env_m14.tpfbdt',
-    '/map/m14/GI_Env_m14.tpfbhd',
-    '/map/m14/m14_0000.tpfbdt',
-    '/map/m14/m14_0000.tpfbhd',
-    '/map/m14/m14_0001.tpfbdt',
-    '/map/m14/m14_0001.tpfbhd',
-    '/map/m14/m14_0002.tpfbdt',
-    '/map/m14/m14_0002.tpfbhd',
-    '/map/m14/m14_0003.tpfbdt',
-    '/map/m14/m14_0003.tpfbhd',
-    '/map/m14/m14_9999.tpf.dcx',
-    '/map/m14_00_00_00/h14_00_00_00.hkxbdt',
-    '/map/m14_00_00_00/h14_00_00_00.hkxbhd',
-    '/map/m14_00_00_00/l14_00_00_00.hkxbdt',
-    '/map/m14_00_00_00/l14_00_00_00.hkxbhd',
-    '/map/m14_00_00_00/m0000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0010B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0020B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0030B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0040B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0050B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0060B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0070B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0080B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0090B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0100B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0110B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0120B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0130B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0140B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0150B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0160B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0200B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0201B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0202B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0203B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0204B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0205B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0206B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0207B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0208B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0209B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0210B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0211B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0212B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0213B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0214B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0215B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0216B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0217B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0218B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0219B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0220B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0221B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0222B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0223B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0224B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0225B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0226B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0227B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0228B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0300B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0301B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0302B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0303B0A14.flver.dcx',
-    '/map/m14_00_00_00/m0304B0A14.flver.dcx',
-    '/map/m14_00_00_00/m14_00_00_00.mcg',
-    '/map/m14_00_00_00/m14_00_00_00.mcp',
-    '/map/m14_00_00_00/m14_00_00_00.nvmbnd.dcx',
-    '/map/m14_00_00_00/m2000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m2500B0A14.flver.dcx',
-    '/map/m14_00_00_00/m2600B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3100B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3110B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3120B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3130B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3140B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3200B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3201B0A14.flver.dcx',
-    '/map/m14_00_00_00/m3202B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4010B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4020B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4030B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4040B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4050B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4060B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4070B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4080B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4090B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4100B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4110B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4120B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4130B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4140B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4150B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4160B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4170B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4180B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4190B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4200B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4210B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4220B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4230B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4240B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4250B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4260B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4270B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4280B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4290B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4300B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4310B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4320B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4330B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4340B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4400B0A14.flver.dcx',
-    '/map/m14_00_00_00/m4410B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5010B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5020B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5030B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5040B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5050B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5060B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5070B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5080B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5090B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5100B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5110B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5120B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5130B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5140B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5150B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5160B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5170B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5180B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5190B0A14.flver.dcx',
-    '/map/m14_00_00_00/m5200B0A14.flver.dcx',
-    '/map/m14_00_00_00/m6000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m6010B0A14.flver.dcx',
-    '/map/m14_00_00_00/m7000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m9000B0A14.flver.dcx',
-    '/map/m14_00_00_00/m9100B0A14.flver.dcx',
-    '/map/m14_00_00_00/m9200B0A14.flver.dcx',
-    '/map/m14_00_00_00/m9500B0A14.flver.dcx',
-    '/map/m14_00_00_00/m9999B0A14.flver.dcx',
-    '/map/m14_01_00_00/h14_01_00_00.hkxbdt',
-    '/map/m14_01_00_00/h14_01_00_00.hkxbhd',
-    '/map/m14_01_00_00/l14_01_00_00.hkxbdt',
-    '/map/m14_01_00_00/l14_01_00_00.hkxbhd',
-    '/map/m14_01_00_00/m0000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0010B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0020B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0030B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0040B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0050B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0060B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0070B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0080B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0090B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0091B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0100B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0110B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0120B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0130B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0140B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0150B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0160B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0170B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0180B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0190B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0200B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0201B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0210B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0220B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0230B1A14.flver.dcx',
-    '/map/m14_01_00_00/m0231B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1010B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1020B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1030B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1040B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1050B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1060B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1070B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1080B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1090B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1100B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1110B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1120B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1130B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1140B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1150B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1160B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1165B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1166B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1170B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1175B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1180B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1190B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1200B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1300B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1310B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1320B1A14.flver.dcx',
-    '/map/m14_01_00_00/m14_01_00_00.mcg',
-    '/map/m14_01_00_00/m14_01_00_00.mcp',
-    '/map/m14_01_00_00/m14_01_00_00.nvmbnd.dcx',
-    '/map/m14_01_00_00/m1500B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1510B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1520B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1530B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1540B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1550B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1560B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1570B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1580B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1590B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1600B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1610B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1700B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1710B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1720B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1730B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1740B1A14.flver.dcx',
-    '/map/m14_01_00_00/m1750B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2010B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2020B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2030B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2040B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2050B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2060B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2070B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2080B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2090B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2100B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2110B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2120B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2130B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2140B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2150B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2160B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2170B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2180B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2190B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2200B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2210B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2220B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2230B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2240B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2250B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2260B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2261B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2270B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2280B1A14.flver.dcx',
-    '/map/m14_01_00_00/m2290B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3010B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3020B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3030B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3040B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3050B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3060B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3070B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3080B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3090B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3100B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3110B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3120B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3130B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3140B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3150B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3160B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3161B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3162B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3163B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3170B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3180B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3190B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3200B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3210B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3211B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3212B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3220B1A14.flver.dcx',
-    '/map/m14_01_00_00/m3230B1A14.flver.dcx',
-    '/map/m14_01_00_00/m4000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m4010B1A14.flver.dcx',
-    '/map/m14_01_00_00/m4020B1A14.flver.dcx',
-    '/map/m14_01_00_00/m7000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m7100B1A14.flver.dcx',
-    '/map/m14_01_00_00/m7500B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8000B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8001B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8002B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8003B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8004B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8005B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8006B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8007B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8008B1A14.flver.dcx',
-    '/map/m14_01_00_00/m8009B1A14.flver.dcx',
-    '/map/m14_01_00_00/m9700B1A14.flver.dcx',
-    '/map/m15/GI_Env_m15.tpfbdt',
-    '/map/m15/GI_Env_m15.tpfbhd',
-    '/map/m15/m15_0000.tpfbdt',
-    '/map/m15/m15_0000.tpfbhd',
-    '/map/m15/m15_0001.tpfbdt',
-    '/map/m15/m15_0001.tpfbhd',
-    '/map/m15/m15_0002.tpfbdt',
-    '/map/m15/m15_0002.tpfbhd',
-    '/map/m15/m15_0003.tpfbdt',
-    '/map/m15/m15_0003.tpfbhd',
-    '/map/m15/m15_9999.tpf.dcx',
-    '/map/m15_00_00_00/h15_00_00_00.hkxbdt',
-    '/map/m15_00_00_00/h15_00_00_00.hkxbhd',
-    '/map/m15_00_00_00/l15_00_00_00.hkxbdt',
-    '/map/m15_00_00_00/l15_00_00_00.hkxbhd',
-    '/map/m15_00_00_00/m0000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m0100B0A15.flver.dcx',
-    '/map/m15_00_00_00/m0200B0A15.flver.dcx',
-    '/map/m15_00_00_00/m1000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m15_00_00_00.mcg',
-    '/map/m15_00_00_00/m15_00_00_00.mcp',
-    '/map/m15_00_00_00/m15_00_00_00.nvmbnd.dcx',
-    '/map/m15_00_00_00/m1999B0A15.flver.dcx',
-    '/map/m15_00_00_00/m2000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m2010B0A15.flver.dcx',
-    '/map/m15_00_00_00/m2100B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4001B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4010B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4011B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4015B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4020B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4021B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4030B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4035B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4040B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4041B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4045B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4046B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4050B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4051B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4052B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4060B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4061B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4062B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4065B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4070B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4071B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4075B0A15.flver.dcx',
-    '/map/m15_00_00_00/m4100B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5010B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5011B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5020B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5021B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5022B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5023B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5030B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5031B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5032B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5040B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5041B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5050B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5051B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5060B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5061B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5100B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5101B0A15.flver.dcx',
-    '/map/m15_00_00_00/m5500B0A15.flver.dcx',
-    '/map/m15_00_00_00/m6000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m6100B0A15.flver.dcx',
-    '/map/m15_00_00_00/m7000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m8000B0A15.flver.dcx',
-    '/map/m15_00_00_00/m8010B0A15.flver.dcx',
-    '/map/m15_00_00_00/m9000B0A15.flver.dcx',
-    '/map/m15_01_00_00/h15_01_00_00.hkxbdt',
-    '/map/m15_01_00_00/h15_01_00_00.hkxbhd',
-    '/map/m15_01_00_00/l15_01_00_00.hkxbdt',
-    '/map/m15_01_00_00/l15_01_00_00.hkxbhd',
-    '/map/m15_01_00_00/m0000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m0010B1A15.flver.dcx',
-    '/map/m15_01_00_00/m1000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m15_01_00_00.mcg',
-    '/map/m15_01_00_00/m15_01_00_00.mcp',
-    '/map/m15_01_00_00/m15_01_00_00.nvmbnd.dcx',
-    '/map/m15_01_00_00/m2000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2100B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2150B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2200B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2300B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2301B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2310B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2315B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2320B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2325B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2330B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2340B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2341B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2350B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2400B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2500B1A15.flver.dcx',
-    '/map/m15_01_00_00/m2600B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3001B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3050B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3200B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3201B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3202B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3310B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3312B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3313B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3330B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3331B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3340B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3350B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3360B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3370B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3400B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3401B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3410B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3500B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3510B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3511B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3515B1A15.flver.dcx',
-    '/map/m15_01_00_00/m3520B1A15.flver.dcx',
-    '/map/m15_01_00_00/m5000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m6300B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7100B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7101B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7110B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7150B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7160B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7161B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7162B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7163B1A15.flver.dcx',
-    '/map/m15_01_00_00/m7200B1A15.flver.dcx',
-    '/map/m15_01_00_00/m8000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m8001B1A15.flver.dcx',
-    '/map/m15_01_00_00/m8010B1A15.flver.dcx',
-    '/map/m15_01_00_00/m8020B1A15.flver.dcx',
-    '/map/m15_01_00_00/m8030B1A15.flver.dcx',
-    '/map/m15_01_00_00/m9000B1A15.flver.dcx',
-    '/map/m15_01_00_00/m9010B1A15.flver.dcx',
-    '/map/m15_01_00_00/m9500B1A15.flver.dcx',
-    '/map/m16/GI_Env_m16.tpfbdt',
-    '/map/m16/GI_Env_m16.tpfbhd',
-    '/map/m16/m16_0000.tpfbdt',
-    '/map/m16/m16_0000.tpfbhd',
-    '/map/m16/m16_0001.tpfbdt',
-    '/map/m16/m16_0001.tpfbhd',
-    '/map/m16/m16_0002.tpfbdt',
-    '/map/m16/m16_0002.tpfbhd',
-    '/map/m16/m16_0003.tpfbdt',
-    '/map/m16/m16_0003.tpfbhd',
-    '/map/m16/m16_9999.tpf.dcx',
-    '/map/m16_00_00_00/h16_00_00_00.hkxbdt',
-    '/map/m16_00_00_00/h16_00_00_00.hkxbhd',
-    '/map/m16_00_00_00/l16_00_00_00.hkxbdt',
-    '/map/m16_00_00_00/l16_00_00_00.hkxbhd',
-    '/map/m16_00_00_00/m0000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m0100B0A16.flver.dcx',
-    '/map/m16_00_00_00/m0200B0A16.flver.dcx',
-    '/map/m16_00_00_00/m0900B0A16.flver.dcx',
-    '/map/m16_00_00_00/m1000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m1100B0A16.flver.dcx',
-    '/map/m16_00_00_00/m1200B0A16.flver.dcx',
-    '/map/m16_00_00_00/m1201B0A16.flver.dcx',
-    '/map/m16_00_00_00/m1210B0A16.flver.dcx',
-    '/map/m16_00_00_00/m16_00_00_00.mcg',
-    '/map/m16_00_00_00/m16_00_00_00.mcp',
-    '/map/m16_00_00_00/m16_00_00_00.nvmbnd.dcx',
-    '/map/m16_00_00_00/m2000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2050B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2100B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2200B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2300B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2350B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2400B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2500B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2600B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2700B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2750B0A16.flver.dcx',
-    '/map/m16_00_00_00/m2800B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3300B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3500B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3501B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3510B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3511B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3700B0A16.flver.dcx',
-    '/map/m16_00_00_00/m3750B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4001B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4010B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4011B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4012B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4013B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4014B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4015B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4016B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4017B0A16.flver.dcx',
-    '/map/m16_00_00_00/m4018B0A16.flver.dcx',
-    '/map/m16_00_00_00/m5000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m5100B0A16.flver.dcx',
-    '/map/m16_00_00_00/m5110B0A16.flver.dcx',
-    '/map/m16_00_00_00/m6000B2A16.flver.dcx',
-    '/map/m16_00_00_00/m7000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m7010B0A16.flver.dcx',
-    '/map/m16_00_00_00/m8000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m8010B0A16.flver.dcx',
-    '/map/m16_00_00_00/m8500B0A16.flver.dcx',
-    '/map/m16_00_00_00/m8600B0A16.flver.dcx',
-    '/map/m16_00_00_00/m8700B0A16.flver.dcx',
-    '/map/m16_00_00_00/m9000B0A16.flver.dcx',
-    '/map/m16_00_00_00/m9010B0A16.flver.dcx',
-    '/map/m16_00_00_00/m9100B0A16.flver.dcx',
-    '/map/m16_00_00_00/m9200B0A16.flver.dcx',
-    '/map/m17/GI_Env_m17.tpfbdt',
-    '/map/m17/GI_Env_m17.tpfbhd',
-    '/map/m17/m17_0000.tpfbdt',
-    '/map/m17/m17_0000.tpfbhd',
-    '/map/m17/m17_0001.tpfbdt',
-    '/map/m17/m17_0001.tpfbhd',
-    '/map/m17/m17_0002.tpfbdt',
-    '/map/m17/m17_0002.tpfbhd',
-    '/map/m17/m17_0003.tpfbdt',
-    '/map/m17/m17_0003.tpfbhd',
-    '/map/m17/m17_9999.tpf.dcx',
-    '/map/m17_00_00_00/h17_00_00_00.hkxbdt',
-    '/map/m17_00_00_00/h17_00_00_00.hkxbhd',
-    '/map/m17_00_00_00/l17_00_00_00.hkxbdt',
-    '/map/m17_00_00_00/l17_00_00_00.hkxbhd',
-    '/map/m17_00_00_00/m17_00_00_00.mcg',
-    '/map/m17_00_00_00/m17_00_00_00.mcp',
-    '/map/m17_00_00_00/m17_00_00_00.nvmbnd.dcx',
-    '/map/m17_00_00_00/m2000B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2001B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2002B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2003B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2010B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2011B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2012B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2013B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2019B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2020B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2021B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2022B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2023B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2029B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2030B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2031B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2032B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2033B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2034B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2035B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2036B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2037B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2038B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2039B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2040B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2041B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2042B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2043B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2044B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2045B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2050B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2051B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2060B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2061B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2062B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2063B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2070B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2071B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2072B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2090B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2101B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2102B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2103B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2111B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2112B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2113B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2121B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2122B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2123B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2129B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2130B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2131B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2132B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2133B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2134B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2135B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2136B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2137B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2138B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2139B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2140B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2141B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2142B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2143B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2144B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2145B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2190B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2200B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2201B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2202B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2203B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2204B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2205B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2210B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2211B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2212B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2213B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2214B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2215B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2216B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2217B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2220B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2300B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2400B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2404B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2406B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2407B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2408B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2409B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2410B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2420B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2430B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2440B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2480B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2490B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2491B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2495B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2500B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2505B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2510B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2520B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2530B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2540B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2550B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2600B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2610B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2650B0A17.flver.dcx',
-    '/map/m17_00_00_00/m2660B0A17.flver.dcx',
-    '/map/m17_00_00_00/m8000B0A17.flver.dcx',
-    '/map/m17_00_00_00/m8010B0A17.flver.dcx',
-    '/map/m17_00_00_00/m9000B0A17.flver.dcx',
-    '/map/m18/GI_Env_m18.tpfbdt',
-    '/map/m18/GI_Env_m18.tpfbhd',
-    '/map/m18/m18_0000.tpfbdt',
-    '/map/m18/m18_0000.tpfbhd',
-    '/map/m18/m18_0001.tpfbdt',
-    '/map/m18/m18_0001.tpfbhd',
-    '/map/m18/m18_0002.tpfbdt',
-    '/map/m18/m18_0002.tpfbhd',
-    '/map/m18/m18_0003.tpfbdt',
-    '/map/m18/m18_0003.tpfbhd',
-    '/map/m18/m18_9999.tpf.dcx',
-    '/map/m18_00_00_00/h18_00_00_00.hkxbdt',
-    '/map/m18_00_00_00/h18_00_00_00.hkxbhd',
-    '/map/m18_00_00_00/l18_00_00_00.hkxbdt',
-    '/map/m18_00_00_00/l18_00_00_00.hkxbhd',
-    '/map/m18_00_00_00/m0000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m0010B0A18.flver.dcx',
-    '/map/m18_00_00_00/m0100B0A18.flver.dcx',
-    '/map/m18_00_00_00/m1000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m1050B0A18.flver.dcx',
-    '/map/m18_00_00_00/m1100B0A18.flver.dcx',
-    '/map/m18_00_00_00/m18_00_00_00.mcg',
-    '/map/m18_00_00_00/m18_00_00_00.mcp',
-    '/map/m18_00_00_00/m18_00_00_00.nvmbnd.dcx',
-    '/map/m18_00_00_00/m2000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m2100B0A18.flver.dcx',
-    '/map/m18_00_00_00/m3000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m3100B0A18.flver.dcx',
-    '/map/m18_00_00_00/m3200B0A18.flver.dcx',
-    '/map/m18_00_00_00/m3300B0A18.flver.dcx',
-    '/map/m18_00_00_00/m3400B0A18.flver.dcx',
-    '/map/m18_00_00_00/m4000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m5000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m8000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m8100B0A18.flver.dcx',
-    '/map/m18_00_00_00/m8200B0A18.flver.dcx',
-    '/map/m18_00_00_00/m8300B0A18.flver.dcx',
-    '/map/m18_00_00_00/m8310B0A18.flver.dcx',
-    '/map/m18_00_00_00/m9000B0A18.flver.dcx',
-    '/map/m18_00_00_00/m9100B0A18.flver.dcx',
-    '/map/m18_01_00_00/h18_01_00_00.hkxbdt',
-    '/map/m18_01_00_00/h18_01_00_00.hkxbhd',
-    '/map/m18_01_00_00/l18_01_00_00.hkxbdt',
-    '/map/m18_01_00_00/l18_01_00_00.hkxbhd',
-    '/map/m18_01_00_00/m0000B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0001B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0005B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0010B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0015B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0020B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0030B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0035B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0040B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0041B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0045B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0046B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0050B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0060B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0061B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0062B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0070B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0080B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0090B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0100B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0110B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0120B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0130B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0140B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0150B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0160B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0200B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0201B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0210B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0300B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0301B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0310B1A18.flver.dcx',
-    '/map/m18_01_00_00/m0320B1A18.flver.dcx',
-    '/map/m18_01_00_00/m18_01_00_00.mcg',
-    '/map/m18_01_00_00/m18_01_00_00.mcp',
-    '/map/m18_01_00_00/m18_01_00_00.nvmbnd.dcx',
-    '/map/m18_01_00_00/m5000B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5001B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5010B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5100B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5101B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5200B1A18.flver.dcx',
-    '/map/m18_01_00_00/m5201B1A18.flver.dcx',
-    '/map/m18_01_00_00/m9000B1A18.flver.dcx',
-    '/map/m18_01_00_00/m9100B1A18.flver.dcx',
-    '/map/m18_01_00_00/m9999B1A18.flver.dcx',
-    '/map/MapStudio/m10_00_00_00.msb',
-    '/map/MapStudio/m10_01_00_00.msb',
-    '/map/MapStudio/m10_02_00_00.msb',
-    '/map/MapStudio/m11_00_00_00.msb',
-    '/map/MapStudio/m12_00_00_00.msb',
-    '/map/MapStudio/m12_00_00_01.msb',
-    '/map/MapStudio/m12_01_00_00.msb',
-    '/map/MapStudio/m13_00_00_00.msb',
-    '/map/MapStudio/m13_01_00_00.msb',
-    '/map/MapStudio/m13_02_00_00.msb',
-    '/map/MapStudio/m14_00_00_00.msb',
-    '/map/MapStudio/m14_01_00_00.msb',
-    '/map/MapStudio/m15_00_00_00.msb',
-    '/map/MapStudio/m15_01_00_00.msb',
-    '/map/MapStudio/m16_00_00_00.msb',
-    '/map/MapStudio/m17_00_00_00.msb',
-    '/map/MapStudio/m18_00_00_00.msb',
-    '/map/MapStudio/m18_01_00_00.msb',
-    '/map/MapViewList.loadlistlist',
-    '/map/WorldMsbList.worldloadlistlist',
-    '/remo/scn100000.remobnd.dcx',
-    '/remo/scn100100.remobnd.dcx',
-    '/remo/scn100101.remobnd.dcx',
-    '/remo/scn100105.remobnd.dcx',
-    '/remo/scn100110.remobnd.dcx',
-    '/remo/scn100111.remobnd.dcx',
-    '/remo/scn100112.remobnd.dcx',
-    '/remo/scn100113.remobnd.dcx',
-    '/remo/scn100200.remobnd.dcx',
-    '/remo/scn100201.remobnd.dcx',
-    '/remo/scn100202.remobnd.dcx',
-    '/remo/scn100203.remobnd.dcx',
-    '/remo/scn100210.remobnd.dcx',
-    '/remo/scn100220.remobnd.dcx',
-    '/remo/scn100225.remobnd.dcx',
-    '/remo/scn100226.remobnd.dcx',
-    '/remo/scn100230.remobnd.dcx',
-    '/remo/scn100235.remobnd.dcx',
-    '/remo/scn100240.remobnd.dcx',
-    '/remo/scn100250.remobnd.dcx',
-    '/remo/scn110000.remobnd.dcx',
-    '/remo/scn110010.remobnd.dcx',
-    '/remo/scn110035.remobnd.dcx',
-    '/remo/scn120000.remobnd.dcx',
-    '/remo/scn120001.remobnd.dcx',
-    '/remo/scn120002.remobnd.dcx',
-    '/remo/scn120003.remobnd.dcx',
-    '/remo/scn120100.remobnd.dcx',
-    '/remo/scn120110.remobnd.dcx',
-    '/remo/scn120130.remobnd.dcx',
-    '/remo/scn120140.remobnd.dcx',
-    '/remo/scn130000.remobnd.dcx',
-    '/remo/scn130001.remobnd.dcx',
-    '/remo/scn130010.remobnd.dcx',
-    '/remo/scn130020.remobnd.dcx',
-    '/remo/scn130021.remobnd.dcx',
-    '/remo/scn130100.remobnd.dcx',
-    '/remo/scn130110.remobnd.dcx',
-    '/remo/scn130111.remobnd.dcx',
-    '/remo/scn130120.remobnd.dcx',
-    '/remo/scn130121.remobnd.dcx',
-    '/remo/scn140000.remobnd.dcx',
-    '/remo/scn140001.remobnd.dcx',
-    '/remo/scn140010.remobnd.dcx',
-    '/remo/scn140015.remobnd.dcx',
-    '/remo/scn140100.remobnd.dcx',
-    '/remo/scn140110.remobnd.dcx',
-    '/remo/scn140111.remobnd.dcx',
-    '/remo/scn140115.remobnd.dcx',
-    '/remo/scn140116.remobnd.dcx',
-    '/remo/scn140117.remobnd.dcx',
-    '/remo/scn140118.remobnd.dcx',
-    '/remo/scn140120.remobnd.dcx',
-    '/remo/scn150000.remobnd.dcx',
-    '/remo/scn150001.remobnd.dcx',
-    '/remo/scn150002.remobnd.dcx',
-    '/remo/scn150010.remobnd.dcx',
-    '/remo/scn150100.remobnd.dcx',
-    '/remo/scn150101.remobnd.dcx',
-    '/remo/scn150102.remobnd.dcx',
-    '/remo/scn150103.remobnd.dcx',
-    '/remo/scn150104.remobnd.dcx',
-    '/remo/scn150105.remobnd.dcx',
-    '/remo/scn150110.remobnd.dcx',
-    '/remo/scn150111.remobnd.dcx',
-    '/remo/scn150120.remobnd.dcx',
-    '/remo/scn150121.remobnd.dcx',
-    '/remo/scn150130.remobnd.dcx',
-    '/remo/scn150132.remobnd.dcx',
-    '/remo/scn150135.remobnd.dcx',
-    '/remo/scn150140.remobnd.dcx',
-    '/remo/scn150150.remobnd.dcx',
-    '/remo/scn150151.remobnd.dcx',
-    '/remo/scn150152.remobnd.dcx',
-    '/remo/scn150155.remobnd.dcx',
-    '/remo/scn150156.remobnd.dcx',
-    '/remo/scn150157.remobnd.dcx',
-    '/remo/scn150160.remobnd.dcx',
-    '/remo/scn150161.remobnd.dcx',
-    '/remo/scn150165.remobnd.dcx',
-    '/remo/scn150166.remobnd.dcx',
-    '/remo/scn160000.remobnd.dcx',
-    '/remo/scn160001.remobnd.dcx',
-    '/remo/scn160010.remobnd.dcx',
-    '/remo/scn160035.remobnd.dcx',
-    '/remo/scn160040.remobnd.dcx',
-    '/remo/scn160050.remobnd.dcx',
-    '/remo/scn170000.remobnd.dcx',
-    '/remo/scn170010.remobnd.dcx',
-    '/remo/scn180000.remobnd.dcx',
-    '/remo/scn180001.remobnd.dcx',
-    '/remo/scn180010.remobnd.dcx',
-    '/remo/scn180015.remobnd.dcx',
-    '/remo/scn180040.remobnd.dcx',
-    '/remo/scn180041.remobnd.dcx',
-    '/remo/scn180050.remobnd.dcx',
-    '/remo/scn180051.remobnd.dcx',
-    '/remo/scn180060.remobnd.dcx',
-    '/remo/scn180100.remobnd.dcx',
-    '/remo/scn180101.remobnd.dcx',
-    '/remo/scn180110.remobnd.dcx',
-    '/remo/scn180125.remobnd.dcx',
-    '/remo/scn180126.remobnd.dcx',
-    '/remo/scn180130.remobnd.dcx',
-    '/script/aiCommon.luabnd.dcx',
-    '/script/eventCommon.luabnd.dcx',
-    '/script/m10_00_00_00.luabnd.dcx',
-    '/script/m10_01_00_00.luabnd.dcx',
-    '/script/m10_02_00_00.luabnd.dcx',
-    '/script/m11_00_00_00.luabnd.dcx',
-    '/script/m12_00_00_00.luabnd.dcx',
-    '/script/m12_01_00_00.luabnd.dcx',
-    '/script/m13_00_00_00.luabnd.dcx',
-    '/script/m13_01_00_00.luabnd.dcx',
-    '/script/m13_02_00_00.luabnd.dcx',
-    '/script/m14_00_00_00.luabnd.dcx',
-    '/script/m14_01_00_00.luabnd.dcx',
-    '/script/m15_00_00_00.luabnd.dcx',
-    '/script/m15_01_00_00.luabnd.dcx',
-    '/script/m16_00_00_00.luabnd.dcx',
-    '/script/m17_00_00_00.luabnd.dcx',
-    '/script/m18_00_00_00.luabnd.dcx',
-    '/script/m18_01_00_00.luabnd.dcx',
-    '/script/talk/m10_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m10_01_00_00.talkesdbnd.dcx',
-    '/script/talk/m10_02_00_00.talkesdbnd.dcx',
-    '/script/talk/m11_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m12_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m12_00_00_01.talkesdbnd.dcx',
-    '/script/talk/m12_01_00_00.talkesdbnd.dcx',
-    '/script/talk/m13_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m13_01_00_00.talkesdbnd.dcx',
-    '/script/talk/m13_02_00_00.talkesdbnd.dcx',
-    '/script/talk/m14_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m14_01_00_00.talkesdbnd.dcx',
-    '/script/talk/m14_02_00_00.talkesdbnd.dcx',
-    '/script/talk/m15_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m15_01_00_00.talkesdbnd.dcx',
-    '/script/talk/m16_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m17_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m18_00_00_00.talkesdbnd.dcx',
-    '/script/talk/m18_01_00_00.talkesdbnd.dcx',
-    '/sfx/FRPG_SfxBnd_c3471.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_c4100.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_c4500.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_c4510.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_CommonEffects.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m10.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m10_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m10_01.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m10_02.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m11.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m12.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m12_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m12_01.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m13.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m13_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m13_01.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m13_02.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m14.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m14_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m14_01.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m15.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m15_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m15_01.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m16.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m17.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m18.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m18_00.ffxbnd.dcx',
-    '/sfx/FRPG_SfxBnd_m18_01.ffxbnd.dcx',
-    '/facegen/FaceGen.fgbnd',
-    '/font/DbgFont14h.ccm.dcx',
-    '/font/DbgFont14h.tpf.dcx',
-    '/font/english/DSFont24.ccm.dcx',
-    '/font/english/DSFont24.tpf.dcx',
-    '/font/english/TalkFont24.ccm.dcx',
-    '/font/english/TalkFont24.tpf.dcx',
-    '/font/japanese/DSFont24.ccm.dcx',
-    '/font/japanese/DSFont24.tpf.dcx',
-    '/font/japanese/TalkFont24.ccm.dcx',
-    '/font/japanese/TalkFont24.tpf.dcx',
-    '/font/korean/DSFont24.ccm.dcx',
-    '/font/korean/DSFont24.tpf.dcx',
-    '/font/korean/TalkFont24.ccm.dcx',
-    '/font/korean/TalkFont24.tpf.dcx',
-    '/font/polish/DSFont24.ccm.dcx',
-    '/font/polish/DSFont24.tpf.dcx',
-    '/font/polish/TalkFont24.ccm.dcx',
-    '/font/polish/TalkFont24.tpf.dcx',
-    '/font/tchinese/DSFont24.ccm.dcx',
-    '/font/tchinese/DSFont24.tpf.dcx',
-    '/font/tchinese/TalkFont24.ccm.dcx',
-    '/font/tchinese/TalkFont24.tpf.dcx',
-    '/menu/00.tpf.dcx',
-    '/menu/01.tpf.dcx',
-    '/menu/02.tpf.dcx',
-    '/menu/03.tpf.dcx',
-    '/menu/04.tpf.dcx',
-    '/menu/05.tpf.dcx',
-    '/menu/06.tpf.dcx',
-    '/menu/07.tpf.dcx',
-    '/menu/08.tpf.dcx',
-    '/menu/09.tpf.dcx',
-    '/menu/10.tpf.dcx',
-    '/menu/11.tpf.dcx',
-    '/menu/12.tpf.dcx',
-    '/menu/13.tpf.dcx',
-    '/menu/14.tpf.dcx',
-    '/menu/15.tpf.dcx',
-    '/menu/16.tpf.dcx',
-    '/menu/bk.tpf.dcx',
-    '/menu/common.menuesdbnd.dcx',
-    '/menu/common.menuesdbnd.dcx.sdat',
-    '/menu/ENGLISH/menu_local.tpf.dcx',
-    '/menu/fade.drb',
-    '/menu/fade.drb.dcx',
-    '/menu/fade.tpf.dcx',
-    '/menu/FRENCH/menu_local.tpf.dcx',
-    '/menu/GERMAN/menu_local.tpf.dcx',
-    '/menu/ingame.menuesdbnd.dcx',
-    '/menu/ingame.menuesdbnd.dcx.sdat',
-    '/menu/ITALIAN/menu_local.tpf.dcx',
-    '/menu/KOREAN/menu_local.tpf.dcx',
-    '/menu/menu.drb',
-    '/menu/menu.drb.dcx',
-    '/menu/menu.tpf.dcx',
-    '/menu/menu_0.tpf.dcx',
-    '/menu/menu_1.tpf.dcx',
-    '/menu/menu_2.tpf.dcx',
-    '/menu/menu_3.tpf.dcx',
-    '/menu/menu_4.tpf.dcx',
-    '/menu/menu_5.tpf.dcx',
-    '/menu/nowloading.drb',
-    '/menu/nowloading.drb.dcx',
-    '/menu/nowloading.tpf.dcx',
-    '/menu/POLISH/menu_local.tpf.dcx',
-    '/menu/RUSSIAN/menu_local.tpf.dcx',
-    '/menu/SPANISH/menu_local.tpf.dcx',
-    '/menu/TCHINESE/menu_local.tpf.dcx',
-    '/menu/title.menuesdbnd.dcx',
-    '/menu/title.menuesdbnd.dcx.sdat',
-    '/msg/ENGLISH/item.msgbnd.dcx',
-    '/msg/ENGLISH/menu.msgbnd.dcx',
-    '/msg/FRENCH/item.msgbnd.dcx',
-    '/msg/FRENCH/menu.msgbnd.dcx',
-    '/msg/GERMAN/item.msgbnd.dcx',
-    '/msg/GERMAN/menu.msgbnd.dcx',
-    '/msg/ITALIAN/item.msgbnd.dcx',
-    '/msg/ITALIAN/menu.msgbnd.dcx',
-    '/msg/JAPANESE/item.msgbnd.dcx',
-    '/msg/JAPANESE/menu.msgbnd.dcx',
-    '/msg/KOREAN/item.msgbnd.dcx',
-    '/msg/KOREAN/menu.msgbnd.dcx',
-    '/msg/POLISH/item.msgbnd.dcx',
-    '/msg/POLISH/menu.msgbnd.dcx',
-    '/msg/RUSSIAN/item.msgbnd.dcx',
-    '/msg/RUSSIAN/menu.msgbnd.dcx',
-    '/msg/SPANISH/item.msgbnd.dcx',
-    '/msg/SPANISH/menu.msgbnd.dcx',
-    '/msg/TCHINESE/item.msgbnd.dcx',
-    '/msg/TCHINESE/menu.msgbnd.dcx',
-    '/mtd/Mtd.mtdbnd.dcx',
-    '/obj/o0020.objbnd.dcx',
-    '/obj/o0100.objbnd.dcx',
-    '/obj/o0101.objbnd.dcx',
-    '/obj/o0105.objbnd.dcx',
-    '/obj/o0106.objbnd.dcx',
-    '/obj/o0110.objbnd.dcx',
-    '/obj/o0150.objbnd.dcx',
-    '/obj/o0200.objbnd.dcx',
-    '/obj/o0201.objbnd.dcx',
-    '/obj/o0300.objbnd.dcx',
-    '/obj/o0500.objbnd.dcx',
-    '/obj/o0502.objbnd.dcx',
-    '/obj/o0503.objbnd.dcx',
-    '/obj/o0504.objbnd.dcx',
-    '/obj/o0700.objbnd.dcx',
-    '/obj/o0701.objbnd.dcx',
-    '/obj/o1000.objbnd.dcx',
-    '/obj/o1001.objbnd.dcx',
-    '/obj/o1002.objbnd.dcx',
-    '/obj/o1010.objbnd.dcx',
-    '/obj/o1011.objbnd.dcx',
-    '/obj/o1020.objbnd.dcx',
-    '/obj/o1030.objbnd.dcx',
-    '/obj/o1031.objbnd.dcx',
-    '/obj/o1040.objbnd.dcx',
-    '/obj/o1041.objbnd.dcx',
-    '/obj/o1042.objbnd.dcx',
-    '/obj/o1048.objbnd.dcx',
-    '/obj/o1049.objbnd.dcx',
-    '/obj/o1050.objbnd.dcx',
-    '/obj/o1051.objbnd.dcx',
-    '/obj/o1052.objbnd.dcx',
-    '/obj/o1055.objbnd.dcx',
-    '/obj/o1056.objbnd.dcx',
-    '/obj/o1057.objbnd.dcx',
-    '/obj/o1058.objbnd.dcx',
-    '/obj/o1060.objbnd.dcx',
-    '/obj/o1061.objbnd.dcx',
-    '/obj/o1062.objbnd.dcx',
-    '/obj/o1063.objbnd.dcx',
-    '/obj/o1064.objbnd.dcx',
-    '/obj/o1065.objbnd.dcx',
-    '/obj/o1066.objbnd.dcx',
-    '/obj/o1067.objbnd.dcx',
-    '/obj/o1068.objbnd.dcx',
-    '/obj/o1069.objbnd.dcx',
-    '/obj/o1070.objbnd.dcx',
-    '/obj/o1071.objbnd.dcx',
-    '/obj/o1072.objbnd.dcx',
-    '/obj/o1073.objbnd.dcx',
-    '/obj/o1074.objbnd.dcx',
-    '/obj/o1075.objbnd.dcx',
-    '/obj/o1076.objbnd.dcx',
-    '/obj/o1077.objbnd.dcx',
-    '/obj/o1078.objbnd.dcx',
-    '/obj/o1079.objbnd.dcx',
-    '/obj/o1080.objbnd.dcx',
-    '/obj/o1100.objbnd.dcx',
-    '/obj/o1110.objbnd.dcx',
-    '/obj/o1111.objbnd.dcx',
-    '/obj/o1112.objbnd.dcx',
-    '/obj/o1120.objbnd.dcx',
-    '/obj/o1121.objbnd.dcx',
-    '/obj/o1122.objbnd.dcx',
-    '/obj/o1125.objbnd.dcx',
-    '/obj/o1126.objbnd.dcx',
-    '/obj/o1129.objbnd.dcx',
-    '/obj/o1130.objbnd.dcx',
-    '/obj/o1131.objbnd.dcx',
-    '/obj/o1132.objbnd.dcx',
-    '/obj/o1133.objbnd.dcx',
-    '/obj/o1134.objbnd.dcx',
-    '/obj/o1135.objbnd.dcx',
-    '/obj/o1136.objbnd.dcx',
-    '/obj/o1140.objbnd.dcx',
-    '/obj/o1145.objbnd.dcx',
-    '/obj/o1146.objbnd.dcx',
-    '/obj/o1150.objbnd.dcx',
-    '/obj/o1151.objbnd.dcx',
-    '/obj/o1152.objbnd.dcx',
-    '/obj/o1153.objbnd.dcx',
-    '/obj/o1154.objbnd.dcx',
-    '/obj/o1155.objbnd.dcx',
-    '/obj/o1156.objbnd.dcx',
-    '/obj/o1160.objbnd.dcx',
-    '/obj/o1162.objbnd.dcx',
-    '/obj/o1163.objbnd.dcx',
-    '/obj/o1170.objbnd.dcx',
-    '/obj/o1172.objbnd.dcx',
-    '/obj/o1173.objbnd.dcx',
-    '/obj/o1175.objbnd.dcx',
-    '/obj/o1176.objbnd.dcx',
-    '/obj/o1190.objbnd.dcx',
-    '/obj/o1200.objbnd.dcx',
-    '/obj/o1201.objbnd.dcx',
-    '/obj/o1202.objbnd.dcx',
-    '/obj/o1205.objbnd.dcx',
-    '/obj/o1206.objbnd.dcx',
-    '/obj/o1207.objbnd.dcx',
-    '/obj/o1208.objbnd.dcx',
-    '/obj/o1209.objbnd.dcx',
-    '/obj/o1210.objbnd.dcx',
-    '/obj/o1211.objbnd.dcx',
-    '/obj/o1212.objbnd.dcx',
-    '/obj/o1213.objbnd.dcx',
-    '/obj/o1214.objbnd.dcx',
-    '/obj/o1215.objbnd.dcx',
-    '/obj/o1216.objbnd.dcx',
-    '/obj/o1217.objbnd.dcx',
-    '/obj/o1218.objbnd.dcx',
-    '/obj/o1219.objbnd.dcx',
-    '/obj/o1220.objbnd.dcx',
-    '/obj/o1223.objbnd.dcx',
-    '/obj/o1224.objbnd.dcx',
-    '/obj/o1230.objbnd.dcx',
-    '/obj/o1231.objbnd.dcx',
-    '/obj/o1232.objbnd.dcx',
-    '/obj/o1233.objbnd.dcx',
-    '/obj/o1240.objbnd.dcx',
-    '/obj/o1241.objbnd.dcx',
-    '/obj/o1242.objbnd.dcx',
-    '/obj/o1243.objbnd.dcx',
-    '/obj/o1244.objbnd.dcx',
-    '/obj/o1250.objbnd.dcx',
-    '/obj/o1251.objbnd.dcx',
-    '/obj/o1252.objbnd.dcx',
-    '/obj/o1270.objbnd.dcx',
-    '/obj/o1271.objbnd.dcx',
-    '/obj/o1290.objbnd.dcx',
-    '/obj/o1300.objbnd.dcx',
-    '/obj/o1301.objbnd.dcx',
-    '/obj/o1302.objbnd.dcx',
-    '/obj/o1303.objbnd.dcx',
-    '/obj/o1305.objbnd.dcx',
-    '/obj/o1306.objbnd.dcx',
-    '/obj/o1308.objbnd.dcx',
-    '/obj/o1309.objbnd.dcx',
-    '/obj/o1310.objbnd.dcx',
-    '/obj/o1311.objbnd.dcx',
-    '/obj/o1312.objbnd.dcx',
-    '/obj/o1313.objbnd.dcx',
-    '/obj/o1314.objbnd.dcx',
-    '/obj/o1315.objbnd.dcx',
-    '/obj/o1316.objbnd.dcx',
-    '/obj/o1317.objbnd.dcx',
-    '/obj/o1318.objbnd.dcx',
-    '/obj/o1319.objbnd.dcx',
-    '/obj/o1320.objbnd.dcx',
-    '/obj/o1321.objbnd.dcx',
-    '/obj/o1322.objbnd.dcx',
-    '/obj/o1323.objbnd.dcx',
-    '/obj/o1330.objbnd.dcx',
-    '/obj/o1340.objbnd.dcx',
-    '/obj/o1350.objbnd.dcx',
-    '/obj/o1351.objbnd.dcx',
-    '/obj/o1357.objbnd.dcx',
-    '/obj/o1358.objbnd.dcx',
-    '/obj/o1400.objbnd.dcx',
-    '/obj/o1401.objbnd.dcx',
-    '/obj/o1402.objbnd.dcx',
-    '/obj/o1403.objbnd.dcx',
-    '/obj/o1404.objbnd.dcx',
-    '/obj/o1405.objbnd.dcx',
-    '/obj/o1406.objbnd.dcx',
-    '/obj/o1407.objbnd.dcx',
-    '/obj/o1408.objbnd.dcx',
-    '/obj/o1409.objbnd.dcx',
-    '/obj/o1410.objbnd.dcx',
-    '/obj/o1411.objbnd.dcx',
-    '/obj/o1412.objbnd.dcx',
-    '/obj/o1413.objbnd.dcx',
-    '/obj/o1414.objbnd.dcx',
-    '/obj/o1415.objbnd.dcx',
-    '/obj/o1416.objbnd.dcx',
-    '/obj/o1417.objbnd.dcx',
-    '/obj/o1418.objbnd.dcx',
-    '/obj/o1419.objbnd.dcx',
-    '/obj/o1420.objbnd.dcx',
-    '/obj/o1421.objbnd.dcx',
-    '/obj/o1450.objbnd.dcx',
-    '/obj/o1460.objbnd.dcx',
-    '/obj/o1465.objbnd.dcx',
-    '/obj/o1470.objbnd.dcx',
-    '/obj/o1475.objbnd.dcx',
-    '/obj/o1480.objbnd.dcx',
-    '/obj/o1481.objbnd.dcx',
-    '/obj/o1490.objbnd.dcx',
-    '/obj/o1495.objbnd.dcx',
-    '/obj/o1496.objbnd.dcx',
-    '/obj/o1497.objbnd.dcx',
-    '/obj/o1500.objbnd.dcx',
-    '/obj/o1510.objbnd.dcx',
-    '/obj/o1511.objbnd.dcx',
-    '/obj/o1512.objbnd.dcx',
-    '/obj/o1513.objbnd.dcx',
-    '/obj/o1520.objbnd.dcx',
-    '/obj/o1521.objbnd.dcx',
-    '/obj/o1530.objbnd.dcx',
-    '/obj/o1540.objbnd.dcx',
-    '/obj/o1550.objbnd.dcx',
-    '/obj/o1560.objbnd.dcx',
-    '/obj/o1570.objbnd.dcx',
-    '/obj/o1571.objbnd.dcx',
-    '/obj/o1580.objbnd.dcx',
-    '/obj/o1600.objbnd.dcx',
-    '/obj/o1601.objbnd.dcx',
-    '/obj/o1602.objbnd.dcx',
-    '/obj/o1603.objbnd.dcx',
-    '/obj/o1604.objbnd.dcx',
-    '/obj/o1605.objbnd.dcx',
-    '/obj/o1610.objbnd.dcx',
-    '/obj/o1700.objbnd.dcx',
-    '/obj/o1701.objbnd.dcx',
-    '/obj/o1702.objbnd.dcx',
-    '/obj/o1703.objbnd.dcx',
-    '/obj/o1710.objbnd.dcx',
-    '/obj/o1711.objbnd.dcx',
-    '/obj/o1712.objbnd.dcx',
-    '/obj/o1713.objbnd.dcx',
-    '/obj/o1800.objbnd.dcx',
-    '/obj/o1801.objbnd.dcx',
-    '/obj/o1802.objbnd.dcx',
-    '/obj/o1900.objbnd.dcx',
-    '/obj/o1910.objbnd.dcx',
-    '/obj/o1915.objbnd.dcx',
-    '/obj/o1916.objbnd.dcx',
-    '/obj/o1920.objbnd.dcx',
-    '/obj/o1930.objbnd.dcx',
-    '/obj/o1940.objbnd.dcx',
-    '/obj/o1945.objbnd.dcx',
-    '/obj/o1946.objbnd.dcx',
-    '/obj/o1950.objbnd.dcx',
-    '/obj/o1960.objbnd.dcx',
-    '/obj/o1965.objbnd.dcx',
-    '/obj/o1966.objbnd.dcx',
-    '/obj/o1967.objbnd.dcx',
-    '/obj/o2000.objbnd.dcx',
-    '/obj/o2100.objbnd.dcx',
-    '/obj/o2110.objbnd.dcx',
-    '/obj/o2111.objbnd.dcx',
-    '/obj/o2120.objbnd.dcx',
-    '/obj/o2130.objbnd.dcx',
-    '/obj/o2131.objbnd.dcx',
-    '/obj/o2200.objbnd.dcx',
-    '/obj/o2201.objbnd.dcx',
-    '/obj/o2202.objbnd.dcx',
-    '/obj/o2203.objbnd.dcx',
-    '/obj/o2250.objbnd.dcx',
-    '/obj/o2251.objbnd.dcx',
-    '/obj/o2252.objbnd.dcx',
-    '/obj/o2253.objbnd.dcx',
-    '/obj/o2300.objbnd.dcx',
-    '/obj/o2400.objbnd.dcx',
-    '/obj/o2401.objbnd.dcx',
-    '/obj/o2402.objbnd.dcx',
-    '/obj/o2403.objbnd.dcx',
-    '/obj/o2450.objbnd.dcx',
-    '/obj/o2600.objbnd.dcx',
-    '/obj/o2601.objbnd.dcx',
-    '/obj/o2610.objbnd.dcx',
-    '/obj/o2611.objbnd.dcx',
-    '/obj/o2612.objbnd.dcx',
-    '/obj/o2613.objbnd.dcx',
-    '/obj/o2620.objbnd.dcx',
-    '/obj/o2621.objbnd.dcx',
-    '/obj/o2630.objbnd.dcx',
-    '/obj/o2700.objbnd.dcx',
-    '/obj/o2701.objbnd.dcx',
-    '/obj/o2710.objbnd.dcx',
-    '/obj/o2720.objbnd.dcx',
-    '/obj/o2730.objbnd.dcx',
-    '/obj/o2731.objbnd.dcx',
-    '/obj/o2732.objbnd.dcx',
-    '/obj/o2740.objbnd.dcx',
-    '/obj/o2750.objbnd.dcx',
-    '/obj/o2760.objbnd.dcx',
-    '/obj/o2765.objbnd.dcx',
-    '/obj/o2770.objbnd.dcx',
-    '/obj/o2780.objbnd.dcx',
-    '/obj/o2785.objbnd.dcx',
-    '/obj/o2790.objbnd.dcx',
-    '/obj/o2791.objbnd.dcx',
-    '/obj/o2795.objbnd.dcx',
-    '/obj/o2800.objbnd.dcx',
-    '/obj/o2801.objbnd.dcx',
-    '/obj/o2900.objbnd.dcx',
-    '/obj/o2901.objbnd.dcx',
-    '/obj/o2902.objbnd.dcx',
-    '/obj/o2903.objbnd.dcx',
-    '/obj/o2904.objbnd.dcx',
-    '/obj/o2905.objbnd.dcx',
-    '/obj/o2906.objbnd.dcx',
-    '/obj/o2907.objbnd.dcx',
-    '/obj/o2908.objbnd.dcx',
-    '/obj/o2909.objbnd.dcx',
-    '/obj/o2910.objbnd.dcx',
-    '/obj/o2911.objbnd.dcx',
-    '/obj/o2912.objbnd.dcx',
-    '/obj/o2913.objbnd.dcx',
-    '/obj/o2914.objbnd.dcx',
-    '/obj/o2915.objbnd.dcx',
-    '/obj/o2916.objbnd.dcx',
-    '/obj/o2917.objbnd.dcx',
-    '/obj/o2918.objbnd.dcx',
-    '/obj/o2919.objbnd.dcx',
-    '/obj/o2920.objbnd.dcx',
-    '/obj/o3000.objbnd.dcx',
-    '/obj/o3001.objbnd.dcx',
-    '/obj/o3010.objbnd.dcx',
-    '/obj/o3011.objbnd.dcx',
-    '/obj/o3020.objbnd.dcx',
-    '/obj/o3021.objbnd.dcx',
-    '/obj/o3030.objbnd.dcx',
-    '/obj/o3031.objbnd.dcx',
-    '/obj/o3032.objbnd.dcx',
-    '/obj/o3033.objbnd.dcx',
-    '/obj/o3034.objbnd.dcx',
-    '/obj/o3035.objbnd.dcx',
-    '/obj/o3036.objbnd.dcx',
-    '/obj/o3040.objbnd.dcx',
-    '/obj/o3041.objbnd.dcx',
-    '/obj/o3042.objbnd.dcx',
-    '/obj/o3043.objbnd.dcx',
-    '/obj/o3044.objbnd.dcx',
-    '/obj/o3045.objbnd.dcx',
-    '/obj/o3046.objbnd.dcx',
-    '/obj/o3047.objbnd.dcx',
-    '/obj/o3048.objbnd.dcx',
-    '/obj/o3050.objbnd.dcx',
-    '/obj/o3051.objbnd.dcx',
-    '/obj/o3052.objbnd.dcx',
-    '/obj/o3053.objbnd.dcx',
-    '/obj/o3060.objbnd.dcx',
-    '/obj/o3100.objbnd.dcx',
-    '/obj/o3101.objbnd.dcx',
-    '/obj/o3102.objbnd.dcx',
-    '/obj/o3140.objbnd.dcx',
-    '/obj/o3141.objbnd.dcx',
-    '/obj/o3142.objbnd.dcx',
-    '/obj/o3143.objbnd.dcx',
-    '/obj/o3144.objbnd.dcx',
-    '/obj/o3240.objbnd.dcx',
-    '/obj/o3241.objbnd.dcx',
-    '/obj/o3242.objbnd.dcx',
-    '/obj/o3243.objbnd.dcx',
-    '/obj/o3300.objbnd.dcx',
-    '/obj/o3301.objbnd.dcx',
-    '/obj/o3302.objbnd.dcx',
-    '/obj/o3310.objbnd.dcx',
-    '/obj/o3311.objbnd.dcx',
-    '/obj/o3312.objbnd.dcx',
-    '/obj/o3320.objbnd.dcx',
-    '/obj/o3321.objbnd.dcx',
-    '/obj/o3350.objbnd.dcx',
-    '/obj/o3400.objbnd.dcx',
-    '/obj/o3450.objbnd.dcx',
-    '/obj/o3451.objbnd.dcx',
-    '/obj/o3452.objbnd.dcx',
-    '/obj/o3500.objbnd.dcx',
-    '/obj/o3501.objbnd.dcx',
-    '/obj/o3600.objbnd.dcx',
-    '/obj/o3610.objbnd.dcx',
-    '/obj/o3611.objbnd.dcx',
-    '/obj/o3612.objbnd.dcx',
-    '/obj/o3650.objbnd.dcx',
-    '/obj/o3651.objbnd.dcx',
-    '/obj/o3652.objbnd.dcx',
-    '/obj/o3653.objbnd.dcx',
-    '/obj/o3654.objbnd.dcx',
-    '/obj/o3660.objbnd.dcx',
-    '/obj/o3661.objbnd.dcx',
-    '/obj/o3870.objbnd.dcx',
-    '/obj/o3871.objbnd.dcx',
-    '/obj/o3872.objbnd.dcx',
-    '/obj/o3873.objbnd.dcx',
-    '/obj/o3880.objbnd.dcx',
-    '/obj/o3881.objbnd.dcx',
-    '/obj/o3890.objbnd.dcx',
-    '/obj/o3900.objbnd.dcx',
-    '/obj/o3901.objbnd.dcx',
-    '/obj/o3902.objbnd.dcx',
-    '/obj/o3910.objbnd.dcx',
-    '/obj/o3950.objbnd.dcx',
-    '/obj/o3951.objbnd.dcx',
-    '/obj/o3952.objbnd.dcx',
-    '/obj/o3953.objbnd.dcx',
-    '/obj/o3954.objbnd.dcx',
-    '/obj/o3955.objbnd.dcx',
-    '/obj/o3960.objbnd.dcx',
-    '/obj/o3961.objbnd.dcx',
-    '/obj/o3962.objbnd.dcx',
-    '/obj/o3963.objbnd.dcx',
-    '/obj/o3964.objbnd.dcx',
-    '/obj/o3965.objbnd.dcx',
-    '/obj/o3970.objbnd.dcx',
-    '/obj/o3971.objbnd.dcx',
-    '/obj/o3972.objbnd.dcx',
-    '/obj/o3973.objbnd.dcx',
-    '/obj/o4000.objbnd.dcx',
-    '/obj/o4001.objbnd.dcx',
-    '/obj/o4002.objbnd.dcx',
-    '/obj/o4003.objbnd.dcx',
-    '/obj/o4050.objbnd.dcx',
-    '/obj/o4100.objbnd.dcx',
-    '/obj/o4101.objbnd.dcx',
-    '/obj/o4102.objbnd.dcx',
-    '/obj/o4103.objbnd.dcx',
-    '/obj/o4104.objbnd.dcx',
-    '/obj/o4105.objbnd.dcx',
-    '/obj/o4106.objbnd.dcx',
-    '/obj/o4107.objbnd.dcx',
-    '/obj/o4108.objbnd.dcx',
-    '/obj/o4109.objbnd.dcx',
-    '/obj/o4110.objbnd.dcx',
-    '/obj/o4111.objbnd.dcx',
-    '/obj/o4112.objbnd.dcx',
-    '/obj/o4113.objbnd.dcx',
-    '/obj/o4114.objbnd.dcx',
-    '/obj/o4115.objbnd.dcx',
-    '/obj/o4116.objbnd.dcx',
-    '/obj/o4117.objbnd.dcx',
-    '/obj/o4118.objbnd.dcx',
-    '/obj/o4119.objbnd.dcx',
-    '/obj/o4120.objbnd.dcx',
-    '/obj/o4121.objbnd.dcx',
-    '/obj/o4122.objbnd.dcx',
-    '/obj/o4123.objbnd.dcx',
-    '/obj/o4124.objbnd.dcx',
-    '/obj/o4125.objbnd.dcx',
-    '/obj/o4200.objbnd.dcx',
-    '/obj/o4201.objbnd.dcx',
-    '/obj/o4202.objbnd.dcx',
-    '/obj/o4215.objbnd.dcx',
-    '/obj/o4300.objbnd.dcx',
-    '/obj/o4301.objbnd.dcx',
-    '/obj/o4302.objbnd.dcx',
-    '/obj/o4303.objbnd.dcx',
-    '/obj/o4304.objbnd.dcx',
-    '/obj/o4305.objbnd.dcx',
-    '/obj/o4350.objbnd.dcx',
-    '/obj/o4351.objbnd.dcx',
-    '/obj/o4352.objbnd.dcx',
-    '/obj/o4353.objbnd.dcx',
-    '/obj/o4360.objbnd.dcx',
-    '/obj/o4361.objbnd.dcx',
-    '/obj/o4362.objbnd.dcx',
-    '/obj/o4370.objbnd.dcx',
-    '/obj/o4400.objbnd.dcx',
-    '/obj/o4401.objbnd.dcx',
-    '/obj/o4402.objbnd.dcx',
-    '/obj/o4404.objbnd.dcx',
-    '/obj/o4405.objbnd.dcx',
-    '/obj/o4406.objbnd.dcx',
-    '/obj/o4407.objbnd.dcx',
-    '/obj/o4408.objbnd.dcx',
-    '/obj/o4409.objbnd.dcx',
-    '/obj/o4410.objbnd.dcx',
-    '/obj/o4411.objbnd.dcx',
-    '/obj/o4450.objbnd.dcx',
-    '/obj/o4451.objbnd.dcx',
-    '/obj/o4460.objbnd.dcx',
-    '/obj/o4461.objbnd.dcx',
-    '/obj/o4500.objbnd.dcx',
-    '/obj/o4510.objbnd.dcx',
-    '/obj/o4550.objbnd.dcx',
-    '/obj/o4560.objbnd.dcx',
-    '/obj/o4570.objbnd.dcx',
-    '/obj/o4600.objbnd.dcx',
-    '/obj/o4610.objbnd.dcx',
-    '/obj/o4611.objbnd.dcx',
-    '/obj/o4620.objbnd.dcx',
-    '/obj/o4621.objbnd.dcx',
-    '/obj/o4622.objbnd.dcx',
-    '/obj/o4623.objbnd.dcx',
-    '/obj/o4624.objbnd.dcx',
-    '/obj/o4625.objbnd.dcx',
-    '/obj/o4626.objbnd.dcx',
-    '/obj/o4627.objbnd.dcx',
-    '/obj/o4628.objbnd.dcx',
-    '/obj/o4629.objbnd.dcx',
-    '/obj/o4630.objbnd.dcx',
-    '/obj/o4631.objbnd.dcx',
-    '/obj/o4632.objbnd.dcx',
-    '/obj/o4633.objbnd.dcx',
-    '/obj/o4634.objbnd.dcx',
-    '/obj/o4635.objbnd.dcx',
-    '/obj/o4636.objbnd.dcx',
-    '/obj/o4637.objbnd.dcx',
-    '/obj/o4700.objbnd.dcx',
-    '/obj/o4701.objbnd.dcx',
-    '/obj/o4800.objbnd.dcx',
-    '/obj/o4810.objbnd.dcx',
-    '/obj/o4820.objbnd.dcx',
-    '/obj/o4830.objbnd.dcx',
-    '/obj/o4840.objbnd.dcx',
-    '/obj/o4850.objbnd.dcx',
-    '/obj/o4900.objbnd.dcx',
-    '/obj/o4901.objbnd.dcx',
-    '/obj/o4950.objbnd.dcx',
-    '/obj/o4951.objbnd.dcx',
-    '/obj/o4952.objbnd.dcx',
-    '/obj/o4953.objbnd.dcx',
-    '/obj/o4954.objbnd.dcx',
-    '/obj/o4955.objbnd.dcx',
-    '/obj/o4956.objbnd.dcx',
-    '/obj/o4957.objbnd.dcx',
-    '/obj/o4958.objbnd.dcx',
-    '/obj/o4960.objbnd.dcx',
-    '/obj/o4961.objbnd.dcx',
-    '/obj/o4962.objbnd.dcx',
-    '/obj/o4963.objbnd.dcx',
-    '/obj/o4964.objbnd.dcx',
-    '/obj/o4965.objbnd.dcx',
-    '/obj/o4966.objbnd.dcx',
-    '/obj/o4967.objbnd.dcx',
-    '/obj/o4968.objbnd.dcx',
-    '/obj/o4969.objbnd.dcx',
-    '/obj/o4970.objbnd.dcx',
-    '/obj/o4971.objbnd.dcx',
-    '/obj/o4972.objbnd.dcx',
-    '/obj/o4973.objbnd.dcx',
-    '/obj/o5000.objbnd.dcx',
-    '/obj/o5010.objbnd.dcx',
-    '/obj/o5040.objbnd.dcx',
-    '/obj/o5100.objbnd.dcx',
-    '/obj/o5110.objbnd.dcx',
-    '/obj/o5120.objbnd.dcx',
-    '/obj/o5130.objbnd.dcx',
-    '/obj/o5140.objbnd.dcx',
-    '/obj/o5150.objbnd.dcx',
-    '/obj/o5151.objbnd.dcx',
-    '/obj/o5152.objbnd.dcx',
-    '/obj/o5153.objbnd.dcx',
-    '/obj/o5154.objbnd.dcx',
-    '/obj/o5155.objbnd.dcx',
-    '/obj/o5200.objbnd.dcx',
-    '/obj/o5210.objbnd.dcx',
-    '/obj/o5220.objbnd.dcx',
-    '/obj/o5250.objbnd.dcx',
-    '/obj/o5300.objbnd.dcx',
-    '/obj/o5301.objbnd.dcx',
-    '/obj/o5310.objbnd.dcx',
-    '/obj/o5400.objbnd.dcx',
-    '/obj/o5401.objbnd.dcx',
-    '/obj/o5402.objbnd.dcx',
-    '/obj/o5403.objbnd.dcx',
-    '/obj/o5404.objbnd.dcx',
-    '/obj/o5410.objbnd.dcx',
-    '/obj/o5500.objbnd.dcx',
-    '/obj/o5501.objbnd.dcx',
-    '/obj/o5510.objbnd.dcx',
-    '/obj/o5520.objbnd.dcx',
-    '/obj/o5550.objbnd.dcx',
-    '/obj/o5551.objbnd.dcx',
-    '/obj/o5552.objbnd.dcx',
-    '/obj/o5560.objbnd.dcx',
-    '/obj/o5561.objbnd.dcx',
-    '/obj/o5570.objbnd.dcx',
-    '/obj/o5580.objbnd.dcx',
-    '/obj/o5590.objbnd.dcx',
-    '/obj/o5600.objbnd.dcx',
-    '/obj/o5610.objbnd.dcx',
-    '/obj/o5611.objbnd.dcx',
-    '/obj/o5612.objbnd.dcx',
-    '/obj/o5620.objbnd.dcx',
-    '/obj/o5630.objbnd.dcx',
-    '/obj/o5650.objbnd.dcx',
-    '/obj/o5651.objbnd.dcx',
-    '/obj/o5652.objbnd.dcx',
-    '/obj/o5653.objbnd.dcx',
-    '/obj/o5654.objbnd.dcx',
-    '/obj/o5655.objbnd.dcx',
-    '/obj/o5700.objbnd.dcx',
-    '/obj/o5710.objbnd.dcx',
-    '/obj/o5720.objbnd.dcx',
-    '/obj/o5730.objbnd.dcx',
-    '/obj/o5740.objbnd.dcx',
-    '/obj/o5750.objbnd.dcx',
-    '/obj/o5760.objbnd.dcx',
-    '/obj/o5800.objbnd.dcx',
-    '/obj/o5801.objbnd.dcx',
-    '/obj/o5810.objbnd.dcx',
-    '/obj/o5850.objbnd.dcx',
-    '/obj/o5860.objbnd.dcx',
-    '/obj/o5861.objbnd.dcx',
-    '/obj/o5862.objbnd.dcx',
-    '/obj/o5863.objbnd.dcx',
-    '/obj/o5864.objbnd.dcx',
-    '/obj/o5865.objbnd.dcx',
-    '/obj/o5866.objbnd.dcx',
-    '/obj/o5867.objbnd.dcx',
-    '/obj/o5868.objbnd.dcx',
-    '/obj/o5869.objbnd.dcx',
-    '/obj/o5870.objbnd.dcx',
-    '/obj/o5871.objbnd.dcx',
-    '/obj/o5900.objbnd.dcx',
-    '/obj/o5905.objbnd.dcx',
-    '/obj/o5906.objbnd.dcx',
-    '/obj/o5910.objbnd.dcx',
-    '/obj/o5911.objbnd.dcx',
-    '/obj/o5920.objbnd.dcx',
-    '/obj/o5930.objbnd.dcx',
-    '/obj/o5940.objbnd.dcx',
-    '/obj/o5950.objbnd.dcx',
-    '/obj/o5951.objbnd.dcx',
-    '/obj/o5952.objbnd.dcx',
-    '/obj/o5960.objbnd.dcx',
-    '/obj/o5965.objbnd.dcx',
-    '/obj/o5966.objbnd.dcx',
-    '/obj/o5967.objbnd.dcx',
-    '/obj/o5968.objbnd.dcx',
-    '/obj/o5969.objbnd.dcx',
-    '/obj/o5970.objbnd.dcx',
-    '/obj/o5971.objbnd.dcx',
-    '/obj/o5972.objbnd.dcx',
-    '/obj/o5980.objbnd.dcx',
-    '/obj/o5981.objbnd.dcx',
-    '/obj/o5982.objbnd.dcx',
-    '/obj/o5983.objbnd.dcx',
-    '/obj/o5990.objbnd.dcx',
-    '/obj/o5998.objbnd.dcx',
-    '/obj/o5999.objbnd.dcx',
-    '/obj/o6000.objbnd.dcx',
-    '/obj/o6010.objbnd.dcx',
-    '/obj/o6100.objbnd.dcx',
-    '/obj/o6110.objbnd.dcx',
-    '/obj/o6200.objbnd.dcx',
-    '/obj/o6400.objbnd.dcx',
-    '/obj/o6401.objbnd.dcx',
-    '/obj/o6410.objbnd.dcx',
-    '/obj/o6450.objbnd.dcx',
-    '/obj/o6451.objbnd.dcx',
-    '/obj/o6452.objbnd.dcx',
-    '/obj/o6455.objbnd.dcx',
-    '/obj/o6456.objbnd.dcx',
-    '/obj/o6457.objbnd.dcx',
-    '/obj/o6500.objbnd.dcx',
-    '/obj/o6600.objbnd.dcx',
-    '/obj/o6601.objbnd.dcx',
-    '/obj/o6602.objbnd.dcx',
-    '/obj/o6603.objbnd.dcx',
-    '/obj/o6604.objbnd.dcx',
-    '/obj/o6605.objbnd.dcx',
-    '/obj/o6606.objbnd.dcx',
-    '/obj/o6607.objbnd.dcx',
-    '/obj/o6700.objbnd.dcx',
-    '/obj/o7100.objbnd.dcx',
-    '/obj/o7199.objbnd.dcx',
-    '/obj/o7200.objbnd.dcx',
-    '/obj/o7201.objbnd.dcx',
-    '/obj/o7202.objbnd.dcx',
-    '/obj/o7210.objbnd.dcx',
-    '/obj/o7220.objbnd.dcx',
-    '/obj/o7230.objbnd.dcx',
-    '/obj/o7231.objbnd.dcx',
-    '/obj/o7240.objbnd.dcx',
-    '/obj/o7241.objbnd.dcx',
-    '/obj/o7250.objbnd.dcx',
-    '/obj/o7251.objbnd.dcx',
-    '/obj/o7300.objbnd.dcx',
-    '/obj/o7301.objbnd.dcx',
-    '/obj/o7302.objbnd.dcx',
-    '/obj/o7303.objbnd.dcx',
-    '/obj/o7400.objbnd.dcx',
-    '/obj/o7401.objbnd.dcx',
-    '/obj/o7402.objbnd.dcx',
-    '/obj/o7403.objbnd.dcx',
-    '/obj/o7404.objbnd.dcx',
-    '/obj/o7500.objbnd.dcx',
-    '/obj/o7501.objbnd.dcx',
-    '/obj/o7510.objbnd.dcx',
-    '/obj/o7600.objbnd.dcx',
-    '/obj/o7601.objbnd.dcx',
-    '/obj/o7610.objbnd.dcx',
-    '/obj/o7620.objbnd.dcx',
-    '/obj/o7621.objbnd.dcx',
-    '/obj/o7630.objbnd.dcx',
-    '/obj/o7640.objbnd.dcx',
-    '/obj/o7641.objbnd.dcx',
-    '/obj/o7650.objbnd.dcx',
-    '/obj/o7670.objbnd.dcx',
-    '/obj/o7680.objbnd.dcx',
-    '/obj/o7690.objbnd.dcx',
-    '/obj/o7700.objbnd.dcx',
-    '/obj/o7900.objbnd.dcx',
-    '/obj/o7901.objbnd.dcx',
-    '/obj/o7902.objbnd.dcx',
-    '/obj/o7906.objbnd.dcx',
-    '/obj/o7907.objbnd.dcx',
-    '/obj/o7908.objbnd.dcx',
-    '/obj/o8000.objbnd.dcx',
-    '/obj/o8050.objbnd.dcx',
-    '/obj/o8051.objbnd.dcx',
-    '/obj/o8100.objbnd.dcx',
-    '/obj/o8150.objbnd.dcx',
-    '/obj/o8200.objbnd.dcx',
-    '/obj/o8300.objbnd.dcx',
-    '/obj/o8310.objbnd.dcx',
-    '/obj/o8311.objbnd.dcx',
-    '/obj/o8312.objbnd.dcx',
-    '/obj/o8320.objbnd.dcx',
-    '/obj/o8400.objbnd.dcx',
-    '/obj/o8401.objbnd.dcx',
-    '/obj/o8402.objbnd.dcx',
-    '/obj/o8403.objbnd.dcx',
-    '/obj/o8404.objbnd.dcx',
-    '/obj/o8410.objbnd.dcx',
-    '/obj/o8411.objbnd.dcx',
-    '/obj/o8420.objbnd.dcx',
-    '/obj/o8421.objbnd.dcx',
-    '/obj/o8422.objbnd.dcx',
-    '/obj/o8425.objbnd.dcx',
-    '/obj/o8430.objbnd.dcx',
-    '/obj/o8500.objbnd.dcx',
-    '/obj/o8501.objbnd.dcx',
-    '/obj/o8510.objbnd.dcx',
-    '/obj/o8511.objbnd.dcx',
-    '/obj/o8520.objbnd.dcx',
-    '/obj/o8521.objbnd.dcx',
-    '/obj/o8530.objbnd.dcx',
-    '/obj/o8531.objbnd.dcx',
-    '/obj/o8540.objbnd.dcx',
-    '/obj/o8541.objbnd.dcx',
-    '/obj/o8542.objbnd.dcx',
-    '/obj/o8543.objbnd.dcx',
-    '/obj/o8544.objbnd.dcx',
-    '/obj/o8549.objbnd.dcx',
-    '/obj/o8550.objbnd.dcx',
-    '/obj/o8600.objbnd.dcx',
-    '/obj/o8601.objbnd.dcx',
-    '/obj/o8610.objbnd.dcx',
-    '/obj/o8700.objbnd.dcx',
-    '/obj/o8701.objbnd.dcx',
-    '/obj/o8702.objbnd.dcx',
-    '/obj/o8950.objbnd.dcx',
-    '/obj/o8951.objbnd.dcx',
-    '/obj/o8952.objbnd.dcx',
-    '/obj/o8953.objbnd.dcx',
-    '/obj/o8999.objbnd.dcx',
-    '/obj/o9000.objbnd.dcx',
-    '/obj/o9001.objbnd.dcx',
-    '/obj/o9002.objbnd.dcx',
-    '/obj/o9003.objbnd.dcx',
-    '/obj/o9100.objbnd.dcx',
-    '/obj/o9200.objbnd.dcx',
-    '/obj/o9800.objbnd.dcx',
-    '/obj/o9990.objbnd.dcx',
-    '/obj/o9991.objbnd.dcx',
-    '/obj/o9992.objbnd.dcx',
-    '/obj/o9993.objbnd.dcx',
-    '/obj/o9994.objbnd.dcx',
-    '/obj/o9995.objbnd.dcx',
-    '/obj/o9998.objbnd.dcx',
-    '/obj/o9999.objbnd.dcx',
-    '/other/default.rumblebnd',
-    '/other/envlight.tpf',
-    '/other/ICON01.PNG',
-    '/other/ICON02.PNG',
-    '/other/ICON03.PNG',
-    '/other/InGameStay.loadlist',
-    '/other/lensflare.tpf',
-    '/other/MovTaeFRPG.movtae',
-    '/other/network.properties',
-    '/other/pic1.png',
-    '/other/pic2.png',
-    '/other/pic3.png',
-    '/other/PROTO_MENU_TEX.tpf.dcx',
-    '/other/SYSTEX_TEX.tpf.dcx',
-    '/param/DrawParam/a10_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a11_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a12_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a13_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a14_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a15_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a16_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a17_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a18_DrawParam.parambnd.dcx',
-    '/param/DrawParam/a99_DrawParam.parambnd.dcx',
-    '/param/DrawParam/default_DrawParam.parambnd.dcx',
-    '/param/GameParam/GameParam.parambnd.dcx',
-    '/paramdef/paramdef.paramdefbnd.dcx',
-    '/parts/AM_A_1000.partsbnd.dcx',
-    '/parts/AM_A_1000_L.partsbnd.dcx',
-    '/parts/AM_A_1000_M.partsbnd.dcx',
-    '/parts/AM_A_2560.partsbnd.dcx',
-    '/parts/AM_A_2560_L.partsbnd.dcx',
-    '/parts/AM_A_2560_M.partsbnd.dcx',
-    '/parts/AM_A_2570.partsbnd.dcx',
-    '/parts/AM_A_2570_L.partsbnd.dcx',
-    '/parts/AM_A_2570_M.partsbnd.dcx',
-    '/parts/AM_A_2870.partsbnd.dcx',
-    '/parts/AM_A_2870_L.partsbnd.dcx',
-    '/parts/AM_A_2870_M.partsbnd.dcx',
-    '/parts/AM_A_8200.partsbnd.dcx',
-    '/parts/AM_A_8200_L.partsbnd.dcx',
-    '/parts/AM_A_8200_M.partsbnd.dcx',
-    '/parts/AM_A_9200.partsbnd.dcx',
-    '/parts/AM_A_9200_L.partsbnd.dcx',
-    '/parts/AM_A_9200_M.partsbnd.dcx',
-    '/parts/AM_A_9210.partsbnd.dcx',
-    '/parts/AM_A_9210_L.partsbnd.dcx',
-    '/parts/AM_A_9210_M.partsbnd.dcx',
-    '/parts/AM_A_9220.partsbnd.dcx',
-    '/parts/AM_A_9220_L.partsbnd.dcx',
-    '/parts/AM_A_9220_M.partsbnd.dcx',
-    '/parts/AM_A_9240.partsbnd.dcx',
-    '/parts/AM_A_9240_L.partsbnd.dcx',
-    '/parts/AM_A_9240_M.partsbnd.dcx',
-    '/parts/AM_A_9250.partsbnd.dcx',
-    '/parts/AM_A_9250_L.partsbnd.dcx',
-    '/parts/AM_A_9250_M.partsbnd.dcx',
-    '/parts/AM_A_9290.partsbnd.dcx',
-    '/parts/AM_A_9290_L.partsbnd.dcx',
-    '/parts/AM_A_9290_M.partsbnd.dcx',
-    '/parts/AM_A_9310.partsbnd.dcx',
-    '/parts/AM_A_9310_L.partsbnd.dcx',
-    '/parts/AM_A_9310_M.partsbnd.dcx',
-    '/parts/AM_A_9390.partsbnd.dcx',
-    '/parts/AM_A_9390_L.partsbnd.dcx',
-    '/parts/AM_A_9390_M.partsbnd.dcx',
-    '/parts/AM_A_9470.partsbnd.dcx',
-    '/parts/AM_A_9470_L.partsbnd.dcx',
-    '/parts/AM_A_9470_M.partsbnd.dcx',
-    '/parts/AM_A_9490.partsbnd.dcx',
-    '/parts/AM_A_9490_L.partsbnd.dcx',
-    '/parts/AM_A_9490_M.partsbnd.dcx',
-    '/parts/AM_A_9500.partsbnd.dcx',
-    '/parts/AM_A_9500_L.partsbnd.dcx',
-    '/parts/AM_A_9500_M.partsbnd.dcx',
-    '/parts/AM_A_9509.partsbnd.dcx',
-    '/parts/AM_A_9509_L.partsbnd.dcx',
-    '/parts/AM_A_9509_M.partsbnd.dcx',
-    '/parts/AM_A_9550.partsbnd.dcx',
-    '/parts/AM_A_9550_L.partsbnd.dcx',
-    '/parts/AM_A_9550_M.partsbnd.dcx',
-    '/parts/AM_A_9560.partsbnd.dcx',
-    '/parts/AM_A_9560_L.partsbnd.dcx',
-    '/parts/AM_A_9560_M.partsbnd.dcx',
-    '/parts/AM_A_9570.partsbnd.dcx',
-    '/parts/AM_A_9570_L.partsbnd.dcx',
-    '/parts/AM_A_9570_M.partsbnd.dcx',
-    '/parts/AM_A_9600.partsbnd.dcx',
-    '/parts/AM_A_9600_L.partsbnd.dcx',
-    '/parts/AM_A_9600_M.partsbnd.dcx',
-    '/parts/AM_A_9630.partsbnd.dcx',
-    '/parts/AM_A_9630_L.partsbnd.dcx',
-    '/parts/AM_A_9630_M.partsbnd.dcx',
-    '/parts/AM_A_9700.partsbnd.dcx',
-    '/parts/AM_A_9700_L.partsbnd.dcx',
-    '/parts/AM_A_9700_M.partsbnd.dcx',
-    '/parts/AM_A_9730.partsbnd.dcx',
-    '/parts/AM_A_9730_L.partsbnd.dcx',
-    '/parts/AM_A_9730_M.partsbnd.dcx',
-    '/parts/AM_F_0000.partsbnd.dcx',
-    '/parts/AM_F_0000_L.partsbnd.dcx',
-    '/parts/AM_F_0000_M.partsbnd.dcx',
-    '/parts/AM_F_2520.partsbnd.dcx',
-    '/parts/AM_F_2520_L.partsbnd.dcx',
-    '/parts/AM_F_2520_M.partsbnd.dcx',
-    '/parts/AM_F_2540.partsbnd.dcx',
-    '/parts/AM_F_2540_L.partsbnd.dcx',
-    '/parts/AM_F_2540_M.partsbnd.dcx',
-    '/parts/AM_F_2550.partsbnd.dcx',
-    '/parts/AM_F_2550_L.partsbnd.dcx',
-    '/parts/AM_F_2550_M.partsbnd.dcx',
-    '/parts/AM_F_5320.partsbnd.dcx',
-    '/parts/AM_F_5320_L.partsbnd.dcx',
-    '/parts/AM_F_5320_M.partsbnd.dcx',
-    '/parts/AM_F_5370.partsbnd.dcx',
-    '/parts/AM_F_5370_L.partsbnd.dcx',
-    '/parts/AM_F_5370_M.partsbnd.dcx',
-    '/parts/AM_F_8990.partsbnd.dcx',
-    '/parts/AM_F_8990_L.partsbnd.dcx',
-    '/parts/AM_F_8990_M.partsbnd.dcx',
-    '/parts/AM_F_9230.partsbnd.dcx',
-    '/parts/AM_F_9230_L.partsbnd.dcx',
-    '/parts/AM_F_9230_M.partsbnd.dcx',
-    '/parts/AM_F_9260.partsbnd.dcx',
-    '/parts/AM_F_9260_L.partsbnd.dcx',
-    '/parts/AM_F_9260_M.partsbnd.dcx',
-    '/parts/AM_F_9270.partsbnd.dcx',
-    '/parts/AM_F_9270_L.partsbnd.dcx',
-    '/parts/AM_F_9270_M.partsbnd.dcx',
-    '/parts/AM_F_9280.partsbnd.dcx',
-    '/parts/AM_F_9280_L.partsbnd.dcx',
-    '/parts/AM_F_9280_M.partsbnd.dcx',
-    '/parts/AM_F_9300.partsbnd.dcx',
-    '/parts/AM_F_9300_L.partsbnd.dcx',
-    '/parts/AM_F_9300_M.partsbnd.dcx',
-    '/parts/AM_F_9320.partsbnd.dcx',
-    '/parts/AM_F_9320_L.partsbnd.dcx',
-    '/parts/AM_F_9320_M.partsbnd.dcx',
-    '/parts/AM_F_9340.partsbnd.dcx',
-    '/parts/AM_F_9340_L.partsbnd.dcx',
-    '/parts/AM_F_9340_M.partsbnd.dcx',
-    '/parts/AM_F_9341.partsbnd.dcx',
-    '/parts/AM_F_9341_L.partsbnd.dcx',
-    '/parts/AM_F_9341_M.partsbnd.dcx',
-    '/parts/AM_F_9350.partsbnd.dcx',
-    '/parts/AM_F_9350_L.partsbnd.dcx',
-    '/parts/AM_F_9350_M.partsbnd.dcx',
-    '/parts/AM_F_9360.partsbnd.dcx',
-    '/parts/AM_F_9360_L.partsbnd.dcx',
-    '/parts/AM_F_9360_M.partsbnd.dcx',
-    '/parts/AM_F_9370.partsbnd.dcx',
-    '/parts/AM_F_9370_L.partsbnd.dcx',
-    '/parts/AM_F_9370_M.partsbnd.dcx',
-    '/parts/AM_F_9371.partsbnd.dcx',
-    '/parts/AM_F_9371_L.partsbnd.dcx',
-    '/parts/AM_F_9371_M.partsbnd.dcx',
-    '/parts/AM_F_9372.partsbnd.dcx',
-    '/parts/AM_F_9372_L.partsbnd.dcx',
-    '/parts/AM_F_9372_M.partsbnd.dcx',
-    '/parts/AM_F_9380.partsbnd.dcx',
-    '/parts/AM_F_9380_L.partsbnd.dcx',
-    '/parts/AM_F_9380_M.partsbnd.dcx',
-    '/parts/AM_F_9400.partsbnd.dcx',
-    '/parts/AM_F_9400_L.partsbnd.dcx',
-    '/parts/AM_F_9400_M.partsbnd.dcx',
-    '/parts/AM_F_9420.partsbnd.dcx',
-    '/parts/AM_F_9420_L.partsbnd.dcx',
-    '/parts/AM_F_9420_M.partsbnd.dcx',
-    '/parts/AM_F_9430.partsbnd.dcx',
-    '/parts/AM_F_9430_L.partsbnd.dcx',
-    '/parts/AM_F_9430_M.partsbnd.dcx',
-    '/parts/AM_F_9440.partsbnd.dcx',
-    '/parts/AM_F_9440_L.partsbnd.dcx',
-    '/parts/AM_F_9440_M.partsbnd.dcx',
-    '/parts/AM_F_9450.partsbnd.dcx',
-    '/parts/AM_F_9450_L.partsbnd.dcx',
-    '/parts/AM_F_9450_M.partsbnd.dcx',
-    '/parts/AM_F_9460.partsbnd.dcx',
-    '/parts/AM_F_9460_L.partsbnd.dcx',
-    '/parts/AM_F_9460_M.partsbnd.dcx',
-    '/parts/AM_F_9480.partsbnd.dcx',
-    '/parts/AM_F_9480_L.partsbnd.dcx',
-    '/parts/AM_F_9480_M.partsbnd.dcx',
-    '/parts/AM_F_9510.partsbnd.dcx',
-    '/parts/AM_F_9510_L.partsbnd.dcx',
-    '/parts/AM_F_9510_M.partsbnd.dcx',
-    '/parts/AM_F_9520.partsbnd.dcx',
-    '/parts/AM_F_9520_L.partsbnd.dcx',
-    '/parts/AM_F_9520_M.partsbnd.dcx',
-    '/parts/AM_F_9521.partsbnd.dcx',
-    '/parts/AM_F_9521_L.partsbnd.dcx',
-    '/parts/AM_F_9521_M.partsbnd.dcx',
-    '/parts/AM_F_9529.partsbnd.dcx',
-    '/parts/AM_F_9529_L.partsbnd.dcx',
-    '/parts/AM_F_9529_M.partsbnd.dcx',
-    '/parts/AM_F_9530.partsbnd.dcx',
-    '/parts/AM_F_9530_L.partsbnd.dcx',
-    '/parts/AM_F_9530_M.partsbnd.dcx',
-    '/parts/AM_F_9540.partsbnd.dcx',
-    '/parts/AM_F_9540_L.partsbnd.dcx',
-    '/parts/AM_F_9540_M.partsbnd.dcx',
-    '/parts/AM_F_9610.partsbnd.dcx',
-    '/parts/AM_F_9610_L.partsbnd.dcx',
-    '/parts/AM_F_9610_M.partsbnd.dcx',
-    '/parts/AM_F_9620.partsbnd.dcx',
-    '/parts/AM_F_9620_L.partsbnd.dcx',
-    '/parts/AM_F_9620_M.partsbnd.dcx',
-    '/parts/AM_F_9710.partsbnd.dcx',
-    '/parts/AM_F_9710_L.partsbnd.dcx',
-    '/parts/AM_F_9710_M.partsbnd.dcx',
-    '/parts/AM_F_9720.partsbnd.dcx',
-    '/parts/AM_F_9720_L.partsbnd.dcx',
-    '/parts/AM_F_9720_M.partsbnd.dcx',
-    '/parts/AM_F_9740.partsbnd.dcx',
-    '/parts/AM_F_9740_L.partsbnd.dcx',
-    '/parts/AM_F_9740_M.partsbnd.dcx',
-    '/parts/AM_M_0000.partsbnd.dcx',
-    '/parts/AM_M_0000_L.partsbnd.dcx',
-    '/parts/AM_M_0000_M.partsbnd.dcx',
-    '/parts/AM_M_2520.partsbnd.dcx',
-    '/parts/AM_M_2520_L.partsbnd.dcx',
-    '/parts/AM_M_2520_M.partsbnd.dcx',
-    '/parts/AM_M_2540.partsbnd.dcx',
-    '/parts/AM_M_2540_L.partsbnd.dcx',
-    '/parts/AM_M_2540_M.partsbnd.dcx',
-    '/parts/AM_M_2550.partsbnd.dcx',
-    '/parts/AM_M_2550_L.partsbnd.dcx',
-    '/parts/AM_M_2550_M.partsbnd.dcx',
-    '/parts/AM_M_5320.partsbnd.dcx',
-    '/parts/AM_M_5320_L.partsbnd.dcx',
-    '/parts/AM_M_5320_M.partsbnd.dcx',
-    '/parts/AM_M_5370.partsbnd.dcx',
-    '/parts/AM_M_5370_L.partsbnd.dcx',
-    '/parts/AM_M_5370_M.partsbnd.dcx',
-    '/parts/AM_M_6200.partsbnd.dcx',
-    '/parts/AM_M_6200_L.partsbnd.dcx',
-    '/parts/AM_M_6200_M.partsbnd.dcx',
-    '/parts/AM_M_8990.partsbnd.dcx',
-    '/parts/AM_M_8990_L.partsbnd.dcx',
-    '/parts/AM_M_8990_M.partsbnd.dcx',
-    '/parts/AM_M_9230.partsbnd.dcx',
-    '/parts/AM_M_9230_L.partsbnd.dcx',
-    '/parts/AM_M_9230_M.partsbnd.dcx',
-    '/parts/AM_M_9260.partsbnd.dcx',
-    '/parts/AM_M_9260_L.partsbnd.dcx',
-    '/parts/AM_M_9260_M.partsbnd.dcx',
-    '/parts/AM_M_9270.partsbnd.dcx',
-    '/parts/AM_M_9270_L.partsbnd.dcx',
-    '/parts/AM_M_9270_M.partsbnd.dcx',
-    '/parts/AM_M_9280.partsbnd.dcx',
-    '/parts/AM_M_9280_L.partsbnd.dcx',
-    '/parts/AM_M_9280_M.partsbnd.dcx',
-    '/parts/AM_M_9289.partsbnd.dcx',
-    '/parts/AM_M_9289_L.partsbnd.dcx',
-    '/parts/AM_M_9289_M.partsbnd.dcx',
-    '/parts/AM_M_9300.partsbnd.dcx',
-    '/parts/AM_M_9300_L.partsbnd.dcx',
-    '/parts/AM_M_9300_M.partsbnd.dcx',
-    '/parts/AM_M_9309.partsbnd.dcx',
-    '/parts/AM_M_9309_L.partsbnd.dcx',
-    '/parts/AM_M_9309_M.partsbnd.dcx',
-    '/parts/AM_M_9320.partsbnd.dcx',
-    '/parts/AM_M_9320_L.partsbnd.dcx',
-    '/parts/AM_M_9320_M.partsbnd.dcx',
-    '/parts/AM_M_9340.partsbnd.dcx',
-    '/parts/AM_M_9340_L.partsbnd.dcx',
-    '/parts/AM_M_9340_M.partsbnd.dcx',
-    '/parts/AM_M_9341.partsbnd.dcx',
-    '/parts/AM_M_9341_L.partsbnd.dcx',
-    '/parts/AM_M_9341_M.partsbnd.dcx',
-    '/parts/AM_M_9349.partsbnd.dcx',
-    '/parts/AM_M_9349_L.partsbnd.dcx',
-    '/parts/AM_M_9349_M.partsbnd.dcx',
-    '/parts/AM_M_9350.partsbnd.dcx',
-    '/parts/AM_M_9350_L.partsbnd.dcx',
-    '/parts/AM_M_9350_M.partsbnd.dcx',
-    '/parts/AM_M_9360.partsbnd.dcx',
-    '/parts/AM_M_9360_L.partsbnd.dcx',
-    '/parts/AM_M_9360_M.partsbnd.dcx',
-    '/parts/AM_M_9370.partsbnd.dcx',
-    '/parts/AM_M_9370_L.partsbnd.dcx',
-    '/parts/AM_M_9370_M.partsbnd.dcx',
-    '/parts/AM_M_9371.partsbnd.dcx',
-    '/parts/AM_M_9371_L.partsbnd.dcx',
-    '/parts/AM_M_9371_M.partsbnd.dcx',
-    '/parts/AM_M_9372.partsbnd.dcx',
-    '/parts/AM_M_9372_L.partsbnd.dcx',
-    '/parts/AM_M_9372_M.partsbnd.dcx',
-    '/parts/AM_M_9379.partsbnd.dcx',
-    '/parts/AM_M_9379_L.partsbnd.dcx',
-    '/parts/AM_M_9379_M.partsbnd.dcx',
-    '/parts/AM_M_9380.partsbnd.dcx',
-    '/parts/AM_M_9380_L.partsbnd.dcx',
-    '/parts/AM_M_9380_M.partsbnd.dcx',
-    '/parts/AM_M_9389.partsbnd.dcx',
-    '/parts/AM_M_9389_L.partsbnd.dcx',
-    '/parts/AM_M_9389_M.partsbnd.dcx',
-    '/parts/AM_M_9400.partsbnd.dcx',
-    '/parts/AM_M_9400_L.partsbnd.dcx',
-    '/parts/AM_M_9400_M.partsbnd.dcx',
-    '/parts/AM_M_9410.partsbnd.dcx',
-    '/parts/AM_M_9410_L.partsbnd.dcx',
-    '/parts/AM_M_9410_M.partsbnd.dcx',
-    '/parts/AM_M_9420.partsbnd.dcx',
-    '/parts/AM_M_9420_L.partsbnd.dcx',
-    '/parts/AM_M_9420_M.partsbnd.dcx',
-    '/parts/AM_M_9430.partsbnd.dcx',
-    '/parts/AM_M_9430_L.partsbnd.dcx',
-    '/parts/AM_M_9430_M.partsbnd.dcx',
-    '/parts/AM_M_9440.partsbnd.dcx',
-    '/parts/AM_M_9440_L.partsbnd.dcx',
-    '/parts/AM_M_9440_M.partsbnd.dcx',
-    '/parts/AM_M_9450.partsbnd.dcx',
-    '/parts/AM_M_9450_L.partsbnd.dcx',
-    '/parts/AM_M_9450_M.partsbnd.dcx',
-    '/parts/AM_M_9460.partsbnd.dcx',
-    '/parts/AM_M_9460_L.partsbnd.dcx',
-    '/parts/AM_M_9460_M.partsbnd.dcx',
-    '/parts/AM_M_9480.partsbnd.dcx',
-    '/parts/AM_M_9480_L.partsbnd.dcx',
-    '/parts/AM_M_9480_M.partsbnd.dcx',
-    '/parts/AM_M_9510.partsbnd.dcx',
-    '/parts/AM_M_9510_L.partsbnd.dcx',
-    '/parts/AM_M_9510_M.partsbnd.dcx',
-    '/parts/AM_M_9520.partsbnd.dcx',
-    '/parts/AM_M_9520_L.partsbnd.dcx',
-    '/parts/AM_M_9520_M.partsbnd.dcx',
-    '/parts/AM_M_9521.partsbnd.dcx',
-    '/parts/AM_M_9521_L.partsbnd.dcx',
-    '/parts/AM_M_9521_M.partsbnd.dcx',
-    '/parts/AM_M_9530.partsbnd.dcx',
-    '/parts/AM_M_9530_L.partsbnd.dcx',
-    '/parts/AM_M_9530_M.partsbnd.dcx',
-    '/parts/AM_M_9540.partsbnd.dcx',
-    '/parts/AM_M_9540_L.partsbnd.dcx',
-    '/parts/AM_M_9540_M.partsbnd.dcx',
-    '/parts/AM_M_9590.partsbnd.dcx',
-    '/parts/AM_M_9590_L.partsbnd.dcx',
-    '/parts/AM_M_9590_M.partsbnd.dcx',
-    '/parts/AM_M_9610.partsbnd.dcx',
-    '/parts/AM_M_9610_L.partsbnd.dcx',
-    '/parts/AM_M_9610_M.partsbnd.dcx',
-    '/parts/AM_M_9620.partsbnd.dcx',
-    '/parts/AM_M_9620_L.partsbnd.dcx',
-    '/parts/AM_M_9620_M.partsbnd.dcx',
-    '/parts/AM_M_9710.partsbnd.dcx',
-    '/parts/AM_M_9710_L.partsbnd.dcx',
-    '/parts/AM_M_9710_M.partsbnd.dcx',
-    '/parts/AM_M_9720.partsbnd.dcx',
-    '/parts/AM_M_9720_L.partsbnd.dcx',
-    '/parts/AM_M_9720_M.partsbnd.dcx',
-    '/parts/AM_M_9740.partsbnd.dcx',
-    '/parts/AM_M_9740_L.partsbnd.dcx',
-    '/parts/AM_M_9740_M.partsbnd.dcx',
-    '/parts/BD_A_1000.partsbnd.dcx',
-    '/parts/BD_A_1000_L.partsbnd.dcx',
-    '/parts/BD_A_1000_M.partsbnd.dcx',
-    '/parts/BD_A_2570.partsbnd.dcx',
-    '/parts/BD_A_2570_L.partsbnd.dcx',
-    '/parts/BD_A_2570_M.partsbnd.dcx',
-    '/parts/BD_A_2870.partsbnd.dcx',
-    '/parts/BD_A_2870_L.partsbnd.dcx',
-    '/parts/BD_A_2870_M.partsbnd.dcx',
-    '/parts/BD_A_8200.partsbnd.dcx',
-    '/parts/BD_A_8200_L.partsbnd.dcx',
-    '/parts/BD_A_8200_M.partsbnd.dcx',
-    '/parts/BD_A_9200.partsbnd.dcx',
-    '/parts/BD_A_9200_L.partsbnd.dcx',
-    '/parts/BD_A_9200_M.partsbnd.dcx',
-    '/parts/BD_A_9210.partsbnd.dcx',
-    '/parts/BD_A_9210_L.partsbnd.dcx',
-    '/parts/BD_A_9210_M.partsbnd.dcx',
-    '/parts/BD_A_9240.partsbnd.dcx',
-    '/parts/BD_A_9240_L.partsbnd.dcx',
-    '/parts/BD_A_9240_M.partsbnd.dcx',
-    '/parts/BD_A_9250.partsbnd.dcx',
-    '/parts/BD_A_9250_L.partsbnd.dcx',
-    '/parts/BD_A_9250_M.partsbnd.dcx',
-    '/parts/BD_A_9290.partsbnd.dcx',
-    '/parts/BD_A_9290_L.partsbnd.dcx',
-    '/parts/BD_A_9290_M.partsbnd.dcx',
-    '/parts/BD_A_9310.partsbnd.dcx',
-    '/parts/BD_A_9310_L.partsbnd.dcx',
-    '/parts/BD_A_9310_M.partsbnd.dcx',
-    '/parts/BD_A_9390.partsbnd.dcx',
-    '/parts/BD_A_9390_L.partsbnd.dcx',
-    '/parts/BD_A_9390_M.partsbnd.dcx',
-    '/parts/BD_A_9470.partsbnd.dcx',
-    '/parts/BD_A_9470_L.partsbnd.dcx',
-    '/parts/BD_A_9470_M.partsbnd.dcx',
-    '/parts/BD_A_9490.partsbnd.dcx',
-    '/parts/BD_A_9490_L.partsbnd.dcx',
-    '/parts/BD_A_9490_M.partsbnd.dcx',
-    '/parts/BD_A_9500.partsbnd.dcx',
-    '/parts/BD_A_9500_L.partsbnd.dcx',
-    '/parts/BD_A_9500_M.partsbnd.dcx',
-    '/parts/BD_A_9509.partsbnd.dcx',
-    '/parts/BD_A_9509_L.partsbnd.dcx',
-    '/parts/BD_A_9509_M.partsbnd.dcx',
-    '/parts/BD_A_9550.partsbnd.dcx',
-    '/parts/BD_A_9550_L.partsbnd.dcx',
-    '/parts/BD_A_9550_M.partsbnd.dcx',
-    '/parts/BD_A_9560.partsbnd.dcx',
-    '/parts/BD_A_9560_L.partsbnd.dcx',
-    '/parts/BD_A_9560_M.partsbnd.dcx',
-    '/parts/BD_A_9570.partsbnd.dcx',
-    '/parts/BD_A_9570_L.partsbnd.dcx',
-    '/parts/BD_A_9570_M.partsbnd.dcx',
-    '/parts/BD_A_9600.partsbnd.dcx',
-    '/parts/BD_A_9600_L.partsbnd.dcx',
-    '/parts/BD_A_9600_M.partsbnd.dcx',
-    '/parts/BD_A_9630.partsbnd.dcx',
-    '/parts/BD_A_9630_L.partsbnd.dcx',
-    '/parts/BD_A_9630_M.partsbnd.dcx',
-    '/parts/BD_A_9700.partsbnd.dcx',
-    '/parts/BD_A_9700_L.partsbnd.dcx',
-    '/parts/BD_A_9700_M.partsbnd.dcx',
-    '/parts/BD_A_9730.partsbnd.dcx',
-    '/parts/BD_A_9730_L.partsbnd.dcx',
-    '/parts/BD_A_9730_M.partsbnd.dcx',
-    '/parts/BD_F_0000.partsbnd.dcx',
-    '/parts/BD_F_0000_L.partsbnd.dcx',
-    '/parts/BD_F_0000_M.partsbnd.dcx',
-    '/parts/BD_F_2520.partsbnd.dcx',
-    '/parts/BD_F_2520_L.partsbnd.dcx',
-    '/parts/BD_F_2520_M.partsbnd.dcx',
-    '/parts/BD_F_2540.partsbnd.dcx',
-    '/parts/BD_F_2540_L.partsbnd.dcx',
-    '/parts/BD_F_2540_M.partsbnd.dcx',
-    '/parts/BD_F_2550.partsbnd.dcx',
-    '/parts/BD_F_2550_L.partsbnd.dcx',
-    '/parts/BD_F_2550_M.partsbnd.dcx',
-    '/parts/BD_F_2560.partsbnd.dcx',
-    '/parts/BD_F_2560_L.partsbnd.dcx',
-    '/parts/BD_F_2560_M.partsbnd.dcx',
-    '/parts/BD_F_5320.partsbnd.dcx',
-    '/parts/BD_F_5320_L.partsbnd.dcx',
-    '/parts/BD_F_5320_M.partsbnd.dcx',
-    '/parts/BD_F_5370.partsbnd.dcx',
-    '/parts/BD_F_5370_L.partsbnd.dcx',
-    '/parts/BD_F_5370_M.partsbnd.dcx',
-    '/parts/BD_F_8990.partsbnd.dcx',
-    '/parts/BD_F_8990_L.partsbnd.dcx',
-    '/parts/BD_F_8990_M.partsbnd.dcx',
-    '/parts/BD_F_9220.partsbnd.dcx',
-    '/parts/BD_F_9220_L.partsbnd.dcx',
-    '/parts/BD_F_9220_M.partsbnd.dcx',
-    '/parts/BD_F_9230.partsbnd.dcx',
-    '/parts/BD_F_9230_L.partsbnd.dcx',
-    '/parts/BD_F_9230_M.partsbnd.dcx',
-    '/parts/BD_F_9260.partsbnd.dcx',
-    '/parts/BD_F_9260_L.partsbnd.dcx',
-    '/parts/BD_F_9260_M.partsbnd.dcx',
-    '/parts/BD_F_9270.partsbnd.dcx',
-    '/parts/BD_F_9270_L.partsbnd.dcx',
-    '/parts/BD_F_9270_M.partsbnd.dcx',
-    '/parts/BD_F_9280.partsbnd.dcx',
-    '/parts/BD_F_9280_L.partsbnd.dcx',
-    '/parts/BD_F_9280_M.partsbnd.dcx',
-    '/parts/BD_F_9300.partsbnd.dcx',
-    '/parts/BD_F_9300_L.partsbnd.dcx',
-    '/parts/BD_F_9300_M.partsbnd.dcx',
-    '/parts/BD_F_9320.partsbnd.dcx',
-    '/parts/BD_F_9320_L.partsbnd.dcx',
-    '/parts/BD_F_9320_M.partsbnd.dcx',
-    '/parts/BD_F_9340.partsbnd.dcx',
-    '/parts/BD_F_9340_L.partsbnd.dcx',
-    '/parts/BD_F_9340_M.partsbnd.dcx',
-    '/parts/BD_F_9341.partsbnd.dcx',
-    '/parts/BD_F_9341_L.partsbnd.dcx',
-    '/parts/BD_F_9341_M.partsbnd.dcx',
-    '/parts/BD_F_9350.partsbnd.dcx',
-    '/parts/BD_F_9350_L.partsbnd.dcx',
-    '/parts/BD_F_9350_M.partsbnd.dcx',
-    '/parts/BD_F_9360.partsbnd.dcx',
-    '/parts/BD_F_9360_L.partsbnd.dcx',
-    '/parts/BD_F_9360_M.partsbnd.dcx',
-    '/parts/BD_F_9370.partsbnd.dcx',
-    '/parts/BD_F_9370_L.partsbnd.dcx',
-    '/parts/BD_F_9370_M.partsbnd.dcx',
-    '/parts/BD_F_9371.partsbnd.dcx',
-    '/parts/BD_F_9371_L.partsbnd.dcx',
-    '/parts/BD_F_9371_M.partsbnd.dcx',
-    '/parts/BD_F_9372.partsbnd.dcx',
-    '/parts/BD_F_9372_L.partsbnd.dcx',
-    '/parts/BD_F_9372_M.partsbnd.dcx',
-    '/parts/BD_F_9380.partsbnd.dcx',
-    '/parts/BD_F_9380_L.partsbnd.dcx',
-    '/parts/BD_F_9380_M.partsbnd.dcx',
-    '/parts/BD_F_9400.partsbnd.dcx',
-    '/parts/BD_F_9400_L.partsbnd.dcx',
-    '/parts/BD_F_9400_M.partsbnd.dcx',
-    '/parts/BD_F_9420.partsbnd.dcx',
-    '/parts/BD_F_9420_L.partsbnd.dcx',
-    '/parts/BD_F_9420_M.partsbnd.dcx',
-    '/parts/BD_F_9430.partsbnd.dcx',
-    '/parts/BD_F_9430_L.partsbnd.dcx',
-    '/parts/BD_F_9430_M.partsbnd.dcx',
-    '/parts/BD_F_9440.partsbnd.dcx',
-    '/parts/BD_F_9440_L.partsbnd.dcx',
-    '/parts/BD_F_9440_M.partsbnd.dcx',
-    '/parts/BD_F_9450.partsbnd.dcx',
-    '/parts/BD_F_9450_L.partsbnd.dcx',
-    '/parts/BD_F_9450_M.partsbnd.dcx',
-    '/parts/BD_F_9460.partsbnd.dcx',
-    '/parts/BD_F_9460_L.partsbnd.dcx',
-    '/parts/BD_F_9460_M.partsbnd.dcx',
-    '/parts/BD_F_9480.partsbnd.dcx',
-    '/parts/BD_F_9480_L.partsbnd.dcx',
-    '/parts/BD_F_9480_M.partsbnd.dcx',
-    '/parts/BD_F_9510.partsbnd.dcx',
-    '/parts/BD_F_9510_L.partsbnd.dcx',
-    '/parts/BD_F_9510_M.partsbnd.dcx',
-    '/parts/BD_F_9520.partsbnd.dcx',
-    '/parts/BD_F_9520_L.partsbnd.dcx',
-    '/parts/BD_F_9520_M.partsbnd.dcx',
-    '/parts/BD_F_9521.partsbnd.dcx',
-    '/parts/BD_F_9521_L.partsbnd.dcx',
-    '/parts/BD_F_9521_M.partsbnd.dcx',
-    '/parts/BD_F_9529.partsbnd.dcx',
-    '/parts/BD_F_9529_L.partsbnd.dcx',
-    '/parts/BD_F_9529_M.partsbnd.dcx',
-    '/parts/BD_F_9530.partsbnd.dcx',
-    '/parts/BD_F_9530_L.partsbnd.dcx',
-    '/parts/BD_F_9530_M.partsbnd.dcx',
-    '/parts/BD_F_9540.partsbnd.dcx',
-    '/parts/BD_F_9540_L.partsbnd.dcx',
-    '/parts/BD_F_9540_M.partsbnd.dcx',
-    '/parts/BD_F_9610.partsbnd.dcx',
-    '/parts/BD_F_9610_L.partsbnd.dcx',
-    '/parts/BD_F_9610_M.partsbnd.dcx',
-    '/parts/BD_F_9620.partsbnd.dcx',
-    '/parts/BD_F_9620_L.partsbnd.dcx',
-    '/parts/BD_F_9620_M.partsbnd.dcx',
-    '/parts/BD_F_9710.partsbnd.dcx',
-    '/parts/BD_F_9710_L.partsbnd.dcx',
-    '/parts/BD_F_9710_M.partsbnd.dcx',
-    '/parts/BD_F_9720.partsbnd.dcx',
-    '/parts/BD_F_9720_L.partsbnd.dcx',
-    '/parts/BD_F_9720_M.partsbnd.dcx',
-    '/parts/BD_F_9740.partsbnd.dcx',
-    '/parts/BD_F_9740_L.partsbnd.dcx',
-    '/parts/BD_F_9740_M.partsbnd.dcx',
-    '/parts/BD_M_0000.partsbnd.dcx',
-    '/parts/BD_M_0000_L.partsbnd.dcx',
-    '/parts/BD_M_0000_M.partsbnd.dcx',
-    '/parts/BD_M_2520.partsbnd.dcx',
-    '/parts/BD_M_2520_L.partsbnd.dcx',
-    '/parts/BD_M_2520_M.partsbnd.dcx',
-    '/parts/BD_M_2540.partsbnd.dcx',
-    '/parts/BD_M_2540_L.partsbnd.dcx',
-    '/parts/BD_M_2540_M.partsbnd.dcx',
-    '/parts/BD_M_2550.partsbnd.dcx',
-    '/parts/BD_M_2550_L.partsbnd.dcx',
-    '/parts/BD_M_2550_M.partsbnd.dcx',
-    '/parts/BD_M_2560.partsbnd.dcx',
-    '/parts/BD_M_2560_L.partsbnd.dcx',
-    '/parts/BD_M_2560_M.partsbnd.dcx',
-    '/parts/BD_M_5320.partsbnd.dcx',
-    '/parts/BD_M_5320_L.partsbnd.dcx',
-    '/parts/BD_M_5320_M.partsbnd.dcx',
-    '/parts/BD_M_5370.partsbnd.dcx',
-    '/parts/BD_M_5370_L.partsbnd.dcx',
-    '/parts/BD_M_5370_M.partsbnd.dcx',
-    '/parts/BD_M_6200.partsbnd.dcx',
-    '/parts/BD_M_6200_L.partsbnd.dcx',
-    '/parts/BD_M_6200_M.partsbnd.dcx',
-    '/parts/BD_M_8990.partsbnd.dcx',
-    '/parts/BD_M_8990_L.partsbnd.dcx',
-    '/parts/BD_M_8990_M.partsbnd.dcx',
-    '/parts/BD_M_9220.partsbnd.dcx',
-    '/parts/BD_M_9220_L.partsbnd.dcx',
-    '/parts/BD_M_9220_M.partsbnd.dcx',
-    '/parts/BD_M_9230.partsbnd.dcx',
-    '/parts/BD_M_9230_L.partsbnd.dcx',
-    '/parts/BD_M_9230_M.partsbnd.dcx',
-    '/parts/BD_M_9260.partsbnd.dcx',
-    '/parts/BD_M_9260_L.partsbnd.dcx',
-    '/parts/BD_M_9260_M.partsbnd.dcx',
-    '/parts/BD_M_9270.partsbnd.dcx',
-    '/parts/BD_M_9270_L.partsbnd.dcx',
-    '/parts/BD_M_9270_M.partsbnd.dcx',
-    '/parts/BD_M_9280.partsbnd.dcx',
-    '/parts/BD_M_9280_L.partsbnd.dcx',
-    '/parts/BD_M_9280_M.partsbnd.dcx',
-    '/parts/BD_M_9289.partsbnd.dcx',
-    '/parts/BD_M_9289_L.partsbnd.dcx',
-    '/parts/BD_M_9289_M.partsbnd.dcx',
-    '/parts/BD_M_9300.partsbnd.dcx',
-    '/parts/BD_M_9300_L.partsbnd.dcx',
-    '/parts/BD_M_9300_M.partsbnd.dcx',
-    '/parts/BD_M_9309.partsbnd.dcx',
-    '/parts/BD_M_9309_L.partsbnd.dcx',
-    '/parts/BD_M_9309_M.partsbnd.dcx',
-    '/parts/BD_M_9320.partsbnd.dcx',
-    '/parts/BD_M_9320_L.partsbnd.dcx',
-    '/parts/BD_M_9320_M.partsbnd.dcx',
-    '/parts/BD_M_9340.partsbnd.dcx',
-    '/parts/BD_M_9340_L.partsbnd.dcx',
-    '/parts/BD_M_9340_M.partsbnd.dcx',
-    '/parts/BD_M_9341.partsbnd.dcx',
-    '/parts/BD_M_9341_L.partsbnd.dcx',
-    '/parts/BD_M_9341_M.partsbnd.dcx',
-    '/parts/BD_M_9349.partsbnd.dcx',
-    '/parts/BD_M_9349_L.partsbnd.dcx',
-    '/parts/BD_M_9349_M.partsbnd.dcx',
-    '/parts/BD_M_9350.partsbnd.dcx',
-    '/parts/BD_M_9350_L.partsbnd.dcx',
-    '/parts/BD_M_9350_M.partsbnd.dcx',
-    '/parts/BD_M_9360.partsbnd.dcx',
-    '/parts/BD_M_9360_L.partsbnd.dcx',
-    '/parts/BD_M_9360_M.partsbnd.dcx',
-    '/parts/BD_M_9370.partsbnd.dcx',
-    '/parts/BD_M_9370_L.partsbnd.dcx',
-    '/parts/BD_M_9370_M.partsbnd.dcx',
-    '/parts/BD_M_9371.partsbnd.dcx',
-    '/parts/BD_M_9371_L.partsbnd.dcx',
-    '/parts/BD_M_9371_M.partsbnd.dcx',
-    '/parts/BD_M_9372.partsbnd.dcx',
-    '/parts/BD_M_9372_L.partsbnd.dcx',
-    '/parts/BD_M_9372_M.partsbnd.dcx',
-    '/parts/BD_M_9379.partsbnd.dcx',
-    '/parts/BD_M_9379_L.partsbnd.dcx',
-    '/parts/BD_M_9379_M.partsbnd.dcx',
-    '/parts/BD_M_9380.partsbnd.dcx',
-    '/parts/BD_M_9380_L.partsbnd.dcx',
-    '/parts/BD_M_9380_M.partsbnd.dcx',
-    '/parts/BD_M_9389.partsbnd.dcx',
-    '/parts/BD_M_9389_L.partsbnd.dcx',
-    '/parts/BD_M_9389_M.partsbnd.dcx',
-    '/parts/BD_M_9400.partsbnd.dcx',
-    '/parts/BD_M_9400_L.partsbnd.dcx',
-    '/parts/BD_M_9400_M.partsbnd.dcx',
-    '/parts/BD_M_9410.partsbnd.dcx',
-    '/parts/BD_M_9410_L.partsbnd.dcx',
-    '/parts/BD_M_9410_M.partsbnd.dcx',
-    '/parts/BD_M_9420.partsbnd.dcx',
-    '/parts/BD_M_9420_L.partsbnd.dcx',
-    '/parts/BD_M_9420_M.partsbnd.dcx',
-    '/parts/BD_M_9430.partsbnd.dcx',
-    '/parts/BD_M_9430_L.partsbnd.dcx',
-    '/parts/BD_M_9430_M.partsbnd.dcx',
-    '/parts/BD_M_9440.partsbnd.dcx',
-    '/parts/BD_M_9440_L.partsbnd.dcx',
-    '/parts/BD_M_9440_M.partsbnd.dcx',
-    '/parts/BD_M_9450.partsbnd.dcx',
-    '/parts/BD_M_9450_L.partsbnd.dcx',
-    '/parts/BD_M_9450_M.partsbnd.dcx',
-    '/parts/BD_M_9460.partsbnd.dcx',
-    '/parts/BD_M_9460_L.partsbnd.dcx',
-    '/parts/BD_M_9460_M.partsbnd.dcx',
-    '/parts/BD_M_9480.partsbnd.dcx',
-    '/parts/BD_M_9480_L.partsbnd.dcx',
-    '/parts/BD_M_9480_M.partsbnd.dcx',
-    '/parts/BD_M_9510.partsbnd.dcx',
-    '/parts/BD_M_9510_L.partsbnd.dcx',
-    '/parts/BD_M_9510_M.partsbnd.dcx',
-    '/parts/BD_M_9520.partsbnd.dcx',
-    '/parts/BD_M_9520_L.partsbnd.dcx',
-    '/parts/BD_M_9520_M.partsbnd.dcx',
-    '/parts/BD_M_9521.partsbnd.dcx',
-    '/parts/BD_M_9521_L.partsbnd.dcx',
-    '/parts/BD_M_9521_M.partsbnd.dcx',
-    '/parts/BD_M_9530.partsbnd.dcx',
-    '/parts/BD_M_9530_L.partsbnd.dcx',
-    '/parts/BD_M_9530_M.partsbnd.dcx',
-    '/parts/BD_M_9540.partsbnd.dcx',
-    '/parts/BD_M_9540_L.partsbnd.dcx',
-    '/parts/BD_M_9540_M.partsbnd.dcx',
-    '/parts/BD_M_9590.partsbnd.dcx',
-    '/parts/BD_M_9590_L.partsbnd.dcx',
-    '/parts/BD_M_9590_M.partsbnd.dcx',
-    '/parts/BD_M_9610.partsbnd.dcx',
-    '/parts/BD_M_9610_L.partsbnd.dcx',
-    '/parts/BD_M_9610_M.partsbnd.dcx',
-    '/parts/BD_M_9620.partsbnd.dcx',
-    '/parts/BD_M_9620_L.partsbnd.dcx',
-    '/parts/BD_M_9620_M.partsbnd.dcx',
-    '/parts/BD_M_9710.partsbnd.dcx',
-    '/parts/BD_M_9710_L.partsbnd.dcx',
-    '/parts/BD_M_9710_M.partsbnd.dcx',
-    '/parts/BD_M_9720.partsbnd.dcx',
-    '/parts/BD_M_9720_L.partsbnd.dcx',
-    '/parts/BD_M_9720_M.partsbnd.dcx',
-    '/parts/BD_M_9740.partsbnd.dcx',
-    '/parts/BD_M_9740_L.partsbnd.dcx',
-    '/parts/BD_M_9740_M.partsbnd.dcx',
-    '/parts/Common_Body.tpf',
-    '/parts/Common_Body_M.tpf',
-    '/parts/Common_Ghost.tpf',
-    '/parts/FC_A_9000.partsbnd.dcx',
-    '/parts/FC_A_9000_L.partsbnd.dcx',
-    '/parts/FC_A_9000_M.partsbnd.dcx',
-    '/parts/FC_F_0000.partsbnd.dcx',
-    '/parts/FC_F_0000_L.partsbnd.dcx',
-    '/parts/FC_F_0000_M.partsbnd.dcx',
-    '/parts/FC_F_9000.partsbnd.dcx',
-    '/parts/FC_F_9000_L.partsbnd.dcx',
-    '/parts/FC_F_9000_M.partsbnd.dcx',
-    '/parts/FC_F_9900.partsbnd.dcx',
-    '/parts/FC_F_9900_L.partsbnd.dcx',
-    '/parts/FC_F_9900_M.partsbnd.dcx',
-    '/parts/FC_M_0000.partsbnd.dcx',
-    '/parts/FC_M_0000_L.partsbnd.dcx',
-    '/parts/FC_M_0000_M.partsbnd.dcx',
-    '/parts/FC_M_9000.partsbnd.dcx',
-    '/parts/FC_M_9000_L.partsbnd.dcx',
-    '/parts/FC_M_9000_M.partsbnd.dcx',
-    '/parts/FC_M_9900.partsbnd.dcx',
-    '/parts/FC_M_9900_L.partsbnd.dcx',
-    '/parts/FC_M_9900_M.partsbnd.dcx',
-    '/parts/FG_A_0000.partsbnd.dcx',
-    '/parts/FG_A_0000_L.partsbnd.dcx',
-    '/parts/FG_A_0000_M.partsbnd.dcx',
-    '/parts/HD_A_1000.partsbnd.dcx',
-    '/parts/HD_A_1000_L.partsbnd.dcx',
-    '/parts/HD_A_1000_M.partsbnd.dcx',
-    '/parts/HD_A_2560.partsbnd.dcx',
-    '/parts/HD_A_2560_L.partsbnd.dcx',
-    '/parts/HD_A_2560_M.partsbnd.dcx',
-    '/parts/HD_A_2570.partsbnd.dcx',
-    '/parts/HD_A_2570_L.partsbnd.dcx',
-    '/parts/HD_A_2570_M.partsbnd.dcx',
-    '/parts/HD_A_2660.partsbnd.dcx',
-    '/parts/HD_A_2660_L.partsbnd.dcx',
-    '/parts/HD_A_2660_M.partsbnd.dcx',
-    '/parts/HD_A_2780.partsbnd.dcx',
-    '/parts/HD_A_2780_L.partsbnd.dcx',
-    '/parts/HD_A_2780_M.partsbnd.dcx',
-    '/parts/HD_A_2870.partsbnd.dcx',
-    '/parts/HD_A_2870_L.partsbnd.dcx',
-    '/parts/HD_A_2870_M.partsbnd.dcx',
-    '/parts/HD_A_2920.partsbnd.dcx',
-    '/parts/HD_A_2920_L.partsbnd.dcx',
-    '/parts/HD_A_2920_M.partsbnd.dcx',
-    '/parts/HD_A_3320.partsbnd.dcx',
-    '/parts/HD_A_3320_L.partsbnd.dcx',
-    '/parts/HD_A_3320_M.partsbnd.dcx',
-    '/parts/HD_A_3321.partsbnd.dcx',
-    '/parts/HD_A_3321_L.partsbnd.dcx',
-    '/parts/HD_A_3321_M.partsbnd.dcx',
-    '/parts/HD_A_3322.partsbnd.dcx',
-    '/parts/HD_A_3322_L.partsbnd.dcx',
-    '/parts/HD_A_3322_M.partsbnd.dcx',
-    '/parts/HD_A_3460.partsbnd.dcx',
-    '/parts/HD_A_3460_L.partsbnd.dcx',
-    '/parts/HD_A_3460_M.partsbnd.dcx',
-    '/parts/HD_A_4150.partsbnd.dcx',
-    '/parts/HD_A_4150_L.partsbnd.dcx',
-    '/parts/HD_A_4150_M.partsbnd.dcx',
-    '/parts/HD_A_4160.partsbnd.dcx',
-    '/parts/HD_A_4160_L.partsbnd.dcx',
-    '/parts/HD_A_4160_M.partsbnd.dcx',
-    '/parts/HD_A_5320.partsbnd.dcx',
-    '/parts/HD_A_5320_L.partsbnd.dcx',
-    '/parts/HD_A_5320_M.partsbnd.dcx',
-    '/parts/HD_A_5350.partsbnd.dcx',
-    '/parts/HD_A_5350_L.partsbnd.dcx',
-    '/parts/HD_A_5350_M.partsbnd.dcx',
-    '/parts/HD_A_5370.partsbnd.dcx',
-    '/parts/HD_A_5370_L.partsbnd.dcx',
-    '/parts/HD_A_5370_M.partsbnd.dcx',
-    '/parts/HD_A_8200.partsbnd.dcx',
-    '/parts/HD_A_8200_L.partsbnd.dcx',
-    '/parts/HD_A_8200_M.partsbnd.dcx',
-    '/parts/HD_A_9101.partsbnd.dcx',
-    '/parts/HD_A_9101_L.partsbnd.dcx',
-    '/parts/HD_A_9101_M.partsbnd.dcx',
-    '/parts/HD_A_9120.partsbnd.dcx',
-    '/parts/HD_A_9120_L.partsbnd.dcx',
-    '/parts/HD_A_9120_M.partsbnd.dcx',
-    '/parts/HD_A_9121.partsbnd.dcx',
-    '/parts/HD_A_9121_L.partsbnd.dcx',
-    '/parts/HD_A_9121_M.partsbnd.dcx',
-    '/parts/HD_A_9130.partsbnd.dcx',
-    '/parts/HD_A_9130_L.partsbnd.dcx',
-    '/parts/HD_A_9130_M.partsbnd.dcx',
-    '/parts/HD_A_9200.partsbnd.dcx',
-    '/parts/HD_A_9200_L.partsbnd.dcx',
-    '/parts/HD_A_9200_M.partsbnd.dcx',
-    '/parts/HD_A_9210.partsbnd.dcx',
-    '/parts/HD_A_9210_L.partsbnd.dcx',
-    '/parts/HD_A_9210_M.partsbnd.dcx',
-    '/parts/HD_A_9220.partsbnd.dcx',
-    '/parts/HD_A_9220_L.partsbnd.dcx',
-    '/parts/HD_A_9220_M.partsbnd.dcx',
-    '/parts/HD_A_9240.partsbnd.dcx',
-    '/parts/HD_A_9240_L.partsbnd.dcx',
-    '/parts/HD_A_9240_M.partsbnd.dcx',
-    '/parts/HD_A_9250.partsbnd.dcx',
-    '/parts/HD_A_9250_L.partsbnd.dcx',
-    '/parts/HD_A_9250_M.partsbnd.dcx',
-    '/parts/HD_A_9290.partsbnd.dcx',
-    '/parts/HD_A_9290_L.partsbnd.dcx',
-    '/parts/HD_A_9290_M.partsbnd.dcx',
-    '/parts/HD_A_9310.partsbnd.dcx',
-    '/parts/HD_A_9310_L.partsbnd.dcx',
-    '/parts/HD_A_9310_M.partsbnd.dcx',
-    '/parts/HD_A_9390.partsbnd.dcx',
-    '/parts/HD_A_9390_L.partsbnd.dcx',
-    '/parts/HD_A_9390_M.partsbnd.dcx',
-    '/parts/HD_A_9470.partsbnd.dcx',
-    '/parts/HD_A_9470_L.partsbnd.dcx',
-    '/parts/HD_A_9470_M.partsbnd.dcx',
-    '/parts/HD_A_9490.partsbnd.dcx',
-    '/parts/HD_A_9490_L.partsbnd.dcx',
-    '/parts/HD_A_9490_M.partsbnd.dcx',
-    '/parts/HD_A_9500.partsbnd.dcx',
-    '/parts/HD_A_9500_L.partsbnd.dcx',
-    '/parts/HD_A_9500_M.partsbnd.dcx',
-    '/parts/HD_A_9509.partsbnd.dcx',
-    '/parts/HD_A_9509_L.partsbnd.dcx',
-    '/parts/HD_A_9509_M.partsbnd.dcx',
-    '/parts/HD_A_9550.partsbnd.dcx',
-    '/parts/HD_A_9550_L.partsbnd.dcx',
-    '/parts/HD_A_9550_M.partsbnd.dcx',
-    '/parts/HD_A_9560.partsbnd.dcx',
-    '/parts/HD_A_9560_L.partsbnd.dcx',
-    '/parts/HD_A_9560_M.partsbnd.dcx',
-    '/parts/HD_A_9570.partsbnd.dcx',
-    '/parts/HD_A_9570_L.partsbnd.dcx',
-    '/parts/HD_A_9570_M.partsbnd.dcx',
-    '/parts/HD_A_9630.partsbnd.dcx',
-    '/parts/HD_A_9630_L.partsbnd.dcx',
-    '/parts/HD_A_9630_M.partsbnd.dcx',
-    '/parts/HD_A_9700.partsbnd.dcx',
-    '/parts/HD_A_9700_L.partsbnd.dcx',
-    '/parts/HD_A_9700_M.partsbnd.dcx',
-    '/parts/HD_A_9730.partsbnd.dcx',
-    '/parts/HD_A_9730_L.partsbnd.dcx',
-    '/parts/HD_A_9730_M.partsbnd.dcx',
-    '/parts/HD_F_0000.partsbnd.dcx',
-    '/parts/HD_F_0000_L.partsbnd.dcx',
-    '/parts/HD_F_0000_M.partsbnd.dcx',
-    '/parts/HD_F_2520.partsbnd.dcx',
-    '/parts/HD_F_2520_L.partsbnd.dcx',
-    '/parts/HD_F_2520_M.partsbnd.dcx',
-    '/parts/HD_F_2540.partsbnd.dcx',
-    '/parts/HD_F_2540_L.partsbnd.dcx',
-    '/parts/HD_F_2540_M.partsbnd.dcx',
-    '/parts/HD_F_2550.partsbnd.dcx',
-    '/parts/HD_F_2550_L.partsbnd.dcx',
-    '/parts/HD_F_2550_M.partsbnd.dcx',
-    '/parts/HD_F_8990.partsbnd.dcx',
-    '/parts/HD_F_8990_L.partsbnd.dcx',
-    '/parts/HD_F_8990_M.partsbnd.dcx',
-    '/parts/HD_F_9230.partsbnd.dcx',
-    '/parts/HD_F_9230_L.partsbnd.dcx',
-    '/parts/HD_F_9230_M.partsbnd.dcx',
-    '/parts/HD_F_9260.partsbnd.dcx',
-    '/parts/HD_F_9260_L.partsbnd.dcx',
-    '/parts/HD_F_9260_M.partsbnd.dcx',
-    '/parts/HD_F_9270.partsbnd.dcx',
-    '/parts/HD_F_9270_L.partsbnd.dcx',
-    '/parts/HD_F_9270_M.partsbnd.dcx',
-    '/parts/HD_F_9280.partsbnd.dcx',
-    '/parts/HD_F_9280_L.partsbnd.dcx',
-    '/parts/HD_F_9280_M.partsbnd.dcx',
-    '/parts/HD_F_9300.partsbnd.dcx',
-    '/parts/HD_F_9300_L.partsbnd.dcx',
-    '/parts/HD_F_9300_M.partsbnd.dcx',
-    '/parts/HD_F_9320.partsbnd.dcx',
-    '/parts/HD_F_9320_L.partsbnd.dcx',
-    '/parts/HD_F_9320_M.partsbnd.dcx',
-    '/parts/HD_F_9340.partsbnd.dcx',
-    '/parts/HD_F_9340_L.partsbnd.dcx',
-    '/parts/HD_F_9340_M.partsbnd.dcx',
-    '/parts/HD_F_9341.partsbnd.dcx',
-    '/parts/HD_F_9341_L.partsbnd.dcx',
-    '/parts/HD_F_9341_M.partsbnd.dcx',
-    '/parts/HD_F_9350.partsbnd.dcx',
-    '/parts/HD_F_9350_L.partsbnd.dcx',
-    '/parts/HD_F_9350_M.partsbnd.dcx',
-    '/parts/HD_F_9360.partsbnd.dcx',
-    '/parts/HD_F_9360_L.partsbnd.dcx',
-    '/parts/HD_F_9360_M.partsbnd.dcx',
-    '/parts/HD_F_9370.partsbnd.dcx',
-    '/parts/HD_F_9370_L.partsbnd.dcx',
-    '/parts/HD_F_9370_M.partsbnd.dcx',
-    '/parts/HD_F_9371.partsbnd.dcx',
-    '/parts/HD_F_9371_L.partsbnd.dcx',
-    '/parts/HD_F_9371_M.partsbnd.dcx',
-    '/parts/HD_F_9372.partsbnd.dcx',
-    '/parts/HD_F_9372_L.partsbnd.dcx',
-    '/parts/HD_F_9372_M.partsbnd.dcx',
-    '/parts/HD_F_9380.partsbnd.dcx',
-    '/parts/HD_F_9380_L.partsbnd.dcx',
-    '/parts/HD_F_9380_M.partsbnd.dcx',
-    '/parts/HD_F_9400.partsbnd.dcx',
-    '/parts/HD_F_9400_L.partsbnd.dcx',
-    '/parts/HD_F_9400_M.partsbnd.dcx',
-    '/parts/HD_F_9420.partsbnd.dcx',
-    '/parts/HD_F_9420_L.partsbnd.dcx',
-    '/parts/HD_F_9420_M.partsbnd.dcx',
-    '/parts/HD_F_9430.partsbnd.dcx',
-    '/parts/HD_F_9430_L.partsbnd.dcx',
-    '/parts/HD_F_9430_M.partsbnd.dcx',
-    '/parts/HD_F_9440.partsbnd.dcx',
-    '/parts/HD_F_9440_L.partsbnd.dcx',
-    '/parts/HD_F_9440_M.partsbnd.dcx',
-    '/parts/HD_F_9450.partsbnd.dcx',
-    '/parts/HD_F_9450_L.partsbnd.dcx',
-    '/parts/HD_F_9450_M.partsbnd.dcx',
-    '/parts/HD_F_9460.partsbnd.dcx',
-    '/parts/HD_F_9460_L.partsbnd.dcx',
-    '/parts/HD_F_9460_M.partsbnd.dcx',
-    '/parts/HD_F_9480.partsbnd.dcx',
-    '/parts/HD_F_9480_L.partsbnd.dcx',
-    '/parts/HD_F_9480_M.partsbnd.dcx',
-    '/parts/HD_F_9510.partsbnd.dcx',
-    '/parts/HD_F_9510_L.partsbnd.dcx',
-    '/parts/HD_F_9510_M.partsbnd.dcx',
-    '/parts/HD_F_9520.partsbnd.dcx',
-    '/parts/HD_F_9520_L.partsbnd.dcx',
-    '/parts/HD_F_9520_M.partsbnd.dcx',
-    '/parts/HD_F_9521.partsbnd.dcx',
-    '/parts/HD_F_9521_L.partsbnd.dcx',
-    '/parts/HD_F_9521_M.partsbnd.dcx',
-    '/parts/HD_F_9529.partsbnd.dcx',
-    '/parts/HD_F_9529_L.partsbnd.dcx',
-    '/parts/HD_F_9529_M.partsbnd.dcx',
-    '/parts/HD_F_9530.partsbnd.dcx',
-    '/parts/HD_F_9530_L.partsbnd.dcx',
-    '/parts/HD_F_9530_M.partsbnd.dcx',
-    '/parts/HD_F_9540.partsbnd.dcx',
-    '/parts/HD_F_9540_L.partsbnd.dcx',
-    '/parts/HD_F_9540_M.partsbnd.dcx',
-    '/parts/HD_F_9600.partsbnd.dcx',
-    '/parts/HD_F_9600_L.partsbnd.dcx',
-    '/parts/HD_F_9600_M.partsbnd.dcx',
-    '/parts/HD_F_9610.partsbnd.dcx',
-    '/parts/HD_F_9610_L.partsbnd.dcx',
-    '/parts/HD_F_9610_M.partsbnd.dcx',
-    '/parts/HD_F_9620.partsbnd.dcx',
-    '/parts/HD_F_9620_L.partsbnd.dcx',
-    '/parts/HD_F_9620_M.partsbnd.dcx',
-    '/parts/HD_F_9710.partsbnd.dcx',
-    '/parts/HD_F_9710_L.partsbnd.dcx',
-    '/parts/HD_F_9710_M.partsbnd.dcx',
-    '/parts/HD_F_9720.partsbnd.dcx',
-    '/parts/HD_F_9720_L.partsbnd.dcx',
-    '/parts/HD_F_9720_M.partsbnd.dcx',
-    '/parts/HD_F_9740.partsbnd.dcx',
-    '/parts/HD_F_9740_L.partsbnd.dcx',
-    '/parts/HD_F_9740_M.partsbnd.dcx',
-    '/parts/HD_M_0000.partsbnd.dcx',
-    '/parts/HD_M_0000_L.partsbnd.dcx',
-    '/parts/HD_M_0000_M.partsbnd.dcx',
-    '/parts/HD_M_2520.partsbnd.dcx',
-    '/parts/HD_M_2520_L.partsbnd.dcx',
-    '/parts/HD_M_2520_M.partsbnd.dcx',
-    '/parts/HD_M_2540.partsbnd.dcx',
-    '/parts/HD_M_2540_L.partsbnd.dcx',
-    '/parts/HD_M_2540_M.partsbnd.dcx',
-    '/parts/HD_M_2550.partsbnd.dcx',
-    '/parts/HD_M_2550_L.partsbnd.dcx',
-    '/parts/HD_M_2550_M.partsbnd.dcx',
-    '/parts/HD_M_6200.partsbnd.dcx',
-    '/parts/HD_M_6200_L.partsbnd.dcx',
-    '/parts/HD_M_6200_M.partsbnd.dcx',
-    '/parts/HD_M_8990.partsbnd.dcx',
-    '/parts/HD_M_8990_L.partsbnd.dcx',
-    '/parts/HD_M_8990_M.partsbnd.dcx',
-    '/parts/HD_M_9230.partsbnd.dcx',
-    '/parts/HD_M_9230_L.partsbnd.dcx',
-    '/parts/HD_M_9230_M.partsbnd.dcx',
-    '/parts/HD_M_9260.partsbnd.dcx',
-    '/parts/HD_M_9260_L.partsbnd.dcx',
-    '/parts/HD_M_9260_M.partsbnd.dcx',
-    '/parts/HD_M_9270.partsbnd.dcx',
-    '/parts/HD_M_9270_L.partsbnd.dcx',
-    '/parts/HD_M_9270_M.partsbnd.dcx',
-    '/parts/HD_M_9280.partsbnd.dcx',
-    '/parts/HD_M_9280_L.partsbnd.dcx',
-    '/parts/HD_M_9280_M.partsbnd.dcx',
-    '/parts/HD_M_9289.partsbnd.dcx',
-    '/parts/HD_M_9289_L.partsbnd.dcx',
-    '/parts/HD_M_9289_M.partsbnd.dcx',
-    '/parts/HD_M_9300.partsbnd.dcx',
-    '/parts/HD_M_9300_L.partsbnd.dcx',
-    '/parts/HD_M_9300_M.partsbnd.dcx',
-    '/parts/HD_M_9320.partsbnd.dcx',
-    '/parts/HD_M_9320_L.partsbnd.dcx',
-    '/parts/HD_M_9320_M.partsbnd.dcx',
-    '/parts/HD_M_9340.partsbnd.dcx',
-    '/parts/HD_M_9340_L.partsbnd.dcx',
-    '/parts/HD_M_9340_M.partsbnd.dcx',
-    '/parts/HD_M_9341.partsbnd.dcx',
-    '/parts/HD_M_9341_L.partsbnd.dcx',
-    '/parts/HD_M_9341_M.partsbnd.dcx',
-    '/parts/HD_M_9349.partsbnd.dcx',
-    '/parts/HD_M_9349_L.partsbnd.dcx',
-    '/parts/HD_M_9349_M.partsbnd.dcx',
-    '/parts/HD_M_9350.partsbnd.dcx',
-    '/parts/HD_M_9350_L.partsbnd.dcx',
-    '/parts/HD_M_9350_M.partsbnd.dcx',
-    '/parts/HD_M_9360.partsbnd.dcx',
-    '/parts/HD_M_9360_L.partsbnd.dcx',
-    '/parts/HD_M_9360_M.partsbnd.dcx',
-    '/parts/HD_M_9370.partsbnd.dcx',
-    '/parts/HD_M_9370_L.partsbnd.dcx',
-    '/parts/HD_M_9370_M.partsbnd.dcx',
-    '/parts/HD_M_9371.partsbnd.dcx',
-    '/parts/HD_M_9371_L.partsbnd.dcx',
-    '/parts/HD_M_9371_M.partsbnd.dcx',
-    '/parts/HD_M_9372.partsbnd.dcx',
-    '/parts/HD_M_9372_L.partsbnd.dcx',
-    '/parts/HD_M_9372_M.partsbnd.dcx',
-    '/parts/HD_M_9379.partsbnd.dcx',
-    '/parts/HD_M_9379_L.partsbnd.dcx',
-    '/parts/HD_M_9379_M.partsbnd.dcx',
-    '/parts/HD_M_9380.partsbnd.dcx',
-    '/parts/HD_M_9380_L.partsbnd.dcx',
-    '/parts/HD_M_9380_M.partsbnd.dcx',
-    '/parts/HD_M_9389.partsbnd.dcx',
-    '/parts/HD_M_9389_L.partsbnd.dcx',
-    '/parts/HD_M_9389_M.partsbnd.dcx',
-    '/parts/HD_M_9400.partsbnd.dcx',
-    '/parts/HD_M_9400_L.partsbnd.dcx',
-    '/parts/HD_M_9400_M.partsbnd.dcx',
-    '/parts/HD_M_9410.partsbnd.dcx',
-    '/parts/HD_M_9410_L.partsbnd.dcx',
-    '/parts/HD_M_9410_M.partsbnd.dcx',
-    '/parts/HD_M_9420.partsbnd.dcx',
-    '/parts/HD_M_9420_L.partsbnd.dcx',
-    '/parts/HD_M_9420_M.partsbnd.dcx',
-    '/parts/HD_M_9430.partsbnd.dcx',
-    '/parts/HD_M_9430_L.partsbnd.dcx',
-    '/parts/HD_M_9430_M.partsbnd.dcx',
-    '/parts/HD_M_9440.partsbnd.dcx',
-    '/parts/HD_M_9440_L.partsbnd.dcx',
-    '/parts/HD_M_9440_M.partsbnd.dcx',
-    '/parts/HD_M_9450.partsbnd.dcx',
-    '/parts/HD_M_9450_L.partsbnd.dcx',
-    '/parts/HD_M_9450_M.partsbnd.dcx',
-    '/parts/HD_M_9460.partsbnd.dcx',
-    '/parts/HD_M_9460_L.partsbnd.dcx',
-    '/parts/HD_M_9460_M.partsbnd.dcx',
-    '/parts/HD_M_9480.partsbnd.dcx',
-    '/parts/HD_M_9480_L.partsbnd.dcx',
-    '/parts/HD_M_9480_M.partsbnd.dcx',
-    '/parts/HD_M_9510.partsbnd.dcx',
-    '/parts/HD_M_9510_L.partsbnd.dcx',
-    '/parts/HD_M_9510_M.partsbnd.dcx',
-    '/parts/HD_M_9520.partsbnd.dcx',
-    '/parts/HD_M_9520_L.partsbnd.dcx',
-    '/parts/HD_M_9520_M.partsbnd.dcx',
-    '/parts/HD_M_9521.partsbnd.dcx',
-    '/parts/HD_M_9521_L.partsbnd.dcx',
-    '/parts/HD_M_9521_M.partsbnd.dcx',
-    '/parts/HD_M_9530.partsbnd.dcx',
-    '/parts/HD_M_9530_L.partsbnd.dcx',
-    '/parts/HD_M_9530_M.partsbnd.dcx',
-    '/parts/HD_M_9540.partsbnd.dcx',
-    '/parts/HD_M_9540_L.partsbnd.dcx',
-    '/parts/HD_M_9540_M.partsbnd.dcx',
-    '/parts/HD_M_9590.partsbnd.dcx',
-    '/parts/HD_M_9590_L.partsbnd.dcx',
-    '/parts/HD_M_9590_M.partsbnd.dcx',
-    '/parts/HD_M_9600.partsbnd.dcx',
-    '/parts/HD_M_9600_L.partsbnd.dcx',
-    '/parts/HD_M_9600_M.partsbnd.dcx',
-    '/parts/HD_M_9610.partsbnd.dcx',
-    '/parts/HD_M_9610_L.partsbnd.dcx',
-    '/parts/HD_M_9610_M.partsbnd.dcx',
-    '/parts/HD_M_9620.partsbnd.dcx',
-    '/parts/HD_M_9620_L.partsbnd.dcx',
-    '/parts/HD_M_9620_M.partsbnd.dcx',
-    '/parts/HD_M_9710.partsbnd.dcx',
-    '/parts/HD_M_9710_L.partsbnd.dcx',
-    '/parts/HD_M_9710_M.partsbnd.dcx',
-    '/parts/HD_M_9720.partsbnd.dcx',
-    '/parts/HD_M_9720_L.partsbnd.dcx',
-    '/parts/HD_M_9720_M.partsbnd.dcx',
-    '/parts/HD_M_9740.partsbnd.dcx',
-    '/parts/HD_M_9740_L.partsbnd.dcx',
-    '/parts/HD_M_9740_M.partsbnd.dcx',
-    '/parts/HR_F_0000.partsbnd.dcx',
-    '/parts/HR_F_0000_L.partsbnd.dcx',
-    '/parts/HR_F_0000_M.partsbnd.dcx',
-    '/parts/HR_F_0002.partsbnd.dcx',
-    '/parts/HR_F_0002_L.partsbnd.dcx',
-    '/parts/HR_F_0002_M.partsbnd.dcx',
-    '/parts/HR_F_0003.partsbnd.dcx',
-    '/parts/HR_F_0003_L.partsbnd.dcx',
-    '/parts/HR_F_0003_M.partsbnd.dcx',
-    '/parts/HR_F_0004.partsbnd.dcx',
-    '/parts/HR_F_0004_L.partsbnd.dcx',
-    '/parts/HR_F_0004_M.partsbnd.dcx',
-    '/parts/HR_F_0005.partsbnd.dcx',
-    '/parts/HR_F_0005_L.partsbnd.dcx',
-    '/parts/HR_F_0005_M.partsbnd.dcx',
-    '/parts/HR_F_0006.partsbnd.dcx',
-    '/parts/HR_F_0006_L.partsbnd.dcx',
-    '/parts/HR_F_0006_M.partsbnd.dcx',
-    '/parts/HR_F_0007.partsbnd.dcx',
-    '/parts/HR_F_0007_L.partsbnd.dcx',
-    '/parts/HR_F_0007_M.partsbnd.dcx',
-    '/parts/HR_F_0008.partsbnd.dcx',
-    '/parts/HR_F_0008_L.partsbnd.dcx',
-    '/parts/HR_F_0008_M.partsbnd.dcx',
-    '/parts/HR_F_0009.partsbnd.dcx',
-    '/parts/HR_F_0009_L.partsbnd.dcx',
-    '/parts/HR_F_0009_M.partsbnd.dcx',
-    '/parts/HR_F_0010.partsbnd.dcx',
-    '/parts/HR_F_0010_L.partsbnd.dcx',
-    '/parts/HR_F_0010_M.partsbnd.dcx',
-    '/parts/HR_F_9000.partsbnd.dcx',
-    '/parts/HR_F_9000_L.partsbnd.dcx',
-    '/parts/HR_F_9000_M.partsbnd.dcx',
-    '/parts/HR_M_0000.partsbnd.dcx',
-    '/parts/HR_M_0000_L.partsbnd.dcx',
-    '/parts/HR_M_0000_M.partsbnd.dcx',
-    '/parts/HR_M_0001.partsbnd.dcx',
-    '/parts/HR_M_0001_L.partsbnd.dcx',
-    '/parts/HR_M_0001_M.partsbnd.dcx',
-    '/parts/HR_M_0002.partsbnd.dcx',
-    '/parts/HR_M_0002_L.partsbnd.dcx',
-    '/parts/HR_M_0002_M.partsbnd.dcx',
-    '/parts/HR_M_0003.partsbnd.dcx',
-    '/parts/HR_M_0003_L.partsbnd.dcx',
-    '/parts/HR_M_0003_M.partsbnd.dcx',
-    '/parts/HR_M_0004.partsbnd.dcx',
-    '/parts/HR_M_0004_L.partsbnd.dcx',
-    '/parts/HR_M_0004_M.partsbnd.dcx',
-    '/parts/HR_M_0005.partsbnd.dcx',
-    '/parts/HR_M_0005_L.partsbnd.dcx',
-    '/parts/HR_M_0005_M.partsbnd.dcx',
-    '/parts/HR_M_0006.partsbnd.dcx',
-    '/parts/HR_M_0006_L.partsbnd.dcx',
-    '/parts/HR_M_0006_M.partsbnd.dcx',
-    '/parts/HR_M_0007.partsbnd.dcx',
-    '/parts/HR_M_0007_L.partsbnd.dcx',
-    '/parts/HR_M_0007_M.partsbnd.dcx',
-    '/parts/HR_M_0008.partsbnd.dcx',
-    '/parts/HR_M_0008_L.partsbnd.dcx',
-    '/parts/HR_M_0008_M.partsbnd.dcx',
-    '/parts/HR_M_0010.partsbnd.dcx',
-    '/parts/HR_M_0010_L.partsbnd.dcx',
-    '/parts/HR_M_0010_M.partsbnd.dcx',
-    '/parts/HR_M_0011.partsbnd.dcx',
-    '/parts/HR_M_0011_L.partsbnd.dcx',
-    '/parts/HR_M_0011_M.partsbnd.dcx',
-    '/parts/HR_M_0012.partsbnd.dcx',
-    '/parts/HR_M_0012_L.partsbnd.dcx',
-    '/parts/HR_M_0012_M.partsbnd.dcx',
-    '/parts/HR_M_9000.partsbnd.dcx',
-    '/parts/HR_M_9000_L.partsbnd.dcx',
-    '/parts/HR_M_9000_M.partsbnd.dcx',
-    '/parts/LG_A_9600.partsbnd.dcx',
-    '/parts/LG_A_9600_L.partsbnd.dcx',
-    '/parts/LG_A_9600_M.partsbnd.dcx',
-    '/parts/LG_F_0000.partsbnd.dcx',
-    '/parts/LG_F_0000_L.partsbnd.dcx',
-    '/parts/LG_F_0000_M.partsbnd.dcx',
-    '/parts/LG_F_1000.partsbnd.dcx',
-    '/parts/LG_F_1000_L.partsbnd.dcx',
-    '/parts/LG_F_1000_M.partsbnd.dcx',
-    '/parts/LG_F_2520.partsbnd.dcx',
-    '/parts/LG_F_2520_L.partsbnd.dcx',
-    '/parts/LG_F_2520_M.partsbnd.dcx',
-    '/parts/LG_F_2540.partsbnd.dcx',
-    '/parts/LG_F_2540_L.partsbnd.dcx',
-    '/parts/LG_F_2540_M.partsbnd.dcx',
-    '/parts/LG_F_2550.partsbnd.dcx',
-    '/parts/LG_F_2550_L.partsbnd.dcx',
-    '/parts/LG_F_2550_M.partsbnd.dcx',
-    '/parts/LG_F_2560.partsbnd.dcx',
-    '/parts/LG_F_2560_L.partsbnd.dcx',
-    '/parts/LG_F_2560_M.partsbnd.dcx',
-    '/parts/LG_F_2570.partsbnd.dcx',
-    '/parts/LG_F_2570_L.partsbnd.dcx',
-    '/parts/LG_F_2570_M.partsbnd.dcx',
-    '/parts/LG_F_2870.partsbnd.dcx',
-    '/parts/LG_F_2870_L.partsbnd.dcx',
-    '/parts/LG_F_2870_M.partsbnd.dcx',
-    '/parts/LG_F_5320.partsbnd.dcx',
-    '/parts/LG_F_5320_L.partsbnd.dcx',
-    '/parts/LG_F_5320_M.partsbnd.dcx',
-    '/parts/LG_F_5370.partsbnd.dcx',
-    '/parts/LG_F_5370_L.partsbnd.dcx',
-    '/parts/LG_F_5370_M.partsbnd.dcx',
-    '/parts/LG_F_8200.partsbnd.dcx',
-    '/parts/LG_F_8200_L.partsbnd.dcx',
-    '/parts/LG_F_8200_M.partsbnd.dcx',
-    '/parts/LG_F_8990.partsbnd.dcx',
-    '/parts/LG_F_8990_L.partsbnd.dcx',
-    '/parts/LG_F_8990_M.partsbnd.dcx',
-    '/parts/LG_F_9200.partsbnd.dcx',
-    '/parts/LG_F_9200_L.partsbnd.dcx',
-    '/parts/LG_F_9200_M.partsbnd.dcx',
-    '/parts/LG_F_9210.partsbnd.dcx',
-    '/parts/LG_F_9210_L.partsbnd.dcx',
-    '/parts/LG_F_9210_M.partsbnd.dcx',
-    '/parts/LG_F_9220.partsbnd.dcx',
-    '/parts/LG_F_9220_L.partsbnd.dcx',
-    '/parts/LG_F_9220_M.partsbnd.dcx',
-    '/parts/LG_F_9230.partsbnd.dcx',
-    '/parts/LG_F_9230_L.partsbnd.dcx',
-    '/parts/LG_F_9230_M.partsbnd.dcx',
-    '/parts/LG_F_9240.partsbnd.dcx',
-    '/parts/LG_F_9240_L.partsbnd.dcx',
-    '/parts/LG_F_9240_M.partsbnd.dcx',
-    '/parts/LG_F_9250.partsbnd.dcx',
-    '/parts/LG_F_9250_L.partsbnd.dcx',
-    '/parts/LG_F_9250_M.partsbnd.dcx',
-    '/parts/LG_F_9260.partsbnd.dcx',
-    '/parts/LG_F_9260_L.partsbnd.dcx',
-    '/parts/LG_F_9260_M.partsbnd.dcx',
-    '/parts/LG_F_9270.partsbnd.dcx',
-    '/parts/LG_F_9270_L.partsbnd.dcx',
-    '/parts/LG_F_9270_M.partsbnd.dcx',
-    '/parts/LG_F_9280.partsbnd.dcx',
-    '/parts/LG_F_9280_L.partsbnd.dcx',
-    '/parts/LG_F_9280_M.partsbnd.dcx',
-    '/parts/LG_F_9290.partsbnd.dcx',
-    '/parts/LG_F_9290_L.partsbnd.dcx',
-    '/parts/LG_F_9290_M.partsbnd.dcx',
-    '/parts/LG_F_9300.partsbnd.dcx',
-    '/parts/LG_F_9300_L.partsbnd.dcx',
-    '/parts/LG_F_9300_M.partsbnd.dcx',
-    '/parts/LG_F_9310.partsbnd.dcx',
-    '/parts/LG_F_9310_L.partsbnd.dcx',
-    '/parts/LG_F_9310_M.partsbnd.dcx',
-    '/parts/LG_F_9320.partsbnd.dcx',
-    '/parts/LG_F_9320_L.partsbnd.dcx',
-    '/parts/LG_F_9320_M.partsbnd.dcx',
-    '/parts/LG_F_9340.partsbnd.dcx',
-    '/parts/LG_F_9340_L.partsbnd.dcx',
-    '/parts/LG_F_9340_M.partsbnd.dcx',
-    '/parts/LG_F_9341.partsbnd.dcx',
-    '/parts/LG_F_9341_L.partsbnd.dcx',
-    '/parts/LG_F_9341_M.partsbnd.dcx',
-    '/parts/LG_F_9350.partsbnd.dcx',
-    '/parts/LG_F_9350_L.partsbnd.dcx',
-    '/parts/LG_F_9350_M.partsbnd.dcx',
-    '/parts/LG_F_9360.partsbnd.dcx',
-    '/parts/LG_F_9360_L.partsbnd.dcx',
-    '/parts/LG_F_9360_M.partsbnd.dcx',
-    '/parts/LG_F_9370.partsbnd.dcx',
-    '/parts/LG_F_9370_L.partsbnd.dcx',
-    '/parts/LG_F_9370_M.partsbnd.dcx',
-    '/parts/LG_F_9371.partsbnd.dcx',
-    '/parts/LG_F_9371_L.partsbnd.dcx',
-    '/parts/LG_F_9371_M.partsbnd.dcx',
-    '/parts/LG_F_9372.partsbnd.dcx',
-    '/parts/LG_F_9372_L.partsbnd.dcx',
-    '/parts/LG_F_9372_M.partsbnd.dcx',
-    '/parts/LG_F_9380.partsbnd.dcx',
-    '/parts/LG_F_9380_L.partsbnd.dcx',
-    '/parts/LG_F_9380_M.partsbnd.dcx',
-    '/parts/LG_F_9390.partsbnd.dcx',
-    '/parts/LG_F_9390_L.partsbnd.dcx',
-    '/parts/LG_F_9390_M.partsbnd.dcx',
-    '/parts/LG_F_9400.partsbnd.dcx',
-    '/parts/LG_F_9400_L.partsbnd.dcx',
-    '/parts/LG_F_9400_M.partsbnd.dcx',
-    '/parts/LG_F_9420.partsbnd.dcx',
-    '/parts/LG_F_9420_L.partsbnd.dcx',
-    '/parts/LG_F_9420_M.partsbnd.dcx',
-    '/parts/LG_F_9430.partsbnd.dcx',
-    '/parts/LG_F_9430_L.partsbnd.dcx',
-    '/parts/LG_F_9430_M.partsbnd.dcx',
-    '/parts/LG_F_9440.partsbnd.dcx',
-    '/parts/LG_F_9440_L.partsbnd.dcx',
-    '/parts/LG_F_9440_M.partsbnd.dcx',
-    '/parts/LG_F_9450.partsbnd.dcx',
-    '/parts/LG_F_9450_L.partsbnd.dcx',
-    '/parts/LG_F_9450_M.partsbnd.dcx',
-    '/parts/LG_F_9460.partsbnd.dcx',
-    '/parts/LG_F_9460_L.partsbnd.dcx',
-    '/parts/LG_F_9460_M.partsbnd.dcx',
-    '/parts/LG_F_9470.partsbnd.dcx',
-    '/parts/LG_F_9470_L.partsbnd.dcx',
-    '/parts/LG_F_9470_M.partsbnd.dcx',
-    '/parts/LG_F_9480.partsbnd.dcx',
-    '/parts/LG_F_9480_L.partsbnd.dcx',
-    '/parts/LG_F_9480_M.partsbnd.dcx',
-    '/parts/LG_F_9490.partsbnd.dcx',
-    '/parts/LG_F_9490_L.partsbnd.dcx',
-    '/parts/LG_F_9490_M.partsbnd.dcx',
-    '/parts/LG_F_9500.partsbnd.dcx',
-    '/parts/LG_F_9500_L.partsbnd.dcx',
-    '/parts/LG_F_9500_M.partsbnd.dcx',
-    '/parts/LG_F_9510.partsbnd.dcx',
-    '/parts/LG_F_9510_L.partsbnd.dcx',
-    '/parts/LG_F_9510_M.partsbnd.dcx',
-    '/parts/LG_F_9520.partsbnd.dcx',
-    '/parts/LG_F_9520_L.partsbnd.dcx',
-    '/parts/LG_F_9520_M.partsbnd.dcx',
-    '/parts/LG_F_9521.partsbnd.dcx',
-    '/parts/LG_F_9521_L.partsbnd.dcx',
-    '/parts/LG_F_9521_M.partsbnd.dcx',
-    '/parts/LG_F_9529.partsbnd.dcx',
-    '/parts/LG_F_9529_L.partsbnd.dcx',
-    '/parts/LG_F_9529_M.partsbnd.dcx',
-    '/parts/LG_F_9530.partsbnd.dcx',
-    '/parts/LG_F_9530_L.partsbnd.dcx',
-    '/parts/LG_F_9530_M.partsbnd.dcx',
-    '/parts/LG_F_9540.partsbnd.dcx',
-    '/parts/LG_F_9540_L.partsbnd.dcx',
-    '/parts/LG_F_9540_M.partsbnd.dcx',
-    '/parts/LG_F_9550.partsbnd.dcx',
-    '/parts/LG_F_9550_L.partsbnd.dcx',
-    '/parts/LG_F_9550_M.partsbnd.dcx',
-    '/parts/LG_F_9560.partsbnd.dcx',
-    '/parts/LG_F_9560_L.partsbnd.dcx',
-    '/parts/LG_F_9560_M.partsbnd.dcx',
-    '/parts/LG_F_9570.partsbnd.dcx',
-    '/parts/LG_F_9570_L.partsbnd.dcx',
-    '/parts/LG_F_9570_M.partsbnd.dcx',
-    '/parts/LG_F_9610.partsbnd.dcx',
-    '/parts/LG_F_9610_L.partsbnd.dcx',
-    '/parts/LG_F_9610_M.partsbnd.dcx',
-    '/parts/LG_F_9620.partsbnd.dcx',
-    '/parts/LG_F_9620_L.partsbnd.dcx',
-    '/parts/LG_F_9620_M.partsbnd.dcx',
-    '/parts/LG_F_9630.partsbnd.dcx',
-    '/parts/LG_F_9630_L.partsbnd.dcx',
-    '/parts/LG_F_9630_M.partsbnd.dcx',
-    '/parts/LG_F_9700.partsbnd.dcx',
-    '/parts/LG_F_9700_L.partsbnd.dcx',
-    '/parts/LG_F_9700_M.partsbnd.dcx',
-    '/parts/LG_F_9710.partsbnd.dcx',
-    '/parts/LG_F_9710_L.partsbnd.dcx',
-    '/parts/LG_F_9710_M.partsbnd.dcx',
-    '/parts/LG_F_9720.partsbnd.dcx',
-    '/parts/LG_F_9720_L.partsbnd.dcx',
-    '/parts/LG_F_9720_M.partsbnd.dcx',
-    '/parts/LG_F_9730.partsbnd.dcx',
-    '/parts/LG_F_9730_L.partsbnd.dcx',
-    '/parts/LG_F_9730_M.partsbnd.dcx',
-    '/parts/LG_F_9740.partsbnd.dcx',
-    '/parts/LG_F_9740_L.partsbnd.dcx',
-    '/parts/LG_F_9740_M.partsbnd.dcx',
-    '/parts/LG_M_0000.partsbnd.dcx',
-    '/parts/LG_M_0000_L.partsbnd.dcx',
-    '/parts/LG_M_0000_M.partsbnd.dcx',
-    '/parts/LG_M_1000.partsbnd.dcx',
-    '/parts/LG_M_1000_L.partsbnd.dcx',
-    '/parts/LG_M_1000_M.partsbnd.dcx',
-    '/parts/LG_M_2520.partsbnd.dcx',
-    '/parts/LG_M_2520_L.partsbnd.dcx',
-    '/parts/LG_M_2520_M.partsbnd.dcx',
-    '/parts/LG_M_2540.partsbnd.dcx',
-    '/parts/LG_M_2540_L.partsbnd.dcx',
-    '/parts/LG_M_2540_M.partsbnd.dcx',
-    '/parts/LG_M_2550.partsbnd.dcx',
-    '/parts/LG_M_2550_L.partsbnd.dcx',
-    '/parts/LG_M_2550_M.partsbnd.dcx',
-    '/parts/LG_M_2560.partsbnd.dcx',
-    '/parts/LG_M_2560_L.partsbnd.dcx',
-    '/parts/LG_M_2560_M.partsbnd.dcx',
-    '/parts/LG_M_2570.partsbnd.dcx',
-    '/parts/LG_M_2570_L.partsbnd.dcx',
-    '/parts/LG_M_2570_M.partsbnd.dcx',
-    '/parts/LG_M_2870.partsbnd.dcx',
-    '/parts/LG_M_2870_L.partsbnd.dcx',
-    '/parts/LG_M_2870_M.partsbnd.dcx',
-    '/parts/LG_M_5320.partsbnd.dcx',
-    '/parts/LG_M_5320_L.partsbnd.dcx',
-    '/parts/LG_M_5320_M.partsbnd.dcx',
-    '/parts/LG_M_5370.partsbnd.dcx',
-    '/parts/LG_M_5370_L.partsbnd.dcx',
-    '/parts/LG_M_5370_M.partsbnd.dcx',
-    '/parts/LG_M_6200.partsbnd.dcx',
-    '/parts/LG_M_6200_L.partsbnd.dcx',
-    '/parts/LG_M_6200_M.partsbnd.dcx',
-    '/parts/LG_M_8200.partsbnd.dcx',
-    '/parts/LG_M_8200_L.partsbnd.dcx',
-    '/parts/LG_M_8200_M.partsbnd.dcx',
-    '/parts/LG_M_8990.partsbnd.dcx',
-    '/parts/LG_M_8990_L.partsbnd.dcx',
-    '/parts/LG_M_8990_M.partsbnd.dcx',
-    '/parts/LG_M_9200.partsbnd.dcx',
-    '/parts/LG_M_9200_L.partsbnd.dcx',
-    '/parts/LG_M_9200_M.partsbnd.dcx',
-    '/parts/LG_M_9210.partsbnd.dcx',
-    '/parts/LG_M_9210_L.partsbnd.dcx',
-    '/parts/LG_M_9210_M.partsbnd.dcx',
-    '/parts/LG_M_9220.partsbnd.dcx',
-    '/parts/LG_M_9220_L.partsbnd.dcx',
-    '/parts/LG_M_9220_M.partsbnd.dcx',
-    '/parts/LG_M_9230.partsbnd.dcx',
-    '/parts/LG_M_9230_L.partsbnd.dcx',
-    '/parts/LG_M_9230_M.partsbnd.dcx',
-    '/parts/LG_M_9240.partsbnd.dcx',
-    '/parts/LG_M_9240_L.partsbnd.dcx',
-    '/parts/LG_M_9240_M.partsbnd.dcx',
-    '/parts/LG_M_9250.partsbnd.dcx',
-    '/parts/LG_M_9250_L.partsbnd.dcx',
-    '/parts/LG_M_9250_M.partsbnd.dcx',
-    '/parts/LG_M_9260.partsbnd.dcx',
-    '/parts/LG_M_9260_L.partsbnd.dcx',
-    '/parts/LG_M_9260_M.partsbnd.dcx',
-    '/parts/LG_M_9270.partsbnd.dcx',
-    '/parts/LG_M_9270_L.partsbnd.dcx',
-    '/parts/LG_M_9270_M.partsbnd.dcx',
-    '/parts/LG_M_9280.partsbnd.dcx',
-    '/parts/LG_M_9280_L.partsbnd.dcx',
-    '/parts/LG_M_9280_M.partsbnd.dcx',
-    '/parts/LG_M_9289.partsbnd.dcx',
-    '/parts/LG_M_9289_L.partsbnd.dcx',
-    '/parts/LG_M_9289_M.partsbnd.dcx',
-    '/parts/LG_M_9290.partsbnd.dcx',
-    '/parts/LG_M_9290_L.partsbnd.dcx',
-    '/parts/LG_M_9290_M.partsbnd.dcx',
-    '/parts/LG_M_9300.partsbnd.dcx',
-    '/parts/LG_M_9300_L.partsbnd.dcx',
-    '/parts/LG_M_9300_M.partsbnd.dcx',
-    '/parts/LG_M_9309.partsbnd.dcx',
-    '/parts/LG_M_9309_L.partsbnd.dcx',
-    '/parts/LG_M_9309_M.partsbnd.dcx',
-    '/parts/LG_M_9310.partsbnd.dcx',
-    '/parts/LG_M_9310_L.partsbnd.dcx',
-    '/parts/LG_M_9310_M.partsbnd.dcx',
-    '/parts/LG_M_9320.partsbnd.dcx',
-    '/parts/LG_M_9320_L.partsbnd.dcx',
-    '/parts/LG_M_9320_M.partsbnd.dcx',
-    '/parts/LG_M_9340.partsbnd.dcx',
-    '/parts/LG_M_9340_L.partsbnd.dcx',
-    '/parts/LG_M_9340_M.partsbnd.dcx',
-    '/parts/LG_M_9341.partsbnd.dcx',
-    '/parts/LG_M_9341_L.partsbnd.dcx',
-    '/parts/LG_M_9341_M.partsbnd.dcx',
-    '/parts/LG_M_9349.partsbnd.dcx',
-    '/parts/LG_M_9349_L.partsbnd.dcx',
-    '/parts/LG_M_9349_M.partsbnd.dcx',
-    '/parts/LG_M_9350.partsbnd.dcx',
-    '/parts/LG_M_9350_L.partsbnd.dcx',
-    '/parts/LG_M_9350_M.partsbnd.dcx',
-    '/parts/LG_M_9360.partsbnd.dcx',
-    '/parts/LG_M_9360_L.partsbnd.dcx',
-    '/parts/LG_M_9360_M.partsbnd.dcx',
-    '/parts/LG_M_9370.partsbnd.dcx',
-    '/parts/LG_M_9370_L.partsbnd.dcx',
-    '/parts/LG_M_9370_M.partsbnd.dcx',
-    '/parts/LG_M_9371.partsbnd.dcx',
-    '/parts/LG_M_9371_L.partsbnd.dcx',
-    '/parts/LG_M_9371_M.partsbnd.dcx',
-    '/parts/LG_M_9372.partsbnd.dcx',
-    '/parts/LG_M_9372_L.partsbnd.dcx',
-    '/parts/LG_M_9372_M.partsbnd.dcx',
-    '/parts/LG_M_9379.partsbnd.dcx',
-    '/parts/LG_M_9379_L.partsbnd.dcx',
-    '/parts/LG_M_9379_M.partsbnd.dcx',
-    '/parts/LG_M_9380.partsbnd.dcx',
-    '/parts/LG_M_9380_L.partsbnd.dcx',
-    '/parts/LG_M_9380_M.partsbnd.dcx',
-    '/parts/LG_M_9389.partsbnd.dcx',
-    '/parts/LG_M_9389_L.partsbnd.dcx',
-    '/parts/LG_M_9389_M.partsbnd.dcx',
-    '/parts/LG_M_9390.partsbnd.dcx',
-    '/parts/LG_M_9390_L.partsbnd.dcx',
-    '/parts/LG_M_9390_M.partsbnd.dcx',
-    '/parts/LG_M_9400.partsbnd.dcx',
-    '/parts/LG_M_9400_L.partsbnd.dcx',
-    '/parts/LG_M_9400_M.partsbnd.dcx',
-    '/parts/LG_M_9410.partsbnd.dcx',
-    '/parts/LG_M_9410_L.partsbnd.dcx',
-    '/parts/LG_M_9410_M.partsbnd.dcx',
-    '/parts/LG_M_9420.partsbnd.dcx',
-    '/parts/LG_M_9420_L.partsbnd.dcx',
-    '/parts/LG_M_9420_M.partsbnd.dcx',
-    '/parts/LG_M_9430.partsbnd.dcx',
-    '/parts/LG_M_9430_L.partsbnd.dcx',
-    '/parts/LG_M_9430_M.partsbnd.dcx',
-    '/parts/LG_M_9440.partsbnd.dcx',
-    '/parts/LG_M_9440_L.partsbnd.dcx',
-    '/parts/LG_M_9440_M.partsbnd.dcx',
-    '/parts/LG_M_9450.partsbnd.dcx',
-    '/parts/LG_M_9450_L.partsbnd.dcx',
-    '/parts/LG_M_9450_M.partsbnd.dcx',
-    '/parts/LG_M_9460.partsbnd.dcx',
-    '/parts/LG_M_9460_L.partsbnd.dcx',
-    '/parts/LG_M_9460_M.partsbnd.dcx',
-    '/parts/LG_M_9470.partsbnd.dcx',
-    '/parts/LG_M_9470_L.partsbnd.dcx',
-    '/parts/LG_M_9470_M.partsbnd.dcx',
-    '/parts/LG_M_9480.partsbnd.dcx',
-    '/parts/LG_M_9480_L.partsbnd.dcx',
-    '/parts/LG_M_9480_M.partsbnd.dcx',
-    '/parts/LG_M_9490.partsbnd.dcx',
-    '/parts/LG_M_9490_L.partsbnd.dcx',
-    '/parts/LG_M_9490_M.partsbnd.dcx',
-    '/parts/LG_M_9500.partsbnd.dcx',
-    '/parts/LG_M_9500_L.partsbnd.dcx',
-    '/parts/LG_M_9500_M.partsbnd.dcx',
-    '/parts/LG_M_9509.partsbnd.dcx',
-    '/parts/LG_M_9509_L.partsbnd.dcx',
-    '/parts/LG_M_9509_M.partsbnd.dcx',
-    '/parts/LG_M_9510.partsbnd.dcx',
-    '/parts/LG_M_9510_L.partsbnd.dcx',
-    '/parts/LG_M_9510_M.partsbnd.dcx',
-    '/parts/LG_M_9520.partsbnd.dcx',
-    '/parts/LG_M_9520_L.partsbnd.dcx',
-    '/parts/LG_M_9520_M.partsbnd.dcx',
-    '/parts/LG_M_9521.partsbnd.dcx',
-    '/parts/LG_M_9521_L.partsbnd.dcx',
-    '/parts/LG_M_9521_M.partsbnd.dcx',
-    '/parts/LG_M_9530.partsbnd.dcx',
-    '/parts/LG_M_9530_L.partsbnd.dcx',
-    '/parts/LG_M_9530_M.partsbnd.dcx',
-    '/parts/LG_M_9540.partsbnd.dcx',
-    '/parts/LG_M_9540_L.partsbnd.dcx',
-    '/parts/LG_M_9540_M.partsbnd.dcx',
-    '/parts/LG_M_9550.partsbnd.dcx',
-    '/parts/LG_M_9550_L.partsbnd.dcx',
-    '/parts/LG_M_9550_M.partsbnd.dcx',
-    '/parts/LG_M_9560.partsbnd.dcx',
-    '/parts/LG_M_9560_L.partsbnd.dcx',
-    '/parts/LG_M_9560_M.partsbnd.dcx',
-    '/parts/LG_M_9570.partsbnd.dcx',
-    '/parts/LG_M_9570_L.partsbnd.dcx',
-    '/parts/LG_M_9570_M.partsbnd.dcx',
-    '/parts/LG_M_9590.partsbnd.dcx',
-    '/parts/LG_M_9590_L.partsbnd.dcx',
-    '/parts/LG_M_9590_M.partsbnd.dcx',
-    '/parts/LG_M_9610.partsbnd.dcx',
-    '/parts/LG_M_9610_L.partsbnd.dcx',
-    '/parts/LG_M_9610_M.partsbnd.dcx',
-    '/parts/LG_M_9620.partsbnd.dcx',
-    '/parts/LG_M_9620_L.partsbnd.dcx',
-    '/parts/LG_M_9620_M.partsbnd.dcx',
-    '/parts/LG_M_9630.partsbnd.dcx',
-    '/parts/LG_M_9630_L.partsbnd.dcx',
-    '/parts/LG_M_9630_M.partsbnd.dcx',
-    '/parts/LG_M_9700.partsbnd.dcx',
-    '/parts/LG_M_9700_L.partsbnd.dcx',
-    '/parts/LG_M_9700_M.partsbnd.dcx',
-    '/parts/LG_M_9710.partsbnd.dcx',
-    '/parts/LG_M_9710_L.partsbnd.dcx',
-    '/parts/LG_M_9710_M.partsbnd.dcx',
-    '/parts/LG_M_9720.partsbnd.dcx',
-    '/parts/LG_M_9720_L.partsbnd.dcx',
-    '/parts/LG_M_9720_M.partsbnd.dcx',
-    '/parts/LG_M_9730.partsbnd.dcx',
-    '/parts/LG_M_9730_L.partsbnd.dcx',
-    '/parts/LG_M_9730_M.partsbnd.dcx',
-    '/parts/LG_M_9740.partsbnd.dcx',
-    '/parts/LG_M_9740_L.partsbnd.dcx',
-    '/parts/LG_M_9740_M.partsbnd.dcx',
-    '/parts/WP_A_0100.partsbnd.dcx',
-    '/parts/WP_A_0100_L.partsbnd.dcx',
-    '/parts/WP_A_0101.partsbnd.dcx',
-    '/parts/WP_A_0101_L.partsbnd.dcx',
-    '/parts/WP_A_0102.partsbnd.dcx',
-    '/parts/WP_A_0102_L.partsbnd.dcx',
-    '/parts/WP_A_0103.partsbnd.dcx',
-    '/parts/WP_A_0103_L.partsbnd.dcx',
-    '/parts/WP_A_0104.partsbnd.dcx',
-    '/parts/WP_A_0104_L.partsbnd.dcx',
-    '/parts/WP_A_0105.partsbnd.dcx',
-    '/parts/WP_A_0105_L.partsbnd.dcx',
-    '/parts/WP_A_0106.partsbnd.dcx',
-    '/parts/WP_A_0106_L.partsbnd.dcx',
-    '/parts/WP_A_0107.partsbnd.dcx',
-    '/parts/WP_A_0107_L.partsbnd.dcx',
-    '/parts/WP_A_0110.partsbnd.dcx',
-    '/parts/WP_A_0110_L.partsbnd.dcx',
-    '/parts/WP_A_0111.partsbnd.dcx',
-    '/parts/WP_A_0111_L.partsbnd.dcx',
-    '/parts/WP_A_0200.partsbnd.dcx',
-    '/parts/WP_A_0200_L.partsbnd.dcx',
-    '/parts/WP_A_0201.partsbnd.dcx',
-    '/parts/WP_A_0201_L.partsbnd.dcx',
-    '/parts/WP_A_0202.partsbnd.dcx',
-    '/parts/WP_A_0202_L.partsbnd.dcx',
-    '/parts/WP_A_0203.partsbnd.dcx',
-    '/parts/WP_A_0203_L.partsbnd.dcx',
-    '/parts/WP_A_0204.partsbnd.dcx',
-    '/parts/WP_A_0204_L.partsbnd.dcx',
-    '/parts/WP_A_0206.partsbnd.dcx',
-    '/parts/WP_A_0206_L.partsbnd.dcx',
-    '/parts/WP_A_0207.partsbnd.dcx',
-    '/parts/WP_A_0207_L.partsbnd.dcx',
-    '/parts/WP_A_0208.partsbnd.dcx',
-    '/parts/WP_A_0208_L.partsbnd.dcx',
-    '/parts/WP_A_0210.partsbnd.dcx',
-    '/parts/WP_A_0210_L.partsbnd.dcx',
-    '/parts/WP_A_0211.partsbnd.dcx',
-    '/parts/WP_A_0211_L.partsbnd.dcx',
-    '/parts/WP_A_0212.partsbnd.dcx',
-    '/parts/WP_A_0212_L.partsbnd.dcx',
-    '/parts/WP_A_0213.partsbnd.dcx',
-    '/parts/WP_A_0213_L.partsbnd.dcx',
-    '/parts/WP_A_0220.partsbnd.dcx',
-    '/parts/WP_A_0220_L.partsbnd.dcx',
-    '/parts/WP_A_0221.partsbnd.dcx',
-    '/parts/WP_A_0221_L.partsbnd.dcx',
-    '/parts/WP_A_0230.partsbnd.dcx',
-    '/parts/WP_A_0230_L.partsbnd.dcx',
-    '/parts/WP_A_0231.partsbnd.dcx',
-    '/parts/WP_A_0231_L.partsbnd.dcx',
-    '/parts/WP_A_0240.partsbnd.dcx',
-    '/parts/WP_A_0240_L.partsbnd.dcx',
-    '/parts/WP_A_0251.partsbnd.dcx',
-    '/parts/WP_A_0251_L.partsbnd.dcx',
-    '/parts/WP_A_0252.partsbnd.dcx',
-    '/parts/WP_A_0252_L.partsbnd.dcx',
-    '/parts/WP_A_0258.partsbnd.dcx',
-    '/parts/WP_A_0258_L.partsbnd.dcx',
-    '/parts/WP_A_0259.partsbnd.dcx',
-    '/parts/WP_A_0259_L.partsbnd.dcx',
-    '/parts/WP_A_0260.partsbnd.dcx',
-    '/parts/WP_A_0260_L.partsbnd.dcx',
-    '/parts/WP_A_0263.partsbnd.dcx',
-    '/parts/WP_A_0263_L.partsbnd.dcx',
-    '/parts/WP_A_0264.partsbnd.dcx',
-    '/parts/WP_A_0264_L.partsbnd.dcx',
-    '/parts/WP_A_0265.partsbnd.dcx',
-    '/parts/WP_A_0265_L.partsbnd.dcx',
-    '/parts/WP_A_0266.partsbnd.dcx',
-    '/parts/WP_A_0266_L.partsbnd.dcx',
-    '/parts/WP_A_0267.partsbnd.dcx',
-    '/parts/WP_A_0267_L.partsbnd.dcx',
-    '/parts/WP_A_0268.partsbnd.dcx',
-    '/parts/WP_A_0268_L.partsbnd.dcx',
-    '/parts/WP_A_0269.partsbnd.dcx',
-    '/parts/WP_A_0269_L.partsbnd.dcx',
-    '/parts/WP_A_0270.partsbnd.dcx',
-    '/parts/WP_A_0270_L.partsbnd.dcx',
-    '/parts/WP_A_0271.partsbnd.dcx',
-    '/parts/WP_A_0271_L.partsbnd.dcx',
-    '/parts/WP_A_0272.partsbnd.dcx',
-    '/parts/WP_A_0272_L.partsbnd.dcx',
-    '/parts/WP_A_0273.partsbnd.dcx',
-    '/parts/WP_A_0273_L.partsbnd.dcx',
-    '/parts/WP_A_0274.partsbnd.dcx',
-    '/parts/WP_A_0274_L.partsbnd.dcx',
-    '/parts/WP_A_0280.partsbnd.dcx',
-    '/parts/WP_A_0280_L.partsbnd.dcx',
-    '/parts/WP_A_0281.partsbnd.dcx',
-    '/parts/WP_A_0281_L.partsbnd.dcx',
-    '/parts/WP_A_0282.partsbnd.dcx',
-    '/parts/WP_A_0282_L.partsbnd.dcx',
-    '/parts/WP_A_0284.partsbnd.dcx',
-    '/parts/WP_A_0284_L.partsbnd.dcx',
-    '/parts/WP_A_0290.partsbnd.dcx',
-    '/parts/WP_A_0290_L.partsbnd.dcx',
-    '/parts/WP_A_0291.partsbnd.dcx',
-    '/parts/WP_A_0291_L.partsbnd.dcx',
-    '/parts/WP_A_0300.partsbnd.dcx',
-    '/parts/WP_A_0300_L.partsbnd.dcx',
-    '/parts/WP_A_0301.partsbnd.dcx',
-    '/parts/WP_A_0301_L.partsbnd.dcx',
-    '/parts/WP_A_0302.partsbnd.dcx',
-    '/parts/WP_A_0302_L.partsbnd.dcx',
-    '/parts/WP_A_0400.partsbnd.dcx',
-    '/parts/WP_A_0400_L.partsbnd.dcx',
-    '/parts/WP_A_0401.partsbnd.dcx',
-    '/parts/WP_A_0401_L.partsbnd.dcx',
-    '/parts/WP_A_0402.partsbnd.dcx',
-    '/parts/WP_A_0402_L.partsbnd.dcx',
-    '/parts/WP_A_0403.partsbnd.dcx',
-    '/parts/WP_A_0403_L.partsbnd.dcx',
-    '/parts/WP_A_0406.partsbnd.dcx',
-    '/parts/WP_A_0406_L.partsbnd.dcx',
-    '/parts/WP_A_0450.partsbnd.dcx',
-    '/parts/WP_A_0450_L.partsbnd.dcx',
-    '/parts/WP_A_0451.partsbnd.dcx',
-    '/parts/WP_A_0451_L.partsbnd.dcx',
-    '/parts/WP_A_0452.partsbnd.dcx',
-    '/parts/WP_A_0452_L.partsbnd.dcx',
-    '/parts/WP_A_0502.partsbnd.dcx',
-    '/parts/WP_A_0502_L.partsbnd.dcx',
-    '/parts/WP_A_0503.partsbnd.dcx',
-    '/parts/WP_A_0503_L.partsbnd.dcx',
-    '/parts/WP_A_0504.partsbnd.dcx',
-    '/parts/WP_A_0504_L.partsbnd.dcx',
-    '/parts/WP_A_0505.partsbnd.dcx',
-    '/parts/WP_A_0505_L.partsbnd.dcx',
-    '/parts/WP_A_0506.partsbnd.dcx',
-    '/parts/WP_A_0506_L.partsbnd.dcx',
-    '/parts/WP_A_0507.partsbnd.dcx',
-    '/parts/WP_A_0507_L.partsbnd.dcx',
-    '/parts/WP_A_0508.partsbnd.dcx',
-    '/parts/WP_A_0508_L.partsbnd.dcx',
-    '/parts/WP_A_0509.partsbnd.dcx',
-    '/parts/WP_A_0509_L.partsbnd.dcx',
-    '/parts/WP_A_0510.partsbnd.dcx',
-    '/parts/WP_A_0510_L.partsbnd.dcx',
-    '/parts/WP_A_0600.partsbnd.dcx',
-    '/parts/WP_A_0600_L.partsbnd.dcx',
-    '/parts/WP_A_0601.partsbnd.dcx',
-    '/parts/WP_A_0601_L.partsbnd.dcx',
-    '/parts/WP_A_0602.partsbnd.dcx',
-    '/parts/WP_A_0602_L.partsbnd.dcx',
-    '/parts/WP_A_0603.partsbnd.dcx',
-    '/parts/WP_A_0603_L.partsbnd.dcx',
-    '/parts/WP_A_0604.partsbnd.dcx',
-    '/parts/WP_A_0604_L.partsbnd.dcx',
-    '/parts/WP_A_0605.partsbnd.dcx',
-    '/parts/WP_A_0605_L.partsbnd.dcx',
-    '/parts/WP_A_0606.partsbnd.dcx',
-    '/parts/WP_A_0606_L.partsbnd.dcx',
-    '/parts/WP_A_0607.partsbnd.dcx',
-    '/parts/WP_A_0607_L.partsbnd.dcx',
-    '/parts/WP_A_0608.partsbnd.dcx',
-    '/parts/WP_A_0608_L.partsbnd.dcx',
-    '/parts/WP_A_0651.partsbnd.dcx',
-    '/parts/WP_A_0651_L.partsbnd.dcx',
-    '/parts/WP_A_0652.partsbnd.dcx',
-    '/parts/WP_A_0652_L.partsbnd.dcx',
-    '/parts/WP_A_0653.partsbnd.dcx',
-    '/parts/WP_A_0653_L.partsbnd.dcx',
-    '/parts/WP_A_0654.partsbnd.dcx',
-    '/parts/WP_A_0654_L.partsbnd.dcx',
-    '/parts/WP_A_0655.partsbnd.dcx',
-    '/parts/WP_A_0655_L.partsbnd.dcx',
-    '/parts/WP_A_0656.partsbnd.dcx',
-    '/parts/WP_A_0656_L.partsbnd.dcx',
-    '/parts/WP_A_0657.partsbnd.dcx',
-    '/parts/WP_A_0657_L.partsbnd.dcx',
-    '/parts/WP_A_0658.partsbnd.dcx',
-    '/parts/WP_A_0658_L.partsbnd.dcx',
-    '/parts/WP_A_0659.partsbnd.dcx',
-    '/parts/WP_A_0659_L.partsbnd.dcx',
-    '/parts/WP_A_0700.partsbnd.dcx',
-    '/parts/WP_A_0700_L.partsbnd.dcx',
-    '/parts/WP_A_0702.partsbnd.dcx',
-    '/parts/WP_A_0702_L.partsbnd.dcx',
-    '/parts/WP_A_0703.partsbnd.dcx',
-    '/parts/WP_A_0703_L.partsbnd.dcx',
-    '/parts/WP_A_0710.partsbnd.dcx',
-    '/parts/WP_A_0710_L.partsbnd.dcx',
-    '/parts/WP_A_0720.partsbnd.dcx',
-    '/parts/WP_A_0720_L.partsbnd.dcx',
-    '/parts/WP_A_0721.partsbnd.dcx',
-    '/parts/WP_A_0721_L.partsbnd.dcx',
-    '/parts/WP_A_0722.partsbnd.dcx',
-    '/parts/WP_A_0722_L.partsbnd.dcx',
-    '/parts/WP_A_0730.partsbnd.dcx',
-    '/parts/WP_A_0730_L.partsbnd.dcx',
-    '/parts/WP_A_0731.partsbnd.dcx',
-    '/parts/WP_A_0731_L.partsbnd.dcx',
-    '/parts/WP_A_0740.partsbnd.dcx',
-    '/parts/WP_A_0740_L.partsbnd.dcx',
-    '/parts/WP_A_0801.partsbnd.dcx',
-    '/parts/WP_A_0801_L.partsbnd.dcx',
-    '/parts/WP_A_0802.partsbnd.dcx',
-    '/parts/WP_A_0802_L.partsbnd.dcx',
-    '/parts/WP_A_0803.partsbnd.dcx',
-    '/parts/WP_A_0803_L.partsbnd.dcx',
-    '/parts/WP_A_0804.partsbnd.dcx',
-    '/parts/WP_A_0804_L.partsbnd.dcx',
-    '/parts/WP_A_0805.partsbnd.dcx',
-    '/parts/WP_A_0805_L.partsbnd.dcx',
-    '/parts/WP_A_0810.partsbnd.dcx',
-    '/parts/WP_A_0810_L.partsbnd.dcx',
-    '/parts/WP_A_0811.partsbnd.dcx',
-    '/parts/WP_A_0811_L.partsbnd.dcx',
-    '/parts/WP_A_0901.partsbnd.dcx',
-    '/parts/WP_A_0901_L.partsbnd.dcx',
-    '/parts/WP_A_0902.partsbnd.dcx',
-    '/parts/WP_A_0902_L.partsbnd.dcx',
-    '/parts/WP_A_0903.partsbnd.dcx',
-    '/parts/WP_A_0903_L.partsbnd.dcx',
-    '/parts/WP_A_0904.partsbnd.dcx',
-    '/parts/WP_A_0904_L.partsbnd.dcx',
-    '/parts/WP_A_0905.partsbnd.dcx',
-    '/parts/WP_A_0905_L.partsbnd.dcx',
-    '/parts/WP_A_0906.partsbnd.dcx',
-    '/parts/WP_A_0906_L.partsbnd.dcx',
-    '/parts/WP_A_0907.partsbnd.dcx',
-    '/parts/WP_A_0907_L.partsbnd.dcx',
-    '/parts/WP_A_0908.partsbnd.dcx',
-    '/parts/WP_A_0908_L.partsbnd.dcx',
-    '/parts/WP_A_0909.partsbnd.dcx',
-    '/parts/WP_A_0909_L.partsbnd.dcx',
-    '/parts/WP_A_0910.partsbnd.dcx',
-    '/parts/WP_A_0910_L.partsbnd.dcx',
-    '/parts/WP_A_0911.partsbnd.dcx',
-    '/parts/WP_A_0911_L.partsbnd.dcx',
-    '/parts/WP_A_0912.partsbnd.dcx',
-    '/parts/WP_A_0912_L.partsbnd.dcx',
-    '/parts/WP_A_0913.partsbnd.dcx',
-    '/parts/WP_A_0913_L.partsbnd.dcx',
-    '/parts/WP_A_0914.partsbnd.dcx',
-    '/parts/WP_A_0914_L.partsbnd.dcx',
-    '/parts/WP_A_0915.partsbnd.dcx',
-    '/parts/WP_A_0915_L.partsbnd.dcx',
-    '/parts/WP_A_0916.partsbnd.dcx',
-    '/parts/WP_A_0916_L.partsbnd.dcx',
-    '/parts/WP_A_0920.partsbnd.dcx',
-    '/parts/WP_A_0920_L.partsbnd.dcx',
-    '/parts/WP_A_0921.partsbnd.dcx',
-    '/parts/WP_A_0921_L.partsbnd.dcx',
-    '/parts/WP_A_1000.partsbnd.dcx',
-    '/parts/WP_A_1000_L.partsbnd.dcx',
-    '/parts/WP_A_1002.partsbnd.dcx',
-    '/parts/WP_A_1002_L.partsbnd.dcx',
-    '/parts/WP_A_1003.partsbnd.dcx',
-    '/parts/WP_A_1003_L.partsbnd.dcx',
-    '/parts/WP_A_1004.partsbnd.dcx',
-    '/parts/WP_A_1004_L.partsbnd.dcx',
-    '/parts/WP_A_1005.partsbnd.dcx',
-    '/parts/WP_A_1005_L.partsbnd.dcx',
-    '/parts/WP_A_1100.partsbnd.dcx',
-    '/parts/WP_A_1100_L.partsbnd.dcx',
-    '/parts/WP_A_1101.partsbnd.dcx',
-    '/parts/WP_A_1101_L.partsbnd.dcx',
-    '/parts/WP_A_1102.partsbnd.dcx',
-    '/parts/WP_A_1102_L.partsbnd.dcx',
-    '/parts/WP_A_1103.partsbnd.dcx',
-    '/parts/WP_A_1103_L.partsbnd.dcx',
-    '/parts/WP_A_1200.partsbnd.dcx',
-    '/parts/WP_A_1200_L.partsbnd.dcx',
-    '/parts/WP_A_1201.partsbnd.dcx',
-    '/parts/WP_A_1201_L.partsbnd.dcx',
-    '/parts/WP_A_1210.partsbnd.dcx',
-    '/parts/WP_A_1210_L.partsbnd.dcx',
-    '/parts/WP_A_1300.partsbnd.dcx',
-    '/parts/WP_A_1300_L.partsbnd.dcx',
-    '/parts/WP_A_1301.partsbnd.dcx',
-    '/parts/WP_A_1301_L.partsbnd.dcx',
-    '/parts/WP_A_1302.partsbnd.dcx',
-    '/parts/WP_A_1302_L.partsbnd.dcx',
-    '/parts/WP_A_1304.partsbnd.dcx',
-    '/parts/WP_A_1304_L.partsbnd.dcx',
-    '/parts/WP_A_1305.partsbnd.dcx',
-    '/parts/WP_A_1305_L.partsbnd.dcx',
-    '/parts/WP_A_1360.partsbnd.dcx',
-    '/parts/WP_A_1360_L.partsbnd.dcx',
-    '/parts/WP_A_1361.partsbnd.dcx',
-    '/parts/WP_A_1361_L.partsbnd.dcx',
-    '/parts/WP_A_1399.partsbnd.dcx',
-    '/parts/WP_A_1399_L.partsbnd.dcx',
-    '/parts/WP_A_1401.partsbnd.dcx',
-    '/parts/WP_A_1401_L.partsbnd.dcx',
-    '/parts/WP_A_1402.partsbnd.dcx',
-    '/parts/WP_A_1402_L.partsbnd.dcx',
-    '/parts/WP_A_1404.partsbnd.dcx',
-    '/parts/WP_A_1404_L.partsbnd.dcx',
-    '/parts/WP_A_1405.partsbnd.dcx',
-    '/parts/WP_A_1405_L.partsbnd.dcx',
-    '/parts/WP_A_1500.partsbnd.dcx',
-    '/parts/WP_A_1500_L.partsbnd.dcx',
-    '/parts/WP_A_1501.partsbnd.dcx',
-    '/parts/WP_A_1501_L.partsbnd.dcx',
-    '/parts/WP_A_1502.partsbnd.dcx',
-    '/parts/WP_A_1502_L.partsbnd.dcx',
-    '/parts/WP_A_1503.partsbnd.dcx',
-    '/parts/WP_A_1503_L.partsbnd.dcx',
-    '/parts/WP_A_1504.partsbnd.dcx',
-    '/parts/WP_A_1504_L.partsbnd.dcx',
-    '/parts/WP_A_1505.partsbnd.dcx',
-    '/parts/WP_A_1505_L.partsbnd.dcx',
-    '/parts/WP_A_1507.partsbnd.dcx',
-    '/parts/WP_A_1507_L.partsbnd.dcx',
-    '/parts/WP_A_1509.partsbnd.dcx',
-    '/parts/WP_A_1509_L.partsbnd.dcx',
-    '/parts/WP_A_1510.partsbnd.dcx',
-    '/parts/WP_A_1510_L.partsbnd.dcx',
-    '/parts/WP_A_1511.partsbnd.dcx',
-    '/parts/WP_A_1511_L.partsbnd.dcx',
-    '/parts/WP_A_1513.partsbnd.dcx',
-    '/parts/WP_A_1513_L.partsbnd.dcx',
-    '/parts/WP_A_1514.partsbnd.dcx',
-    '/parts/WP_A_1514_L.partsbnd.dcx',
-    '/parts/WP_A_1515.partsbnd.dcx',
-    '/parts/WP_A_1515_L.partsbnd.dcx',
-    '/parts/WP_A_1516.partsbnd.dcx',
-    '/parts/WP_A_1516_L.partsbnd.dcx',
-    '/parts/WP_A_1517.partsbnd.dcx',
-    '/parts/WP_A_1517_L.partsbnd.dcx',
-    '/parts/WP_A_1518.partsbnd.dcx',
-    '/parts/WP_A_1518_L.partsbnd.dcx',
-    '/parts/WP_A_1519.partsbnd.dcx',
-    '/parts/WP_A_1519_L.partsbnd.dcx',
-    '/parts/WP_A_1520.partsbnd.dcx',
-    '/parts/WP_A_1520_L.partsbnd.dcx',
-    '/parts/WP_A_1521.partsbnd.dcx',
-    '/parts/WP_A_1521_L.partsbnd.dcx',
-    '/parts/WP_A_1522.partsbnd.dcx',
-    '/parts/WP_A_1522_L.partsbnd.dcx',
-    '/parts/WP_A_1523.partsbnd.dcx',
-    '/parts/WP_A_1523_L.partsbnd.dcx',
-    '/parts/WP_A_1524.partsbnd.dcx',
-    '/parts/WP_A_1524_L.partsbnd.dcx',
-    '/parts/WP_A_1525.partsbnd.dcx',
-    '/parts/WP_A_1525_L.partsbnd.dcx',
-    '/parts/WP_A_1526.partsbnd.dcx',
-    '/parts/WP_A_1526_L.partsbnd.dcx',
-    '/parts/WP_A_1527.partsbnd.dcx',
-    '/parts/WP_A_1527_L.partsbnd.dcx',
-    '/parts/WP_A_1528.partsbnd.dcx',
-    '/parts/WP_A_1528_L.partsbnd.dcx',
-    '/parts/WP_A_1529.partsbnd.dcx',
-    '/parts/WP_A_1529_L.partsbnd.dcx',
-    '/parts/WP_A_1530.partsbnd.dcx',
-    '/parts/WP_A_1530_L.partsbnd.dcx',
-    '/parts/WP_A_1531.partsbnd.dcx',
-    '/parts/WP_A_1531_L.partsbnd.dcx',
-    '/parts/WP_A_1532.partsbnd.dcx',
-    '/parts/WP_A_1532_L.partsbnd.dcx',
-    '/parts/WP_A_1533.partsbnd.dcx',
-    '/parts/WP_A_1533_L.partsbnd.dcx',
-    '/parts/WP_A_1534.partsbnd.dcx',
-    '/parts/WP_A_1534_L.partsbnd.dcx',
-    '/parts/WP_A_1535.partsbnd.dcx',
-    '/parts/WP_A_1535_L.partsbnd.dcx',
-    '/parts/WP_A_1536.partsbnd.dcx',
-    '/parts/WP_A_1536_L.partsbnd.dcx',
-    '/parts/WP_A_1537.partsbnd.dcx',
-    '/parts/WP_A_1537_L.partsbnd.dcx',
-    '/parts/WP_A_1538.partsbnd.dcx',
-    '/parts/WP_A_1538_L.partsbnd.dcx',
-    '/parts/WP_A_1539.partsbnd.dcx',
-    '/parts/WP_A_1539_L.partsbnd.dcx',
-    '/parts/WP_A_1540.partsbnd.dcx',
-    '/parts/WP_A_1540_L.partsbnd.dcx',
-    '/parts/WP_A_1541.partsbnd.dcx',
-    '/parts/WP_A_1541_L.partsbnd.dcx',
-    '/parts/WP_A_1542.partsbnd.dcx',
-    '/parts/WP_A_1542_L.partsbnd.dcx',
-    '/parts/WP_A_1543.partsbnd.dcx',
-    '/parts/WP_A_1543_L.partsbnd.dcx',
-    '/parts/WP_A_1544.partsbnd.dcx',
-    '/parts/WP_A_1544_L.partsbnd.dcx',
-    '/parts/WP_A_1545.partsbnd.dcx',
-    '/parts/WP_A_1545_L.partsbnd.dcx',
-    '/parts/WP_A_1546.partsbnd.dcx',
-    '/parts/WP_A_1546_L.partsbnd.dcx',
-    '/parts/WP_A_1547.partsbnd.dcx',
-    '/parts/WP_A_1547_L.partsbnd.dcx',
-    '/parts/WP_A_1548.partsbnd.dcx',
-    '/parts/WP_A_1548_L.partsbnd.dcx',
-    '/parts/WP_A_1549.partsbnd.dcx',
-    '/parts/WP_A_1549_L.partsbnd.dcx',
-    '/parts/WP_A_1550.partsbnd.dcx',
-    '/parts/WP_A_1550_L.partsbnd.dcx',
-    '/parts/WP_A_1700.partsbnd.dcx',
-    '/parts/WP_A_1700_L.partsbnd.dcx',
-    '/parts/WP_A_1800.partsbnd.dcx',
-    '/parts/WP_A_1800_L.partsbnd.dcx',
-    '/parts/WP_A_1801.partsbnd.dcx',
-    '/parts/WP_A_1801_L.partsbnd.dcx',
-    '/parts/WP_A_2001.partsbnd.dcx',
-    '/parts/WP_A_2001_L.partsbnd.dcx',
-    '/parts/WP_A_2002.partsbnd.dcx',
-    '/parts/WP_A_2002_L.partsbnd.dcx',
-    '/parts/WP_A_2003.partsbnd.dcx',
-    '/parts/WP_A_2003_L.partsbnd.dcx',
-    '/parts/WP_A_2004.partsbnd.dcx',
-    '/parts/WP_A_2004_L.partsbnd.dcx',
-    '/parts/WP_A_2005.partsbnd.dcx',
-    '/parts/WP_A_2005_L.partsbnd.dcx',
-    '/parts/WP_A_2006.partsbnd.dcx',
-    '/parts/WP_A_2006_L.partsbnd.dcx',
-    '/parts/WP_A_2007.partsbnd.dcx',
-    '/parts/WP_A_2007_L.partsbnd.dcx',
-    '/parts/WP_A_2008.partsbnd.dcx',
-    '/parts/WP_A_2008_L.partsbnd.dcx',
-    '/parts/WP_A_2009.partsbnd.dcx',
-    '/parts/WP_A_2009_L.partsbnd.dcx',
-    '/parts/WP_A_2010.partsbnd.dcx',
-    '/parts/WP_A_2010_L.partsbnd.dcx',
-    '/parts/WP_A_2011.partsbnd.dcx',
-    '/parts/WP_A_2011_L.partsbnd.dcx',
-    '/parts/WP_A_2012.partsbnd.dcx',
-    '/parts/WP_A_2012_L.partsbnd.dcx',
-    '/parts/WP_A_2013.partsbnd.dcx',
-    '/parts/WP_A_2013_L.partsbnd.dcx',
-    '/parts/WP_A_2014.partsbnd.dcx',
-    '/parts/WP_A_2014_L.partsbnd.dcx',
-    '/parts/WP_A_2015.partsbnd.dcx',
-    '/parts/WP_A_2015_L.partsbnd.dcx',
-    '/parts/WP_A_2016.partsbnd.dcx',
-    '/parts/WP_A_2016_L.partsbnd.dcx',
-    '/parts/WP_A_2017.partsbnd.dcx',
-    '/parts/WP_A_2017_L.partsbnd.dcx',
-    '/parts/WP_A_2018.partsbnd.dcx',
-    '/parts/WP_A_2018_L.partsbnd.dcx',
-    '/parts/WP_A_2019.partsbnd.dcx',
-    '/parts/WP_A_2019_L.partsbnd.dcx',
-    '/parts/WP_A_2020.partsbnd.dcx',
-    '/parts/WP_A_2020_L.partsbnd.dcx',
-    '/parts/WP_A_2021.partsbnd.dcx',
-    '/parts/WP_A_2021_L.partsbnd.dcx',
-    '/parts/WP_A_2022.partsbnd.dcx',
-    '/parts/WP_A_2022_L.partsbnd.dcx',
-    '/parts/WP_A_2023.partsbnd.dcx',
-    '/parts/WP_A_2023_L.partsbnd.dcx',
-    '/parts/WP_A_2024.partsbnd.dcx',
-    '/parts/WP_A_2024_L.partsbnd.dcx',
-    '/parts/WP_A_2025.partsbnd.dcx',
-    '/parts/WP_A_2025_L.partsbnd.dcx',
-    '/parts/WP_A_2026.partsbnd.dcx',
-    '/parts/WP_A_2026_L.partsbnd.dcx',
-    '/shader/DbgFont.shaderbnd.dcx',
-    '/shader/FRPG_Filter.shaderbnd.dcx',
-    '/shader/FRPG_Flver_fpo.shaderbnd.dcx',
-    '/shader/FRPG_Flver_vpo.shaderbnd.dcx',
-    '/shader/FRPG_Menu.shaderbnd.dcx',
-    '/shader/FRPG_Sfx.shaderbnd.dcx',
-    '/sound/fdlc.fev',
-    '/sound/fdlc_c3471.fev',
-    '/sound/fdlc_c3471.fsb',
-    '/sound/fdlc_c3471.itl',
-    '/sound/fdlc_c3472.fev',
-    '/sound/fdlc_c3472.fsb',
-    '/sound/fdlc_c3472.itl',
-    '/sound/fdlc_c4090.fev',
-    '/sound/fdlc_c4090.fsb',
-    '/sound/fdlc_c4090.itl',
-    '/sound/fdlc_c4091.fev',
-    '/sound/fdlc_c4091.fsb',
-    '/sound/fdlc_c4091.itl',
-    '/sound/fdlc_c4100.fev',
-    '/sound/fdlc_c4100.fsb',
-    '/sound/fdlc_c4100.itl',
-    '/sound/fdlc_c4110.fev',
-    '/sound/fdlc_c4110.fsb',
-    '/sound/fdlc_c4110.itl',
-    '/sound/fdlc_c4120.fev',
-    '/sound/fdlc_c4120.fsb',
-    '/sound/fdlc_c4120.itl',
-    '/sound/fdlc_c4130.fev',
-    '/sound/fdlc_c4130.fsb',
-    '/sound/fdlc_c4130.itl',
-    '/sound/fdlc_c4140.fev',
-    '/sound/fdlc_c4140.fsb',
-    '/sound/fdlc_c4140.itl',
-    '/sound/fdlc_c4150.fev',
-    '/sound/fdlc_c4150.fsb',
-    '/sound/fdlc_c4150.itl',
-    '/sound/fdlc_c4160.fev',
-    '/sound/fdlc_c4160.fsb',
-    '/sound/fdlc_c4160.itl',
-    '/sound/fdlc_c4170.fev',
-    '/sound/fdlc_c4170.fsb',
-    '/sound/fdlc_c4170.itl',
-    '/sound/fdlc_c4171.fev',
-    '/sound/fdlc_c4171.fsb',
-    '/sound/fdlc_c4171.itl',
-    '/sound/fdlc_c4172.fev',
-    '/sound/fdlc_c4172.fsb',
-    '/sound/fdlc_c4172.itl',
-    '/sound/fdlc_c4180.fev',
-    '/sound/fdlc_c4180.fsb',
-    '/sound/fdlc_c4180.itl',
-    '/sound/fdlc_c4190.fev',
-    '/sound/fdlc_c4190.fsb',
-    '/sound/fdlc_c4190.itl',
-    '/sound/fdlc_c4500.fev',
-    '/sound/fdlc_c4500.fsb',
-    '/sound/fdlc_c4500.itl',
-    '/sound/fdlc_c4510.fev',
-    '/sound/fdlc_c4510.fsb',
-    '/sound/fdlc_c4510.itl',
-    '/sound/fdlc_c4511.fev',
-    '/sound/fdlc_c4511.fsb',
-    '/sound/fdlc_c4511.itl',
-    '/sound/fdlc_c4520.fev',
-    '/sound/fdlc_c4520.fsb',
-    '/sound/fdlc_c4520.itl',
-    '/sound/fdlc_c4531.fev',
-    '/sound/fdlc_c4531.fsb',
-    '/sound/fdlc_c4531.itl',
-    '/sound/fdlc_m12.fev',
-    '/sound/fdlc_m12.fsb',
-    '/sound/fdlc_m12.itl',
-    '/sound/fdlc_main.fev',
-    '/sound/fdlc_main.fsb',
-    '/sound/fdlc_main.itl',
-    '/sound/fdlc_p120002.fev',
-    '/sound/fdlc_p120002.fsb',
-    '/sound/fdlc_p120002.itl',
-    '/sound/fdlc_p120003.fev',
-    '/sound/fdlc_p120003.fsb',
-    '/sound/fdlc_p120003.itl',
-    '/sound/fdlc_p120100.fev',
-    '/sound/fdlc_p120100.fsb',
-    '/sound/fdlc_p120100.itl',
-    '/sound/fdlc_p120110.fev',
-    '/sound/fdlc_p120110.fsb',
-    '/sound/fdlc_p120110.itl',
-    '/sound/fdlc_p120130.fev',
-    '/sound/fdlc_p120130.fsb',
-    '/sound/fdlc_p120130.itl',
-    '/sound/fdlc_p120140.fev',
-    '/sound/fdlc_p120140.fsb',
-    '/sound/fdlc_p120140.itl',
-    '/sound/fdlc_sm12.fev',
-    '/sound/fdlc_sm12.fsb',
-    '/sound/fdlc_sm12.itl',
-    '/sound/fdlc_smain.fev',
-    '/sound/fdlc_smain.fsb',
-    '/sound/fdlc_smain.itl',
-    '/sound/fdlc_stationary.fev',
-    '/sound/frpg.fev',
-    '/sound/frpg_c1000.fev',
-    '/sound/frpg_c1000.fsb',
-    '/sound/frpg_c1000.itl',
-    '/sound/frpg_c1200.fev',
-    '/sound/frpg_c1200.fsb',
-    '/sound/frpg_c1200.itl',
-    '/sound/frpg_c1201.fev',
-    '/sound/frpg_c1201.fsb',
-    '/sound/frpg_c1201.itl',
-    '/sound/frpg_c1202.fev',
-    '/sound/frpg_c1202.fsb',
-    '/sound/frpg_c1202.itl',
-    '/sound/frpg_c1203.fev',
-    '/sound/frpg_c1203.fsb',
-    '/sound/frpg_c1203.itl',
-    '/sound/frpg_c2060.fev',
-    '/sound/frpg_c2060.fsb',
-    '/sound/frpg_c2060.itl',
-    '/sound/frpg_c2210.fev',
-    '/sound/frpg_c2210.fsb',
-    '/sound/frpg_c2210.itl',
-    '/sound/frpg_c2230.fev',
-    '/sound/frpg_c2230.fsb',
-    '/sound/frpg_c2230.itl',
-    '/sound/frpg_c2231.fev',
-    '/sound/frpg_c2231.fsb',
-    '/sound/frpg_c2231.itl',
-    '/sound/frpg_c2232.fev',
-    '/sound/frpg_c2232.fsb',
-    '/sound/frpg_c2232.itl',
-    '/sound/frpg_c2240.fev',
-    '/sound/frpg_c2240.fsb',
-    '/sound/frpg_c2240.itl',
-    '/sound/frpg_c2250.fev',
-    '/sound/frpg_c2250.fsb',
-    '/sound/frpg_c2250.itl',
-    '/sound/frpg_c2260.fev',
-    '/sound/frpg_c2260.fsb',
-    '/sound/frpg_c2260.itl',
-    '/sound/frpg_c2270.fev',
-    '/sound/frpg_c2270.fsb',
-    '/sound/frpg_c2270.itl',
-    '/sound/frpg_c2280.fev',
-    '/sound/frpg_c2280.fsb',
-    '/sound/frpg_c2280.itl',
-    '/sound/frpg_c2290.fev',
-    '/sound/frpg_c2290.fsb',
-    '/sound/frpg_c2290.itl',
-    '/sound/frpg_c2300.fev',
-    '/sound/frpg_c2300.fsb',
-    '/sound/frpg_c2300.itl',
-    '/sound/frpg_c2310.fev',
-    '/sound/frpg_c2310.fsb',
-    '/sound/frpg_c2310.itl',
-    '/sound/frpg_c2320.fev',
-    '/sound/frpg_c2320.fsb',
-    '/sound/frpg_c2320.itl',
-    '/sound/frpg_c2330.fev',
-    '/sound/frpg_c2330.fsb',
-    '/sound/frpg_c2330.itl',
-    '/sound/frpg_c2360.fev',
-    '/sound/frpg_c2360.fsb',
-    '/sound/frpg_c2360.itl',
-    '/sound/frpg_c2370.fev',
-    '/sound/frpg_c2370.fsb',
-    '/sound/frpg_c2370.itl',
-    '/sound/frpg_c2380.fev',
-    '/sound/frpg_c2380.fsb',
-    '/sound/frpg_c2380.itl',
-    '/sound/frpg_c2390.fev',
-    '/sound/frpg_c2390.fsb',
-    '/sound/frpg_c2390.itl',
-    '/sound/frpg_c2400.fev',
-    '/sound/frpg_c2400.fsb',
-    '/sound/frpg_c2400.itl',
-    '/sound/frpg_c2410.fev',
-    '/sound/frpg_c2410.fsb',
-    '/sound/frpg_c2410.itl',
-    '/sound/frpg_c2430.fev',
-    '/sound/frpg_c2430.fsb',
-    '/sound/frpg_c2430.itl',
-    '/sound/frpg_c2500.fev',
-    '/sound/frpg_c2500.fsb',
-    '/sound/frpg_c2500.itl',
-    '/sound/frpg_c2510.fev',
-    '/sound/frpg_c2510.fsb',
-    '/sound/frpg_c2510.itl',
-    '/sound/frpg_c2520.fev',
-    '/sound/frpg_c2520.fsb',
-    '/sound/frpg_c2520.itl',
-    '/sound/frpg_c2530.fev',
-    '/sound/frpg_c2530.fsb',
-    '/sound/frpg_c2530.itl',
-    '/sound/frpg_c2540.fev',
-    '/sound/frpg_c2540.fsb',
-    '/sound/frpg_c2540.itl',
-    '/sound/frpg_c2550.fev',
-    '/sound/frpg_c2550.fsb',
-    '/sound/frpg_c2550.itl',
-    '/sound/frpg_c2560.fev',
-    '/sound/frpg_c2560.fsb',
-    '/sound/frpg_c2560.itl',
-    '/sound/frpg_c2570.fev',
-    '/sound/frpg_c2570.fsb',
-    '/sound/frpg_c2570.itl',
-    '/sound/frpg_c2590.fev',
-    '/sound/frpg_c2590.fsb',
-    '/sound/frpg_c2590.itl',
-    '/sound/frpg_c2600.fev',
-    '/sound/frpg_c2600.fsb',
-    '/sound/frpg_c2600.itl',
-    '/sound/frpg_c2640.fev',
-    '/sound/frpg_c2640.fsb',
-    '/sound/frpg_c2640.itl',
-    '/sound/frpg_c2650.fev',
-    '/sound/frpg_c2650.fsb',
-    '/sound/frpg_c2650.itl',
-    '/sound/frpg_c2660.fev',
-    '/sound/frpg_c2660.fsb',
-    '/sound/frpg_c2660.itl',
-    '/sound/frpg_c2670.fev',
-    '/sound/frpg_c2670.fsb',
-    '/sound/frpg_c2670.itl',
-    '/sound/frpg_c2680.fev',
-    '/sound/frpg_c2680.fsb',
-    '/sound/frpg_c2680.itl',
-    '/sound/frpg_c2690.fev',
-    '/sound/frpg_c2690.fsb',
-    '/sound/frpg_c2690.itl',
-    '/sound/frpg_c2700.fev',
-    '/sound/frpg_c2700.fsb',
-    '/sound/frpg_c2700.itl',
-    '/sound/frpg_c2710.fev',
-    '/sound/frpg_c2710.fsb',
-    '/sound/frpg_c2710.itl',
-    '/sound/frpg_c2711.fev',
-    '/sound/frpg_c2711.fsb',
-    '/sound/frpg_c2711.itl',
-    '/sound/frpg_c2730.fev',
-    '/sound/frpg_c2730.fsb',
-    '/sound/frpg_c2730.itl',
-    '/sound/frpg_c2731.fev',
-    '/sound/frpg_c2731.fsb',
-    '/sound/frpg_c2731.itl',
-    '/sound/frpg_c2750.fev',
-    '/sound/frpg_c2750.fsb',
-    '/sound/frpg_c2750.itl',
-    '/sound/frpg_c2780.fev',
-    '/sound/frpg_c2780.fsb',
-    '/sound/frpg_c2780.itl',
-    '/sound/frpg_c2790.fev',
-    '/sound/frpg_c2790.fsb',
-    '/sound/frpg_c2790.itl',
-    '/sound/frpg_c2791.fev',
-    '/sound/frpg_c2791.fsb',
-    '/sound/frpg_c2791.itl',
-    '/sound/frpg_c2792.fev',
-    '/sound/frpg_c2792.fsb',
-    '/sound/frpg_c2792.itl',
-    '/sound/frpg_c2793.fev',
-    '/sound/frpg_c2793.fsb',
-    '/sound/frpg_c2793.itl',
-    '/sound/frpg_c2794.fev',
-    '/sound/frpg_c2794.fsb',
-    '/sound/frpg_c2794.itl',
-    '/sound/frpg_c2795.fev',
-    '/sound/frpg_c2795.fsb',
-    '/sound/frpg_c2795.itl',
-    '/sound/frpg_c2800.fev',
-    '/sound/frpg_c2800.fsb',
-    '/sound/frpg_c2800.itl',
-    '/sound/frpg_c2810.fev',
-    '/sound/frpg_c2810.fsb',
-    '/sound/frpg_c2810.itl',
-    '/sound/frpg_c2811.fev',
-    '/sound/frpg_c2811.fsb',
-    '/sound/frpg_c2811.itl',
-    '/sound/frpg_c2820.fev',
-    '/sound/frpg_c2820.fsb',
-    '/sound/frpg_c2820.itl',
-    '/sound/frpg_c2830.fev',
-    '/sound/frpg_c2830.fsb',
-    '/sound/frpg_c2830.itl',
-    '/sound/frpg_c2840.fev',
-    '/sound/frpg_c2840.fsb',
-    '/sound/frpg_c2840.itl',
-    '/sound/frpg_c2860.fev',
-    '/sound/frpg_c2860.fsb',
-    '/sound/frpg_c2860.itl',
-    '/sound/frpg_c2870.fev',
-    '/sound/frpg_c2870.fsb',
-    '/sound/frpg_c2870.itl',
-    '/sound/frpg_c2900.fev',
-    '/sound/frpg_c2900.fsb',
-    '/sound/frpg_c2900.itl',
-    '/sound/frpg_c2910.fev',
-    '/sound/frpg_c2910.fsb',
-    '/sound/frpg_c2910.itl',
-    '/sound/frpg_c2920.fev',
-    '/sound/frpg_c2920.fsb',
-    '/sound/frpg_c2920.itl',
-    '/sound/frpg_c2930.fev',
-    '/sound/frpg_c2930.fsb',
-    '/sound/frpg_c2930.itl',
-    '/sound/frpg_c2940.fev',
-    '/sound/frpg_c2940.fsb',
-    '/sound/frpg_c2940.itl',
-    '/sound/frpg_c2950.fev',
-    '/sound/frpg_c2950.fsb',
-    '/sound/frpg_c2950.itl',
-    '/sound/frpg_c2960.fev',
-    '/sound/frpg_c2960.fsb',
-    '/sound/frpg_c2960.itl',
-    '/sound/frpg_c3090.fev',
-    '/sound/frpg_c3090.fsb',
-    '/sound/frpg_c3090.itl',
-    '/sound/frpg_c3110.fev',
-    '/sound/frpg_c3110.fsb',
-    '/sound/frpg_c3110.itl',
-    '/sound/frpg_c3200.fev',
-    '/sound/frpg_c3200.fsb',
-    '/sound/frpg_c3200.itl',
-    '/sound/frpg_c3210.fev',
-    '/sound/frpg_c3210.fsb',
-    '/sound/frpg_c3210.itl',
-    '/sound/frpg_c3220.fev',
-    '/sound/frpg_c3220.fsb',
-    '/sound/frpg_c3220.itl',
-    '/sound/frpg_c3230.fev',
-    '/sound/frpg_c3230.fsb',
-    '/sound/frpg_c3230.itl',
-    '/sound/frpg_c3240.fev',
-    '/sound/frpg_c3240.fsb',
-    '/sound/frpg_c3240.itl',
-    '/sound/frpg_c3250.fev',
-    '/sound/frpg_c3250.fsb',
-    '/sound/frpg_c3250.itl',
-    '/sound/frpg_c3270.fev',
-    '/sound/frpg_c3270.fsb',
-    '/sound/frpg_c3270.itl',
-    '/sound/frpg_c3290.fev',
-    '/sound/frpg_c3290.fsb',
-    '/sound/frpg_c3290.itl',
-    '/sound/frpg_c3300.fev',
-    '/sound/frpg_c3300.fsb',
-    '/sound/frpg_c3300.itl',
-    '/sound/frpg_c3320.fev',
-    '/sound/frpg_c3320.fsb',
-    '/sound/frpg_c3320.itl',
-    '/sound/frpg_c3330.fev',
-    '/sound/frpg_c3330.fsb',
-    '/sound/frpg_c3330.itl',
-    '/sound/frpg_c3340.fev',
-    '/sound/frpg_c3340.fsb',
-    '/sound/frpg_c3340.itl',
-    '/sound/frpg_c3341.fev',
-    '/sound/frpg_c3341.fsb',
-    '/sound/frpg_c3341.itl',
-    '/sound/frpg_c3350.fev',
-    '/sound/frpg_c3350.fsb',
-    '/sound/frpg_c3350.itl',
-    '/sound/frpg_c3370.fev',
-    '/sound/frpg_c3370.fsb',
-    '/sound/frpg_c3370.itl',
-    '/sound/frpg_c3380.fev',
-    '/sound/frpg_c3380.fsb',
-    '/sound/frpg_c3380.itl',
-    '/sound/frpg_c3390.fev',
-    '/sound/frpg_c3390.fsb',
-    '/sound/frpg_c3390.itl',
-    '/sound/frpg_c3400.fev',
-    '/sound/frpg_c3400.fsb',
-    '/sound/frpg_c3400.itl',
-    '/sound/frpg_c3410.fev',
-    '/sound/frpg_c3410.fsb',
-    '/sound/frpg_c3410.itl',
-    '/sound/frpg_c3420.fev',
-    '/sound/frpg_c3420.fsb',
-    '/sound/frpg_c3420.itl',
-    '/sound/frpg_c3421.fev',
-    '/sound/frpg_c3421.fsb',
-    '/sound/frpg_c3421.itl',
-    '/sound/frpg_c3422.fev',
-    '/sound/frpg_c3422.fsb',
-    '/sound/frpg_c3422.itl',
-    '/sound/frpg_c3430.fev',
-    '/sound/frpg_c3430.fsb',
-    '/sound/frpg_c3430.itl',
-    '/sound/frpg_c3431.fev',
-    '/sound/frpg_c3431.fsb',
-    '/sound/frpg_c3431.itl',
-    '/sound/frpg_c3450.fev',
-    '/sound/frpg_c3450.fsb',
-    '/sound/frpg_c3450.itl',
-    '/sound/frpg_c3451.fev',
-    '/sound/frpg_c3451.fsb',
-    '/sound/frpg_c3451.itl',
-    '/sound/frpg_c3460.fev',
-    '/sound/frpg_c3460.fsb',
-    '/sound/frpg_c3460.itl',
-    '/sound/frpg_c3461.fev',
-    '/sound/frpg_c3461.fsb',
-    '/sound/frpg_c3461.itl',
-    '/sound/frpg_c3470.fev',
-    '/sound/frpg_c3470.fsb',
-    '/sound/frpg_c3470.itl',
-    '/sound/frpg_c3480.fev',
-    '/sound/frpg_c3480.fsb',
-    '/sound/frpg_c3480.itl',
-    '/sound/frpg_c3490.fev',
-    '/sound/frpg_c3490.fsb',
-    '/sound/frpg_c3490.itl',
-    '/sound/frpg_c3491.fev',
-    '/sound/frpg_c3491.fsb',
-    '/sound/frpg_c3491.itl',
-    '/sound/frpg_c3500.fev',
-    '/sound/frpg_c3500.fsb',
-    '/sound/frpg_c3500.itl',
-    '/sound/frpg_c3501.fev',
-    '/sound/frpg_c3501.fsb',
-    '/sound/frpg_c3501.itl',
-    '/sound/frpg_c3510.fev',
-    '/sound/frpg_c3510.fsb',
-    '/sound/frpg_c3510.itl',
-    '/sound/frpg_c3520.fev',
-    '/sound/frpg_c3520.fsb',
-    '/sound/frpg_c3520.itl',
-    '/sound/frpg_c3530.fev',
-    '/sound/frpg_c3530.fsb',
-    '/sound/frpg_c3530.itl',
-    '/sound/frpg_c3531.fev',
-    '/sound/frpg_c3531.fsb',
-    '/sound/frpg_c3531.itl',
-    '/sound/frpg_c5200.fev',
-    '/sound/frpg_c5200.fsb',
-    '/sound/frpg_c5200.itl',
-    '/sound/frpg_c5201.fev',
-    '/sound/frpg_c5201.fsb',
-    '/sound/frpg_c5201.itl',
-    '/sound/frpg_c5202.fev',
-    '/sound/frpg_c5202.fsb',
-    '/sound/frpg_c5202.itl',
-    '/sound/frpg_c5210.fev',
-    '/sound/frpg_c5210.fsb',
-    '/sound/frpg_c5210.itl',
-    '/sound/frpg_c5220.fev',
-    '/sound/frpg_c5220.fsb',
-    '/sound/frpg_c5220.itl',
-    '/sound/frpg_c5230.fev',
-    '/sound/frpg_c5230.fsb',
-    '/sound/frpg_c5230.itl',
-    '/sound/frpg_c5231.fev',
-    '/sound/frpg_c5231.fsb',
-    '/sound/frpg_c5231.itl',
-    '/sound/frpg_c5240.fev',
-    '/sound/frpg_c5240.fsb',
-    '/sound/frpg_c5240.itl',
-    '/sound/frpg_c5250.fev',
-    '/sound/frpg_c5250.fsb',
-    '/sound/frpg_c5250.itl',
-    '/sound/frpg_c5260.fev',
-    '/sound/frpg_c5260.fsb',
-    '/sound/frpg_c5260.itl',
-    '/sound/frpg_c5261.fev',
-    '/sound/frpg_c5261.fsb',
-    '/sound/frpg_c5261.itl',
-    '/sound/frpg_c5270.fev',
-    '/sound/frpg_c5270.fsb',
-    '/sound/frpg_c5270.itl',
-    '/sound/frpg_c5271.fev',
-    '/sound/frpg_c5271.fsb',
-    '/sound/frpg_c5271.itl',
-    '/sound/frpg_c5280.fev',
-    '/sound/frpg_c5280.fsb',
-    '/sound/frpg_c5280.itl',
-    '/sound/frpg_c5290.fev',
-    '/sound/frpg_c5290.fsb',
-    '/sound/frpg_c5290.itl',
-    '/sound/frpg_c5291.fev',
-    '/sound/frpg_c5291.fsb',
-    '/sound/frpg_c5291.itl',
-    '/sound/frpg_c5300.fev',
-    '/sound/frpg_c5300.fsb',
-    '/sound/frpg_c5300.itl',
-    '/sound/frpg_c5310.fev',
-    '/sound/frpg_c5310.fsb',
-    '/sound/frpg_c5310.itl',
-    '/sound/frpg_c5320.fev',
-    '/sound/frpg_c5320.fsb',
-    '/sound/frpg_c5320.itl',
-    '/sound/frpg_c5330.fev',
-    '/sound/frpg_c5330.fsb',
-    '/sound/frpg_c5330.itl',
-    '/sound/frpg_c5340.fev',
-    '/sound/frpg_c5340.fsb',
-    '/sound/frpg_c5340.itl',
-    '/sound/frpg_c5350.fev',
-    '/sound/frpg_c5350.fsb',
-    '/sound/frpg_c5350.itl',
-    '/sound/frpg_c5351.fev',
-    '/sound/frpg_c5351.fsb',
-    '/sound/frpg_c5351.itl',
-    '/sound/frpg_c5352.fev',
-    '/sound/frpg_c5352.fsb',
-    '/sound/frpg_c5352.itl',
-    '/sound/frpg_c5353.fev',
-    '/sound/frpg_c5353.fsb',
-    '/sound/frpg_c5353.itl',
-    '/sound/frpg_c5360.fev',
-    '/sound/frpg_c5360.fsb',
-    '/sound/frpg_c5360.itl',
-    '/sound/frpg_c5361.fev',
-    '/sound/frpg_c5361.fsb',
-    '/sound/frpg_c5361.itl',
-    '/sound/frpg_c5370.fev',
-    '/sound/frpg_c5370.fsb',
-    '/sound/frpg_c5370.itl',
-    '/sound/frpg_c5390.fev',
-    '/sound/frpg_c5390.fsb',
-    '/sound/frpg_c5390.itl',
-    '/sound/frpg_c5400.fev',
-    '/sound/frpg_c5400.fsb',
-    '/sound/frpg_c5400.itl',
-    '/sound/frpg_c5401.fev',
-    '/sound/frpg_c5401.fsb',
-    '/sound/frpg_c5401.itl',
-    '/sound/frpg_m10.fev',
-    '/sound/frpg_m10.fsb',
-    '/sound/frpg_m10.itl',
-    '/sound/frpg_m11.fev',
-    '/sound/frpg_m11.fsb',
-    '/sound/frpg_m11.itl',
-    '/sound/frpg_m12.fev',
-    '/sound/frpg_m12.fsb',
-    '/sound/frpg_m12.itl',
-    '/sound/frpg_m13.fev',
-    '/sound/frpg_m13.fsb',
-    '/sound/frpg_m13.itl',
-    '/sound/frpg_m14.fev',
-    '/sound/frpg_m14.fsb',
-    '/sound/frpg_m14.itl',
-    '/sound/frpg_m15.fev',
-    '/sound/frpg_m15.fsb',
-    '/sound/frpg_m15.itl',
-    '/sound/frpg_m16.fev',
-    '/sound/frpg_m16.fsb',
-    '/sound/frpg_m16.itl',
-    '/sound/frpg_m17.fev',
-    '/sound/frpg_m17.fsb',
-    '/sound/frpg_m17.itl',
-    '/sound/frpg_m18.fev',
-    '/sound/frpg_m18.fsb',
-    '/sound/frpg_m18.itl',
-    '/sound/frpg_main.fev',
-    '/sound/frpg_main.fsb',
-    '/sound/frpg_main.itl',
-    '/sound/frpg_mixer.fev',
-    '/sound/frpg_multich.mch',
-    '/sound/frpg_multiMix.mix',
-    '/sound/frpg_multiRPC.rpc',
-    '/sound/frpg_p100000.fev',
-    '/sound/frpg_p100000.fsb',
-    '/sound/frpg_p100000.itl',
-    '/sound/frpg_p100100.fev',
-    '/sound/frpg_p100100.fsb',
-    '/sound/frpg_p100100.itl',
-    '/sound/frpg_p100105.fev',
-    '/sound/frpg_p100105.fsb',
-    '/sound/frpg_p100105.itl',
-    '/sound/frpg_p100110.fev',
-    '/sound/frpg_p100110.fsb',
-    '/sound/frpg_p100110.itl',
-    '/sound/frpg_p100225.fev',
-    '/sound/frpg_p100225.fsb',
-    '/sound/frpg_p100225.itl',
-    '/sound/frpg_p100226.fev',
-    '/sound/frpg_p100226.fsb',
-    '/sound/frpg_p100226.itl',
-    '/sound/frpg_p100230.fev',
-    '/sound/frpg_p100230.fsb',
-    '/sound/frpg_p100230.itl',
-    '/sound/frpg_p100240.fev',
-    '/sound/frpg_p100240.fsb',
-    '/sound/frpg_p100240.itl',
-    '/sound/frpg_p100250.fev',
-    '/sound/frpg_p100250.fsb',
-    '/sound/frpg_p100250.itl',
-    '/sound/frpg_p110000.fev',
-    '/sound/frpg_p110000.fsb',
-    '/sound/frpg_p110000.itl',
-    '/sound/frpg_p110010.fev',
-    '/sound/frpg_p110010.fsb',
-    '/sound/frpg_p110010.itl',
-    '/sound/frpg_p110035.fev',
-    '/sound/frpg_p110035.fsb',
-    '/sound/frpg_p110035.itl',
-    '/sound/frpg_p120000.fev',
-    '/sound/frpg_p120000.fsb',
-    '/sound/frpg_p120000.itl',
-    '/sound/frpg_p130000.fev',
-    '/sound/frpg_p130000.fsb',
-    '/sound/frpg_p130000.itl',
-    '/sound/frpg_p130010.fev',
-    '/sound/frpg_p130010.fsb',
-    '/sound/frpg_p130010.itl',
-    '/sound/frpg_p130020.fev',
-    '/sound/frpg_p130020.fsb',
-    '/sound/frpg_p130020.itl',
-    '/sound/frpg_p130021.fev',
-    '/sound/frpg_p130021.fsb',
-    '/sound/frpg_p130021.itl',
-    '/sound/frpg_p130100.fev',
-    '/sound/frpg_p130100.fsb',
-    '/sound/frpg_p130100.itl',
-    '/sound/frpg_p130110.fev',
-    '/sound/frpg_p130110.fsb',
-    '/sound/frpg_p130110.itl',
-    '/sound/frpg_p130111.fev',
-    '/sound/frpg_p130111.fsb',
-    '/sound/frpg_p130111.itl',
-    '/sound/frpg_p130120.fev',
-    '/sound/frpg_p130120.fsb',
-    '/sound/frpg_p130120.itl',
-    '/sound/frpg_p130121.fev',
-    '/sound/frpg_p130121.fsb',
-    '/sound/frpg_p130121.itl',
-    '/sound/frpg_p140000.fev',
-    '/sound/frpg_p140000.fsb',
-    '/sound/frpg_p140000.itl',
-    '/sound/frpg_p140010.fev',
-    '/sound/frpg_p140010.fsb',
-    '/sound/frpg_p140010.itl',
-    '/sound/frpg_p140015.fev',
-    '/sound/frpg_p140015.fsb',
-    '/sound/frpg_p140015.itl',
-    '/sound/frpg_p140100.fev',
-    '/sound/frpg_p140100.fsb',
-    '/sound/frpg_p140100.itl',
-    '/sound/frpg_p140110.fev',
-    '/sound/frpg_p140110.fsb',
-    '/sound/frpg_p140110.itl',
-    '/sound/frpg_p140111.fev',
-    '/sound/frpg_p140111.fsb',
-    '/sound/frpg_p140111.itl',
-    '/sound/frpg_p140115.fev',
-    '/sound/frpg_p140115.fsb',
-    '/sound/frpg_p140115.itl',
-    '/sound/frpg_p140116.fev',
-    '/sound/frpg_p140116.fsb',
-    '/sound/frpg_p140116.itl',
-    '/sound/frpg_p140117.fev',
-    '/sound/frpg_p140117.fsb',
-    '/sound/frpg_p140117.itl',
-    '/sound/frpg_p140118.fev',
-    '/sound/frpg_p140118.fsb',
-    '/sound/frpg_p140118.itl',
-    '/sound/frpg_p140120.fev',
-    '/sound/frpg_p140120.fsb',
-    '/sound/frpg_p140120.itl',
-    '/sound/frpg_p150000.fev',
-    '/sound/frpg_p150000.fsb',
-    '/sound/frpg_p150000.itl',
-    '/sound/frpg_p150002.fev',
-    '/sound/frpg_p150002.fsb',
-    '/sound/frpg_p150002.itl',
-    '/sound/frpg_p150100.fev',
-    '/sound/frpg_p150100.fsb',
-    '/sound/frpg_p150100.itl',
-    '/sound/frpg_p150101.fev',
-    '/sound/frpg_p150101.fsb',
-    '/sound/frpg_p150101.itl',
-    '/sound/frpg_p150102.fev',
-    '/sound/frpg_p150102.fsb',
-    '/sound/frpg_p150102.itl',
-    '/sound/frpg_p150103.fev',
-    '/sound/frpg_p150103.fsb',
-    '/sound/frpg_p150103.itl',
-    '/sound/frpg_p150110.fev',
-    '/sound/frpg_p150110.fsb',
-    '/sound/frpg_p150110.itl',
-    '/sound/frpg_p150111.fev',
-    '/sound/frpg_p150111.fsb',
-    '/sound/frpg_p150111.itl',
-    '/sound/frpg_p150120.fev',
-    '/sound/frpg_p150120.fsb',
-    '/sound/frpg_p150120.itl',
-    '/sound/frpg_p150121.fev',
-    '/sound/frpg_p150121.fsb',
-    '/sound/frpg_p150121.itl',
-    '/sound/frpg_p150130.fev',
-    '/sound/frpg_p150130.fsb',
-    '/sound/frpg_p150130.itl',
-    '/sound/frpg_p150132.fev',
-    '/sound/frpg_p150132.fsb',
-    '/sound/frpg_p150132.itl',
-    '/sound/frpg_p150135.fev',
-    '/sound/frpg_p150135.fsb',
-    '/sound/frpg_p150135.itl',
-    '/sound/frpg_p150140.fev',
-    '/sound/frpg_p150140.fsb',
-    '/sound/frpg_p150140.itl',
-    '/sound/frpg_p150150.fev',
-    '/sound/frpg_p150150.fsb',
-    '/sound/frpg_p150150.itl',
-    '/sound/frpg_p150151.fev',
-    '/sound/frpg_p150151.fsb',
-    '/sound/frpg_p150151.itl',
-    '/sound/frpg_p150152.fev',
-    '/sound/frpg_p150152.fsb',
-    '/sound/frpg_p150152.itl',
-    '/sound/frpg_p150155.fev',
-    '/sound/frpg_p150155.fsb',
-    '/sound/frpg_p150155.itl',
-    '/sound/frpg_p150156.fev',
-    '/sound/frpg_p150156.fsb',
-    '/sound/frpg_p150156.itl',
-    '/sound/frpg_p150157.fev',
-    '/sound/frpg_p150157.fsb',
-    '/sound/frpg_p150157.itl',
-    '/sound/frpg_p150160.fev',
-    '/sound/frpg_p150160.fsb',
-    '/sound/frpg_p150160.itl',
-    '/sound/frpg_p150161.fev',
-    '/sound/frpg_p150161.fsb',
-    '/sound/frpg_p150161.itl',
-    '/sound/frpg_p150165.fev',
-    '/sound/frpg_p150165.fsb',
-    '/sound/frpg_p150165.itl',
-    '/sound/frpg_p150166.fev',
-    '/sound/frpg_p150166.fsb',
-    '/sound/frpg_p150166.itl',
-    '/sound/frpg_p160000.fev',
-    '/sound/frpg_p160000.fsb',
-    '/sound/frpg_p160000.itl',
-    '/sound/frpg_p160001.fev',
-    '/sound/frpg_p160001.fsb',
-    '/sound/frpg_p160001.itl',
-    '/sound/frpg_p160010.fev',
-    '/sound/frpg_p160010.fsb',
-    '/sound/frpg_p160010.itl',
-    '/sound/frpg_p160040.fev',
-    '/sound/frpg_p160040.fsb',
-    '/sound/frpg_p160040.itl',
-    '/sound/frpg_p160050.fev',
-    '/sound/frpg_p160050.fsb',
-    '/sound/frpg_p160050.itl',
-    '/sound/frpg_p170000.fev',
-    '/sound/frpg_p170000.fsb',
-    '/sound/frpg_p170000.itl',
-    '/sound/frpg_p170010.fev',
-    '/sound/frpg_p170010.fsb',
-    '/sound/frpg_p170010.itl',
-    '/sound/frpg_p180000.fev',
-    '/sound/frpg_p180000.fsb',
-    '/sound/frpg_p180000.itl',
-    '/sound/frpg_p180001.fev',
-    '/sound/frpg_p180001.fsb',
-    '/sound/frpg_p180001.itl',
-    '/sound/frpg_p180010.fev',
-    '/sound/frpg_p180010.fsb',
-    '/sound/frpg_p180010.itl',
-    '/sound/frpg_p180015.fev',
-    '/sound/frpg_p180015.fsb',
-    '/sound/frpg_p180015.itl',
-    '/sound/frpg_p180040.fev',
-    '/sound/frpg_p180040.fsb',
-    '/sound/frpg_p180040.itl',
-    '/sound/frpg_p180041.fev',
-    '/sound/frpg_p180041.fsb',
-    '/sound/frpg_p180041.itl',
-    '/sound/frpg_p180050.fev',
-    '/sound/frpg_p180050.fsb',
-    '/sound/frpg_p180050.itl',
-    '/sound/frpg_p180051.fev',
-    '/sound/frpg_p180051.fsb',
-    '/sound/frpg_p180051.itl',
-    '/sound/frpg_p180060.fev',
-    '/sound/frpg_p180060.fsb',
-    '/sound/frpg_p180060.itl',
-    '/sound/frpg_p180101.fev',
-    '/sound/frpg_p180101.fsb',
-    '/sound/frpg_p180101.itl',
-    '/sound/frpg_p180125.fev',
-    '/sound/frpg_p180125.fsb',
-    '/sound/frpg_p180125.itl',
-    '/sound/frpg_p180126.fev',
-    '/sound/frpg_p180126.fsb',
-    '/sound/frpg_p180126.itl',
-    '/sound/frpg_p180130.fev',
-    '/sound/frpg_p180130.fsb',
-    '/sound/frpg_p180130.itl',
-    '/sound/frpg_sm10.fev',
-    '/sound/frpg_sm10.fsb',
-    '/sound/frpg_sm10.itl',
-    '/sound/frpg_sm11.fev',
-    '/sound/frpg_sm11.fsb',
-    '/sound/frpg_sm11.itl',
-    '/sound/frpg_sm12.fev',
-    '/sound/frpg_sm12.fsb',
-    '/sound/frpg_sm12.itl',
-    '/sound/frpg_sm13.fev',
-    '/sound/frpg_sm13.fsb',
-    '/sound/frpg_sm13.itl',
-    '/sound/frpg_sm14.fev',
-    '/sound/frpg_sm14.fsb',
-    '/sound/frpg_sm14.itl',
-    '/sound/frpg_sm15.fev',
-    '/sound/frpg_sm15.fsb',
-    '/sound/frpg_sm15.itl',
-    '/sound/frpg_sm16.fev',
-    '/sound/frpg_sm16.fsb',
-    '/sound/frpg_sm16.itl',
-    '/sound/frpg_sm17.fev',
-    '/sound/frpg_sm17.fsb',
-    '/sound/frpg_sm17.itl',
-    '/sound/frpg_sm18.fev',
-    '/sound/frpg_sm18.fsb',
-    '/sound/frpg_sm18.itl',
-    '/sound/frpg_smain.fev',
-    '/sound/frpg_smain.fsb',
-    '/sound/frpg_smain.itl',
-    '/sound/frpg_stationary.fev',
-    '/sound/frpg_xm10.fev',
-    '/sound/frpg_xm10.fsb',
-    '/sound/frpg_xm10.itl',
-    '/sound/frpg_xm11.fev',
-    '/sound/frpg_xm11.fsb',
-    '/sound/frpg_xm11.itl',
-    '/sound/frpg_xm12.fev',
-    '/sound/frpg_xm12.fsb',
-    '/sound/frpg_xm12.itl',
-    '/sound/frpg_xm13.fev',
-    '/sound/frpg_xm13.fsb',
-    '/sound/frpg_xm13.itl',
-    '/sound/frpg_xm14.fev',
-    '/sound/frpg_xm14.fsb',
-    '/sound/frpg_xm14.itl',
-    '/sound/frpg_xm15.fev',
-    '/sound/frpg_xm15.fsb',
-    '/sound/frpg_xm15.itl',
-    '/sound/frpg_xm16.fev',
-    '/sound/frpg_xm16.fsb',
-    '/sound/frpg_xm16.itl',
-    '/sound/frpg_xm17.fev',
-    '/sound/frpg_xm17.fsb',
-    '/sound/frpg_xm17.itl',
-    '/sound/frpg_xm18.fev',
-    '/sound/frpg_xm18.fsb',
-    '/sound/frpg_xm18.itl',
-]
+
+# Load FILENAMES, c4110 and FINGERPRINTS on first access
+def __getattr__(name):
+    try:
+        loader = LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+    return loader()
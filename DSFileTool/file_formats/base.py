@@ -1,9 +1,13 @@
 import os
 
+from DSFileTool.filesystem import copy_range
+
 
 class BaseFile:
     def __init__(self, endian='small'):
         self.endian = endian
+        # receives the unpacked files, they are written to disk when unset
+        self.sink = None
 
     # Create a file and its containing directories, if they don't exist
     @staticmethod
@@ -17,6 +21,33 @@ class BaseFile:
         f = open(filename, 'wb+')
         return f
 
+    # Write the content to a new file
+    @staticmethod
+    def write_new_file(filename, content):
+        f = BaseFile.create_file(filename)
+        f.write(content)
+        f.close()
+
+    # Let the sink get ready for the files about to be unpacked
+    def prepare_files(self, filenames):
+        if self.sink is not None:
+            self.sink.prepare(filenames)
+
+    # Hand the content of an unpacked file to the sink
+    def write_file(self, filename, content):
+        if self.sink is not None:
+            self.sink.write(filename, content)
+        else:
+            self.write_new_file(filename, content)
+
+    # Have the sink copy size bytes at offset of the open file to a file
+    def copy_file(self, filename, file, offset, size):
+        if self.sink is not None:
+            self.sink.copy(filename, file, offset, size)
+        else:
+            with self.create_file(filename) as f:
+                copy_range(file, f, offset, size)
+
     # Join filepath to base
     @staticmethod
     def fix_filename(base, filepath):
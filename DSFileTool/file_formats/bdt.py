@@ -1,21 +1,39 @@
+import contextlib
 import os
-import sys
 import struct
+import threading
 
-from DSFileTool.tools import build_name_hash_dict
+from DSFileTool.tools import Dotdict, build_name_hash_dict
 from DSFileTool.file_formats.base import BaseFile
 from DSFileTool.file_formats.dcx import DCX
 from DSFileTool.logger import Logger
+from DSFileTool.progress import Progress
 
 
 class BDT(BaseFile):
+    # The header may be given as a path or as its content, and the data file
+    #  as a path or as an open file object
     def __init__(self, header_file, data_file, out_path=None):
         super().__init__()
         self.data_file = data_file
         self.out_path = out_path or os.path.split(data_file)[0]
         self.header_file = header_file
-        with open(header_file, 'rb') as f:
-            self.content = f.read()
+        if isinstance(header_file, (bytes, bytearray, memoryview)):
+            self.content = bytes(header_file)
+        else:
+            with open(header_file, 'rb') as f:
+                self.content = f.read()
+        self.file_dict = None
+        # output paths written by this or earlier archives, records written
+        #  to one of them are renamed. None checks the filesystem instead.
+        #  paths_lock is held while checking and adding a path, BDTs sharing
+        #  used_paths from several threads share it too
+        self.used_paths = None
+        self.paths_lock = threading.Lock()
+        self.show_progress = True
+        # records stored uncompressed and at least this large are copied
+        #  from the data file without being read, None reads every record
+        self.copy_size = None
         self.log = Logger()
 
     # Check if the given file is a .bhd header
@@ -106,23 +124,95 @@ class BDT(BaseFile):
                 return_dict[name] = (record_offset, record_size)
         return return_dict
 
+    # Open the data file, leaving an already open file object open
+    def open_data_file(self):
+        if hasattr(self.data_file, 'read'):
+            return contextlib.nullcontext(self.data_file)
+        return open(self.data_file, 'rb')
+
     # Pack a filelist into a header/data file pair
     def pack(self, file_list):
         raise NotImplementedError
 
-    # Unpack the data file using the header contents
-    def unpack(self):
+    # Parse the header to a dictionary, once
+    def get_file_dict(self):
+        if self.file_dict is None:
+            if self.is_header_bhd():
+                self.file_dict = self.parse_bhd_header_to_dict()
+            elif self.is_header_bhd5():
+                self.file_dict = self.parse_bhd5_header_to_dict()
+            else:
+                raise AssertionError(
+                    'Header file does not match known formats.'
+                )
+        return self.file_dict
+
+    # Get the size each record has once unpacked from the DCX headers,
+    #  without reading or decompressing the records
+    def get_out_sizes(self):
+        out_sizes = {}
+        with self.open_data_file() as d:
+            for name, (record_offset, record_size) in \
+                    self.get_file_dict().items():
+                d.seek(record_offset)
+                dcx = DCX(d.read(min(record_size, DCX.HEADER_SIZE)))
+                if len(dcx.content) == DCX.HEADER_SIZE and dcx.is_dcx_file():
+                    out_sizes[name] = dcx.get_uncompressed_size()
+                else:
+                    out_sizes[name] = record_size
+        return out_sizes
+
+    # Check if a record was already written to the file path
+    def is_path_used(self, file_path):
+        if self.used_paths is None:
+            return os.path.isfile(file_path)
+        return file_path in self.used_paths
+
+    # Mark the file path as used, returns the path to write the record to.
+    #  With rename set, a path already used gets .xxx appended
+    def claim_path(self, file_path, rename=False):
+        with self.paths_lock:
+            if rename and self.is_path_used(file_path):
+                # skip duplicates (fade.drb, menu.drb, nowloading.drb)
+                file_path = file_path + '.xxx'
+            if self.used_paths is not None:
+                self.used_paths.add(file_path)
+        return file_path
+
+    # Check if a record is stored uncompressed and large enough to be
+    #  copied, only data files opened from a path can be copied from
+    def should_copy(self, d, record_offset, record_size):
+        if (
+            self.copy_size is None or record_size < self.copy_size or
+            hasattr(self.data_file, 'read')
+        ):
+            return False
+        d.seek(record_offset)
+        return not DCX(d.read(4)).is_dcx_file()
+
+    # Unpack the data file using the header contents. skip is called with
+    #  each record name, offset, size and a function reading its stored
+    #  content, and returns the path the record was previously unpacked to
+    #  if it can be skipped. on_file is called with
+    #  the path of each file once it has been written and the record it was
+    #  unpacked from, or None if the record was skipped. The content of
+    #  copied records is None
+    def unpack(self, on_file=None, skip=None):
         created_file_list = []
 
-        if self.is_header_bhd():
-            file_dict = self.parse_bhd_header_to_dict()
-        elif self.is_header_bhd5():
-            file_dict = self.parse_bhd5_header_to_dict()
-        else:
-            raise AssertionError('Header file does not match known formats.')
-
+        file_dict = self.get_file_dict()
         file_cnt = len(file_dict.keys())
-        with open(self.data_file, 'rb') as d:
+        self.prepare_files(
+            [self.fix_filename(self.out_path, name) for name in file_dict]
+        )
+        progress = contextlib.nullcontext()
+        if self.show_progress:
+            progress = Progress(
+                lambda counters, _: ' * Unpacking files from archive ' +
+                                    f'({counters["records"]}/{file_cnt})...',
+                clear=True
+            )
+        with self.open_data_file() as d, progress:
             HEADER_STRING = b'BDF307D7R6\x00\x00\x00\x00\x00\x00'
             HEADER_OFFSET = len(HEADER_STRING)
 
@@ -132,33 +222,57 @@ class BDT(BaseFile):
                   'Data file is possibly corrupt or malformed.'
             assert d.read(HEADER_OFFSET) == HEADER_STRING, err
 
-            count = 0
             for name in file_dict:
                 (record_offset, record_size) = file_dict[name]
-                file_path = self.fix_filename(self.out_path, name)
-                d.seek(record_offset)
-                content = d.read(record_size)
+                if self.show_progress:
+                    progress.add('records')
+
+                # Read the stored content of the record
+                def read_content():
+                    d.seek(record_offset)
+                    return d.read(record_size)
+
+                if skip is not None:
+                    file_path = skip(
+                        name, record_offset, record_size, read_content
+                    )
+                    if file_path is not None:
+                        self.claim_path(file_path)
+                        created_file_list.append(file_path)
+                        if on_file is not None:
+                            on_file(file_path, None)
+                        continue
 
-                if (dcx := DCX(content)).is_dcx_file():
+                file_path = self.fix_filename(self.out_path, name)
+                if self.should_copy(d, record_offset, record_size):
+                    content = stored_content = None
+                    is_dcx = False
+                else:
+                    content = stored_content = read_content()
+                    is_dcx = DCX(content).is_dcx_file()
+
+                if is_dcx:
                     if file_path[-4:] == '.dcx':
                         file_path = file_path[:-4]
-                    content = dcx.decompress()
-                elif os.path.isfile(file_path):
-                    # skip duplicates (fade.drb, menu.drb, nowloading.drb)
-                    file_path = file_path + '.xxx'
+                    content = DCX(content).decompress()
+                file_path = self.claim_path(file_path, rename=not is_dcx)
 
-                count += 1
                 created_file_list.append(file_path)
-                f = self.create_file(file_path)
-                f.write(content)
-                f.close()
-
-                print(
-                    '\r * Unpacking files from archive ' +
-                    f'({count}/{file_cnt})...',
-                    end=''
-                )
-                sys.stdout.flush()
-        print('\r' + ' ' * 50 + '\r', end='')
+                if content is None:
+                    self.copy_file(file_path, d, record_offset, record_size)
+                else:
+                    self.write_file(file_path, content)
+                if on_file is not None:
+                    on_file(file_path, Dotdict({
+                        'name': name,
+                        'offset': record_offset,
+                        'size': record_size,
+                        'out_size': (
+                            record_size if content is None else len(content)
+                        ),
+                        'dcx': is_dcx,
+                        'stored_content': stored_content,
+                        'content': content,
+                    }))
 
         return created_file_list
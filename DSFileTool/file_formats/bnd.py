@@ -1,5 +1,6 @@
 import struct
 
+from DSFileTool.tools import Dotdict
 from DSFileTool.file_formats.base import BaseFile
 
 
@@ -22,9 +23,16 @@ class BND(BaseFile):
     def is_header_bnd(self):
         return self.content[0:4] == b'BND3'
 
-    # Unpack the .bnd file content from a BND3-packed file
-    def unpack(self):
-        created_file_list = []
+    # Iterate over the records of the BND3-packed content, yielding the
+    #  relativized filename and a view of the data of each record
+    def iter_records(self):
+        for record in self.iter_entries():
+            yield record.path, record.content
+
+    # Iterate over the records of the BND3-packed content, yielding their
+    #  stored name, relativized filename, offset, size and a view of the data
+    def iter_entries(self):
+        content_view = memoryview(self.content)
 
         offset = 0
         offset = self.assert_bytes(offset, b'BND3')
@@ -42,7 +50,6 @@ class BND(BaseFile):
         # skip to the records
         offset = 0x20
 
-        count = 0
         for _ in range(record_cnt):
             if flag == 0x74 or flag == 0x54:
                 (
@@ -66,17 +73,29 @@ class BND(BaseFile):
                   f'has unknown record separator: {hex(record_sep)}.'
             assert record_sep == 0x40, err
 
-            filename = str(self.extract_zero_str(filename_offset), 'shift_jis')
-            filename = filename.replace('\\', '/')
+            name = str(self.extract_zero_str(filename_offset), 'shift_jis')
+            name = name.replace('\\', '/')
             filename = self.relativize_filename(
-                filename, self.base_path, self.n_base_path
+                name, self.base_path, self.n_base_path
             )
-            filedata = self.content[data_offset:data_offset + data_size]
-
+            filedata = content_view[data_offset:data_offset + data_size]
+            yield Dotdict({
+                'name': name,
+                'path': filename,
+                'offset': data_offset,
+                'size': data_size,
+                'content': filedata,
+            })
+
+    # Unpack the .bnd file content from a BND3-packed file, on_file is called
+    #  with the path of each file once it has been written and its content
+    def unpack(self, on_file=None):
+        created_file_list = []
+        records = list(self.iter_records())
+        self.prepare_files([filename for (filename, _) in records])
+        for filename, filedata in records:
             created_file_list.append(filename)
-            f = self.create_file(filename)
-            f.write(filedata)
-            f.flush()
-            f.close()
-            count += 1
+            self.write_file(filename, filedata)
+            if on_file is not None:
+                on_file(filename, filedata)
         return created_file_list
@@ -6,6 +6,9 @@ from DSFileTool.file_formats.base import BaseFile
 
 
 class DCX(BaseFile):
+    # Bytes of the header up to and including the compressed size
+    HEADER_SIZE = 0x24
+
     def __init__(self, content=None):
         super().__init__(endian='big')
         self.content = content
@@ -17,6 +20,12 @@ class DCX(BaseFile):
     def is_dcx_file(self):
         return self.content[0:4] == b'DCX\x00'
 
+    # Get the uncompressed size recorded in the header, which is all the
+    #  content needs to hold
+    def get_uncompressed_size(self):
+        (uncomp_size,) = struct.unpack_from('>I', self.content, 0x1c)
+        return uncomp_size
+
     # Get the compressed .dcx content
     def compress(self):
         header = OrderedDict([
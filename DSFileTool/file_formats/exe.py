@@ -1,7 +1,11 @@
+import bisect
 import hashlib
+import json
 import mmap
 import os
+import struct
 
+from DSFileTool import defaults
 from DSFileTool.logger import Logger
 
 
@@ -66,11 +70,36 @@ class EXE:
         ),
     }
 
+    # Binary patch file layout: magic, format version, game version name,
+    #  source/target SHA256 digests and a list of (offset, bytes) records
+    PATCH_FILE_MAGIC = b'DSXP'
+    PATCH_FILE_VERSION = 1
+
+    # Hashes of small fixed regions of known executables, keyed by game
+    #  version. Entries are recorded from executables that match a known
+    #  checksum with record_fingerprint() and persisted as JSON. They add to
+    #  and override the fingerprints shipped in the resources directory
+    FINGERPRINTS = {}
+
+    # Sizes of the regions hashed by fingerprint()
+    FINGERPRINT_HEADER_SIZE = 0x1000
+    FINGERPRINT_TEXT_SIZE = 0x1000
+    FINGERPRINT_PATCH_RADIUS = 0x80
+
     def __init__(self, base_path='./', forced_exe_name=None):
         self.base_path = base_path
         self.file_name = forced_exe_name
         self.file_path = None
 
+        # filled in by scan()
+        self.checksum = None
+        # filled in by validate()
+        self.game_version = None
+        self.lookup_offsets = {}
+        self.replacement_offsets = {}
+        # bytes read from the .exe so far
+        self.bytes_read = 0
+
         self.log = Logger()
 
     # Get the path to the .exe file
@@ -79,14 +108,51 @@ class EXE:
 
     # Compute the SHA256 checksum of the .exe read in of chunks
     def get_checksum(self, chunk_size=65536):
+        self.scan(chunk_size)
+        return self.checksum
+
+    # Read the .exe once, computing its checksum and recording the offsets
+    #  of every PATCH_LOOKUPS and PATCH_REPLACEMENTS pattern along the way
+    def scan(self, chunk_size=65536):
+        patterns = {('lookup', idx): lookup
+                    for idx, lookup in self.PATCH_LOOKUPS.items()}
+        patterns.update({('replacement', name): replacement[0]
+                         for name, replacement
+                         in self.PATCH_REPLACEMENTS.items()})
+        offsets = {key: [] for key in patterns}
+        # bytes kept from the previous chunk so that matches crossing
+        #  a chunk boundary are still found
+        overlap = max(len(pattern) for pattern in patterns.values()) - 1
+
         hash_string = hashlib.sha256()
+        tail = b''
+        window_offset = 0
         with open(self.file_path, 'rb') as f:
             for block in iter(lambda: f.read(chunk_size), b''):
+                self.bytes_read += len(block)
                 hash_string.update(block)
-        return hash_string.hexdigest()
+                window = tail + block
+                for key, pattern in patterns.items():
+                    pos = window.find(pattern)
+                    while pos != -1:
+                        # matches ending inside the tail were already found
+                        if pos + len(pattern) > len(tail):
+                            offsets[key].append(window_offset + pos)
+                        pos = window.find(pattern, pos + 1)
+                tail = window[-overlap:]
+                window_offset += len(window) - len(tail)
+
+        self.checksum = hash_string.hexdigest()
+        self.lookup_offsets = {
+            idx: offsets[('lookup', idx)] for idx in self.PATCH_LOOKUPS
+        }
+        self.replacement_offsets = {
+            name: offsets[('replacement', name)]
+            for name in self.PATCH_REPLACEMENTS
+        }
 
-    # Validate the .exe and returns its status and patch address
-    def validate(self):
+    # Locate the .exe in the base path, returns whether it exists
+    def locate(self):
         if not self.file_name:
             if os.path.isfile(os.path.join(self.base_path, 'DATA.exe')):
                 self.file_name = 'DATA.exe'
@@ -95,59 +161,367 @@ class EXE:
 
         if not self.file_path:
             self.file_path = os.path.join(self.base_path, self.file_name)
-            if not os.path.isfile(self.file_path):
-                return None, None
+        return os.path.isfile(self.file_path)
+
+    # Get the game version whose checksum in checksums matches the .exe
+    def get_game_version(self, checksums):
+        for game_version, checksum in checksums.items():
+            if self.checksum == checksum:
+                return game_version
+        return None
+
+    # Hash the PE header, the start of the .text section and the bytes
+    #  around the patch location, reading only a few KB of the .exe
+    def fingerprint(self, patch_location):
+        regions = {}
+        with open(self.file_path, 'rb') as f:
+            header = f.read(self.FINGERPRINT_HEADER_SIZE)
+            self.bytes_read += len(header)
+            regions['header'] = hashlib.sha256(header).hexdigest()
+
+            text_offset = self.get_text_offset(header)
+            if text_offset is not None:
+                f.seek(text_offset)
+                text = f.read(self.FINGERPRINT_TEXT_SIZE)
+                self.bytes_read += len(text)
+                regions['text'] = hashlib.sha256(text).hexdigest()
+
+            start = max(patch_location - self.FINGERPRINT_PATCH_RADIUS, 0)
+            f.seek(start)
+            neighbourhood = bytearray(
+                f.read(2 * self.FINGERPRINT_PATCH_RADIUS)
+            )
+            self.bytes_read += len(neighbourhood)
+            # hash the patched and original builds alike
+            pos = patch_location - start
+            if pos < len(neighbourhood) and neighbourhood[pos] == 0xEB:
+                neighbourhood[pos] = 0x74
+            regions['patch'] = hashlib.sha256(neighbourhood).hexdigest()
+        return regions
+
+    # Get the file offset of the .text section from the PE header
+    @staticmethod
+    def get_text_offset(header):
+        if header[:2] != b'MZ' or len(header) < 0x40:
+            return None
+        (pe_offset,) = struct.unpack_from('<I', header, 0x3C)
+        if header[pe_offset:pe_offset + 4] != b'PE\x00\x00':
+            return None
+
+        (section_cnt,) = struct.unpack_from('<H', header, pe_offset + 6)
+        (optional_size,) = struct.unpack_from('<H', header, pe_offset + 20)
+        offset = pe_offset + 24 + optional_size
+        for _ in range(section_cnt):
+            if offset + 40 > len(header):
+                break
+            (name, raw_offset) = struct.unpack_from('<8s12xI', header, offset)
+            if name.rstrip(b'\x00') == b'.text':
+                return raw_offset
+            offset += 40
+        return None
+
+    # Record the fingerprint of an .exe that matches a known checksum
+    def record_fingerprint(self):
+        if self.checksum is None:
+            self.scan()
+
+        game_version = (
+            self.get_game_version(self.ORIGINAL_CHECKSUMS) or
+            self.get_game_version(self.PATCHED_CHECKSUMS)
+        )
+        err = 'Only executables with a known checksum can be fingerprinted.'
+        assert game_version is not None, err
+
+        self.FINGERPRINTS[game_version] = self.fingerprint(
+            self.PATCH_LOCATIONS[game_version]
+        )
+        return game_version
+
+    # Get the shipped and the recorded fingerprints
+    def get_fingerprints(self):
+        return {**defaults.FINGERPRINTS, **self.FINGERPRINTS}
+
+    # Merge the fingerprints stored in a JSON file into FINGERPRINTS
+    @staticmethod
+    def load_fingerprints(filename):
+        with open(filename, 'r') as f:
+            EXE.FINGERPRINTS.update(json.load(f))
+
+    # Store FINGERPRINTS in a JSON file
+    @staticmethod
+    def save_fingerprints(filename):
+        with open(filename, 'w') as f:
+            json.dump(EXE.FINGERPRINTS, f, indent=2, sort_keys=True)
+
+    # Classify the .exe from a few small reads instead of a full checksum,
+    #  returns its status, game version and patch address, and whether the
+    #  fingerprint of the game version matched. Without a fingerprint on
+    #  record, an unpatched .exe is UNEXPECTED
+    def identify(self):
+        if not self.locate():
+            return None, None, None, False
+
+        fingerprints = self.get_fingerprints()
+        lookup_len = len(self.PATCH_LOOKUPS['ORIGINAL'])
+        with open(self.file_path, 'rb') as f:
+            for game_version, patch_location in self.PATCH_LOCATIONS.items():
+                f.seek(patch_location - 7)
+                probe = f.read(lookup_len)
+                self.bytes_read += len(probe)
+                for idx, lookup in self.PATCH_LOOKUPS.items():
+                    if probe != lookup:
+                        continue
+
+                    known = fingerprints.get(game_version)
+                    if known and known != self.fingerprint(patch_location):
+                        continue
+
+                    if known:
+                        status = idx
+                    elif idx == 'ORIGINAL':
+                        status = 'UNEXPECTED'
+                    else:
+                        status = 'PATCHED'
+                    return status, game_version, patch_location, bool(known)
+        return None, None, None, False
+
+    # Validate the .exe and returns its status and patch address, the game
+    #  version is kept in game_version. With quick set, a fingerprint match
+    #  skips the full checksum
+    def validate(self, quick=False):
+        self.game_version = None
+        if not self.locate():
+            return None, None
+
+        if quick and self.checksum is None:
+            (status, game_version, patch_location, matched) = \
+                self.identify()
+            if matched:
+                self.game_version = game_version
+                return status, patch_location
+
+        # the scan results are kept up to date by patch()
+        if self.checksum is None:
+            self.scan()
 
-        checksum = self.get_checksum()
         for game_version, patch_location in self.PATCH_LOCATIONS.items():
-            if checksum == self.ORIGINAL_CHECKSUMS[game_version]:
+            if self.checksum == self.ORIGINAL_CHECKSUMS[game_version]:
+                self.game_version = game_version
                 return 'ORIGINAL', patch_location
-            elif checksum == self.PATCHED_CHECKSUMS[game_version]:
+            elif self.checksum == self.PATCHED_CHECKSUMS[game_version]:
+                self.game_version = game_version
                 return 'PATCHED', patch_location
 
-        # if here, no valid exe was found
-        with open(self.file_path, 'rb+') as exe_file:
-            mm = mmap.mmap(exe_file.fileno(), 0)
-            for idx, lookup in self.PATCH_LOOKUPS.items():
-                mm.seek(0)
-                pos = mm.find(lookup)
-                if pos != -1:
-                    if idx == 'ORIGINAL':
-                        return 'UNEXPECTED', pos + 7
-                    else:
-                        return 'PATCHED', pos + 7
+        # if here, no valid exe was found, try the known layouts first. The
+        #  checksum shows that the .exe is not an original one
+        (status, game_version, patch_location, _) = self.identify()
+        if status is not None:
+            self.game_version = game_version
+            if status == 'ORIGINAL':
+                status = 'UNEXPECTED'
+            return status, patch_location
+
+        for idx, positions in self.lookup_offsets.items():
+            if len(positions) > 0:
+                if idx == 'ORIGINAL':
+                    return 'UNEXPECTED', positions[0] + 7
+                else:
+                    return 'PATCHED', positions[0] + 7
 
         # if still here, no .exe was found at all
         return None, None
 
+    # Patch the mapped .exe, returns the list of written (offset, bytes)
+    #  and the number of replacements made for each PATCH_REPLACEMENTS entry
+    def patch_mapping(self, mm, patch_location):
+        changes = []
+        counts = {}
+        for name, replacement in self.PATCH_REPLACEMENTS.items():
+            count = 0
+            find_str = replacement[0]
+            replace_str = replacement[1]
+
+            for pos in self.replacement_offsets[name]:
+                # an earlier replacement may have overwritten this match
+                if mm[pos:pos + len(find_str)] == find_str:
+                    mm[pos:pos + len(replace_str)] = replace_str
+                    changes.append((pos, replace_str))
+                    count += 1
+            counts[name] = count
+
+        # Disable .dcx loading.
+        mm.seek(patch_location)
+        if mm.read_byte() == 0x74:
+            mm.seek(-1, os.SEEK_CUR)
+            mm.write_byte(0xEB)
+            changes.append((patch_location, b'\xEB'))
+
+        return changes, counts
+
     # Patch the .exe to work with the unpacked data
     def patch(self, patch_location):
+        if self.checksum is None:
+            self.scan()
+
         with open(self.file_path, 'rb+') as f:
             mm = mmap.mmap(f.fileno(), 0)
 
-            for name, replacement in self.PATCH_REPLACEMENTS.items():
-                count = 0
-                find_str = replacement[0]
-                replace_str = replacement[1]
-
-                mm.seek(0)
-                next_pos = mm.find(find_str)
-                while next_pos != -1:
-                    mm.seek(next_pos)
-                    mm.write(replace_str)
-                    count += 1
-                    next_pos = mm.find(find_str)
-
+            (changes, counts) = self.patch_mapping(mm, patch_location)
+            for name, count in counts.items():
                 if count > 0:
                     self.log.que(
                         f' - Patched {count} times {name} in {self.file_name}.'
                     )
+                self.replacement_offsets[name] = []
 
-            # Disable .dcx loading.
-            mm.seek(patch_location)
-            if mm.read_byte() == 0x74:
-                mm.seek(-1, os.SEEK_CUR)
-                mm.write_byte(0xEB)
+            lookup_pos = patch_location - 7
+            if (
+                (patch_location, b'\xEB') in changes and
+                lookup_pos in self.lookup_offsets['ORIGINAL']
+            ):
+                self.lookup_offsets['ORIGINAL'].remove(lookup_pos)
+                bisect.insort(self.lookup_offsets['PATCHED'], lookup_pos)
 
             mm.flush()
+            # the modified pages are still mapped, so hash them from memory
+            #  instead of reading the file back
+            self.checksum = hashlib.sha256(mm).hexdigest()
             mm.close()
+
+    # Write the patch that would be applied to the .exe as a binary diff,
+    #  returns the number of records written
+    def export_patch(self, patch_location, patch_file):
+        if self.checksum is None:
+            self.scan()
+
+        game_version = self.get_game_version(self.ORIGINAL_CHECKSUMS)
+        err = 'Only an unmodified executable with a known checksum ' + \
+              'can be exported as a patch.'
+        assert game_version is not None, err
+
+        # patch a private copy of the mapping, leaving the file untouched
+        with open(self.file_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            (changes, _) = self.patch_mapping(mm, patch_location)
+            target_digest = hashlib.sha256(mm).digest()
+            mm.close()
+
+        err = f'Patched copy of {self.file_name} does not match ' + \
+              f'the expected {game_version} checksum.'
+        assert target_digest.hex() == \
+            self.PATCHED_CHECKSUMS[game_version], err
+
+        # merge adjacent changes into single records
+        records = []
+        for offset, data in sorted(changes):
+            if records and records[-1][0] + len(records[-1][1]) == offset:
+                records[-1] = (records[-1][0], records[-1][1] + data)
+            else:
+                records.append((offset, data))
+
+        name = game_version.encode('ascii')
+        with open(patch_file, 'wb') as p:
+            p.write(struct.pack(
+                '<4sHB', self.PATCH_FILE_MAGIC, self.PATCH_FILE_VERSION,
+                len(name)
+            ))
+            p.write(name)
+            p.write(bytes.fromhex(self.checksum))
+            p.write(target_digest)
+            p.write(struct.pack('<I', len(records)))
+            for offset, data in records:
+                p.write(struct.pack('<IH', offset, len(data)))
+                p.write(data)
+        return len(records)
+
+    # Apply a binary diff written by export_patch, only mapping the pages
+    #  it touches. before_write is called once the .exe is known to be the
+    #  one the patch was made for, before it is modified. Returns False if
+    #  the .exe was already patched
+    def apply_patch(self, patch_file, chunk_size=1048576, before_write=None):
+        err = f'Executable {self.file_name} was not found.'
+        assert self.locate(), err
+
+        with open(patch_file, 'rb') as p:
+            content = p.read()
+
+        offset = 0
+        (magic, file_version, name_len) = struct.unpack_from(
+            '<4sHB', content, offset
+        )
+        offset += struct.calcsize('<4sHB')
+        err = 'File is not a Dark Souls .exe patch.'
+        assert magic == self.PATCH_FILE_MAGIC, err
+        err = f'Unsupported .exe patch version: {file_version}.'
+        assert file_version == self.PATCH_FILE_VERSION, err
+
+        game_version = str(content[offset:offset + name_len], 'ascii')
+        offset += name_len
+        source_digest = content[offset:offset + 32]
+        target_digest = content[offset + 32:offset + 64]
+        offset += 64
+
+        err = f'Patch was made for an unknown game version: {game_version}.'
+        assert game_version in self.ORIGINAL_CHECKSUMS, err
+        err = f'Patch source checksum does not match {game_version}.'
+        assert source_digest.hex() == \
+            self.ORIGINAL_CHECKSUMS[game_version], err
+
+        (record_cnt,) = struct.unpack_from('<I', content, offset)
+        offset += struct.calcsize('<I')
+        records = []
+        for _ in range(record_cnt):
+            (record_offset, record_len) = struct.unpack_from(
+                '<IH', content, offset
+            )
+            offset += struct.calcsize('<IH')
+            records.append(
+                (record_offset, content[offset:offset + record_len])
+            )
+            offset += record_len
+
+        # only the digest is needed, no pattern scan
+        hash_string = hashlib.sha256()
+        with open(self.file_path, 'rb') as f:
+            for block in iter(lambda: f.read(chunk_size), b''):
+                hash_string.update(block)
+        digest = hash_string.digest()
+
+        if digest == target_digest:
+            self.checksum = digest.hex()
+            return False
+        err = f'{self.file_name} does not match the {game_version} ' + \
+              'checksum the patch was made for.'
+        assert digest == source_digest, err
+
+        # group the records by the pages they touch
+        page_size = mmap.ALLOCATIONGRANULARITY
+        file_size = os.path.getsize(self.file_path)
+        pages = []
+        for record_offset, data in sorted(records):
+            start = record_offset - record_offset % page_size
+            end = min(
+                -(-(record_offset + len(data)) // page_size) * page_size,
+                file_size
+            )
+            if pages and start <= pages[-1][1]:
+                pages[-1][1] = max(pages[-1][1], end)
+                pages[-1][2].append((record_offset, data))
+            else:
+                pages.append([start, end, [(record_offset, data)]])
+
+        if before_write is not None:
+            before_write()
+        with open(self.file_path, 'rb+') as f:
+            for start, end, page_records in pages:
+                mm = mmap.mmap(f.fileno(), end - start, offset=start)
+                for record_offset, data in page_records:
+                    pos = record_offset - start
+                    mm[pos:pos + len(data)] = data
+                mm.flush()
+                mm.close()
+
+        self.checksum = target_digest.hex()
+        self.lookup_offsets = {}
+        self.replacement_offsets = {}
+        return True
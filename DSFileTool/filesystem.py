@@ -0,0 +1,296 @@
+import errno
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from DSFileTool.tools import get_digest
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# ioctl request cloning the extents of a file on CoW filesystems (Linux)
+FICLONE = 0x40049409
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+# Remove a partially written file, ignoring errors
+def discard_file(filename):
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+# Move src to dst, only succeeds within the same filesystem
+def move_file(src, dst):
+    os.rename(src, dst)
+    return 0
+
+
+# Hard-link src as dst
+def link_file(src, dst):
+    os.link(src, dst)
+    return 0
+
+
+# Clone src as dst on filesystems supporting reflinks (Btrfs, XFS, ...)
+def reflink_file(src, dst):
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, 'Reflinks are not supported.')
+
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        shutil.copystat(src, dst)
+    except OSError:
+        discard_file(dst)
+        raise
+    return 0
+
+
+# Copy src to dst in the kernel when possible, returns the bytes copied
+def copy_file(src, dst):
+    copied = 0
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            size = os.fstat(s.fileno()).st_size
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while copied < size:
+                        count = os.copy_file_range(
+                            s.fileno(), d.fileno(), size - copied
+                        )
+                        if count == 0:
+                            break
+                        copied += count
+                except OSError as e:
+                    if e.errno not in (
+                        errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                        errno.EOPNOTSUPP, errno.EBADF
+                    ):
+                        raise
+
+            # buffered copy of whatever the kernel did not copy
+            s.seek(copied)
+            d.seek(copied)
+            for block in iter(lambda: s.read(COPY_CHUNK_SIZE), b''):
+                d.write(block)
+                copied += len(block)
+        shutil.copystat(src, dst)
+    except OSError:
+        discard_file(dst)
+        raise
+    return copied
+
+
+# Allocate the blocks of a file of the given size up front, where the
+#  platform and the filesystem support it
+def preallocate_file(f, size):
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError as e:
+        # running out of space is worth failing early for
+        if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS):
+            raise
+
+
+# Copy size bytes at offset of the src file object to the current position
+#  of the dst file object in the kernel when possible
+def copy_range(src, dst, offset, size):
+    copied = 0
+    try:
+        while copied < size:
+            if hasattr(os, 'copy_file_range'):
+                count = os.copy_file_range(
+                    src.fileno(), dst.fileno(), size - copied,
+                    offset + copied
+                )
+            else:
+                count = os.sendfile(
+                    dst.fileno(), src.fileno(), offset + copied,
+                    size - copied
+                )
+            if count == 0:
+                break
+            copied += count
+    except (AttributeError, OSError) as e:
+        # no kernel copy on this platform or between these files
+        if isinstance(e, OSError) and e.errno not in (
+            errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+            errno.EBADF, errno.ENOTSOCK
+        ):
+            raise
+
+    # buffered copy of whatever the kernel did not copy
+    src.seek(offset + copied)
+    while copied < size:
+        block = src.read(min(COPY_CHUNK_SIZE, size - copied))
+        if len(block) == 0:
+            break
+        dst.write(block)
+        copied += len(block)
+    return copied
+
+
+BACKUP_STRATEGIES = {
+    'move': move_file,
+    'link': link_file,
+    'reflink': reflink_file,
+    'copy': copy_file,
+}
+
+
+# Back up src as dst with the first of the strategies that works,
+#  returns the strategy used and the number of bytes copied
+def backup_file(src, dst, strategies):
+    error = None
+    for strategy in strategies:
+        try:
+            return strategy, BACKUP_STRATEGIES[strategy](src, dst)
+        except OSError as e:
+            error = e
+    raise error
+
+
+# Remove every file in file_list, returns the number of files removed
+def unlink_files(file_list):
+    for filename in file_list:
+        try:
+            os.unlink(filename)
+        except PermissionError:
+            # read-only files cannot be removed on Windows
+            os.chmod(filename, 0o666)
+            os.unlink(filename)
+    return len(file_list)
+
+
+# Recursively remove a directory: walk it with os.scandir, unlink the files
+#  of each directory from a thread pool and remove the directories
+#  bottom-up. on_progress is called with the number of files removed so far
+def remove_tree(path, workers=8, on_progress=None):
+    dirs = []
+    batches = []
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        dirs.append(directory)
+        file_list = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    file_list.append(entry.path)
+        if len(file_list) > 0:
+            batches.append(file_list)
+
+    removed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for count in pool.map(unlink_files, batches):
+            removed += count
+            if on_progress is not None:
+                on_progress(removed)
+
+    # parents are always listed before their subdirectories
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+    return removed
+
+
+DELETING_PREFIX = '_Deleting'
+
+
+class TreeRemoval(threading.Thread):
+    # Remove a directory with remove_tree in a thread of its own. The error
+    #  it failed with, if any, is kept in error for the caller to report
+    def __init__(self, path, workers=8):
+        super().__init__(daemon=False)
+        self.path = path
+        self.workers = workers
+        self.error = None
+
+    def run(self):
+        try:
+            remove_tree(self.path, self.workers)
+        except OSError as e:
+            self.error = e
+
+
+# Rename the directories aside and remove them in a background thread, so
+#  their paths can be reused immediately. Returns the started TreeRemoval
+#  and the list of directories that could not be renamed
+def remove_trees_in_background(paths, parent='.', workers=8):
+    aside_dir = tempfile.mkdtemp(prefix=DELETING_PREFIX, dir=parent)
+    failed_paths = []
+    for path in paths:
+        try:
+            os.rename(path, os.path.join(aside_dir, os.path.basename(path)))
+        except OSError:
+            failed_paths.append(path)
+
+    removal = TreeRemoval(aside_dir, workers)
+    removal.start()
+    return removal, failed_paths
+
+
+# Find the directories left aside by background removals that did not
+#  finish, e.g. because the process was killed
+def find_leftover_removals(parent='.'):
+    with os.scandir(parent) as it:
+        return sorted(
+            entry.path for entry in it
+            if entry.name.startswith(DELETING_PREFIX)
+            and entry.is_dir(follow_symlinks=False)
+        )
+
+
+class Deduplicator:
+    # Store byte-identical files once, later copies are hard-linked to the
+    #  first one written. Editing one copy in place edits all of them
+    def __init__(self):
+        # (digest, size) -> path of the first copy
+        self.paths = {}
+        # path of a first copy -> its (digest, size)
+        self.keys = {}
+        self.linked = 0
+        self.saved_bytes = 0
+        self.lock = threading.Lock()
+
+    # Write the content to filename with write_file, or link it to an
+    #  identical file written before
+    def write(self, filename, content, write_file):
+        key = (get_digest(content), len(content))
+        with self.lock:
+            # a path written again no longer holds its previous content
+            old_key = self.keys.pop(filename, None)
+            if old_key is not None:
+                del self.paths[old_key]
+            source = self.paths.get(key)
+            if source is None:
+                self.paths[key] = filename
+                self.keys[filename] = key
+
+        # the path may be a link to another copy from a previous run
+        discard_file(filename)
+        if source is not None:
+            try:
+                os.link(source, filename)
+            except OSError:
+                # the first copy may not be written yet or may be on
+                #  another filesystem
+                pass
+            else:
+                with self.lock:
+                    # the first copy may have been rewritten before the link
+                    if self.keys.get(source) == key:
+                        self.linked += 1
+                        self.saved_bytes += len(content)
+                        return
+                discard_file(filename)
+        write_file(filename, content)
@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+
+
+class Journal:
+    def __init__(self, filename):
+        self.filename = filename
+        # (unit, archive, name) -> entry, as loaded from the previous run
+        #  and as recorded by the current one
+        self.previous = {}
+        self.entries = {}
+        self.complete = False
+        self.resume = False
+        self.file = None
+        self.lock = threading.Lock()
+
+    # Load the entries of an existing journal, returns whether it exists
+    def load(self):
+        self.previous = {}
+        self.complete = False
+        if not os.path.isfile(self.filename):
+            return False
+
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line of an interrupted run may be cut short
+                    break
+                if entry['unit'] == 'complete':
+                    self.complete = True
+                    continue
+                key = (entry['unit'], entry['archive'], entry['name'])
+                self.previous[key] = entry
+        return True
+
+    # Open the journal for writing. When resuming, new entries are appended
+    #  to the previous ones, otherwise the journal is written afresh and
+    #  the entries of skipped work have to be kept explicitly
+    def open(self, resume=False):
+        self.resume = resume
+        self.entries = {}
+        self.complete = False
+        self.file = open(
+            self.filename, 'a' if resume else 'w', encoding='utf-8'
+        )
+
+    # Get the entry the previous run recorded for a unit of work, if any
+    def get(self, unit, archive, name):
+        return self.previous.get((unit, archive, name))
+
+    # Record a completed unit of work
+    def record(self, unit, archive, name, **fields):
+        self.write_entry(
+            {'unit': unit, 'archive': archive, 'name': name, **fields}
+        )
+
+    # Keep the entry of a unit of work skipped because it is up to date
+    def keep(self, entry):
+        if not self.resume:
+            self.write_entry(entry)
+
+    # Write an entry to the journal
+    def write_entry(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self.lock:
+            self.entries[(entry['unit'], entry['archive'], entry['name'])] = \
+                entry
+            self.file.write(line)
+            # flushed so the entry survives the process being interrupted
+            self.file.flush()
+
+    # Mark the run as complete and close the journal
+    def finish(self):
+        with self.lock:
+            self.complete = True
+            self.file.write(json.dumps({'unit': 'complete'}) + '\n')
+        self.close()
+
+    # Close the journal
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    # Get the output files of an entry
+    @staticmethod
+    def get_entry_files(entry):
+        if entry['unit'] == 'record':
+            return [entry['path']]
+        elif entry['unit'] == 'bnd':
+            return entry.get('files', [])
+        elif entry['unit'] == 'pair':
+            return [f for (f, _) in entry['files']]
+        return []
+
+    # Get the output files recorded by the previous run but not by the
+    #  current one
+    def get_stale_files(self):
+        current_files = set()
+        for entry in self.entries.values():
+            current_files.update(self.get_entry_files(entry))
+
+        stale_files = set()
+        for entry in self.previous.values():
+            stale_files.update(self.get_entry_files(entry))
+        return sorted(stale_files - current_files)
+
+    # Check that the files of an entry still exist with their recorded sizes
+    @staticmethod
+    def verify_files(files):
+        for (path, size) in files:
+            try:
+                if os.path.getsize(path) != size:
+                    return False
+            except OSError:
+                return False
+        return True
@@ -1,71 +1,145 @@
+import atexit
+import contextlib
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import re
-import sys
-
-import huepy
 
+from DSFileTool.colors import Hue
 from DSFileTool.tools import Dotdict, Singleton
 
 
+class ConsoleLogFormatter(logging.Formatter):
+    # Leave out the timestamp of records logged with no_timestamp
+    def format(self, rec):
+        if getattr(rec, 'no_timestamp', False):
+            return rec.getMessage()
+        return super().format(rec)
+
+
+class ConsoleLogHandler(logging.StreamHandler):
+    def __init__(self):
+        super().__init__()
+        # progress line shown on the terminal, if any
+        self.progress = None
+
+    # Keep the cursor on the line of records logged with same_line, and
+    #  write the records above the progress line while it is shown
+    def emit(self, rec):
+        self.terminator = '' if getattr(rec, 'same_line', False) else '\n'
+        progress = self.progress
+        if progress is None:
+            super().emit(rec)
+        else:
+            progress.write_above(
+                functools.partial(logging.StreamHandler.emit, self, rec)
+            )
+
+
 class FileLogFormatter(logging.Formatter):
+    COLOR_PATTERN = re.compile('\033' + r'\[[\d;]\d?m')
+    COMMAND_PATTERN = re.compile(r'^\[\S\]\s')
+
+    # Format a copy of the record without colors and command, the record
+    #  itself is shared with the console handler
     def format(self, rec):
-        msg = rec.msg
-        msg = re.sub('\033' + r'\[[\d;]\d?m', '', msg)  # remove color/bold
-        msg = re.sub(r'^\[\S\]\s', '', msg)  # remove command
-        rec.msg = msg
+        msg = self.COLOR_PATTERN.sub('', rec.getMessage())
+        msg = self.COMMAND_PATTERN.sub('', msg)
+        rec = logging.makeLogRecord(dict(rec.__dict__, msg=msg, args=None))
         return super().format(rec)
 
 
 class Logger(metaclass=Singleton):
     COLOR = Dotdict({
-        'white': huepy.white,
-        'grey': huepy.grey,
-        'black': huepy.black,
-        'green': huepy.green,
-        'lightgreen': huepy.lightgreen,
-        'cyan': huepy.cyan,
-        'lightcyan': huepy.lightcyan,
-        'red': huepy.red,
-        'lightred': huepy.lightred,
-        'blue': huepy.blue,
-        'lightblue': huepy.lightblue,
-        'purple': huepy.purple,
-        'lightpurple': huepy.lightpurple,
-        'orange': huepy.orange,
-        'yellow': huepy.yellow,
+        'white': Hue('white'),
+        'grey': Hue('grey'),
+        'black': Hue('black'),
+        'green': Hue('green'),
+        'lightgreen': Hue('lightgreen'),
+        'cyan': Hue('cyan'),
+        'lightcyan': Hue('lightcyan'),
+        'red': Hue('red'),
+        'lightred': Hue('lightred'),
+        'blue': Hue('blue'),
+        'lightblue': Hue('lightblue'),
+        'purple': Hue('purple'),
+        'lightpurple': Hue('lightpurple'),
+        'orange': Hue('orange'),
+        'yellow': Hue('yellow'),
     })
 
     STYLE = Dotdict({
-        'bg': huepy.bg,
-        'bold': huepy.bold,
-        'italic': huepy.italic,
-        'under': huepy.under,
-        'strike': huepy.strike,
+        'bg': Hue('bg'),
+        'bold': Hue('bold'),
+        'italic': Hue('italic'),
+        'under': Hue('under'),
+        'strike': Hue('strike'),
     })
 
     COMMAND = Dotdict({
-        'info': (huepy.info, 'yellow'),
-        'que': (huepy.que, 'lightblue'),
-        'bad': (huepy.bad, 'lightred'),
-        'good': (huepy.good, 'green'),
-        'run': (huepy.run, 'white'),
+        'info': (Hue('info'), 'yellow'),
+        'que': (Hue('que'), 'lightblue'),
+        'bad': (Hue('bad'), 'lightred'),
+        'good': (Hue('good'), 'green'),
+        'run': (Hue('run'), 'white'),
         'plain': (lambda msg: msg, 'white'),
     })
 
+    # Records are queued by the calling threads and written by a listener
+    #  thread, so logging never waits for the console or the log file
     def __init__(self):
         self.logger = logging.getLogger('UnpackDarkSoulsExtended')
 
-        self.formatter = logging.Formatter(
+        self.formatter = ConsoleLogFormatter(
             fmt='%(asctime)s %(message)s', datefmt='[%d/%m %H:%M]'
         )
 
-        self.stream = logging.StreamHandler()
+        self.stream = ConsoleLogHandler()
         self.stream.setLevel(logging.DEBUG)
         self.stream.setFormatter(self.formatter)
+        self.handlers = [self.stream]
 
-        self.logger.addHandler(self.stream)
+        self.queue = queue.Queue()
+        self.logger.addHandler(logging.handlers.QueueHandler(self.queue))
         self.logger.setLevel(logging.DEBUG)
+        self.listener = None
+        self.start_listener()
+        atexit.register(self.stop_listener)
+
+    # Start writing the queued records to the handlers
+    def start_listener(self):
+        self.listener = logging.handlers.QueueListener(
+            self.queue, *self.handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    # Write the remaining queued records and stop the listener thread
+    def stop_listener(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    # Wait until the queued records are written, before prompting the user
+    def flush(self):
+        self.queue.join()
+        for handler in self.handlers:
+            handler.flush()
+
+    # Start a Progress and keep its line below the console records until it
+    #  is stopped at the end of the context
+    @contextlib.contextmanager
+    def show_progress(self, progress):
+        self.stream.progress = progress
+        progress.start()
+        try:
+            yield progress
+        finally:
+            # the records queued so far are written above the line
+            self.flush()
+            self.stream.progress = None
+            progress.stop()
 
     def start_log(self):
         logF = os.path.join('./', 'UnpackDarkSoulsExtended.log')
@@ -77,7 +151,10 @@ class Logger(metaclass=Singleton):
         self.logF.setFormatter(FileLogFormatter(
             fmt='%(asctime)s %(message)s', datefmt='[%d/%m %H:%M]'
         ))
-        self.logger.addHandler(self.logF)
+        # the handlers of a listener are fixed, so it is replaced
+        self.stop_listener()
+        self.handlers.append(self.logF)
+        self.start_listener()
 
     def __getattr__(self, name):
         return self.command(name)
@@ -94,18 +171,11 @@ class Logger(metaclass=Singleton):
                 msg = self.STYLE.bold(msg)
             msg = f'{cmd[0]("")}{msg}'
 
-            if same_line:
-                self.stream.terminator = ''
-
-            if no_timestamp:
-                self.stream.setFormatter(None)
-                self.logger.info(msg)
-                self.stream.setFormatter(self.formatter)
-            else:
-                self.logger.info(msg)
-
-            self.stream.terminator = '\n'
-            sys.stdout.flush()
+            # the options travel with the record to the handlers
+            self.logger.info(msg, extra={
+                'no_timestamp': no_timestamp,
+                'same_line': same_line,
+            })
 
         return command_call
 
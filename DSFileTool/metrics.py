@@ -0,0 +1,153 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from DSFileTool.tools import Singleton
+
+
+# Get the current resident set size of the process in bytes, where
+#  /proc/self/statm is available
+def get_current_rss():
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, IndexError, OSError, ValueError):
+        return None
+
+
+# Get the highest resident set size the process reached in bytes, if known
+def get_peak_rss():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+class Metrics(metaclass=Singleton):
+    COUNTERS = ['bytes_read', 'bytes_written', 'bytes_inflated', 'files']
+
+    def __init__(self):
+        self.phases = {}
+        self.start_time = time.time()
+        self.lock = threading.Lock()
+        self.snapshot_thread = None
+        self.stopped = threading.Event()
+        # profiles the phases in its scope when set
+        self.profiler = None
+
+    # Get the entry of a phase, creating it the first time
+    def get_phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = {
+                'start': None,
+                'end': None,
+                'wall': 0.0,
+                'busy': 0.0,
+                'cpu': 0.0,
+                # highest RSS sampled when the phase started or ended, and
+                #  the highest RSS of the process so far when it ended
+                'rss': None,
+                'rss_high_water': None,
+                **{counter: 0 for counter in self.COUNTERS},
+            }
+        return phase
+
+    # Time a phase, the times of repeated phases add up. Phases run by
+    #  several threads at once are timed with the CPU time of the calling
+    #  thread: busy sums the time of the calls, while wall spans from the
+    #  first start to the last end. origin names the archive the phase
+    #  works on, for the profiler
+    @contextlib.contextmanager
+    def phase(self, name, threaded=False, origin=None):
+        get_cpu_time = time.thread_time if threaded else time.process_time
+        profile = contextlib.nullcontext()
+        if self.profiler is not None:
+            profile = self.profiler.profile_phase(name, origin)
+        start_rss = get_current_rss()
+        start = time.perf_counter()
+        start_cpu = get_cpu_time()
+        try:
+            with profile:
+                yield
+        finally:
+            end = time.perf_counter()
+            cpu = get_cpu_time() - start_cpu
+            end_rss = get_current_rss()
+            with self.lock:
+                phase = self.get_phase(name)
+                if phase['start'] is None or start < phase['start']:
+                    phase['start'] = start
+                if phase['end'] is None or end > phase['end']:
+                    phase['end'] = end
+                phase['busy'] += end - start
+                if threaded:
+                    phase['wall'] = phase['end'] - phase['start']
+                else:
+                    phase['wall'] += end - start
+                phase['cpu'] += cpu
+                for rss in (start_rss, end_rss):
+                    if rss is not None and (
+                        phase['rss'] is None or rss > phase['rss']
+                    ):
+                        phase['rss'] = rss
+                phase['rss_high_water'] = get_peak_rss()
+
+    # Add to the counters of a phase
+    def add(self, name, **counters):
+        with self.lock:
+            phase = self.get_phase(name)
+            for counter, amount in counters.items():
+                phase[counter] += amount
+
+    # Get the report of the phases so far
+    def get_report(self, complete=True):
+        with self.lock:
+            phases = {
+                name: {
+                    key: value for key, value in phase.items()
+                    if key not in ('start', 'end')
+                }
+                for name, phase in self.phases.items()
+            }
+        return {
+            'started': self.start_time,
+            'elapsed': time.time() - self.start_time,
+            'complete': complete,
+            'rss_high_water': get_peak_rss(),
+            'phases': phases,
+        }
+
+    # Write the report as JSON, replacing the previous one at once
+    def write_report(self, filename, complete=True):
+        temp_filename = filename + '.tmp'
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(complete), f, indent=2)
+        os.replace(temp_filename, filename)
+
+    # Rewrite the report every interval seconds until stopped
+    def start_snapshots(self, filename, interval):
+        def write_snapshots():
+            while not self.stopped.wait(interval):
+                self.write_report(filename, complete=False)
+
+        self.snapshot_thread = threading.Thread(
+            target=write_snapshots, daemon=True
+        )
+        self.snapshot_thread.start()
+
+    # Stop the periodic snapshots
+    def stop_snapshots(self):
+        self.stopped.set()
+        if self.snapshot_thread is not None:
+            self.snapshot_thread.join()
+            self.snapshot_thread = None
@@ -0,0 +1,94 @@
+import queue
+import threading
+
+from DSFileTool.tools import Dotdict
+
+
+class Pipeline:
+    def __init__(self):
+        self.stages = {}
+        self.pending = 0
+        self.errors = []
+        self.stopped = False
+        self.condition = threading.Condition()
+
+    # Register a stage whose handler is called with every item queued to it
+    #  by one of its workers. A bounded queue blocks submit() when full
+    def add_stage(self, name, handler, workers=1, queue_size=0):
+        self.stages[name] = Dotdict({
+            'name': name,
+            'handler': handler,
+            'workers': workers,
+            'queue': queue.Queue(queue_size),
+            'threads': [],
+            'done': 0,
+        })
+
+    # Queue an item for the given stage
+    def submit(self, stage_name, item):
+        with self.condition:
+            self.pending += 1
+        self.stages[stage_name].queue.put(item)
+
+    # Get the number of processed items per stage
+    def get_counts(self):
+        with self.condition:
+            return {name: stage.done for name, stage in self.stages.items()}
+
+    # Run the handler of the stage for each of its queued items
+    def work(self, stage):
+        while True:
+            item = stage.queue.get()
+            if item is None:
+                break
+
+            try:
+                # after a failure, only drain the queues
+                if not self.stopped:
+                    stage.handler(item)
+            except BaseException as e:
+                with self.condition:
+                    self.errors.append(e)
+                    self.stopped = True
+            finally:
+                with self.condition:
+                    stage.done += 1
+                    self.pending -= 1
+                    self.condition.notify_all()
+
+    # Start the workers, queue the initial items and wait until every stage
+    #  is idle. on_wait is called periodically while waiting
+    def run(self, stage_name, items, on_wait=None, interval=0.5):
+        for stage in self.stages.values():
+            for _ in range(stage.workers):
+                thread = threading.Thread(
+                    target=self.work, args=(stage,), daemon=True
+                )
+                thread.start()
+                stage.threads.append(thread)
+
+        try:
+            for item in items:
+                self.submit(stage_name, item)
+
+            while True:
+                with self.condition:
+                    if self.pending == 0:
+                        break
+                    # a timeout keeps the wait interruptible
+                    self.condition.wait(interval)
+                if on_wait is not None:
+                    on_wait()
+        except KeyboardInterrupt:
+            self.stopped = True
+            raise
+
+        for stage in self.stages.values():
+            for _ in stage.threads:
+                stage.queue.put(None)
+        for stage in self.stages.values():
+            for thread in stage.threads:
+                thread.join()
+
+        if len(self.errors) > 0:
+            raise self.errors[0]
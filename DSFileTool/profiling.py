@@ -0,0 +1,145 @@
+import contextlib
+import cProfile
+import pstats
+import threading
+import tracemalloc
+
+from DSFileTool.logger import Logger
+
+
+class Profiler:
+    # Profile the code run by the main thread and by the pipeline workers,
+    #  or with scope set only the phases it names: a stage ('bnd', 'pair',
+    #  'bdt'), a phase ('bdt dvdbnd0.bdt') or an archive ('dvdbnd0.bdt').
+    #  An archive also covers the BND files and pairs unpacked from it. The
+    #  profiles of every thread are merged into one set of statistics
+    def __init__(self, scope=None, trace_memory=False):
+        self.scope = scope
+        self.trace_memory = trace_memory
+        self.stats = None
+        # phases in scope tracing memory, and what was traced at their end
+        self.tracing = 0
+        self.snapshot = None
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        # whether the current thread is already being profiled
+        self.local = threading.local()
+        # whether a thread could not be profiled, which is only logged once
+        self.warned = False
+        self.log = Logger()
+
+    # Check if a phase is in the scope of the profiler, origin is the name
+    #  of the archive the item handled by the phase was unpacked from
+    def matches(self, phase_name, origin=None):
+        return (
+            self.scope is None or phase_name == self.scope or
+            phase_name.startswith(self.scope + ' ') or
+            phase_name.endswith(' ' + self.scope) or origin == self.scope
+        )
+
+    # Profile the calling thread, unless it is already being profiled
+    @contextlib.contextmanager
+    def profile(self):
+        if getattr(self.local, 'active', False):
+            yield
+            return
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # newer Pythons allow a single active profiler per process
+            with self.lock:
+                warned = self.warned
+                self.warned = True
+            if not warned:
+                self.log.warn(
+                    'Could not profile thread '
+                    f'{threading.current_thread().name} ({e}), the time '
+                    'spent in threads profiled at the same time as another '
+                    'one is missing from the profile.'
+                )
+            yield
+            return
+        self.local.active = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.local.active = False
+            with self.lock:
+                if self.stats is None:
+                    self.stats = pstats.Stats(profile)
+                else:
+                    self.stats.add(profile)
+
+    # Trace the memory allocated while phases in scope run. Tracing stops
+    #  once none of them is running: the snapshot holding the most memory
+    #  at that point is kept, along with the highest peak
+    @contextlib.contextmanager
+    def trace(self):
+        with self.lock:
+            if self.tracing == 0:
+                tracemalloc.start()
+            self.tracing += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.tracing -= 1
+                if self.tracing == 0:
+                    (current, peak) = tracemalloc.get_traced_memory()
+                    if self.snapshot is None or current > self.current:
+                        self.snapshot = tracemalloc.take_snapshot()
+                        self.current = current
+                    self.peak = max(self.peak, peak)
+                    tracemalloc.stop()
+
+    # Profile the calling thread, tracing its memory if asked to
+    @contextlib.contextmanager
+    def profile_scope(self):
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(self.profile())
+            if self.trace_memory:
+                stack.enter_context(self.trace())
+            yield
+
+    # Profile a phase if it is in scope
+    def profile_phase(self, phase_name, origin=None):
+        if self.matches(phase_name, origin):
+            return self.profile_scope()
+        return contextlib.nullcontext()
+
+    # Write the merged profile in the pstats format
+    def write_stats(self, filename):
+        with self.lock:
+            if self.stats is not None:
+                self.stats.dump_stats(filename)
+                return True
+        return False
+
+    # Write the source lines that allocated the most memory still in use at
+    #  the end of the traced phases, and the peak traced memory
+    def write_memory_report(self, filename, top=25):
+        with self.lock:
+            snapshot = self.snapshot
+            (current, peak) = (self.current, self.peak)
+        if snapshot is None:
+            return False
+
+        # leave out the allocations of the profiler itself
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+        statistics = snapshot.statistics('lineno')
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(
+                f'Traced memory: {current / 2 ** 20:.1f} MB, ' +
+                f'peak {peak / 2 ** 20:.1f} MB\n\n'
+            )
+            f.write(f'Top {top} allocations by source line:\n')
+            for stat in statistics[:top]:
+                f.write(f'{stat}\n')
+        return True
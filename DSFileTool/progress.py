@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+
+
+class Counters:
+    # Thread-safe named counters
+    def __init__(self):
+        self.values = {}
+        self.lock = threading.Lock()
+
+    # Add to a counter
+    def add(self, name, amount=1):
+        with self.lock:
+            self.values[name] = self.values.get(name, 0) + amount
+
+    # Get a copy of the counters, missing counters read as 0
+    def snapshot(self):
+        with self.lock:
+            return CounterSnapshot(self.values)
+
+
+class CounterSnapshot(dict):
+    def __missing__(self, name):
+        return 0
+
+
+class Progress:
+    # Redraws per second on a terminal, and seconds between summary lines
+    #  otherwise
+    RATE = 5
+    SUMMARY_INTERVAL = 30
+
+    # Show the progress line built by render from the counters and the
+    #  elapsed seconds. It is redrawn from a thread at most RATE times per
+    #  second on a terminal; when the output is redirected a summary line is
+    #  written every SUMMARY_INTERVAL seconds instead. With clear set, the
+    #  line is removed from the terminal once stopped
+    def __init__(self, render, stream=None, clear=False):
+        self.render = render
+        self.clear = clear
+        self.stream = stream or sys.stdout
+        self.is_tty = self.stream.isatty()
+        self.counters = Counters()
+        self.start_time = None
+        self.last_summary = None
+        self.line_length = 0
+        self.stopped = threading.Event()
+        self.thread = None
+        # held while writing to the stream
+        self.lock = threading.Lock()
+
+    # Add to a counter shown by the progress line
+    def add(self, name, amount=1):
+        self.counters.add(name, amount)
+
+    # Start redrawing in the background
+    def start(self):
+        self.start_time = self.last_summary = time.monotonic()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    # Redraw until stopped
+    def run(self):
+        interval = 1 / self.RATE
+        while not self.stopped.wait(interval):
+            self.draw()
+
+    # Draw the progress line, or write a summary line when it is due
+    def draw(self, final=False):
+        with self.lock:
+            self.draw_line(final)
+
+    # Same as draw, with the lock already held
+    def draw_line(self, final=False):
+        now = time.monotonic()
+        line = self.render(
+            self.counters.snapshot(), now - self.start_time
+        )
+        if self.is_tty:
+            padding = ' ' * max(0, self.line_length - len(line))
+            self.stream.write('\r' + line + padding)
+            self.line_length = len(line)
+        elif final or now - self.last_summary >= self.SUMMARY_INTERVAL:
+            self.stream.write(line + '\n')
+            self.last_summary = now
+        self.stream.flush()
+
+    # Remove the progress line from the terminal
+    def clear_line(self):
+        self.stream.write('\r' + ' ' * self.line_length + '\r')
+        self.stream.flush()
+        self.line_length = 0
+
+    # Call write, which writes lines to the terminal, with the progress line
+    #  cleared first and drawn again below them
+    def write_above(self, write):
+        with self.lock:
+            if not self.is_tty or self.thread is None:
+                write()
+                return
+            self.clear_line()
+            write()
+            self.draw_line()
+
+    # Stop redrawing, leaving the final state on its own line or clearing
+    #  it from the terminal
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            if self.clear and self.is_tty:
+                self.clear_line()
+            elif not self.clear:
+                self.draw_line(final=True)
+                if self.is_tty:
+                    self.stream.write('\n')
+            self.stream.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+# Format a throughput in MB/s
+def format_rate(byte_count, seconds):
+    if seconds <= 0:
+        return '- MB/s'
+    return f'{byte_count / seconds / 2 ** 20:.1f} MB/s'
+
+
+# Format the time left to process total items at the rate done / seconds
+def format_eta(done, total, seconds):
+    if done <= 0 or seconds <= 0 or total <= done:
+        return 'ETA --:--'
+    left = int((total - done) * seconds / done)
+    return f'ETA {left // 60:02}:{left % 60:02}'
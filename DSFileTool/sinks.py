@@ -0,0 +1,378 @@
+import collections
+import io
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from DSFileTool.filesystem import copy_range, discard_file, preallocate_file
+
+
+# A sink receives the unpacked files: BDT.unpack and BND.unpack hand every
+#  file to the sink set on them instead of writing it themselves
+class Sink:
+    # Get ready for the given files before they are written
+    def prepare(self, filenames):
+        pass
+
+    # Store the content of a file
+    def write(self, filename, content):
+        raise NotImplementedError
+
+    # Store size bytes at offset of an open file as a file
+    def copy(self, filename, file, offset, size):
+        file.seek(offset)
+        self.write(filename, file.read(size))
+
+    # Wait until a file handed to the sink has been stored
+    def wait_for(self, filename):
+        pass
+
+    # Call callback once the files handed to the sink have been stored
+    def when_stored(self, filenames, callback):
+        callback()
+
+    # Finish writing, the sink cannot be used afterwards
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FileSystemSink(Sink):
+    # Directories created in parallel when at least this many are missing
+    PARALLEL_MKDIR_COUNT = 64
+    MKDIR_WORKERS = 8
+    # Directories kept open to create files relative to them
+    MAX_DIR_FDS = 256
+    # Files from this size are allocated in full before being written
+    PREALLOCATE_SIZE = 1024 * 1024
+
+    # Write the files to disk, hard-linking duplicates when a Deduplicator
+    #  is given. Each output directory is created once and remembered
+    def __init__(self, dedup=None):
+        self.dedup = dedup
+        self.dirs = set()
+        # directory -> descriptor, where os.open supports dir_fd
+        self.dir_fds = {}
+        self.use_dir_fd = os.open in os.supports_dir_fd
+        self.lock = threading.Lock()
+
+    # Create the directories of the files that do not exist yet
+    def prepare(self, filenames):
+        with self.lock:
+            new_dirs = {os.path.dirname(f) for f in filenames} - self.dirs
+        if len(new_dirs) >= self.PARALLEL_MKDIR_COUNT:
+            with ThreadPoolExecutor(max_workers=self.MKDIR_WORKERS) as pool:
+                list(pool.map(self.make_dir, new_dirs))
+        else:
+            for directory in new_dirs:
+                self.make_dir(directory)
+
+    # Create a directory and its parents, if they don't exist
+    def make_dir(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            self.dirs.add(directory)
+
+    # Get an open descriptor of a created directory, or None
+    def get_dir_fd(self, directory):
+        with self.lock:
+            dir_fd = self.dir_fds.get(directory)
+            if dir_fd is None and len(self.dir_fds) < self.MAX_DIR_FDS:
+                dir_fd = os.open(directory, os.O_RDONLY)
+                self.dir_fds[directory] = dir_fd
+        return dir_fd
+
+    # Open a new file of the given size in a created directory
+    def open_new_file(self, filename, size):
+        (directory, name) = os.path.split(filename)
+        if directory not in self.dirs:
+            self.make_dir(directory)
+
+        dir_fd = self.get_dir_fd(directory) if self.use_dir_fd else None
+        if dir_fd is None:
+            f = open(filename, 'wb')
+        else:
+            f = open(os.open(
+                name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666,
+                dir_fd=dir_fd
+            ), 'wb')
+        if size >= self.PREALLOCATE_SIZE:
+            try:
+                preallocate_file(f, size)
+            except OSError:
+                f.close()
+                raise
+        return f
+
+    # Write the content to a new file in a created directory
+    def write_new_file(self, filename, content):
+        with self.open_new_file(filename, len(content)) as f:
+            f.write(content)
+
+    def write(self, filename, content):
+        if self.dedup is not None:
+            self.dedup.write(filename, content, self.write_new_file)
+        else:
+            self.write_new_file(filename, content)
+
+    # Copy in the kernel where possible, duplicates are not linked as the
+    #  content is never read
+    def copy(self, filename, file, offset, size):
+        if self.dedup is not None:
+            discard_file(filename)
+        with self.open_new_file(filename, size) as f:
+            copy_range(file, f, offset, size)
+
+    def close(self):
+        with self.lock:
+            for dir_fd in self.dir_fds.values():
+                os.close(dir_fd)
+            self.dir_fds = {}
+
+
+class WriteBehindSink(Sink):
+    # Queue the files for writer threads storing them in another sink, so
+    #  unpacking does not wait for the disk. Writing blocks while the queued
+    #  content exceeds max_bytes. Copies are made right away, as the source
+    #  file is still in use by the caller
+    def __init__(self, sink, max_bytes=64 * 1024 * 1024, workers=2):
+        self.sink = sink
+        self.max_bytes = max_bytes
+        self.queue = collections.deque()
+        self.queued_bytes = 0
+        # filename -> number of queued writes
+        self.queued_files = {}
+        # filename -> [number of files left, callback] waiting for it, the
+        #  callback is None once one of the files failed
+        self.waiters = {}
+        self.error = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self.work, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    # Raise the first error of the writer threads, with the lock held
+    def raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def prepare(self, filenames):
+        self.sink.prepare(filenames)
+
+    def write(self, filename, content):
+        with self.condition:
+            # a file larger than the budget is let through on its own
+            while (
+                self.error is None and len(self.queued_files) > 0 and
+                self.queued_bytes + len(content) > self.max_bytes
+            ):
+                self.condition.wait()
+            self.raise_error()
+            self.queue.append((filename, content))
+            self.queued_bytes += len(content)
+            self.queued_files[filename] = \
+                self.queued_files.get(filename, 0) + 1
+            self.condition.notify_all()
+
+    def copy(self, filename, file, offset, size):
+        self.wait_for(filename)
+        self.sink.copy(filename, file, offset, size)
+
+    # Store the queued files until the sink is closed
+    def work(self):
+        while True:
+            with self.condition:
+                while len(self.queue) == 0 and not self.closed:
+                    self.condition.wait()
+                if len(self.queue) == 0:
+                    return
+                (filename, content) = self.queue.popleft()
+
+            stored = False
+            try:
+                self.sink.write(filename, content)
+                stored = True
+            except BaseException as e:
+                self.set_error(e)
+            finally:
+                callbacks = []
+                with self.condition:
+                    self.queued_bytes -= len(content)
+                    self.queued_files[filename] -= 1
+                    if self.queued_files[filename] == 0:
+                        del self.queued_files[filename]
+                        for waiter in self.waiters.pop(filename, []):
+                            waiter[0] -= 1
+                            if not stored:
+                                # one of its files is missing
+                                waiter[1] = None
+                            elif waiter[0] == 0 and waiter[1] is not None:
+                                callbacks.append(waiter[1])
+                    self.condition.notify_all()
+
+            for callback in callbacks:
+                try:
+                    callback()
+                except BaseException as e:
+                    self.set_error(e)
+
+    # Keep the first error of the writer threads
+    def set_error(self, error):
+        with self.condition:
+            if self.error is None:
+                self.error = error
+
+    def wait_for(self, filename):
+        with self.condition:
+            while filename in self.queued_files:
+                self.condition.wait()
+            self.raise_error()
+
+    # Call callback from a writer thread once the queued writes of the files
+    #  are done, or right away if none are queued. It is not called if
+    #  storing one of the files fails
+    def when_stored(self, filenames, callback):
+        with self.condition:
+            self.raise_error()
+            queued = {f for f in filenames if f in self.queued_files}
+            if len(queued) > 0:
+                waiter = [len(queued), callback]
+                for filename in queued:
+                    self.waiters.setdefault(filename, []).append(waiter)
+                return
+        callback()
+
+    # Write the queued files and close the underlying sink
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        for thread in self.threads:
+            thread.join()
+        self.sink.close()
+        with self.condition:
+            self.raise_error()
+
+
+class FilterSink(Sink):
+    # Pass the files to another sink, leaving out those for which
+    #  skip(filename) is true
+    def __init__(self, sink, skip):
+        self.sink = sink
+        self.skip = skip
+
+    def prepare(self, filenames):
+        self.sink.prepare([f for f in filenames if not self.skip(f)])
+
+    def write(self, filename, content):
+        if not self.skip(filename):
+            self.sink.write(filename, content)
+
+    def copy(self, filename, file, offset, size):
+        if not self.skip(filename):
+            self.sink.copy(filename, file, offset, size)
+
+    def wait_for(self, filename):
+        self.sink.wait_for(filename)
+
+    def when_stored(self, filenames, callback):
+        self.sink.when_stored(
+            [f for f in filenames if not self.skip(f)], callback
+        )
+
+    def close(self):
+        self.sink.close()
+
+
+class ArchiveSink(Sink):
+    # Stream the files to an uncompressed archive. file is a path or a
+    #  writable file object, the members are named relative to root
+    def __init__(self, file, root='.'):
+        self.root = os.path.abspath(root)
+        self.lock = threading.Lock()
+        if hasattr(file, 'write'):
+            self.file = file
+            self.own_file = False
+        else:
+            self.file = open(file, 'wb')
+            self.own_file = True
+        self.archive = self.open_archive(self.file)
+
+    # Open the archive writer on the file object
+    def open_archive(self, file):
+        raise NotImplementedError
+
+    # Add a member to the archive
+    def add_member(self, name, content):
+        raise NotImplementedError
+
+    # Get the archive member name of a file
+    def get_member_name(self, filename):
+        name = os.path.relpath(os.path.abspath(filename), self.root)
+        return name.replace(os.sep, '/')
+
+    def write(self, filename, content):
+        name = self.get_member_name(filename)
+        with self.lock:
+            self.add_member(name, content)
+
+    def close(self):
+        with self.lock:
+            self.archive.close()
+            if self.own_file:
+                self.file.close()
+
+
+class TarSink(ArchiveSink):
+    def open_archive(self, file):
+        # stream mode never seeks, so the file may be a pipe
+        return tarfile.open(fileobj=file, mode='w|')
+
+    def add_member(self, name, content):
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        info.mtime = int(time.time())
+        self.archive.addfile(info, io.BytesIO(content))
+
+
+class ZipSink(ArchiveSink):
+    def open_archive(self, file):
+        return zipfile.ZipFile(file, 'w', zipfile.ZIP_STORED)
+
+    def add_member(self, name, content):
+        self.archive.writestr(name, bytes(content))
+
+
+class MemorySink(Sink):
+    # Keep the files in a dictionary of path -> content
+    def __init__(self):
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def write(self, filename, content):
+        with self.lock:
+            self.files[filename] = bytes(content)
+
+
+class NullSink(Sink):
+    # Discard the files, only counting them
+    def __init__(self):
+        self.file_count = 0
+        self.byte_count = 0
+        self.lock = threading.Lock()
+
+    def write(self, filename, content):
+        with self.lock:
+            self.file_count += 1
+            self.byte_count += len(content)
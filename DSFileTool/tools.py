@@ -1,9 +1,9 @@
+import functools
+import hashlib
 import sys
 
-import huepy
-import numpy as np
-
-from DSFileTool.defaults import FILENAMES
+from DSFileTool import defaults
+from DSFileTool.colors import Hue
 
 
 class Dotdict(dict):
@@ -23,8 +23,12 @@ class Singleton(type):
 
 # Prompt the user with a Yes / No question, defaults to Yes
 def prompt(query):
+    from DSFileTool.logger import Logger
+    # queued log lines are written before the question
+    Logger().flush()
     try:
-        q = huepy.white(f'{huepy.grey(query)} [Y]es / No: ')
+        (white, grey) = (Hue('white', sys.stdout), Hue('grey', sys.stdout))
+        q = white(f'{grey(query)} [Y]es / No: ')
         return ['', 'y', 'ye', 'yes', 'n', 'no'].index(input(q).lower()) < 4
     except ValueError:
         return prompt('Unknown response. Respond with')
@@ -35,24 +39,55 @@ def wait_before_exit(exit_code):
     from DSFileTool.logger import Logger
     log = Logger()
     log.run('grey', 'Press ANY key to quit...', same_line=True)
+    log.flush()
     input()
     sys.exit(exit_code)
 
 
+# Import NumPy on first use, it is only needed to hash many names at once.
+#  Returns None when it is not installed
+@functools.lru_cache(maxsize=None)
+def get_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 # Dark Souls .bhd5 filepath hash function
 def get_hash_from_string(s):
-    np.warnings.simplefilter('ignore', RuntimeWarning)
-
-    hash_val = np.uint32(0)
-    for char in bytearray(s.lower(), encoding='utf-8'):
-        hash_val *= np.uint32(37)
-        hash_val += np.uint32(char)
-    return hash_val.item()
+    hash_val = 0
+    for char in s.lower().encode('utf-8'):
+        hash_val = (hash_val * 37 + char) & 0xFFFFFFFF
+    return hash_val
+
+
+# Hash a list of filepaths, a column of characters at a time with NumPy
+def get_hashes_from_strings(strings):
+    np = get_numpy()
+    if np is None:
+        return [get_hash_from_string(s) for s in strings]
+
+    encoded = [s.lower().encode('utf-8') for s in strings]
+    width = max((len(e) for e in encoded), default=0)
+    # leading zeros leave the hash at 0, so the strings are aligned right
+    chars = np.frombuffer(
+        b''.join(e.rjust(width, b'\x00') for e in encoded), dtype=np.uint8
+    ).reshape(len(encoded), width)
+    hash_vals = np.zeros(len(encoded), dtype=np.uint32)
+    for column in chars.T:
+        # the multiplication wraps around at 32 bits like the game's
+        hash_vals = hash_vals * np.uint32(37) + column
+    return hash_vals.tolist()
 
 
 # Return a dictionary that translates known .bhd5 filepath hashes to filepaths
 def build_name_hash_dict():
-    name_hash_dict = {}
-    for name in FILENAMES:
-        name_hash_dict[get_hash_from_string(name)] = name
-    return name_hash_dict
+    names = defaults.FILENAMES
+    return dict(zip(get_hashes_from_strings(names), names))
+
+
+# Return a short digest of the content, used to verify unpacked files
+def get_digest(content):
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
@@ -1,15 +1,33 @@
+import io
 import os
 import shutil
-import sys
+import struct
+import tempfile
+import threading
+import zlib
 
-from DSFileTool.defaults import c4110
+from DSFileTool import defaults
+from DSFileTool.catalog import Catalog
 from DSFileTool.logger import Logger
-from DSFileTool.tools import prompt, wait_before_exit
+from DSFileTool.metrics import Metrics
+from DSFileTool.journal import Journal
+from DSFileTool.pipeline import Pipeline
+from DSFileTool.progress import Progress, format_eta, format_rate
+from DSFileTool.sinks import (
+    FileSystemSink, FilterSink, TarSink, WriteBehindSink, ZipSink
+)
+from DSFileTool.tools import get_digest, prompt, wait_before_exit
 from DSFileTool.file_formats.bdt import BDT
 from DSFileTool.file_formats.bnd import BND
+from DSFileTool.file_formats.dcx import DCX
 from DSFileTool.file_formats.exe import EXE
+from DSFileTool.filesystem import (
+    Deduplicator, TreeRemoval, backup_file, find_leftover_removals,
+    remove_tree, remove_trees_in_background
+)
 
 log = Logger()
+metrics = Metrics()
 
 
 class Unpacker:
@@ -19,18 +37,121 @@ class Unpacker:
         'sfx', 'shader', 'sound'
     ]
     BACKUP_DIR = '_Backup'
+    JOURNAL_FILE = 'UnpackDarkSoulsExtended.journal'
+    CATALOG_FILE = 'UnpackDarkSoulsExtended.db'
+    # Fingerprints of the executables verified by a full checksum, so later
+    #  runs identify them from a few small reads
+    FINGERPRINTS_FILE = 'UnpackDarkSoulsExtended.fingerprints.json'
+    # Timings and counters of each phase, also rewritten every
+    #  METRICS_INTERVAL seconds during the run when set
+    METRICS_FILE = 'UnpackDarkSoulsExtended.metrics.json'
+    METRICS_INTERVAL = None
     TEMP_DIR = '_TMP'
     TEMP_DATA_SUBDIR = 'DATA'
     TEMP_N_SUBDIR = 'N'
 
+    # Backup strategies to try in order, for files removed after unpacking
+    #  (the archives) and for files modified in place (the .exe). Hard links
+    #  come before moves so that an interrupted unpack keeps its archives,
+    #  archives it moved are resumed from the backup directory
+    BACKUP_STRATEGIES = {
+        'deleted': ['link', 'reflink', 'move', 'copy'],
+        'modified': ['reflink', 'copy'],
+    }
+
+    # Worker threads and queue size of each stage of the unpacking pipeline
+    STAGE_WORKERS = {'bdt': 4, 'bnd': 4, 'pair': 2}
+    STAGE_QUEUE_SIZE = 256
+
+    # Bytes of unpacked files queued for the writer threads at most
+    WRITE_BEHIND_BYTES = 64 * 1024 * 1024
+    WRITE_BEHIND_WORKERS = 2
+
+    # Worker threads removing files, and whether existing unpacked
+    #  directories are removed in the background
+    DELETE_WORKERS = 8
+    BACKGROUND_DELETE = True
+    background_deletions = []
+
+    # Whether byte-identical unpacked files are hard-linked to one copy
+    DEDUPLICATE = False
+
+    # Size from which records stored uncompressed are copied in the kernel
+    #  instead of through memory. They are not hashed in the journal and
+    #  catalog
+    COPY_SIZE = 1024 * 1024
+
+    # Whether up-to-date records are also compared with the checksum of
+    #  their stored content when resuming or unpacking incrementally
+    VERIFY_STORED_CONTENT = False
+
+    # Size above which BND members kept for direct unpacking are spilled
+    #  to a temporary file
+    SPILL_THRESHOLD = 32 * 1024 * 1024
+
     # Recursively removes a directory
     @staticmethod
     def remove_directory(d):
-        try:
-            shutil.rmtree(d)
-        except OSError:
-            if not os.path.isdir(d):
-                raise
+        progress = Progress(
+            lambda counters, _: f' * Removed {counters["files"]} files ' +
+                                f'from {d}...',
+            clear=True
+        )
+        # remove_tree reports the running total
+        progress_lock = threading.Lock()
+        removed = [0]
+
+        # Count the files removed so far
+        def show_progress(count):
+            with progress_lock:
+                progress.add('files', count - removed[0])
+                removed[0] = count
+
+        with log.show_progress(progress):
+            try:
+                remove_tree(d, Unpacker.DELETE_WORKERS, show_progress)
+            except OSError:
+                if not os.path.isdir(d):
+                    raise
+
+    # Wait for the directories being removed in the background
+    @staticmethod
+    def wait_for_deletions():
+        if len(Unpacker.background_deletions) > 0:
+            log.que(
+                'lightcyan', 'Waiting for old directories to be removed...'
+            )
+            failed = []
+            for removal in Unpacker.background_deletions:
+                removal.join()
+                if removal.error is not None:
+                    failed.append(removal)
+            Unpacker.background_deletions = []
+            for removal in failed:
+                log.warn(
+                    f'Could not remove {removal.path}: {removal.error}. '
+                    'It will be removed again on the next run.'
+                )
+            log.good('Done.')
+
+    # Remove the directories left aside by an earlier run that was stopped
+    #  before its background removals finished
+    @staticmethod
+    def remove_leftover_deletions():
+        leftovers = find_leftover_removals()
+        if len(leftovers) == 0:
+            return
+        log.que(
+            ' - Deleting directories left over from an earlier run: '
+            f'{", ".join(os.path.basename(d) for d in leftovers)}'
+        )
+        for d in leftovers:
+            if Unpacker.BACKGROUND_DELETE:
+                removal = TreeRemoval(d, Unpacker.DELETE_WORKERS)
+                removal.start()
+                Unpacker.background_deletions.append(removal)
+            else:
+                Unpacker.remove_directory(d)
 
     # Check if any existing directories match the ones from the archives
     @staticmethod
@@ -41,9 +162,11 @@ class Unpacker:
                 already_unpacked_dirs.append(d)
         return already_unpacked_dirs
 
-    # Make a backup of the files in file_list into BACKUP_DIR
+    # Make a backup of the files in file_list into BACKUP_DIR. The files in
+    #  deleted_files are removed after unpacking, so they may be linked or
+    #  moved instead of copied. Returns the backup paths of moved files
     @staticmethod
-    def make_backups(file_list):
+    def make_backups(file_list, deleted_files=()):
         if os.path.exists(Unpacker.BACKUP_DIR):
             Unpacker.remove_directory(Unpacker.BACKUP_DIR)
 
@@ -53,21 +176,48 @@ class Unpacker:
             if not os.path.isdir(Unpacker.BACKUP_DIR):
                 raise
 
+        moved_files = {}
+        copied_total = 0
         for f in file_list:
-            shutil.copy2(f, Unpacker.BACKUP_DIR)
+            if f in deleted_files:
+                strategies = Unpacker.BACKUP_STRATEGIES['deleted']
+            else:
+                strategies = Unpacker.BACKUP_STRATEGIES['modified']
+
+            backup_path = os.path.join(
+                Unpacker.BACKUP_DIR, os.path.basename(f)
+            )
+            (strategy, copied) = backup_file(f, backup_path, strategies)
+            if strategy == 'move':
+                moved_files[f] = backup_path
+            copied_total += copied
             log.que(
-                f' - Backed up file {os.path.basename(f)}.'
+                f' - Backed up file {os.path.basename(f)} ({strategy}).'
             )
+        log.que(f' - Copied {copied_total / 2 ** 20:.1f} MB of data.')
+        metrics.add(
+            'backups', bytes_written=copied_total, files=len(file_list)
+        )
+        return moved_files
 
-    # Remove all unpacked directories
+    # Remove all unpacked directories, by default they are renamed aside and
+    #  removed while unpacking goes on
     @staticmethod
     def remove_unpacked_dirs(dirs):
         log.que(
             'lightcyan',
             'Deleting existing unpacked archive directories...'
         )
+        if Unpacker.BACKGROUND_DELETE:
+            (removal, dirs) = remove_trees_in_background(
+                dirs, workers=Unpacker.DELETE_WORKERS
+            )
+            Unpacker.background_deletions.append(removal)
+
+        # directories that could not be moved aside are removed now
         for d in dirs:
-            Unpacker.remove_directory(d)
+            if os.path.isdir(d):
+                Unpacker.remove_directory(d)
         log.good('Done.')
 
     # Create all directories in UNPACKED_DIRS
@@ -83,24 +233,49 @@ class Unpacker:
     # Return a dictionary of all BDT/BHT pairs
     @staticmethod
     def build_bdt_bhd_pairing(file_list):
-        bdt_list = [
-            f for f in file_list if os.path.splitext(f)[1][-3:] == 'bdt'
-        ]
-        bhd_list = [
-            f for f in file_list if os.path.splitext(f)[1][-3:] == 'bhd'
-        ]
-
-        return_dict = {bdt_file: [] for bdt_file in bdt_list}
-        for bdt_file in bdt_list:
-            (_, bdt_filename) = os.path.split(os.path.abspath(bdt_file))
-            trimmed_bdt_filename = bdt_filename[:-3]
-            for bhd_file in bhd_list:
-                (_, bhd_filename) = os.path.split(os.path.abspath(bhd_file))
-                trimmed_bhd_filename = bhd_filename[:-3]
-                if trimmed_bdt_filename == trimmed_bhd_filename:
-                    return_dict[bdt_file].append(bhd_file)
-
-        return return_dict
+        bdt_list = []
+        bhd_dict = {}
+        for f in file_list:
+            file_ext = os.path.splitext(f)[1][-3:]
+            if file_ext == 'bdt':
+                bdt_list.append(f)
+            elif file_ext == 'bhd':
+                trimmed_bhd_filename = os.path.basename(f)[:-3]
+                bhd_dict.setdefault(trimmed_bhd_filename, []).append(f)
+
+        return {
+            bdt_file: list(bhd_dict.get(os.path.basename(bdt_file)[:-3], []))
+            for bdt_file in bdt_list
+        }
+
+    # Report BDT files without a header or with several candidate headers,
+    #  returns the list of BDT files without a header
+    @staticmethod
+    def check_bdt_bhd_pairing(pairing_dict):
+        orphans = sorted(f for f, bhds in pairing_dict.items() if not bhds)
+        ambiguous = sorted(f for f, bhds in pairing_dict.items()
+                           if len(bhds) > 1)
+
+        if len(ambiguous) > 0:
+            log.warn(
+                'white', f'{len(ambiguous)} BDT file(s) match several',
+                'header files, the one next to each BDT file or else the',
+                'first match is used:',
+                no_timestamp=True
+            )
+            for bdt_file in ambiguous:
+                bhd_names = ', '.join(pairing_dict[bdt_file])
+                log.info('grey', f' - {bdt_file}: {bhd_names}')
+        if len(orphans) > 0:
+            log.bad(f'{len(orphans)} BDT file(s) have no header file:')
+            for bdt_file in orphans:
+                log.bad('white', f' - {bdt_file}')
+        return orphans
+
+    # Check if a file is part of a BDT/BHD pair
+    @staticmethod
+    def is_pair_file(filename):
+        return os.path.splitext(filename)[1][-3:] in ('bdt', 'bhd')
 
     # Get the list of valid archive files
     @staticmethod
@@ -117,23 +292,450 @@ class Unpacker:
                     archive_list[file_name][0] = file_obj.path
         return archive_list
 
-    # Unpack all .bdt archives in the archive list
+    # Unpack all .bdt archives in the archive list. With direct set, the *bnd
+    #  files are not unpacked into the temporary directory, only their
+    #  BDT/BHD pairs are kept (in memory or in spill files) for unpacking.
+    #  Completed work is recorded in the journal, and work it already
+    #  records is verified and skipped. Every extracted file is recorded in
+    #  the catalog. With an output sink, the files are stored there instead
+    #  of on disk: the containers are then unpacked directly from memory and
+    #  the BDT/BHD pairs are left out
     @staticmethod
-    def unpack_archives(archive_list):
-        BND_MANIFEST_FILE = 'bnd_manifest.txt'
-        BND_MANIFEST_HEADER = '''
-This manifest records the source *bnd file locations and their corresponding
-list of included files. Use this manifest and the unpacked files in this
-directory to examine the contents of all the .bnd files directly and then
-unpack/modify/repack the associated .bnd file for any given unpacked file.
+    def unpack_archives(
+        archive_list, direct=False, journal=None, catalog=None, output=None
+    ):
+        err = 'Unpacking to an output sink cannot be journaled.'
+        assert output is None or journal is None, err
+        direct = direct or output is not None
+        cwd = os.getcwd()
+        temp_dir = os.path.join(cwd, Unpacker.TEMP_DIR)
+        bnd_n_base_path = os.path.join(temp_dir, Unpacker.TEMP_N_SUBDIR)
+
+        lock = threading.Lock()
+        created_files = set()
+        # files written by this run rather than kept from a previous one
+        fresh_files = set()
+        # extracted file -> top-level archive it came from
+        origins = {}
+        dedup = None
+        if Unpacker.DEDUPLICATE and output is None:
+            dedup = Deduplicator()
+        # the later stages read the unpacked files back from disk, once
+        #  the writer threads have written them, or from contents
+        if output is None:
+            target = FileSystemSink(dedup)
+        else:
+            target = FilterSink(output, Unpacker.is_pair_file)
+        sink = WriteBehindSink(
+            target, Unpacker.WRITE_BEHIND_BYTES, Unpacker.WRITE_BEHIND_WORKERS
+        )
+        # *bnd file -> content, for the files not read back from disk
+        contents = {}
+        # duplicates can only be found in records that are read, and
+        #  records are only kept in memory once read
+        copy_size = Unpacker.COPY_SIZE
+        if dedup is not None or output is not None:
+            copy_size = None
+        # trimmed file name -> [[*bdt files], [*bhd files]]
+        pairs = {}
+        # *bdt files queued with the header next to them
+        paired_files = set()
+        # pair files that were not written: path -> content or file object.
+        #  A *bdt file is released once its pair is unpacked, the headers
+        #  are small and kept until the end
+        members = {}
+        member_files = set()
+        unpacked_pairs = []
+        # output paths of the top-level archives and of the nested pairs,
+        #  see BDT.used_paths
+        pair_paths = set()
+        pair_paths_lock = threading.Lock()
+        pipeline = Pipeline()
+
+        # Register a new *bdt/*bhd file and queue the pairs it completes
+        def add_pair_file(filepath, member=None, fresh=True):
+            file_ext = os.path.splitext(filepath)[1][-3:]
+            if file_ext not in ('bdt', 'bhd'):
+                return
+
+            new_pairs = []
+            with lock:
+                if filepath in created_files:
+                    if hasattr(member, 'close'):
+                        member.close()
+                    return
+                created_files.add(filepath)
+                if fresh:
+                    fresh_files.add(filepath)
+                if member is not None:
+                    members[filepath] = member
+                    member_files.add(filepath)
+
+                # a *bdt file is paired with the header next to it as soon
+                #  as both are known, see get_remaining_pairs for the others
+                trimmed_filename = os.path.basename(filepath)[:-3]
+                pair = pairs.setdefault(trimmed_filename, [[], []])
+                if file_ext == 'bdt':
+                    pair[0].append(filepath)
+                    if filepath[:-3] + 'bhd' in pair[1]:
+                        new_pairs = [(filepath, filepath[:-3] + 'bhd')]
+                else:
+                    pair[1].append(filepath)
+                    new_pairs = [
+                        (f, filepath) for f in pair[0]
+                        if f[:-3] + 'bhd' == filepath
+                    ]
+                paired_files.update(f for (f, _) in new_pairs)
+
+            # submit outside of the lock, the stage queue may be full
+            for new_pair in new_pairs:
+                pipeline.submit('pair', new_pair)
+
+        # Queue each new file written by a top-level archive for the stage
+        #  that unpacks it. With content given, it is unpacked from memory
+        def route_file(filepath, fresh=True, content=None):
+            file_ext = os.path.splitext(filepath)[1][-3:]
+            if file_ext != 'bnd':
+                member = content
+                if content is not None and file_ext == 'bdt':
+                    # data files are read as file objects
+                    member = io.BytesIO(content)
+                add_pair_file(filepath, member, fresh)
+                return
+
+            with lock:
+                if filepath in created_files:
+                    return
+                created_files.add(filepath)
+                if content is not None:
+                    contents[filepath] = content
+            pipeline.submit('bnd', filepath)
+
+        # Unpack a top-level .bdt archive
+        def unpack_bdt(bdt):
+            archive_name = os.path.split(bdt.data_file)[1]
+            log.que(
+                f' - Unpacking archive {archive_name} ' +
+                f'using header {os.path.split(bdt.header_file)[1]}...'
+            )
+
+            # Get the path a record was unpacked to by a previous run, if it
+            #  is still up to date
+            def skip_record(name, record_offset, record_size, read_content):
+                entry = journal.get('record', archive_name, name)
+                if (
+                    entry is None or entry['offset'] != record_offset or
+                    entry['size'] != record_size
+                ):
+                    return None
+                file_path = os.path.join(cwd, entry['path'])
+                if not Journal.verify_files([(file_path, entry['out_size'])]):
+                    return None
+                # copied records have no checksum to compare with
+                if Unpacker.VERIFY_STORED_CONTENT and (
+                    entry['crc'] is None or
+                    zlib.crc32(read_content()) != entry['crc']
+                ):
+                    return None
+                journal.keep(entry)
+                progress.add('bytes_in', record_size)
+                return file_path
+
+            # Record the unpacked file and route it to its next stage
+            def record_file(file_path, record):
+                origins[file_path] = archive_name
+                if record is not None:
+                    progress.add('bytes_in', record.size)
+                    progress.add('bytes_out', record.out_size)
+                    metrics.add(
+                        phase_name, bytes_read=record.size,
+                        bytes_written=record.out_size,
+                        bytes_inflated=record.out_size if record.dcx else 0,
+                        files=1
+                    )
+                if record is not None:
+                    # copied records were never read, so are not hashed
+                    crc = digest = None
+                    if record.content is not None:
+                        crc = zlib.crc32(record.stored_content)
+                        digest = get_digest(record.content)
+
+                    # Record the file once it is on disk, so an interrupted
+                    #  run never skips a file that was not fully written
+                    def record_stored():
+                        if journal is not None:
+                            journal.record(
+                                'record', archive_name, record.name,
+                                offset=record.offset, size=record.size,
+                                path=os.path.relpath(file_path, cwd),
+                                crc=crc, out_size=record.out_size,
+                                digest=digest
+                            )
+                        if catalog is not None:
+                            catalog.add(
+                                record.name, archive_name, archive_name,
+                                record.offset, record.size, record.out_size,
+                                record.dcx, os.path.relpath(file_path, cwd),
+                                digest
+                            )
+                    sink.when_stored([file_path], record_stored)
+                content = None
+                if output is not None:
+                    content = record.content
+                route_file(file_path, record is not None, content)
+
+            phase_name = f'bdt {archive_name}'
+            with metrics.phase(phase_name, threaded=True):
+                bdt.unpack(
+                    on_file=record_file,
+                    skip=skip_record if journal is not None else None
+                )
+
+        # Check the members of a *bnd file unpacked by a previous run,
+        #  returns their paths or None if any is missing
+        def get_unpacked_members(bnd, bnd_name, digest):
+            entry = journal.get('bnd', '', bnd_name)
+            # members are not written when unpacking directly
+            if (
+                entry is None or entry['digest'] != digest or
+                entry.get('direct', False)
+            ):
+                return None
+            files = [(f, len(filedata)) for f, filedata in bnd.iter_records()]
+            if not Journal.verify_files(files):
+                return None
+            journal.keep(entry)
+            return [f for (f, _) in files]
+
+        # Record the members of a *bnd file in the catalog
+        def catalog_bnd(bnd, bnd_name, archive_name, written):
+            catalog.remove_parent(bnd_name)
+            for record in bnd.iter_entries():
+                path = None
+                if written:
+                    path = os.path.relpath(record.path, cwd)
+                catalog.add(
+                    record.name, bnd_name, archive_name, record.offset,
+                    record.size, record.size,
+                    DCX(record.content).is_dcx_file(), path,
+                    get_digest(record.content)
+                )
+
+        # Unpack a *bnd file into the temporary directory
+        def unpack_bnd(filepath):
+            directory = os.path.dirname(os.path.abspath(filepath))
+            rel_directory = os.path.relpath(directory)
+
+            sink.wait_for(filepath)
+            with lock:
+                file_content = contents.pop(filepath, None)
+            if file_content is None:
+                with open(filepath, 'rb') as f:
+                    file_content = f.read()
+            metrics.add('bnd', bytes_read=len(file_content))
+            bnd_base_path = os.path.join(
+                temp_dir, Unpacker.TEMP_DATA_SUBDIR, rel_directory
+            )
+            bnd = BND(file_content, bnd_base_path, bnd_n_base_path)
+            bnd.sink = sink
+            bnd_name = os.path.relpath(filepath, cwd)
+            archive_name = origins.get(filepath, '')
+
+            if direct:
+                # the members are the same as those of the previous run if
+                #  the *bnd file is, so their journaled pairs can be skipped
+                fresh = True
+                if journal is not None:
+                    digest = get_digest(file_content)
+                    entry = journal.get('bnd', '', bnd_name)
+                    fresh = entry is None or entry['digest'] != digest
+                    journal.record(
+                        'bnd', '', bnd_name,
+                        size=len(file_content), digest=digest, direct=True
+                    )
+                if catalog is not None:
+                    catalog_bnd(bnd, bnd_name, archive_name, False)
+                for new_file, filedata in bnd.iter_records():
+                    origins[new_file] = archive_name
+                    file_ext = os.path.splitext(new_file)[1][-3:]
+                    if file_ext == 'bhd':
+                        add_pair_file(new_file, bytes(filedata), fresh)
+                    elif file_ext == 'bdt':
+                        spill_file = tempfile.SpooledTemporaryFile(
+                            max_size=Unpacker.SPILL_THRESHOLD, dir=cwd
+                        )
+                        spill_file.write(filedata)
+                        add_pair_file(new_file, spill_file, fresh)
+                return
+
+            # Register a member written by this or a previous run
+            def add_member(new_file, fresh):
+                origins[new_file] = archive_name
+                add_pair_file(new_file, fresh=fresh)
+
+            # Register a member written by this run
+            def record_member(new_file, filedata):
+                progress.add('bytes_out', len(filedata))
+                metrics.add('bnd', bytes_written=len(filedata), files=1)
+                add_member(new_file, True)
+
+            new_file_list = None
+            if journal is not None:
+                digest = get_digest(file_content)
+                new_file_list = get_unpacked_members(bnd, bnd_name, digest)
+            if new_file_list is not None:
+                for new_file in new_file_list:
+                    add_member(new_file, False)
+            else:
+                new_file_list = bnd.unpack(on_file=record_member)
+
+                # Record the members once they are all on disk
+                def record_stored():
+                    if catalog is not None:
+                        catalog_bnd(bnd, bnd_name, archive_name, True)
+                    if journal is not None:
+                        journal.record(
+                            'bnd', '', bnd_name,
+                            size=len(file_content), digest=digest,
+                            files=[
+                                os.path.relpath(new_file, cwd)
+                                for new_file in new_file_list
+                            ]
+                        )
+                sink.when_stored(new_file_list, record_stored)
+
+        # Unpack a nested BDT/BHD pair
+        def unpack_pair(pair):
+            (bdt_file, match_bhd_file) = pair
+
+            # redirect the output of the file depending on its extension
+            (_, bdt_file_ext) = os.path.splitext(bdt_file)
+            if bdt_file_ext == '.chrtpfbdt':
+                rel_directory = 'chr'
+            elif bdt_file_ext == '.hkxbdt':
+                rel_directory = 'map'
+            elif bdt_file_ext == '.tpfbdt':
+                rel_directory = os.path.join('map', 'tx')
+            else:
+                raise AssertionError(
+                    f'Unrecognized *bdt file extension: {bdt_file_ext}.'
+                )
+
+            bdt_name = os.path.relpath(bdt_file, cwd)
+            bhd_name = os.path.relpath(match_bhd_file, cwd)
+            entry = None
+            if journal is not None:
+                entry = journal.get('pair', '', bdt_name)
+            if (
+                entry is None or entry['header'] != bhd_name or
+                bdt_file in fresh_files or match_bhd_file in fresh_files or
+                not Journal.verify_files(
+                    [(os.path.join(cwd, f), size)
+                     for (f, size) in entry['files']]
+                )
+            ):
+                directory = os.path.abspath(os.path.join(cwd, rel_directory))
+                sink.wait_for(bdt_file)
+                sink.wait_for(match_bhd_file)
+                bdt = BDT(
+                    members.get(match_bhd_file, match_bhd_file),
+                    members.get(bdt_file, bdt_file),
+                    directory
+                )
+                bdt.used_paths = pair_paths
+                bdt.paths_lock = pair_paths_lock
+                bdt.show_progress = False
+                bdt.sink = sink
+                bdt.copy_size = copy_size
+                archive_name = origins.get(bdt_file, '')
+                files = []
+                # paths the members are written to and their catalog rows
+                file_paths = []
+                rows = []
+
+                # Keep track of an unpacked pair member
+                def record_member(file_path, record):
+                    path = os.path.relpath(file_path, cwd)
+                    files.append((path, record.out_size))
+                    file_paths.append(file_path)
+                    progress.add('bytes_out', record.out_size)
+                    metrics.add(
+                        'pair', bytes_read=record.size,
+                        bytes_written=record.out_size,
+                        bytes_inflated=record.out_size if record.dcx else 0,
+                        files=1
+                    )
+                    if catalog is not None:
+                        digest = None
+                        if record.content is not None:
+                            digest = get_digest(record.content)
+                        rows.append((
+                            record.name, bdt_name, archive_name,
+                            record.offset, record.size, record.out_size,
+                            record.dcx, path, digest
+                        ))
+
+                # Record the members once they are all on disk
+                def record_stored():
+                    if catalog is not None:
+                        catalog.remove_parent(bdt_name)
+                        for row in rows:
+                            catalog.add(*row)
+                    if journal is not None:
+                        journal.record(
+                            'pair', '', bdt_name, header=bhd_name, files=files
+                        )
+
+                bdt.unpack(on_file=record_member)
+                sink.when_stored(file_paths, record_stored)
+            else:
+                journal.keep(entry)
+
+            # the *bdt file only belongs to this pair, the header may be
+            #  shared by several
+            with lock:
+                unpacked_pairs.append(pair)
+                member = members.pop(bdt_file, None)
+            if hasattr(member, 'close'):
+                member.close()
 
-Note that the files in this directory are not read by the game and modifying
-them has no effect, but can be useful for finding what file should be modified.
+        # Get the pairs of the *bdt files with no header next to them, once
+        #  all the headers are known. The first header of the same name in
+        #  sorted order is used, as check_bdt_bhd_pairing reports
+        def get_remaining_pairs():
+            remaining_pairs = []
+            for (bdt_files, bhd_files) in pairs.values():
+                if len(bhd_files) == 0:
+                    continue
+                for bdt_file in bdt_files:
+                    if bdt_file not in paired_files:
+                        remaining_pairs.append((bdt_file, min(bhd_files)))
+            return sorted(remaining_pairs)
 
+        # Time each call of a stage handler as part of a phase. The archive
+        #  the file of an item came from is passed on, so that profiling an
+        #  archive also covers the BND files and pairs unpacked from it
+        def timed(phase_name, handler, get_file=lambda item: item):
+            def timed_handler(item):
+                origin = origins.get(get_file(item))
+                with metrics.phase(phase_name, threaded=True, origin=origin):
+                    handler(item)
+            return timed_handler
 
-MANIFEST:'''
+        # Describe how many items each stage has processed so far, with the
+        #  throughput and the time left to read the top-level archives
+        def render_progress(counters, seconds):
+            counts = pipeline.get_counts()
+            return f' * Unpacked {counts["bdt"]} archive(s), ' + \
+                   f'{counts["bnd"]} BND file(s), ' + \
+                   f'{counts["pair"]} BDT/BHD pair(s), ' + \
+                   f'{counters["bytes_out"] / 2 ** 20:.0f} MB, ' + \
+                   f'{format_rate(counters["bytes_out"], seconds)}, ' + \
+                   format_eta(counters['bytes_in'], total_bytes, seconds)
 
-        created_files = []
+        progress = Progress(render_progress)
+
+        archives = []
         for archive in sorted(archive_list.values()):
             header_file = archive[0]
             data_file = archive[1]
@@ -154,144 +756,187 @@ MANIFEST:'''
                     'lightred', 'is missing. Skipping.'
                 )
                 continue
+            archives.append((header_file, data_file))
 
-            log.que(
-                f' - Unpacking archive {data_name} ' +
-                f'using header {header_name}...'
-            )
-            new_files = BDT(header_file, data_file, os.getcwd()).unpack()
-            created_files += new_files
-        # remove duplicates
-        created_files = list(set(created_files))
-
-        log.que(' - Unpacking BND archives...')
-        bnd_list = [
-            f for f in created_files if os.path.splitext(f)[1][-3:] == 'bnd'
-        ]
-        msg_len = 0
-        manifest_string_list = []
-        for count, filepath in enumerate(sorted(bnd_list)):
-            (directory, filename) = os.path.split(os.path.abspath(filepath))
-            rel_directory = os.path.relpath(directory)
-
-            msg = f'\r * ({count + 1}/{len(bnd_list)}) ' + \
-                  f'Unpacking BND file {filename}...'
-            print(msg, end='')
-
-            with open(filepath, 'rb') as f:
-                file_content = f.read()
-                bnd_base_path = os.path.join(
-                    os.getcwd(),
-                    Unpacker.TEMP_DIR, Unpacker.TEMP_DATA_SUBDIR, rel_directory
-                )
-                bnd_n_base_path = os.path.join(
-                    os.getcwd(),
-                    Unpacker.TEMP_DIR, Unpacker.TEMP_N_SUBDIR
-                )
-                new_file_list = BND(
-                    file_content, bnd_base_path, bnd_n_base_path
-                ).unpack()
-                created_files += new_file_list
-
-                if len(new_file_list) > 0:
-                    manifest_string_list.append(
-                        os.path.join(rel_directory, filename)
-                    )
-
-                    for new_file in new_file_list:
-                        new_file_rel = os.path.relpath(
-                            new_file,
-                            os.path.join(os.getcwd(), Unpacker.TEMP_DIR)
-                        )
-                        manifest_string_list.append(' ' + new_file_rel)
-
-            print('\r' + ' ' * msg_len, end='')
-            msg_len = len(msg)
-            sys.stdout.flush()
-        print('\r', end='')
+        # archives may share output paths, the first archive in sorted order
+        #  keeps a path and later archives rename their copy
+        bdt_list = []
+        claimed_paths = set()
+        for (header_file, data_file) in archives:
+            bdt = BDT(header_file, data_file, cwd)
+            bdt.show_progress = False
+            bdt.sink = sink
+            bdt.copy_size = copy_size
+            bdt.used_paths = set(claimed_paths)
+            for name in bdt.get_file_dict():
+                file_path = bdt.fix_filename(cwd, name)
+                claimed_paths.add(file_path)
+                if file_path[-4:] == '.dcx':
+                    claimed_paths.add(file_path[:-4])
+            bdt_list.append(bdt)
+        # nested pairs rename their copies of the top-level outputs too
+        pair_paths.update(claimed_paths)
 
+        # the missing header has to be known before its pair shows up
         log.que(' - Writing custom copy of missing file(s)...')
-        manifest_string_list.append('-- Custom --')
+        c4110 = defaults.c4110
         filepath = c4110['PATH'].replace('\\', '/')
-        bnd_n_base_path = os.path.join(
-            os.getcwd(), Unpacker.TEMP_DIR, Unpacker.TEMP_N_SUBDIR
-        )
         filepath_to_use = BND.relativize_filename(
-            filepath, os.getcwd(), bnd_n_base_path
-        )
-        f = BND.create_file(filepath_to_use)
-        f.write(c4110['DATA'])
-        f.close()
-        created_files.append(filepath_to_use)
-        new_file_rel = os.path.relpath(
-            filepath_to_use, os.path.join(os.getcwd(), Unpacker.TEMP_DIR)
+            filepath, cwd, bnd_n_base_path
         )
-        manifest_string_list.append(r' {new_file_rel}')
+        if direct:
+            add_pair_file(filepath_to_use, c4110['DATA'])
+        else:
+            f = BND.create_file(filepath_to_use)
+            f.write(c4110['DATA'])
+            f.close()
+            add_pair_file(filepath_to_use)
+        if catalog is not None:
+            catalog.add(
+                filepath, '', '', None, len(c4110['DATA']),
+                len(c4110['DATA']), False,
+                None if direct else os.path.relpath(filepath_to_use, cwd),
+                get_digest(c4110['DATA'])
+            )
 
-        # populate the manifest
-        manifest_file = os.path.join(
-            os.getcwd(), Unpacker.TEMP_DIR, BND_MANIFEST_FILE
+        # each produced container is queued for its next stage as soon as
+        #  it is written, so the stages run concurrently
+        pipeline.add_stage(
+            'bdt', unpack_bdt,
+            Unpacker.STAGE_WORKERS['bdt'], Unpacker.STAGE_QUEUE_SIZE
+        )
+        pipeline.add_stage(
+            'bnd', timed('bnd', unpack_bnd),
+            Unpacker.STAGE_WORKERS['bnd'], Unpacker.STAGE_QUEUE_SIZE
+        )
+        pipeline.add_stage(
+            'pair', timed('pair', unpack_pair, lambda pair: pair[0]),
+            Unpacker.STAGE_WORKERS['pair'], Unpacker.STAGE_QUEUE_SIZE
         )
-        with open(manifest_file, 'w', encoding='shift_jis') as g:
-            g.write(BND_MANIFEST_HEADER)
-            g.write('\n'.join(manifest_string_list))
+        log.que(' - Unpacking archives, BND files and BDT/BHD pairs...')
+        total_bytes = sum(
+            size for bdt in bdt_list for (_, size) in bdt.file_dict.values()
+        )
+        with log.show_progress(progress):
+            try:
+                pipeline.run('bdt', bdt_list)
+                for pair in get_remaining_pairs():
+                    timed('pair', unpack_pair, lambda pair: pair[0])(pair)
+            finally:
+                sink.close()
+                for member in members.values():
+                    if hasattr(member, 'close'):
+                        member.close()
+        if dedup is not None:
+            log.que(
+                f' - Linked {dedup.linked} duplicate file(s), saving ' +
+                f'{dedup.saved_bytes / 2 ** 20:.1f} MB.'
+            )
 
         log.que(' - Examining unpacked files for BDT/BHD pairs...')
-        pairing_dict = Unpacker.build_bdt_bhd_pairing(list(set(created_files)))
-        for bdt_file in pairing_dict:
-            err = f'BDT File {bdt_file} has no corresponding header file.'
-            assert len(pairing_dict[bdt_file]) != 0, err
-
-        log.que(' - Unpacking BDT/BHD pairs...')
-        pair_cnt = len(pairing_dict.keys())
-        for count, bdt_file in enumerate(sorted(pairing_dict.keys())):
-            print(f'\r * ({count + 1}/{pair_cnt}) Unpacking BDT/BHD pairs...')
-            (_, bdt_filename) = os.path.split(os.path.abspath(bdt_file))
-            match_bhd_file = pairing_dict[bdt_file][0]
-            (_, bhd_filename) = os.path.split(os.path.abspath(match_bhd_file))
-
-            print(
-                f'  - Unpacking archive {bdt_filename} ' +
-                f'using header {bhd_filename}...'
-            )
+        pairing_dict = Unpacker.build_bdt_bhd_pairing(sorted(created_files))
+        orphans = Unpacker.check_bdt_bhd_pairing(pairing_dict)
+        err = f'{len(orphans)} BDT file(s) have no corresponding header file.'
+        assert len(orphans) == 0, err
 
-            # redirect the output of the file depending on its extension
-            (_, bdt_file_ext) = os.path.splitext(bdt_filename)
-            if bdt_file_ext == '.chrtpfbdt':
-                rel_directory = 'chr'
-            elif bdt_file_ext == '.hkxbdt':
-                rel_directory = 'map'
-            elif bdt_file_ext == '.tpfbdt':
-                rel_directory = os.path.join('map', 'tx')
-            else:
-                raise AssertionError(
-                    f'Unrecognized *bdt file extension: {bdt_file_ext}.'
-                )
+        log.que(' - Removing BDT/BHD pairs...')
+        with metrics.phase('cleanup'):
+            for pair in unpacked_pairs:
+                for pair_file in pair:
+                    if pair_file in member_files:
+                        continue
+                    try:
+                        os.remove(pair_file)
+                    except OSError:
+                        if not os.path.isfile(pair_file):
+                            raise
 
-            directory = os.path.abspath(
-                os.path.join(os.getcwd(), rel_directory)
+    # Unpack the archives, recording the work in the journal and the
+    #  catalog. A resumed run appends to the journal of the interrupted one.
+    #  Any other run writes it afresh, and an incremental run carries the
+    #  entries of up-to-date work over before removing the stale files
+    @staticmethod
+    def unpack_journaled(
+        archive_list, journal, direct=False, resume=False, incremental=False
+    ):
+        journal.open(resume)
+        # rows of skipped work are kept from the previous run
+        catalog = Catalog(Unpacker.CATALOG_FILE)
+        catalog.open(keep=resume or incremental)
+        try:
+            Unpacker.unpack_archives(
+                archive_list, direct=direct, journal=journal, catalog=catalog
             )
-            BDT(match_bhd_file, bdt_file, directory).unpack()
+            if incremental:
+                with metrics.phase('cleanup'):
+                    Unpacker.remove_stale_files(journal, catalog)
+            journal.finish()
+        finally:
+            journal.close()
+            catalog.close()
 
-            # erase the previous two lines
-            ANSI_CLEAR_LINE = '\x1b[K'
-            ANSI_CURSOR_UP_LINE = '\x1b[1A'
-            print('\r' + (ANSI_CURSOR_UP_LINE + ANSI_CLEAR_LINE) * 2, end='')
-
-        log.que(' - Removing BDT/BHD pairs...')
-        for bdt_file in pairing_dict.keys():
-            match_bhd_file = pairing_dict[bdt_file][0]
-            try:
-                os.remove(bdt_file)
-            except OSError:
-                if not os.path.isfile(bdt_file):
-                    raise
+    # Remove the files unpacked by the previous run that were not unpacked
+    #  again
+    @staticmethod
+    def remove_stale_files(journal, catalog=None):
+        stale_files = journal.get_stale_files()
+        log.que(f' - Removing {len(stale_files)} stale file(s)...')
+        if catalog is not None:
+            catalog.remove_paths(stale_files)
+        for f in stale_files:
             try:
-                os.remove(match_bhd_file)
+                os.remove(f)
             except OSError:
-                if not os.path.isfile(match_bhd_file):
+                if os.path.isfile(f):
                     raise
 
+    # Get the number of bytes the records of the archives take up once
+    #  unpacked
+    @staticmethod
+    def get_unpack_size(archive_list):
+        unpack_size = 0
+        for (header_file, data_file) in archive_list.values():
+            if header_file is None or data_file is None:
+                continue
+            if os.path.isfile(header_file) and os.path.isfile(data_file):
+                bdt = BDT(header_file, data_file)
+                unpack_size += sum(bdt.get_out_sizes().values())
+        return unpack_size
+
+    # Get the number of bytes make_backups may copy for the files in
+    #  file_list. Moves never copy, but any other strategy may fall back to
+    #  copying the whole file
+    @staticmethod
+    def get_backup_size(file_list, deleted_files=()):
+        backup_size = 0
+        for f in file_list:
+            if f in deleted_files:
+                strategies = Unpacker.BACKUP_STRATEGIES['deleted']
+            else:
+                strategies = Unpacker.BACKUP_STRATEGIES['modified']
+            if 'move' not in strategies:
+                backup_size += os.path.getsize(f)
+        return backup_size
+
+    # Check that the archives fit on the disk once unpacked, along with the
+    #  backup_size bytes of backups. The contents of the unpacked .bnd files
+    #  come on top, so this is a lower bound
+    @staticmethod
+    def check_disk_space(archive_list, backup_size=0, path='.'):
+        needed_size = Unpacker.get_unpack_size(archive_list) + backup_size
+        free_space = shutil.disk_usage(path).free
+        if free_space >= needed_size:
+            return
+
+        log.warn(
+            'lightred', 'Not enough free disk space.',
+            'white', f'Unpacking needs at least {needed_size / 2 ** 20:.0f}',
+            'white', f'MB, but only {free_space / 2 ** 20:.0f} MB are free.',
+            no_timestamp=True
+        )
+        if not prompt('Continue anyway?'):
+            wait_before_exit(1)
+
     # Removes any Dark Souls archive files from the current directory
     @staticmethod
     def remove_archives(archive_list):
@@ -320,11 +965,118 @@ MANIFEST:'''
         Unpacker.remove_directory(Unpacker.TEMP_DIR)
         log.good('Done.')
 
+    # Load the fingerprints recorded by previous runs, if any
+    @staticmethod
+    def load_exe_fingerprints():
+        if not os.path.isfile(Unpacker.FINGERPRINTS_FILE):
+            return
+        try:
+            EXE.load_fingerprints(Unpacker.FINGERPRINTS_FILE)
+        except (OSError, ValueError):
+            log.warn(
+                'white', 'Ignoring unreadable .exe fingerprints in',
+                Unpacker.FINGERPRINTS_FILE, no_timestamp=True
+            )
+
+    # Record the fingerprint of an .exe whose checksum matches a known
+    #  game version, unless one is already known
+    @staticmethod
+    def record_exe_fingerprint(exe_obj):
+        if exe_obj.checksum is None or (
+            exe_obj.get_game_version(EXE.ORIGINAL_CHECKSUMS) is None and
+            exe_obj.get_game_version(EXE.PATCHED_CHECKSUMS) is None
+        ):
+            return
+        if exe_obj.game_version in exe_obj.get_fingerprints():
+            return
+        exe_obj.record_fingerprint()
+        try:
+            EXE.save_fingerprints(Unpacker.FINGERPRINTS_FILE)
+        except OSError:
+            # the fingerprint only spares a full read on later runs
+            pass
+
+    # Export the patch for the .exe in the path as a binary diff
+    @staticmethod
+    def export_exe_patch(patch_file, path='./'):
+        log.que('lightcyan', 'Exporting .exe patch...')
+        exe_obj = EXE(path)
+        (exe_status, patch_location) = exe_obj.validate()
+        if exe_status != 'ORIGINAL':
+            log.bad('No unmodified executable with a known checksum found.')
+            return False
+
+        try:
+            record_cnt = exe_obj.export_patch(patch_location, patch_file)
+        except AssertionError as e:
+            log.bad(str(e))
+            return False
+        log.que(f' - Wrote {record_cnt} patch records to {patch_file}.')
+        log.good('Done.')
+        return True
+
+    # Apply a binary diff exported by export_exe_patch to the .exe in the path
+    @staticmethod
+    def apply_exe_patch(patch_file, path='./'):
+        log.que('lightcyan', 'Applying .exe patch...')
+        exe_obj = EXE(path)
+
+        # Back up the .exe like attempt_unpack does, once it is known to be
+        #  the original one
+        def make_backup():
+            backup_dir = os.path.join(path, Unpacker.BACKUP_DIR)
+            os.makedirs(backup_dir, exist_ok=True)
+            exe_name = os.path.basename(exe_obj.get_path())
+            (strategy, _) = backup_file(
+                exe_obj.get_path(), os.path.join(backup_dir, exe_name),
+                Unpacker.BACKUP_STRATEGIES['modified']
+            )
+            log.que(f' - Backed up file {exe_name} ({strategy}).')
+
+        try:
+            patched = exe_obj.apply_patch(patch_file, before_write=make_backup)
+        except (AssertionError, OSError, struct.error) as e:
+            log.bad(str(e))
+            return False
+        if not patched:
+            log.que(' - The .exe is already patched.')
+        log.good('Done.')
+        return True
+
+    # Unpack the archives in the path into a .tar or .zip file instead of
+    #  the game directories, nothing else is changed
+    @staticmethod
+    def unpack_to_archive(filename, path='./'):
+        log.que('lightcyan', f'Unpacking archives to {filename}...')
+        filename = os.path.abspath(filename)
+        cwd = os.getcwd()
+        os.chdir(path)
+        try:
+            archive_list = Unpacker.get_archives()
+            if len(archive_list.keys()) == 0:
+                log.bad('No archives found.')
+                return False
+
+            if filename.lower().endswith('.zip'):
+                output = ZipSink(filename)
+            else:
+                output = TarSink(filename)
+            with output:
+                Unpacker.unpack_archives(archive_list, output=output)
+        finally:
+            os.chdir(cwd)
+        log.good('Done.')
+        return True
+
     # Locate and attempt to unpack any Dark Souls archive files in the path
     @staticmethod
     def attempt_unpack(path='./'):
         os.chdir(path)
         log.start_log()
+        if Unpacker.METRICS_INTERVAL is not None:
+            metrics.start_snapshots(
+                Unpacker.METRICS_FILE, Unpacker.METRICS_INTERVAL
+            )
 
         log.que('lightcyan', 'Preparing to unpack Dark Souls for modding...')
         log.que(' - Examining current directory...')
@@ -334,7 +1086,12 @@ MANIFEST:'''
         log.que(' - Examining Dark Souls executable...')
 
         exe_obj = EXE()
-        (exe_status, patch_location) = exe_obj.validate()
+        Unpacker.load_exe_fingerprints()
+        with metrics.phase('exe_validation'):
+            # a fingerprint match spares reading the whole .exe
+            (exe_status, patch_location) = exe_obj.validate(quick=True)
+        metrics.add('exe_validation', bytes_read=exe_obj.bytes_read)
+        Unpacker.record_exe_fingerprint(exe_obj)
         if exe_status not in ('ORIGINAL', 'PATCHED'):
             if exe_status == 'UNEXPECTED':
                 log.warn(
@@ -354,7 +1111,26 @@ MANIFEST:'''
         log.que(' - Examining data archives...')
         only_patch_exe = False
         archive_list = Unpacker.get_archives()
+        unpack_list = archive_list
+        journal = Journal(Unpacker.JOURNAL_FILE)
+        # archives moved into the backup directory by an interrupted unpack
+        #  have no other copy left, they are unpacked from there
+        from_backup = False
         if (
+            os.path.isdir(Unpacker.BACKUP_DIR) and journal.load() and
+            not journal.complete
+        ):
+            moved_list = {
+                name: archive for name, archive in
+                Unpacker.get_archives(Unpacker.BACKUP_DIR).items()
+                if name not in archive_list
+            }
+            if len(moved_list.keys()) > 0:
+                from_backup = True
+                unpack_list = {**archive_list, **moved_list}
+
+        if (
+            not from_backup and
             len(archive_list.keys()) == 0 and exe_status == 'PATCHED' and
             len(already_unpacked) == len(Unpacker.UNPACKED_DIRS) and
             os.path.isdir(Unpacker.BACKUP_DIR)
@@ -366,7 +1142,10 @@ MANIFEST:'''
             )
             wait_before_exit(0)
 
-        elif len(archive_list.keys()) == 0 and exe_status != 'PATCHED':
+        elif (
+            not from_backup and
+            len(archive_list.keys()) == 0 and exe_status != 'PATCHED'
+        ):
             log.info('white', 'No archives present, but unpatched .exe found.')
             log.warn(
                 'lightred',
@@ -378,9 +1157,36 @@ MANIFEST:'''
             else:
                 wait_before_exit(1)
 
+        resume = False
+        incremental = False
+        if from_backup:
+            log.info(
+                'white', 'A previous unpack was interrupted after moving',
+                'the archives into', Unpacker.BACKUP_DIR
+            )
+            resume = prompt('Resume it? Completed files are kept.')
+        elif (
+            not only_patch_exe and len(archive_list.keys()) > 0 and
+            journal.load()
+        ):
+            if not journal.complete:
+                log.info(
+                    'white', 'A previous unpack was interrupted',
+                    'before it completed.'
+                )
+                resume = prompt('Resume it? Completed files are kept.')
+            elif len(already_unpacked) > 0:
+                log.info(
+                    'white', 'The archives were unpacked before.',
+                    'Files that did not change can be kept.'
+                )
+                incremental = prompt('Only unpack changed files?')
+        # either way the existing directories are kept
+        keep_output = resume or incremental
+
         if not only_patch_exe:
             log.que(' - Examining directory contents...')
-            if len(already_unpacked) > 0:
+            if len(already_unpacked) > 0 and not keep_output:
                 log.info(
                     'white',
                     'The following destination directories already exist and',
@@ -406,7 +1212,10 @@ MANIFEST:'''
                     wait_before_exit(1)
 
         should_make_backups = True
-        if os.path.isdir(Unpacker.BACKUP_DIR):
+        if from_backup:
+            # the backup directory holds the archives to unpack
+            should_make_backups = False
+        elif os.path.isdir(Unpacker.BACKUP_DIR):
             log.warn(
                 'lightred', 'Backup directory',
                 'white', Unpacker.BACKUP_DIR,
@@ -422,7 +1231,7 @@ MANIFEST:'''
                 wait_before_exit(1)
 
         if not only_patch_exe:
-            if os.path.isdir(Unpacker.TEMP_DIR):
+            if os.path.isdir(Unpacker.TEMP_DIR) and not keep_output:
                 log.warn(
                     'lightred', 'Temporary unpacking directory',
                     'white', Unpacker.TEMP_DIR,
@@ -444,16 +1253,33 @@ MANIFEST:'''
             if not prompt('Answer Yes if unsure.'):
                 should_remove_temp_dir = False
 
+        files_to_backup = [exe_obj.get_path()]
+        archive_files = []
+        if not only_patch_exe:
+            archive_files = [f for a in archive_list.values() for f in a]
+            files_to_backup += archive_files
+            backup_size = 0
+            if should_make_backups:
+                backup_size = Unpacker.get_backup_size(
+                    files_to_backup, archive_files
+                )
+            Unpacker.check_disk_space(
+                {} if keep_output else unpack_list, backup_size
+            )
+
         log.good('Done.')
 
+        # archives moved into the backup directory are unpacked from there
         if should_make_backups:
             log.que('lightcyan', 'Making backups...')
-            files_to_backup = [exe_obj.get_path()]
-            if not only_patch_exe:
-                files_to_backup += [
-                    f for a in archive_list.values() for f in a
-                ]
-            Unpacker.make_backups(files_to_backup)
+            with metrics.phase('backups'):
+                moved_files = Unpacker.make_backups(
+                    files_to_backup, archive_files
+                )
+            unpack_list = {
+                name: [moved_files.get(f, f) for f in archive]
+                for name, archive in archive_list.items()
+            }
             log.good('Done.')
         else:
             log.que('lightcyan', 'Skipping backing-up important files.')
@@ -465,12 +1291,14 @@ MANIFEST:'''
             )
         else:
             log.que('lightcyan', 'Patching .exe file...')
-            exe_obj.patch(patch_location)
+            with metrics.phase('exe_patch'):
+                exe_obj.patch(patch_location)
             log.good('Done.')
             if exe_status == 'ORIGINAL':
                 log.que('lightcyan', 'Verifying modifications...')
                 (mod_exe_status, _) = exe_obj.validate()
                 if mod_exe_status == 'PATCHED':
+                    Unpacker.record_exe_fingerprint(exe_obj)
                     log.good('Done.')
                 else:
                     log.bad(
@@ -487,17 +1315,29 @@ MANIFEST:'''
             log.info('Aborting unpacking after .exe modification.')
             wait_before_exit(0)
 
-        if len(already_unpacked) > 0:
-            Unpacker.remove_unpacked_dirs(already_unpacked)
+        with metrics.phase('remove_unpacked_dirs'):
+            Unpacker.remove_leftover_deletions()
+            if len(already_unpacked) > 0 and not keep_output:
+                Unpacker.remove_unpacked_dirs(already_unpacked)
 
-        log.que('lightcyan', 'Unpacking archives...')
+        if resume:
+            log.que('lightcyan', 'Resuming unpacking archives...')
+        else:
+            log.que('lightcyan', 'Unpacking archives...')
         Unpacker.create_unpacked_dirs()
-        Unpacker.unpack_archives(archive_list)
+        Unpacker.unpack_journaled(
+            unpack_list, journal, direct=should_remove_temp_dir,
+            resume=resume, incremental=incremental
+        )
         log.good('Done')
 
-        Unpacker.remove_archives(archive_list)
-        if should_remove_temp_dir:
-            Unpacker.remove_temp_dir()
+        with metrics.phase('cleanup'):
+            Unpacker.remove_archives(archive_list)
+            if should_remove_temp_dir and os.path.isdir(Unpacker.TEMP_DIR):
+                Unpacker.remove_temp_dir()
+            Unpacker.wait_for_deletions()
 
+        metrics.stop_snapshots()
+        metrics.write_report(Unpacker.METRICS_FILE)
         log.good('Unpacking completed.')
         wait_before_exit(0)
@@ -0,0 +1,306 @@
+import argparse
+import contextlib
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from DSFileTool.logger import Logger
+from DSFileTool.sinks import NullSink
+from DSFileTool.unpacker import Unpacker
+from DSFileTool.file_formats.bdt import BDT
+from DSFileTool.file_formats.bnd import BND
+from DSFileTool.file_formats.dcx import DCX
+from DSFileTool.file_formats.exe import EXE
+from benchmarks.results import (
+    compare_results, format_comparison, get_environment,
+    get_parameter_changes, read_results, write_results
+)
+from benchmarks.synthetic import generate, make_exe
+
+# Time the unpacking of synthetic archives stage by stage and as a whole.
+#  Each case is run repeat times and its best time is kept, the throughput
+#  in MB/s is compared against a baseline to find regressions
+
+EXE_NAME = 'DARKSOULS.exe'
+
+
+# Silence the log and the progress lines of the unpacker
+@contextlib.contextmanager
+def quiet(verbose=False):
+    if verbose:
+        yield
+        return
+    log = Logger()
+    level = log.stream.level
+    log.stream.setLevel(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        # the queued records are filtered before the level is restored
+        log.flush()
+        log.stream.setLevel(level)
+
+
+# Get the (header, data) file pairs of the archives in the path
+def get_archive_files(data_path):
+    return sorted(Unpacker.get_archives(data_path).values())
+
+
+# Get the stored content of every top-level record
+def read_records(data_path):
+    records = []
+    for (header_file, data_file) in get_archive_files(data_path):
+        bdt = BDT(header_file, data_file)
+        with open(data_file, 'rb') as d:
+            for (name, (offset, size)) in bdt.get_file_dict().items():
+                d.seek(offset)
+                records.append((name, d.read(size)))
+    return records
+
+
+# Parse the BHD5 headers of the archives
+def bench_header_parsing(data_path, work_path):
+    headers = []
+    for (header_file, data_file) in get_archive_files(data_path):
+        with open(header_file, 'rb') as f:
+            headers.append((f.read(), data_file))
+
+    start = time.perf_counter()
+    record_count = sum(
+        len(BDT(header, data_file).get_file_dict())
+        for (header, data_file) in headers
+    )
+    seconds = time.perf_counter() - start
+    return sum(len(header) for (header, _) in headers), record_count, seconds
+
+
+# Decompress the DCX records of the archives
+def bench_dcx_inflate(data_path, work_path):
+    contents = [
+        content for (_, content) in read_records(data_path)
+        if DCX(content).is_dcx_file()
+    ]
+
+    start = time.perf_counter()
+    byte_count = sum(len(DCX(content).decompress()) for content in contents)
+    seconds = time.perf_counter() - start
+    return byte_count, len(contents), seconds
+
+
+# Unpack the BND containers of the archives, discarding their files
+def bench_bnd_unpack(data_path, work_path):
+    contents = []
+    for (_, content) in read_records(data_path):
+        if DCX(content).is_dcx_file():
+            content = DCX(content).decompress()
+        if BND(content, '', '').is_header_bnd():
+            contents.append(content)
+    base_path = os.path.join(work_path, Unpacker.TEMP_DIR)
+    n_base_path = os.path.join(base_path, Unpacker.TEMP_N_SUBDIR)
+
+    sink = NullSink()
+    start = time.perf_counter()
+    for content in contents:
+        bnd = BND(content, base_path, n_base_path)
+        bnd.sink = sink
+        bnd.unpack()
+    seconds = time.perf_counter() - start
+    return sum(len(content) for content in contents), sink.file_count, seconds
+
+
+# Unpack a copy of the archives to disk, as the unpacker does
+def bench_unpack_archives(data_path, work_path):
+    path = os.path.join(work_path, 'unpack')
+    byte_count = 0
+    os.makedirs(path)
+    for archive_files in get_archive_files(data_path):
+        for filename in archive_files:
+            shutil.copyfile(
+                filename, os.path.join(path, os.path.basename(filename))
+            )
+            byte_count += os.path.getsize(filename)
+
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        archive_list = Unpacker.get_archives()
+        start = time.perf_counter()
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_archives(archive_list)
+        seconds = time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    file_count = sum(len(files) for (_, _, files) in os.walk(path))
+    shutil.rmtree(path)
+    return byte_count, file_count, seconds
+
+
+# Validate and patch a copy of the dummy executable
+def bench_exe_patch(data_path, work_path):
+    path = os.path.join(work_path, 'exe')
+    os.makedirs(path)
+    shutil.copyfile(
+        os.path.join(data_path, EXE_NAME), os.path.join(path, EXE_NAME)
+    )
+
+    start = time.perf_counter()
+    exe = EXE(path, EXE_NAME)
+    (status, patch_location) = exe.validate()
+    err = f'Unexpected status of the dummy executable: {status}'
+    assert status == 'UNEXPECTED', err
+    exe.patch(patch_location)
+    seconds = time.perf_counter() - start
+
+    byte_count = os.path.getsize(exe.get_path())
+    shutil.rmtree(path)
+    return byte_count, 1, seconds
+
+
+CASES = {
+    'header_parsing': bench_header_parsing,
+    'dcx_inflate': bench_dcx_inflate,
+    'bnd_unpack': bench_bnd_unpack,
+    'unpack_archives': bench_unpack_archives,
+    'exe_patch': bench_exe_patch,
+}
+
+
+# Run a case repeat times, keeping the best time
+def run_case(case, data_path, repeat=3, verbose=False):
+    times = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as work_path, quiet(verbose):
+            (byte_count, item_count, seconds) = case(data_path, work_path)
+        times.append(seconds)
+    seconds = min(times)
+    return {
+        'bytes': byte_count,
+        'items': item_count,
+        'seconds': seconds,
+        'times': times,
+        'mb_per_s': byte_count / seconds / 2 ** 20 if seconds > 0 else 0.0,
+    }
+
+
+# Generate the archives and the executable, unless already there
+def prepare_data(data_path, args):
+    if len(Unpacker.get_archives(data_path)) == 0:
+        (record_count, byte_count) = generate(
+            data_path, args.records, args.archives, args.scale, args.seed
+        )
+        print(
+            f'Generated {record_count} records in {args.archives} ' +
+            f'archive(s), {byte_count / 2 ** 20:.1f} MB'
+        )
+    if not os.path.isfile(os.path.join(data_path, EXE_NAME)):
+        make_exe(os.path.join(data_path, EXE_NAME), seed=args.seed)
+
+
+# Run the selected cases, printing each result
+def run(data_path, args):
+    prepare_data(data_path, args)
+    results = {
+        'environment': get_environment(),
+        'parameters': {
+            'records': args.records,
+            'archives': args.archives,
+            'scale': args.scale,
+            'seed': args.seed,
+        },
+        'cases': {},
+    }
+    for name in args.cases:
+        result = run_case(CASES[name], data_path, args.repeat, args.verbose)
+        results['cases'][name] = result
+        print(
+            f'{name:<24} {result["mb_per_s"]:>10.2f} MB/s ' +
+            f'{result["seconds"]:>9.3f} s {result["items"]:>8} item(s)'
+        )
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.e2e',
+        description='Benchmark unpacking synthetic Dark Souls archives'
+    )
+    parser.add_argument(
+        '--cases', nargs='+', choices=list(CASES), default=list(CASES),
+        help='cases to run, all by default'
+    )
+    parser.add_argument(
+        '--records', type=int, default=500,
+        help='approximate number of top-level records'
+    )
+    parser.add_argument(
+        '--archives', type=int, default=4,
+        help='number of BHD5/BDT archives'
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1.0,
+        help='factor applied to the size of the generated files'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='runs of each case, the best one is kept'
+    )
+    parser.add_argument(
+        '--data', metavar='DIR',
+        help='keep the generated files in DIR and reuse them'
+    )
+    parser.add_argument(
+        '--output', metavar='FILE', help='write the results to FILE'
+    )
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help='compare the results with those written to FILE'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.1,
+        help='slowdown reported as a regression (default: 0.1 = 10%%)'
+    )
+    parser.add_argument(
+        '--verbose', action='store_true', help='show the unpacker output'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.data:
+        results = run(args.data, args)
+    else:
+        with tempfile.TemporaryDirectory() as data_path:
+            results = run(data_path, args)
+
+    if args.output:
+        write_results(args.output, results)
+        print(f'Results written to {args.output}')
+
+    if args.baseline:
+        baseline = read_results(args.baseline)
+        changes = get_parameter_changes(baseline, results)
+        if len(changes) > 0:
+            print(
+                'Warning: the baseline was run with different ' +
+                f'parameters ({", ".join(changes)})'
+            )
+        rows = compare_results(
+            baseline, results, 'mb_per_s', tolerance=args.tolerance
+        )
+        print(f'Compared with {args.baseline}:')
+        for line in format_comparison(rows, 'MB/s'):
+            print(line)
+        if any(regressed for (*_, regressed) in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.results import (
+    compare_results, get_environment, read_results, summarize_times,
+    write_results
+)
+
+# Time the import of the package in fresh interpreters with -X importtime,
+#  and check that the modules only needed by some runs stay unloaded
+
+MODULES = [
+    'DSFileTool',
+    'DSFileTool.file_formats.exe',
+    'DSFileTool.unpacker',
+    'main',
+]
+# Modules the imports above must not load, they are imported on first use
+DEFERRED_MODULES = ['numpy', 'huepy', 'cProfile', 'tracemalloc']
+# Imports reported as the slowest of each module
+SLOWEST_COUNT = 5
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Parse the -X importtime lines to (name, self, cumulative) in seconds
+def parse_import_times(output):
+    import_times = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if not fields[0].strip().isdigit():
+            # the column titles
+            continue
+        import_times.append((
+            fields[2].strip(), int(fields[0]) / 1e6, int(fields[1]) / 1e6
+        ))
+    return import_times
+
+
+# Import a module in a new interpreter, returns its cumulative import
+#  time, the import times of every module and the deferred modules loaded
+def import_module(module):
+    code = f'import sys\nimport {module}\n' + \
+        f'print(" ".join(m for m in {DEFERRED_MODULES!r} ' + \
+        'if m in sys.modules))'
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT_PATH, capture_output=True, text=True, check=True
+    )
+    import_times = parse_import_times(process.stderr)
+    seconds = [
+        cumulative for (name, _, cumulative) in import_times
+        if name == module
+    ][-1]
+    return seconds, import_times, process.stdout.split()
+
+
+# Import a module repeat times, after one import writing the bytecode caches
+def measure(module, repeat=10):
+    import_module(module)
+    times = []
+    for _ in range(repeat):
+        (seconds, import_times, loaded) = import_module(module)
+        times.append(seconds)
+    slowest = sorted(
+        ((name, self_time) for (name, self_time, _) in import_times),
+        key=lambda import_time: import_time[1], reverse=True
+    )[:SLOWEST_COUNT]
+    return {
+        **summarize_times(times),
+        'slowest': slowest,
+        'deferred_loaded': loaded,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.import_time',
+        description='Benchmark the import time of the package'
+    )
+    parser.add_argument(
+        '--modules', nargs='+', default=MODULES,
+        help='modules to import, the package and the entry point by default'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=10,
+        help='imports of each module'
+    )
+    parser.add_argument(
+        '--output', metavar='FILE', help='write the results to FILE'
+    )
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help='compare the results with those written to FILE'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.2,
+        help='slowdown reported as a regression (default: 0.2 = 20%%)'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = {'environment': get_environment(), 'cases': {}}
+    failed = False
+    for module in args.modules:
+        result = measure(module, args.repeat)
+        results['cases'][module] = result
+        slowest = ', '.join(
+            f'{name} {self_time * 1000:.1f}'
+            for (name, self_time) in result['slowest']
+        )
+        print(
+            f'{module:<28} {result["median"] * 1000:>8.1f} ms ' +
+            f'IQR {result["iqr"] * 1000:>6.1f} ms (slowest: {slowest})'
+        )
+        if len(result['deferred_loaded']) > 0:
+            print(
+                f'{module} loaded deferred module(s): ' +
+                ', '.join(result['deferred_loaded'])
+            )
+            failed = True
+
+    if args.output:
+        write_results(args.output, results)
+        print(f'Results written to {args.output}')
+
+    if args.baseline:
+        rows = compare_results(
+            read_results(args.baseline), results, 'median',
+            higher_is_better=False, tolerance=args.tolerance
+        )
+        print(f'Compared with {args.baseline}:')
+        for (name, old, new, change, regressed) in rows:
+            status = 'REGRESSED' if regressed else 'ok'
+            print(
+                f'{name:<28} {old * 1000:>8.1f} -> {new * 1000:>8.1f} ms ' +
+                f'{change:>+8.1%}  {status}'
+            )
+            failed = failed or regressed
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
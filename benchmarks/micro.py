@@ -0,0 +1,242 @@
+import argparse
+import random
+import sys
+import timeit
+
+from DSFileTool.defaults import FILENAMES
+from DSFileTool.sinks import NullSink
+from DSFileTool.tools import (
+    build_name_hash_dict, get_hash_from_string, get_hashes_from_strings
+)
+from DSFileTool.file_formats.base import BaseFile
+from DSFileTool.file_formats.bdt import BDT
+from DSFileTool.file_formats.bnd import BND
+from benchmarks.results import (
+    compare_results, get_environment, get_parameter_changes, read_results,
+    summarize_times, write_results
+)
+from benchmarks.synthetic import (
+    BDT_MAGIC, BND_FLAGS, make_bhd5_pair, make_bhd_pair, make_bnd
+)
+
+# Time the per-record loops of the unpacker on fixed synthetic inputs. Each
+#  case is run in loops long enough to be timed reliably, repeat times, and
+#  reported by the median and interquartile range of the time per call
+
+SEED = 0
+# Names hashed by the hashing case
+HASH_NAME_COUNT = 1000
+# Records in the generated headers and containers
+RECORD_COUNT = 200
+# Size of the files in the generated containers
+MEMBER_SIZE = 64
+
+
+# Get a fixed sample of FILENAMES
+def get_names(count):
+    return random.Random(SEED).sample(sorted(FILENAMES), count)
+
+
+# Get files of fixed names and content to pack in a container
+def get_members(count):
+    return [
+        (f'N:\\FRPG\\data\\INTERROOT_win32\\chr\\c{i:04}\\c{i:04}.flver',
+         bytes([i % 256]) * MEMBER_SIZE)
+        for i in range(count)
+    ]
+
+
+# Hash a sample of the names
+def case_get_hash_from_string():
+    names = get_names(HASH_NAME_COUNT)
+    return lambda: [get_hash_from_string(name) for name in names]
+
+
+# Hash a sample of the names at once
+def case_get_hashes_from_strings():
+    names = get_names(HASH_NAME_COUNT)
+    return lambda: get_hashes_from_strings(names)
+
+
+# Hash all the names into the lookup dictionary
+def case_build_name_hash_dict():
+    return build_name_hash_dict
+
+
+# Read the names of a BHD3 header
+def case_extract_zero_str():
+    (header, _) = make_bhd_pair(get_members(RECORD_COUNT))
+    base_file = BaseFile()
+    base_file.content = header
+    names_offset = header.index(b'N:')
+    offsets = [names_offset]
+    for _ in range(RECORD_COUNT - 1):
+        offsets.append(header.index(b'\x00', offsets[-1]) + 1)
+    return lambda: [base_file.extract_zero_str(offset) for offset in offsets]
+
+
+# Check the magic of a BDT data file
+def case_assert_bytes():
+    base_file = BaseFile()
+    base_file.content = BDT_MAGIC
+    return lambda: base_file.assert_bytes(0, BDT_MAGIC)
+
+
+# Parse a BHD3 header
+def case_parse_bhd_header_to_dict():
+    (header, _) = make_bhd_pair(get_members(RECORD_COUNT))
+    bdt = BDT(header, '')
+    return bdt.parse_bhd_header_to_dict
+
+
+# Parse a BHD5 header, building the name hash dictionary
+def case_parse_bhd5_header_to_dict():
+    records = [(name, b'') for name in get_names(RECORD_COUNT)]
+    (header, _) = make_bhd5_pair(records)
+    bdt = BDT(header, '')
+    return bdt.parse_bhd5_header_to_dict
+
+
+# Decode the records of a container packed with the given flag
+def get_bnd_case(flag):
+    def case_bnd_unpack():
+        bnd = BND(make_bnd(get_members(RECORD_COUNT), flag), 'DATA', 'N')
+        bnd.sink = NullSink()
+        return bnd.unpack
+    return case_bnd_unpack
+
+
+# name -> function returning the callable to time, called once
+CASES = {
+    'get_hash_from_string': case_get_hash_from_string,
+    'get_hashes_from_strings': case_get_hashes_from_strings,
+    'build_name_hash_dict': case_build_name_hash_dict,
+    'extract_zero_str': case_extract_zero_str,
+    'assert_bytes': case_assert_bytes,
+    'parse_bhd_header_to_dict': case_parse_bhd_header_to_dict,
+    'parse_bhd5_header_to_dict': case_parse_bhd5_header_to_dict,
+    **{
+        f'bnd_unpack_{flag:#x}': get_bnd_case(flag) for flag in BND_FLAGS
+    },
+}
+
+
+# Time a callable, returns the statistics of the time per call
+def time_call(call, repeat=7, min_time=0.2):
+    timer = timeit.Timer(call)
+    # enough loops for a repetition to last min_time
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+    times = [t / loops for t in timer.repeat(repeat, loops)]
+    return {'loops': loops, **summarize_times(times)}
+
+
+# Format a duration with a unit fitting its magnitude
+def format_time(seconds):
+    for (unit, scale) in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
+
+
+# Run the selected cases, printing each result
+def run(args):
+    results = {
+        'environment': get_environment(),
+        'parameters': {
+            'seed': SEED,
+            'hash_names': HASH_NAME_COUNT,
+            'records': RECORD_COUNT,
+        },
+        'cases': {},
+    }
+    for name in args.cases:
+        result = time_call(CASES[name](), args.repeat, args.min_time)
+        results['cases'][name] = result
+        print(
+            f'{name:<28} {format_time(result["median"]):>12} ' +
+            f'IQR {format_time(result["iqr"]):>12} ' +
+            f'({result["repeat"]} x {result["loops"]} loops)'
+        )
+    return results
+
+
+# Compare the medians of two result files. A slowdown beyond the tolerance
+#  is only a regression when the interquartile ranges do not overlap
+def compare(baseline_file, current_file, tolerance):
+    baseline = read_results(baseline_file)
+    current = read_results(current_file)
+    changes = get_parameter_changes(baseline, current)
+    if len(changes) > 0:
+        print(
+            'Warning: the baseline was run with different ' +
+            f'parameters ({", ".join(changes)})'
+        )
+    regressed = False
+    rows = compare_results(
+        baseline, current, 'median', higher_is_better=False,
+        tolerance=tolerance
+    )
+    for (name, old, new, change, slower) in rows:
+        old_case = baseline['cases'][name]
+        new_case = current['cases'][name]
+        if not slower:
+            status = 'ok'
+        elif new_case['q1'] <= old_case['q3']:
+            status = 'noise'
+        else:
+            status = 'REGRESSED'
+            regressed = True
+        print(
+            f'{name:<28} {format_time(old):>12} -> ' +
+            f'{format_time(new):>12} {change:>+8.1%}  {status}'
+        )
+    return 1 if regressed else 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.micro',
+        description='Benchmark the hashing and header parsing loops'
+    )
+    parser.add_argument(
+        '--cases', nargs='+', choices=list(CASES), default=list(CASES),
+        help='cases to run, all by default'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=7,
+        help='timed repetitions of each case'
+    )
+    parser.add_argument(
+        '--min-time', type=float, default=0.2,
+        help='minimum duration of a repetition in seconds'
+    )
+    parser.add_argument(
+        '--output', metavar='FILE', help='write the results to FILE'
+    )
+    parser.add_argument(
+        '--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+        help='compare two result files instead of running the cases'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.05,
+        help='slowdown reported as a regression (default: 0.05 = 5%%)'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.compare:
+        return compare(*args.compare, args.tolerance)
+
+    results = run(args)
+    if args.output:
+        write_results(args.output, results)
+        print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
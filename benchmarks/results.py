@@ -0,0 +1,86 @@
+import json
+import os
+import platform
+import statistics
+import sys
+
+
+# Describe the machine the benchmarks ran on
+def get_environment():
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# Summarize repeated timings by their median and interquartile range
+def summarize_times(times):
+    if len(times) > 1:
+        (q1, _, q3) = statistics.quantiles(times, n=4)
+    else:
+        (q1, q3) = (times[0], times[0])
+    return {
+        'repeat': len(times),
+        'median': statistics.median(times),
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'min': min(times),
+        'times': times,
+    }
+
+
+# Write benchmark results as JSON, replacing the previous ones at once
+def write_results(filename, results):
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    os.replace(temp_filename, filename)
+
+
+def read_results(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Compare the cases of two results by the value of key, returns a row of
+#  (case, baseline value, current value, relative change, regressed) for
+#  each case found in both. A case regressed when it got worse by more than
+#  tolerance, with higher values better unless higher_is_better is unset
+def compare_results(baseline, current, key, higher_is_better=True,
+                    tolerance=0.1):
+    rows = []
+    for name, case in current['cases'].items():
+        baseline_case = baseline['cases'].get(name)
+        if baseline_case is None:
+            continue
+        (old, new) = (baseline_case[key], case[key])
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better else change
+        rows.append((name, old, new, change, worse > tolerance))
+    return rows
+
+
+# Format the rows of compare_results as lines of text
+def format_comparison(rows, unit):
+    lines = []
+    for (name, old, new, change, regressed) in rows:
+        status = 'REGRESSED' if regressed else 'ok'
+        lines.append(
+            f'{name:<24} {old:>12.3f} -> {new:>12.3f} {unit:<6} ' +
+            f'{change:>+8.1%}  {status}'
+        )
+    return lines
+
+
+# Get the parameters that differ between two results, which makes their
+#  timings incomparable
+def get_parameter_changes(baseline, current):
+    old = baseline.get('parameters', {})
+    new = current.get('parameters', {})
+    return sorted(
+        name for name in set(old) | set(new) if old.get(name) != new.get(name)
+    )
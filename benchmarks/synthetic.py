@@ -0,0 +1,331 @@
+import argparse
+import os
+import random
+import struct
+
+from DSFileTool.defaults import FILENAMES, c4110
+from DSFileTool.tools import get_hash_from_string
+from DSFileTool.file_formats.bdt import BDT
+from DSFileTool.file_formats.dcx import DCX
+from DSFileTool.file_formats.exe import EXE
+
+# Generate Dark Souls-like archives from made up content, so the unpacking
+#  can be measured without the game data. Top-level BHD5/BDT archives hold
+#  records named after FILENAMES: DCX-compressed BND3 containers of every
+#  flag variant, *chrbnd containers whose *chrtpfbhd header pairs with a
+#  top-level *chrtpfbdt (including the c4110 one missing from the game),
+#  *tpfbhd/*tpfbdt and *hkxbhd/*hkxbdt pairs and plain files
+
+BND_FLAGS = [0x74, 0x54, 0x70]
+BHD_FLAGS = [0x74, 0x54]
+BHD_MAGIC = b'BHF307D7R6\x00\x00'
+BDT_MAGIC = b'BDF307D7R6\x00\x00\x00\x00\x00\x00'
+BND_MAGIC = b'BND307D7R6\x00\x00'
+N_PATH = 'N:\\FRPG\\data\\INTERROOT_win32'
+
+# Top-level records per BHD5 bin
+BIN_RECORDS = 8
+# Mean size of the generated files before scaling
+MEAN_SIZE = 32 * 1024
+# Number of files in the generated containers
+MEMBER_COUNTS = (2, 8)
+MEMBER_EXTS = ['flver', 'tpf', 'hkx', 'anc']
+# Size of the dummy executable, which has to cover all PATCH_LOCATIONS
+EXE_SIZE = 16 * 1024 * 1024
+# Occurrences of each PATCH_REPLACEMENTS string in the dummy executable
+EXE_REPLACEMENTS = 4
+
+
+# Get the extension of a name without .dcx
+def get_ext(name):
+    if name.endswith('.dcx'):
+        name = name[:-4]
+    return os.path.splitext(name)[1][1:]
+
+
+# Get the name of a record without its directory and extensions
+def get_stem(name):
+    return os.path.basename(name).split('.')[0]
+
+
+# Get a random file size, scaled
+def get_size(rng, scale):
+    return 16 + int(rng.expovariate(1 / MEAN_SIZE) * scale)
+
+
+# Get content of the given size, half random bytes and half a repeated
+#  pattern so that it compresses like game files
+def make_payload(rng, size):
+    random_size = size // 2
+    content = rng.getrandbits(8 * random_size).to_bytes(random_size, 'little')
+    word = rng.getrandbits(8 * 16).to_bytes(16, 'little')
+    return (content + word * (size // 16 + 1))[:size]
+
+
+# Compress the content if the name asks for it
+def make_stored_content(name, content):
+    if name.endswith('.dcx'):
+        return DCX(content).compress()
+    return content
+
+
+# Pack (name, content) files into a BND3 container
+def make_bnd(files, flag=0x74):
+    record_format = '<IIIII' if flag == 0x70 else '<IIIIII'
+    names = [name.encode('shift_jis') + b'\x00' for (name, _) in files]
+    names_offset = 0x20 + len(files) * struct.calcsize(record_format)
+    data_offset = names_offset + sum(len(name) for name in names)
+
+    header = bytearray(BND_MAGIC + struct.pack('<III', flag, len(files), 0))
+    header += b'\x00' * (0x20 - len(header))
+    for i, (_, content) in enumerate(files):
+        record = (0x40, len(content), data_offset, i, names_offset)
+        if flag != 0x70:
+            record += (len(content),)
+        header += struct.pack(record_format, *record)
+        names_offset += len(names[i])
+        data_offset += len(content)
+    return b''.join([header] + names + [content for (_, content) in files])
+
+
+# Pack (name, content) files into a BHF3 header and BDT data file
+def make_bhd_pair(files, flag=0x74):
+    names = [name.encode('shift_jis') + b'\x00' for (name, _) in files]
+    names_offset = 0x20 + len(files) * struct.calcsize('<IIIIII')
+
+    header = bytearray(BHD_MAGIC + struct.pack('<II', flag, len(files)))
+    header += b'\x00' * (0x20 - len(header))
+    data = bytearray(BDT_MAGIC)
+    for i, (_, content) in enumerate(files):
+        header += struct.pack(
+            '<IIIIII', 0x40, len(content), len(data), i, names_offset,
+            len(content)
+        )
+        names_offset += len(names[i])
+        data += content
+    return b''.join([header] + names), bytes(data)
+
+
+# Pack (name, content) records into a BHD5 header and BDT archive, the
+#  records are spread over the bins by name hash
+def make_bhd5_pair(records):
+    bin_cnt = max(1, len(records) // BIN_RECORDS)
+    bins = [[] for _ in range(bin_cnt)]
+    data = bytearray(BDT_MAGIC)
+    for name, content in records:
+        record_hash = get_hash_from_string(name)
+        bins[record_hash % bin_cnt].append(
+            (record_hash, len(content), len(data))
+        )
+        data += content
+
+    bin_offset = 0x18
+    record_offset = bin_offset + bin_cnt * struct.calcsize('<II')
+    header = bytearray(b'BHD5\xFF\x00\x00\x00\x01\x00\x00\x00')
+    header += struct.pack('<III', 0, bin_cnt, bin_offset)
+    for records_bin in bins:
+        header += struct.pack('<II', len(records_bin), record_offset)
+        record_offset += len(records_bin) * struct.calcsize('<IIII')
+    for records_bin in bins:
+        for record in records_bin:
+            header += struct.pack('<IIII', *record, 0)
+    struct.pack_into('<I', header, 12, len(header))
+    return bytes(header), bytes(data)
+
+
+# Make the files of a container, named like the game names them
+def make_members(rng, name, scale):
+    stem = get_stem(name)
+    directory = os.path.dirname(name).replace('/', '\\')
+    files = []
+    for i in range(rng.randint(*MEMBER_COUNTS)):
+        ext = MEMBER_EXTS[i % len(MEMBER_EXTS)]
+        member_name = f'{N_PATH}{directory}\\{stem}\\{stem}_{i}.{ext}'
+        files.append((member_name, make_payload(rng, get_size(rng, scale))))
+    return files
+
+
+# Make the files of a *tpfbdt or *hkxbdt, named like the game names them
+def make_pair_members(rng, name, scale):
+    stem = get_stem(name)
+    ext = 'tpf.dcx' if 'tpf' in get_ext(name) else 'hkx'
+    files = []
+    for i in range(rng.randint(*MEMBER_COUNTS)):
+        member_name = f'{stem}_{i:04}.{ext}'
+        content = make_payload(rng, get_size(rng, scale))
+        files.append((member_name, make_stored_content(member_name, content)))
+    return files
+
+
+# Make a *chrtpfbdt matching the header given in c4110
+def make_c4110_data(rng):
+    bdt = BDT(c4110['DATA'], '')
+    records = sorted(bdt.get_file_dict().values())
+    size = records[-1][0] + records[-1][1]
+    data = bytearray(size)
+    data[:len(BDT_MAGIC)] = BDT_MAGIC
+    for (record_offset, record_size) in records:
+        data[record_offset:record_offset + record_size] = \
+            make_payload(rng, record_size)
+    return bytes(data)
+
+
+# Group the names that have to be generated together: a header and its data
+#  file, and a *chrbnd with the *chrtpfbdt its header pairs with
+def get_name_groups():
+    groups = {}
+    for name in FILENAMES:
+        ext = get_ext(name)
+        if ext == 'chrtpfbdt':
+            key = name[:-len('tpfbdt')] + 'bnd.dcx'
+        elif ext[-3:] in ('bhd', 'bdt'):
+            key = name[:-3]
+        else:
+            key = name
+        groups.setdefault(key, []).append(name)
+    return sorted(groups.values())
+
+
+# Make the stored content of the records of a group of names
+def make_group(rng, group, scale, flag_index):
+    records = []
+    chrtpfbdt = [name for name in group if name.endswith('.chrtpfbdt')]
+    for name in group:
+        ext = get_ext(name)
+        if ext == 'chrtpfbdt':
+            continue
+        elif ext[-3:] == 'bnd':
+            files = make_members(rng, name, scale)
+            if ext == 'chrbnd' and chrtpfbdt and get_stem(name) != 'c4110':
+                (header, data) = make_bhd_pair(
+                    make_pair_members(rng, chrtpfbdt[0], scale),
+                    BHD_FLAGS[flag_index % len(BHD_FLAGS)]
+                )
+                stem = get_stem(name)
+                files.append(
+                    (f'{N_PATH}\\chr\\{stem}\\{stem}.chrtpfbhd', header)
+                )
+                records.append((chrtpfbdt[0], data))
+            content = make_bnd(files, BND_FLAGS[flag_index % len(BND_FLAGS)])
+            records.append((name, make_stored_content(name, content)))
+        elif ext[-3:] == 'bhd':
+            data_name = name[:-3] + 'bdt'
+            (header, data) = make_bhd_pair(
+                make_pair_members(rng, name, scale),
+                BHD_FLAGS[flag_index % len(BHD_FLAGS)]
+            )
+            records.append((name, header))
+            records.append((data_name, data))
+        elif ext[-3:] == 'bdt':
+            continue
+        else:
+            content = make_payload(rng, get_size(rng, scale))
+            records.append((name, make_stored_content(name, content)))
+
+    # the header of c4110.chrtpfbdt is the one written by the unpacker
+    for name in chrtpfbdt:
+        if get_stem(name) == 'c4110':
+            records.append((name, make_c4110_data(rng)))
+    return records
+
+
+# Write archives holding about record_count records to the path, returns the
+#  number of records and bytes written
+def generate(path, record_count=500, archive_count=4, scale=1.0, seed=0):
+    rng = random.Random(seed)
+    groups = get_name_groups()
+    rng.shuffle(groups)
+    # the c4110 quirk is always part of the archives
+    groups.sort(key=lambda group: '/chr/c4110.chrbnd.dcx' not in group)
+
+    records = []
+    for (i, group) in enumerate(groups):
+        if len(records) >= record_count:
+            break
+        records.extend(make_group(rng, group, scale, i))
+
+    try:
+        os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+    byte_count = 0
+    for i in range(archive_count):
+        (header, data) = make_bhd5_pair(records[i::archive_count])
+        for (ext, content) in (('bhd5', header), ('bdt', data)):
+            with open(os.path.join(path, f'dvdbnd{i}.{ext}'), 'wb') as f:
+                f.write(content)
+            byte_count += len(content)
+    return len(records), byte_count
+
+
+# Write an executable the EXE class can validate and patch: it holds the
+#  original lookup at the Steam patch location and the PATCH_REPLACEMENTS
+#  strings, but matches none of the known checksums
+def make_exe(filename, size=EXE_SIZE, seed=0):
+    rng = random.Random(seed)
+    content = bytearray(
+        rng.getrandbits(8 * size).to_bytes(size, 'little')
+    )
+    lookup_offset = EXE.PATCH_LOCATIONS['steam'] - 7
+    lookup = EXE.PATCH_LOOKUPS['ORIGINAL']
+    content[lookup_offset:lookup_offset + len(lookup)] = lookup
+
+    # the strings go to distinct slots away from the lookup
+    slot_size = 64
+    slots = [
+        slot for slot in range(size // slot_size)
+        if abs(slot * slot_size - lookup_offset) > slot_size
+    ]
+    strings = [
+        find_str
+        for (find_str, _) in EXE.PATCH_REPLACEMENTS.values()
+        for _ in range(EXE_REPLACEMENTS)
+    ]
+    for (slot, find_str) in zip(rng.sample(slots, len(strings)), strings):
+        offset = slot * slot_size
+        content[offset:offset + len(find_str)] = find_str
+
+    with open(filename, 'wb') as f:
+        f.write(content)
+    return size
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.synthetic',
+        description='Write synthetic Dark Souls archives and executable'
+    )
+    parser.add_argument('path', help='directory to write the files to')
+    parser.add_argument(
+        '--records', type=int, default=500,
+        help='approximate number of top-level records'
+    )
+    parser.add_argument(
+        '--archives', type=int, default=4,
+        help='number of BHD5/BDT archives'
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1.0,
+        help='factor applied to the size of the generated files'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--exe', action='store_true',
+        help='also write a dummy DARKSOULS.exe'
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    (record_count, byte_count) = generate(
+        args.path, args.records, args.archives, args.scale, args.seed
+    )
+    print(
+        f'Wrote {record_count} records in {args.archives} archive(s), ' +
+        f'{byte_count / 2 ** 20:.1f} MB'
+    )
+    if args.exe:
+        make_exe(os.path.join(args.path, 'DARKSOULS.exe'), seed=args.seed)
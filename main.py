@@ -1,9 +1,99 @@
+import argparse
+import sys
+
 from DSFileTool.logger import Logger
+from DSFileTool.metrics import Metrics
 from DSFileTool.unpacker import Unpacker
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='UnpackDarkSoulsExtended')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--export-patch', metavar='FILE',
+        help='write the .exe patch as a binary diff and exit'
+    )
+    group.add_argument(
+        '--apply-patch', metavar='FILE',
+        help='apply a binary diff made with --export-patch and exit'
+    )
+    group.add_argument(
+        '--unpack-to', metavar='FILE',
+        help='unpack the archives into a .tar or .zip FILE and exit'
+    )
+    parser.add_argument(
+        '--deduplicate', action='store_true',
+        help='hard-link identical unpacked files to a single copy'
+    )
+    parser.add_argument(
+        '--verify-content', action='store_true',
+        help='when resuming or unpacking only changed files, also compare '
+        'the checksum of the archive records of the files kept'
+    )
+    parser.add_argument(
+        '--metrics-interval', metavar='SECONDS', type=float,
+        help='rewrite the timing report every SECONDS during the run'
+    )
+    parser.add_argument(
+        '--profile', metavar='FILE',
+        help='write a cProfile profile of the run to FILE (.pstats)'
+    )
+    parser.add_argument(
+        '--profile-memory', metavar='FILE',
+        help='trace memory allocations and write the top ones to FILE'
+    )
+    parser.add_argument(
+        '--profile-top', metavar='N', type=int, default=25,
+        help='number of allocations listed by --profile-memory'
+    )
+    parser.add_argument(
+        '--profile-scope', metavar='SCOPE',
+        help='only profile a stage (bdt, bnd, pair) or an archive'
+    )
+    return parser.parse_args()
+
+
+# Run the unpacker, profiled when asked to
+def run(args):
+    if not args.profile and not args.profile_memory:
+        Unpacker.attempt_unpack()
+        return
+
+    # cProfile and tracemalloc are only imported when profiling
+    from DSFileTool.profiling import Profiler
+    profiler = Profiler(args.profile_scope, bool(args.profile_memory))
+    Metrics().profiler = profiler
+    try:
+        if args.profile_scope is None:
+            with profiler.profile_scope():
+                Unpacker.attempt_unpack()
+        else:
+            # the phases in scope are profiled through Metrics().profiler
+            Unpacker.attempt_unpack()
+    finally:
+        log = Logger()
+        if args.profile and profiler.write_stats(args.profile):
+            log.info('white', 'Profile written to', args.profile)
+        if args.profile_memory and profiler.write_memory_report(
+            args.profile_memory, args.profile_top
+        ):
+            log.info('white', 'Memory report written to', args.profile_memory)
+
+
 if __name__ == '__main__':
+    args = parse_args()
+    Unpacker.DEDUPLICATE = args.deduplicate
+    Unpacker.VERIFY_STORED_CONTENT = args.verify_content
+    Unpacker.METRICS_INTERVAL = args.metrics_interval
     try:
-        Unpacker.attempt_unpack()
+        if args.export_patch:
+            sys.exit(0 if Unpacker.export_exe_patch(args.export_patch) else 1)
+        elif args.apply_patch:
+            sys.exit(0 if Unpacker.apply_exe_patch(args.apply_patch) else 1)
+        elif args.unpack_to:
+            sys.exit(0 if Unpacker.unpack_to_archive(args.unpack_to) else 1)
+        else:
+            run(args)
     except KeyboardInterrupt:
         log = Logger()
         print('')
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from DSFileTool.catalog import Catalog
+from DSFileTool.tools import get_digest
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import N_PATH, make_bhd5_pair, make_bnd
+
+BND_NAME = '/other/default.rumblebnd'
+MEMBERS = [('a.rumble', b'alpha'), ('b.rumble', b'beta')]
+
+
+# Get the columns of catalog rows by name
+def get_rows(catalog, name):
+    columns = [
+        'name', 'record', 'parent', 'archive', 'offset', 'stored_size',
+        'size', 'dcx', 'path', 'digest'
+    ]
+    return [dict(zip(columns, row)) for row in catalog.find(name)]
+
+
+class CatalogUnpackTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.path = os.path.realpath(tempfile.mkdtemp())
+        os.chdir(self.path)
+        self.bnd = make_bnd([
+            (f'{N_PATH}\\other\\{name}', content)
+            for (name, content) in MEMBERS
+        ])
+        (header, data) = make_bhd5_pair([(BND_NAME, self.bnd)])
+        for (ext, content) in (('bhd5', header), ('bdt', data)):
+            with open(f'dvdbnd0.{ext}', 'wb') as f:
+                f.write(content)
+        self.catalog = Catalog(Unpacker.CATALOG_FILE)
+        self.catalog.open()
+
+    def tearDown(self):
+        self.catalog.close()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.path)
+
+    # Unpack the archive into the catalog and check the rows of the BND
+    #  and its members
+    def check_rows(self, direct):
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_archives(
+            Unpacker.get_archives(), direct=direct, catalog=self.catalog
+        )
+
+        [bnd_row] = get_rows(self.catalog, os.path.basename(BND_NAME))
+        self.assertEqual(bnd_row['record'], BND_NAME)
+        self.assertEqual(bnd_row['parent'], 'dvdbnd0.bdt')
+        self.assertEqual(bnd_row['size'], len(self.bnd))
+        self.assertEqual(bnd_row['digest'], get_digest(self.bnd))
+
+        parent = os.path.relpath(BND_NAME, '/')
+        for (name, content) in MEMBERS:
+            [row] = get_rows(self.catalog, name)
+            self.assertEqual(row['parent'], parent)
+            self.assertEqual(row['archive'], 'dvdbnd0.bdt')
+            self.assertEqual(row['dcx'], 0)
+            self.assertEqual(row['digest'], get_digest(content))
+            # the offset and size locate the member in its BND
+            offset = row['offset']
+            self.assertEqual(
+                self.bnd[offset:offset + row['stored_size']], content
+            )
+            if direct:
+                # members kept in memory have no path
+                self.assertIsNone(row['path'])
+            else:
+                with open(row['path'], 'rb') as f:
+                    self.assertEqual(f.read(), content)
+
+    def test_rows(self):
+        self.check_rows(direct=False)
+
+    def test_rows_direct(self):
+        self.check_rows(direct=True)
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.catalog = Catalog(os.path.join(self.path, 'catalog.db'))
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.path)
+
+    # Add a file to the catalog
+    def add(self, record, parent, path):
+        self.catalog.add(
+            record, parent, 'dvdbnd0.bdt', 0, 1, 1, False, path, 'digest'
+        )
+
+    def test_removals_apply_in_order(self):
+        self.catalog.open()
+        # a batch is written in the middle of the changes
+        with mock.patch.object(Catalog, 'BATCH_SIZE', 2):
+            self.add('N:\\a\\x.bin', 'a.bnd', 'a/x.bin')
+            self.add('N:\\b\\x.bin', 'b.bnd', 'b/x.bin')
+            self.catalog.remove_parent('a.bnd')
+            self.add('N:\\a\\x.bin', 'a.bnd', 'a/x.bin.new')
+            self.catalog.remove_paths(['b/x.bin'])
+        self.assertEqual(
+            [row['path'] for row in get_rows(self.catalog, 'x.bin')],
+            ['a/x.bin.new']
+        )
+
+    def test_open_drops_previous_rows_unless_kept(self):
+        self.catalog.open()
+        self.add('N:\\a\\x.bin', 'a.bnd', 'a/x.bin')
+        self.catalog.close()
+
+        self.catalog.open(keep=True)
+        self.assertEqual(len(self.catalog.find('x.bin')), 1)
+        self.catalog.close()
+
+        self.catalog.open()
+        self.assertEqual(self.catalog.find('x.bin'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
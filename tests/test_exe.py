@@ -0,0 +1,138 @@
+import hashlib
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from DSFileTool.file_formats.exe import EXE
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import make_exe
+
+EXE_NAME = 'DARKSOULS.exe'
+
+
+# Get the SHA256 checksum of a file
+def get_file_checksum(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ExePatchTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.source = os.path.join(self.path, 'source')
+        os.makedirs(self.source)
+        make_exe(os.path.join(self.source, EXE_NAME))
+        self.original = get_file_checksum(os.path.join(self.source, EXE_NAME))
+
+        # the dummy executable passes for the Steam version once patched
+        patched_path = self.copy_exe('patched')
+        exe = EXE(patched_path)
+        (_, patch_location) = exe.validate()
+        exe.patch(patch_location)
+        self.patched = get_file_checksum(os.path.join(patched_path, EXE_NAME))
+        self.checksums = [
+            mock.patch.dict(EXE.ORIGINAL_CHECKSUMS, steam=self.original),
+            mock.patch.dict(EXE.PATCHED_CHECKSUMS, steam=self.patched),
+        ]
+        for checksums in self.checksums:
+            checksums.start()
+
+    def tearDown(self):
+        for checksums in self.checksums:
+            checksums.stop()
+        shutil.rmtree(self.path)
+
+    # Copy the unpatched executable to a directory of its own
+    def copy_exe(self, name):
+        path = os.path.join(self.path, name)
+        os.makedirs(path)
+        shutil.copy(os.path.join(self.source, EXE_NAME), path)
+        return path
+
+    def test_export_and_apply(self):
+        patch_file = os.path.join(self.path, 'steam.patch')
+        self.assertTrue(Unpacker.export_exe_patch(patch_file, self.source))
+        # exporting leaves the executable untouched
+        self.assertEqual(
+            get_file_checksum(os.path.join(self.source, EXE_NAME)),
+            self.original
+        )
+
+        path = self.copy_exe('target')
+        self.assertTrue(Unpacker.apply_exe_patch(patch_file, path))
+        self.assertEqual(
+            get_file_checksum(os.path.join(path, EXE_NAME)), self.patched
+        )
+        backup_path = os.path.join(path, Unpacker.BACKUP_DIR, EXE_NAME)
+        self.assertEqual(get_file_checksum(backup_path), self.original)
+
+        # a second run finds the executable patched and keeps the backup
+        self.assertFalse(EXE(path).apply_patch(patch_file))
+        self.assertTrue(Unpacker.apply_exe_patch(patch_file, path))
+        self.assertEqual(get_file_checksum(backup_path), self.original)
+
+
+
+# Find every offset of a pattern in data, overlapping matches included
+def find_all(data, pattern):
+    offsets = []
+    pos = data.find(pattern)
+    while pos != -1:
+        offsets.append(pos)
+        pos = data.find(pattern, pos + 1)
+    return offsets
+
+
+class ExeScanTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        patterns = list(EXE.PATCH_LOOKUPS.values()) + [
+            replacement[0] for replacement in EXE.PATCH_REPLACEMENTS.values()
+        ]
+        # each pattern at odd offsets, twice in a row, and once at the end
+        #  so that matches cross the boundaries of small chunks
+        rand = random.Random(0)
+        data = bytearray()
+        for pattern in patterns:
+            data += rand.randbytes(rand.randrange(1, 30))
+            data += pattern + pattern
+        data += patterns[0]
+        self.data = bytes(data)
+        with open(os.path.join(self.path, EXE_NAME), 'wb') as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def check_scan(self, chunk_size):
+        exe = EXE(self.path)
+        exe.locate()
+        exe.scan(chunk_size)
+        self.assertEqual(
+            exe.checksum, hashlib.sha256(self.data).hexdigest()
+        )
+        self.assertEqual(exe.bytes_read, len(self.data))
+        for (idx, lookup) in EXE.PATCH_LOOKUPS.items():
+            self.assertEqual(
+                exe.lookup_offsets[idx], find_all(self.data, lookup)
+            )
+        for (name, replacement) in EXE.PATCH_REPLACEMENTS.items():
+            self.assertEqual(
+                exe.replacement_offsets[name],
+                find_all(self.data, replacement[0])
+            )
+
+    def test_scan_small_chunks(self):
+        for chunk_size in (7, 13):
+            with self.subTest(chunk_size=chunk_size):
+                self.check_scan(chunk_size)
+
+    def test_scan_default_chunk_size(self):
+        self.check_scan(65536)
+
+
+if __name__ == '__main__':
+    unittest.main()
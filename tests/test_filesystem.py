@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from DSFileTool.filesystem import (
+    Deduplicator, find_leftover_removals, remove_trees_in_background
+)
+from DSFileTool.unpacker import Unpacker
+
+
+# Write the content to a new file
+def write_file(filename, content):
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+
+class DeduplicatorTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.dedup = Deduplicator()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    # Write the content through the deduplicator, returns the path
+    def write(self, name, content):
+        filename = os.path.join(self.path, name)
+        self.dedup.write(filename, content, write_file)
+        return filename
+
+    def read(self, filename):
+        with open(filename, 'rb') as f:
+            return f.read()
+
+    def test_links_identical_files(self):
+        first = self.write('first', b'content')
+        second = self.write('second', b'content')
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(self.dedup.linked, 1)
+        self.assertEqual(self.dedup.saved_bytes, len(b'content'))
+
+    def test_rewritten_first_copy_is_not_linked(self):
+        first = self.write('first', b'old')
+        self.write('first', b'new')
+        second = self.write('second', b'old')
+        self.assertEqual(self.read(first), b'new')
+        self.assertEqual(self.read(second), b'old')
+        self.assertEqual(self.dedup.linked, 0)
+
+    def test_rewritten_copy_keeps_the_others(self):
+        first = self.write('first', b'old')
+        second = self.write('second', b'old')
+        self.write('first', b'new')
+        third = self.write('third', b'new')
+        self.assertEqual(self.read(second), b'old')
+        self.assertTrue(os.path.samefile(first, third))
+
+
+
+class BackgroundRemovalTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.trees = []
+        for name in ('chr', 'map'):
+            tree = os.path.join(self.path, name)
+            os.makedirs(os.path.join(tree, 'sub'))
+            write_file(os.path.join(tree, 'sub', 'file'), b'content')
+            self.trees.append(tree)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_removes_trees(self):
+        (removal, failed) = remove_trees_in_background(self.trees, self.path)
+        self.assertEqual(failed, [])
+        self.assertFalse(any(os.path.exists(tree) for tree in self.trees))
+        removal.join()
+        self.assertIsNone(removal.error)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_keeps_the_error(self):
+        error = OSError('device busy')
+        with mock.patch(
+            'DSFileTool.filesystem.remove_tree', side_effect=error
+        ):
+            (removal, _) = remove_trees_in_background(self.trees, self.path)
+            removal.join()
+        self.assertIs(removal.error, error)
+        # the directory left aside is found by the next run
+        self.assertEqual(find_leftover_removals(self.path), [removal.path])
+
+    def test_removes_leftovers_at_startup(self):
+        leftover = os.path.join(self.path, '_Deleting1234')
+        os.rename(self.trees[0], leftover)
+        cwd = os.getcwd()
+        os.chdir(self.path)
+        try:
+            Unpacker.remove_leftover_deletions()
+            Unpacker.wait_for_deletions()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(os.listdir(self.path), ['map'])
+
+
+if __name__ == '__main__':
+    unittest.main()
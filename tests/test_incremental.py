@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from DSFileTool.journal import Journal
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import generate
+
+# Records of the generated archives
+RECORD_COUNT = 120
+
+
+# Get the path and content of every file unpacked under a directory, except
+#  the archives and the files the unpacker keeps next to them
+def get_unpacked_files(path):
+    unpacked_files = {}
+    for (directory, _, filenames) in os.walk(path):
+        for filename in filenames:
+            file_path = os.path.join(directory, filename)
+            if os.path.dirname(file_path) == path:
+                continue
+            with open(file_path, 'rb') as f:
+                unpacked_files[os.path.relpath(file_path, path)] = f.read()
+    return unpacked_files
+
+
+class IncrementalUnpackTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.path = os.path.realpath(tempfile.mkdtemp())
+        generate(self.path, record_count=RECORD_COUNT)
+        os.chdir(self.path)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.path)
+
+    # Unpack the archives in the current directory as attempt_unpack does,
+    #  returns the journal of the run
+    def unpack(self, direct, resume=False, incremental=False):
+        journal = Journal(Unpacker.JOURNAL_FILE)
+        journal.load()
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_journaled(
+            Unpacker.get_archives(), journal, direct=direct, resume=resume,
+            incremental=incremental
+        )
+        return journal
+
+    # Unpack twice, the second time incrementally, and check that nothing
+    #  unchanged was removed or rewritten
+    def check_unchanged(self, direct):
+        self.unpack(direct)
+        before = get_unpacked_files(self.path)
+        self.assertGreater(len(before), RECORD_COUNT)
+
+        journal = self.unpack(direct, incremental=True)
+        self.assertEqual(journal.get_stale_files(), [])
+        self.assertEqual(get_unpacked_files(self.path), before)
+
+        # the incremental run is complete, and kept every entry
+        journal.load()
+        self.assertTrue(journal.complete)
+        self.assertEqual(set(journal.previous), set(journal.entries))
+
+    # Resume an unpack interrupted before the pair files were removed, and
+    #  check that only the pairs of new files are unpacked again
+    def check_resume(self, direct):
+        with mock.patch('os.remove'):
+            self.unpack(direct)
+        journal = self.unpack(direct, resume=True)
+        # the custom c4110 header is written again by every run
+        self.assertEqual(
+            [key for key in journal.entries if key[0] == 'pair'],
+            [('pair', '', os.path.join('chr', 'c4110.chrtpfbdt'))]
+        )
+
+    def test_resume_skips_unpacked_pairs(self):
+        self.check_resume(direct=False)
+
+    def test_resume_skips_unpacked_pairs_direct(self):
+        self.check_resume(direct=True)
+
+    # Rewrite a stored record in place, with the same offset and size, and
+    #  unpack incrementally. Returns the content of its unpacked file
+    def unpack_rewritten_record(self, verify):
+        journal = self.unpack(direct=True)
+        journal.load()
+        entry = min(
+            (
+                entry for (key, entry) in journal.previous.items()
+                # sound files are stored as is and not unpacked further
+                if key[0] == 'record' and entry['crc'] is not None
+                and entry['name'].startswith('/sound/')
+            ),
+            key=lambda entry: entry['name']
+        )
+        with open(entry['archive'], 'r+b') as f:
+            f.seek(entry['offset'])
+            f.write(b'changed')
+
+        with mock.patch.object(Unpacker, 'VERIFY_STORED_CONTENT', verify):
+            self.unpack(direct=True, incremental=True)
+        with open(entry['path'], 'rb') as f:
+            return f.read()
+
+    def test_verify_content_unpacks_rewritten_records(self):
+        self.assertTrue(
+            self.unpack_rewritten_record(verify=True).startswith(b'changed')
+        )
+
+    def test_rewritten_records_are_kept_without_verify_content(self):
+        self.assertFalse(
+            self.unpack_rewritten_record(verify=False).startswith(b'changed')
+        )
+
+    def test_incremental_keeps_unchanged_files(self):
+        self.check_unchanged(direct=False)
+
+    def test_incremental_keeps_unchanged_files_direct(self):
+        self.check_unchanged(direct=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
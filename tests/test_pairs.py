@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import (
+    N_PATH, make_bhd5_pair, make_bhd_pair, make_bnd
+)
+
+
+# Write a BHD5/BDT archive holding the (name, content) records
+def write_archive(path, records):
+    (header, data) = make_bhd5_pair(records)
+    for (ext, content) in (('bhd5', header), ('bdt', data)):
+        with open(os.path.join(path, f'dvdbnd0.{ext}'), 'wb') as f:
+            f.write(content)
+
+
+# Read the files unpacked to the given paths, None for missing ones
+def read_files(*paths):
+    contents = []
+    for path in paths:
+        if not os.path.isfile(path):
+            contents.append(None)
+            continue
+        with open(path, 'rb') as f:
+            contents.append(f.read())
+    return contents
+
+
+class PairUnpackTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.path = os.path.realpath(tempfile.mkdtemp())
+        os.chdir(self.path)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.path)
+
+    def unpack(self, records, direct=False):
+        write_archive(self.path, records)
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_archives(Unpacker.get_archives(), direct=direct)
+
+    # Two pairs write the same member, and a pair writes the path of a
+    #  top-level record: one copy keeps the path, the other one is renamed
+    def check_shared_paths(self, direct):
+        records = [('/map/MapStudio/m10_00_00_00.msb', b'top-level')]
+        for (i, content) in enumerate((b'first', b'second')):
+            files = [('h_shared.hkx', content)]
+            if i == 0:
+                files.append(('MapStudio/m10_00_00_00.msb', content))
+            (header, data) = make_bhd_pair(files)
+            name = f'/map/m10_0{i}_00_00/h10_0{i}_00_00.hkxbdt'
+            records += [(name[:-3] + 'bhd', header), (name, data)]
+        self.unpack(records, direct)
+
+        shared = os.path.join('map', 'h_shared.hkx')
+        self.assertEqual(
+            sorted(read_files(shared, shared + '.xxx')),
+            [b'first', b'second']
+        )
+        msb = os.path.join('map', 'MapStudio', 'm10_00_00_00.msb')
+        self.assertEqual(
+            read_files(msb, msb + '.xxx'), [b'top-level', b'first']
+        )
+
+    def test_shared_paths(self):
+        self.check_shared_paths(direct=False)
+
+    def test_shared_paths_direct(self):
+        self.check_shared_paths(direct=True)
+
+    # A *bdt file with no header next to it and two candidate headers uses
+    #  the first one in sorted order
+    def check_header_choice(self, direct):
+        records = []
+        for (directory, bnd_name) in (
+            ('b', '/facegen/FaceGen.fgbnd'), ('a', '/other/default.rumblebnd')
+        ):
+            # the headers only differ by the names of their records
+            (header, data) = make_bhd_pair([(f'h_{directory}.hkx', b'data')])
+            header_name = f'{N_PATH}\\{directory}\\h10_02_00_00.hkxbhd'
+            records.append((bnd_name, make_bnd([(header_name, header)])))
+        records.append(('/map/m10_02_00_00/h10_02_00_00.hkxbdt', data))
+        self.unpack(records, direct)
+
+        self.assertEqual(
+            read_files(
+                os.path.join('map', 'h_a.hkx'), os.path.join('map', 'h_b.hkx')
+            ),
+            [b'data', None]
+        )
+
+    def test_header_choice(self):
+        self.check_header_choice(direct=False)
+
+    def test_header_choice_direct(self):
+        self.check_header_choice(direct=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
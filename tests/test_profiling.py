@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from DSFileTool.metrics import Metrics
+from DSFileTool.profiling import Profiler
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import generate
+
+
+# Get the names of the functions in the merged profile of a profiler
+def get_profiled_functions(profiler):
+    return {name for (_, _, name) in profiler.stats.stats}
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_archive_scope_covers_derived_phases(self):
+        profiler = Profiler('dvdbnd0.bdt')
+        self.assertTrue(profiler.matches('bdt dvdbnd0.bdt'))
+        self.assertTrue(profiler.matches('bnd', 'dvdbnd0.bdt'))
+        self.assertTrue(profiler.matches('pair', 'dvdbnd0.bdt'))
+        self.assertFalse(profiler.matches('bdt dvdbnd1.bdt'))
+        self.assertFalse(profiler.matches('bnd', 'dvdbnd1.bdt'))
+
+    def test_warns_once_when_a_thread_cannot_be_profiled(self):
+        profiler = Profiler()
+        with mock.patch('cProfile.Profile.enable', side_effect=ValueError(
+            'Another profiling tool is already active'
+        )), mock.patch.object(profiler.log, 'warn') as warn:
+            for _ in range(2):
+                with profiler.profile():
+                    pass
+        self.assertEqual(warn.call_count, 1)
+        self.assertIsNone(profiler.stats)
+
+
+class ProfileScopeTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.path = os.path.realpath(tempfile.mkdtemp())
+        generate(self.path, record_count=60)
+        os.chdir(self.path)
+
+    def tearDown(self):
+        Metrics().profiler = None
+        os.chdir(self.cwd)
+        shutil.rmtree(self.path)
+
+    def test_archive_scope_profiles_its_bnd_files(self):
+        # the generated dvdbnd0.bdt holds BND files
+        profiler = Profiler('dvdbnd0.bdt')
+        Metrics().profiler = profiler
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_archives(Unpacker.get_archives(), direct=True)
+        self.assertIn('unpack_bnd', get_profiled_functions(profiler))
+
+
+if __name__ == '__main__':
+    unittest.main()
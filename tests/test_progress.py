@@ -0,0 +1,30 @@
+import io
+import unittest
+
+from DSFileTool.progress import Progress
+
+
+class TerminalStream(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class ProgressTest(unittest.TestCase):
+    def test_write_above_redraws_the_line(self):
+        stream = TerminalStream()
+        progress = Progress(
+            lambda counters, _: f' * {counters["files"]} files',
+            stream=stream
+        )
+        progress.add('files', 3)
+        with progress:
+            progress.draw()
+            progress.write_above(lambda: stream.write('record\n'))
+        # the record replaces the line, which is drawn again below it
+        lines = stream.getvalue().split('\n')
+        self.assertEqual(lines[0].split('\r')[-1], 'record')
+        self.assertEqual(lines[1].split('\r')[-1], ' * 3 files')
+
+
+if __name__ == '__main__':
+    unittest.main()
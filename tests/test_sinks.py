@@ -0,0 +1,181 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import unittest
+import zipfile
+
+from DSFileTool.sinks import (
+    FilterSink, MemorySink, NullSink, Sink, TarSink, WriteBehindSink, ZipSink
+)
+from DSFileTool.unpacker import Unpacker
+from benchmarks.synthetic import generate
+
+# Files written to the sinks, with a nested path and an empty file
+FILES = {
+    os.path.join('chr', 'c0000', 'c0000.flver'): b'flver' * 100,
+    os.path.join('map', 'tx', 'm10_0000.tpf'): bytes(range(256)),
+    'empty.bin': b'',
+}
+
+
+class BlockingSink(MemorySink):
+    # Keep the files in memory once released, failing for names in fail
+    def __init__(self, fail=()):
+        super().__init__()
+        self.fail = fail
+        self.released = threading.Event()
+
+    def write(self, filename, content):
+        self.released.wait()
+        if filename in self.fail:
+            raise OSError(f'Cannot write {filename}')
+        super().write(filename, content)
+
+
+class WriteBehindSinkTest(unittest.TestCase):
+    def test_when_stored_waits_for_the_writes(self):
+        target = BlockingSink()
+        sink = WriteBehindSink(target)
+        stored = []
+        sink.write('a', b'a')
+        sink.write('b', b'b')
+        sink.when_stored(['a', 'b'], lambda: stored.append(
+            sorted(target.files)
+        ))
+        self.assertEqual(stored, [])
+        target.released.set()
+        sink.close()
+        self.assertEqual(stored, [['a', 'b']])
+
+    def test_when_stored_without_queued_files(self):
+        sink = WriteBehindSink(Sink())
+        stored = []
+        sink.when_stored(['a'], lambda: stored.append(True))
+        self.assertEqual(stored, [True])
+        sink.close()
+
+    def test_when_stored_skips_failed_writes(self):
+        target = BlockingSink(fail=('a',))
+        sink = WriteBehindSink(target)
+        stored = []
+        sink.write('a', b'a')
+        sink.write('b', b'b')
+        sink.when_stored(['a', 'b'], lambda: stored.append(True))
+        target.released.set()
+        with self.assertRaises(OSError):
+            sink.close()
+        self.assertEqual(stored, [])
+
+
+class ArchiveSinkTest(unittest.TestCase):
+    # Write FILES to the sink, with the paths under root
+    def write_files(self, sink, root):
+        with sink:
+            for (name, content) in FILES.items():
+                sink.write(os.path.join(root, name), memoryview(content))
+
+    def test_tar_round_trip(self):
+        stream = io.BytesIO()
+        self.write_files(TarSink(stream, 'root'), 'root')
+        stream.seek(0)
+        with tarfile.open(fileobj=stream) as tar:
+            files = {
+                member.name: tar.extractfile(member).read()
+                for member in tar.getmembers()
+            }
+        self.assertEqual(files, {
+            name.replace(os.sep, '/'): content
+            for (name, content) in FILES.items()
+        })
+
+    def test_zip_round_trip(self):
+        stream = io.BytesIO()
+        self.write_files(ZipSink(stream, 'root'), 'root')
+        with zipfile.ZipFile(stream) as archive:
+            files = {name: archive.read(name) for name in archive.namelist()}
+        self.assertEqual(files, {
+            name.replace(os.sep, '/'): content
+            for (name, content) in FILES.items()
+        })
+
+    def test_memory_round_trip(self):
+        sink = MemorySink()
+        self.write_files(sink, '')
+        self.assertEqual(sink.files, FILES)
+
+    def test_filter_sink(self):
+        target = MemorySink()
+        sink = FilterSink(target, lambda f: f.endswith('.tpf'))
+        self.write_files(sink, '')
+        self.assertEqual(
+            sorted(target.files), sorted(f for f in FILES if f[-4:] != '.tpf')
+        )
+
+
+# Get the path and content of the files under a directory, except the
+#  archives and the files the unpacker keeps next to them
+def read_tree(path):
+    files = {}
+    for (directory, _, filenames) in os.walk(path):
+        if directory == path:
+            continue
+        for filename in filenames:
+            file_path = os.path.join(directory, filename)
+            with open(file_path, 'rb') as f:
+                files[os.path.relpath(file_path, path)] = f.read()
+    return files
+
+
+class UnpackToSinkTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.path = os.path.realpath(tempfile.mkdtemp())
+        generate(os.path.join(self.path, 'archives'), record_count=120)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.path)
+
+    # Unpack a copy of the archives in a directory of its own, returns the
+    #  directory and the files written there
+    def unpack(self, name, output=None):
+        path = os.path.join(self.path, name)
+        shutil.copytree(os.path.join(self.path, 'archives'), path)
+        os.chdir(path)
+        Unpacker.create_unpacked_dirs()
+        Unpacker.unpack_archives(
+            Unpacker.get_archives(), direct=True, output=output
+        )
+        return (path, read_tree(path))
+
+    def test_memory_sink_matches_the_disk(self):
+        (_, on_disk) = self.unpack('disk')
+        sink = MemorySink()
+        (path, files) = self.unpack('memory', sink)
+        self.assertEqual(files, {})
+        self.assertGreater(len(on_disk), 0)
+        self.assertEqual(
+            {os.path.relpath(f, path): c for (f, c) in sink.files.items()},
+            on_disk
+        )
+
+    def test_unpack_to_archive(self):
+        sink = NullSink()
+        self.unpack('null', sink)
+        tar_file = os.path.join(self.path, 'unpacked.tar')
+        archives = os.path.join(self.path, 'archives')
+        self.assertTrue(Unpacker.unpack_to_archive(tar_file, archives))
+        with tarfile.open(tar_file) as tar:
+            members = [member for member in tar if member.isfile()]
+        self.assertEqual(len(members), sink.file_count)
+        self.assertEqual(
+            sum(member.size for member in members), sink.byte_count
+        )
+        # the game directories are left alone
+        self.assertEqual(read_tree(archives), {})
+
+if __name__ == '__main__':
+    unittest.main()